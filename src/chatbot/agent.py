@@ -6,35 +6,45 @@ Uses LangChain's native features with optional RAG tool integration for multi-st
 import os
 import time
 import uuid
-from typing import Dict, List, Any, Optional, cast
+from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 import structlog
 
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
-from langchain_core.chat_history import InMemoryChatMessageHistory
-from langchain_community.chat_message_histories import FileChatMessageHistory
-from langchain_core.runnables.history import RunnableWithMessageHistory
-from langchain_core.runnables import RunnableConfig
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, messages_from_dict
+from langchain_core.chat_history import BaseChatMessageHistory, InMemoryChatMessageHistory
 from langchain_core.output_parsers import StrOutputParser
-from langchain.agents import create_openai_tools_agent, AgentExecutor
+from langchain.agents import create_openai_tools_agent
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.memory import ConversationBufferWindowMemory
 
 from src.config.settings import Settings
 from src.utils.azure_langchain import create_azure_chat_openai
 from src.utils.error_handlers import handle_error, ChatbotBaseError
 from src.chatbot.tool_routing_instructions import get_tool_routing_instructions
+from src.chatbot.tool_executor import STOPPED_OUTPUT, ParallelToolExecutor
+from src.chatbot.conversation_memory import TokenBudgetMemory
+from src.chatbot.conversation_store import AppendOnlyChatMessageHistory, count_messages, tail_messages
+from src.chatbot.response_cache import CacheHit, SemanticResponseCache, get_response_cache
+from src.utils.event_loop import iterate_sync, run_sync
 
 logger = structlog.get_logger(__name__)
 
 
-def create_session_history(session_id: str, persistence_file: Optional[str] = None):
-    """Create chat history for a session - Azure best practice for session management."""
+def create_session_history(session_id: str, persistence_file: Optional[str] = None) -> BaseChatMessageHistory:
+    """
+    Create chat history for a session - Azure best practice for session management.
+    
+    Persisted sessions are append-only JSON-lines logs ({persistence_file}_{session_id}.jsonl).
+    A session saved as a JSON array by earlier versions is imported into the log on first use.
+    """
     if persistence_file:
         from pathlib import Path
-        file_path = Path(f"{persistence_file}_{session_id}.json")
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        return FileChatMessageHistory(file_path=str(file_path))
+        import json
+        history = AppendOnlyChatMessageHistory(f"{persistence_file}_{session_id}.jsonl")
+        legacy_file = Path(f"{persistence_file}_{session_id}.json")
+        if len(history) == 0 and legacy_file.exists():
+            history.add_messages(messages_from_dict(json.loads(legacy_file.read_text(encoding="utf-8") or "[]")))
+            legacy_file.rename(legacy_file.with_suffix(".json.imported"))
+        return history
     return InMemoryChatMessageHistory()
 
 
@@ -61,9 +71,14 @@ class ChatbotAgent:
         persistence_file: Optional[str] = None,
         tools: Optional[List[Any]] = None,
         enable_multi_step: bool = False,
-        use_general_knowledge: bool = False
+        use_general_knowledge: bool = False,
+        response_cache: Optional[SemanticResponseCache] = None
     ):
-        """Initialize Azure OpenAI agent with LangChain native features and optional RAG tools."""
+        """
+        Initialize Azure OpenAI agent with LangChain native features and optional RAG tools.
+        
+        The response cache defaults to the process-wide one when response_cache_enabled is set.
+        """
         self.settings = settings
         self.conversation_id = conversation_id or str(uuid.uuid4())
         self.persistence_file = persistence_file
@@ -89,6 +104,14 @@ class ChatbotAgent:
             self.logger.error("Failed to initialize Azure OpenAI", error=str(e))
             raise
         
+        # Stored conversation, and the token-budgeted window of it shared by both modes
+        self.history = create_session_history(self.conversation_id, persistence_file)
+        self.memory = TokenBudgetMemory.from_settings(settings, self.llm)
+        self.memory.resume(tail_messages(self.history, self.memory.resume_size))
+        
+        # Answers to near-identical standalone questions, shared across conversations (opt-in)
+        self.response_cache = response_cache or get_response_cache(settings)
+        
         # Setup system prompt (enhanced for multi-step if enabled)
         self.system_prompt = self._build_system_prompt(system_prompt, prompt_type)
         
@@ -131,28 +154,18 @@ class ChatbotAgent:
     
     def _setup_conversation_chain(self):
         """Setup simple LangChain conversation chain - Azure optimized."""
-        # Simple chain: add system prompt -> LLM -> string output
+        # Simple chain: add system prompt and history -> LLM -> string output
         def add_system_prompt(messages: List[BaseMessage]) -> List[BaseMessage]:
             """Add system prompt and manage context window."""
             result: List[BaseMessage] = [SystemMessage(content=self.system_prompt)]
             
-            # Simple context window management - reduced for performance
-            max_messages = (self.settings.max_conversation_turns * 2) if self.settings.max_conversation_turns else 6
-            recent_messages = messages[-max_messages:] if len(messages) > max_messages else messages
-            
-            result.extend([msg for msg in recent_messages if not isinstance(msg, SystemMessage)])
+            # Context window management - newest turns within the token budget, older ones summarized.
+            # The stored conversation is only appended to (see _record_turn), never re-read per turn.
+            result.extend(self.memory.messages)
+            result.extend(messages)
             return result
         
-        # Create simple chain
-        chain = add_system_prompt | self.llm | StrOutputParser()
-        
-        # Wrap with message history - LangChain handles everything else
-        self.conversation_chain = RunnableWithMessageHistory(
-            cast(Any, chain),  # Type assertion to work around LangChain typing
-            lambda session_id: create_session_history(session_id, self.persistence_file),
-            input_messages_key=None,
-            history_messages_key=None,
-        )
+        self.conversation_chain = add_system_prompt | self.llm | StrOutputParser()
 
     def _setup_agent_executor(self):
         """Setup LangChain agent executor for multi-step conversations with RAG tools."""
@@ -173,23 +186,14 @@ class ChatbotAgent:
             prompt=prompt_template
         )
         
-        # Create conversation memory for multi-step context - reduced for performance
-        memory = ConversationBufferWindowMemory(
-            memory_key="chat_history",
-            output_key="output",
-            return_messages=True,
-            k=3  # Remember last 3 exchanges
-        )
-        
-        # Create agent executor with Azure-optimized settings
-        self.agent_executor = AgentExecutor(
+        # Create agent executor - tool calls of one step run concurrently, each with a timeout
+        self.agent_executor = ParallelToolExecutor(
             agent=agent,
             tools=self.tools,
-            memory=memory,
-            verbose=False,  # Disable verbose to avoid callback issues
+            memory=self.memory,
             max_iterations=5,  # Restored original value
-            early_stopping_method="force",  # Updated to supported value (was "generate")
-            handle_parsing_errors=True
+            tool_timeout_seconds=self.settings.agent_tool_timeout_seconds,
+            max_concurrent_tools=self.settings.agent_max_concurrent_tools
         )
         
         self.logger.info("Multi-step agent executor ready")
@@ -198,8 +202,18 @@ class ChatbotAgent:
         """
         Process user message using either simple chain or multi-step agent executor.
         
+        Synchronous entry point for Streamlit and the CLI; runs aprocess_message
+        on the process-wide event loop.
+        """
+        return run_sync(self.aprocess_message(user_message, **kwargs))
+    
+    async def aprocess_message(self, user_message: str, **kwargs) -> Dict[str, Any]:
+        """
+        Process user message using either simple chain or multi-step agent executor.
+        
         Routes between conversation chain and agent executor based on enable_multi_step flag.
         Also handles agent-controlled RAG behavior based on use_general_knowledge setting.
+        Tools are awaited directly on the caller's event loop.
         """
         if not user_message.strip():
             return self._error_response("Please provide a message.")
@@ -207,25 +221,33 @@ class ChatbotAgent:
         start_time = time.time()
         
         try:
+            # Reuse the answer to a near-identical earlier question if the response cache has one
+            cache_hit = await self._cached_answer(user_message)
+            if cache_hit is not None:
+                response_content = cache_hit.answer
+                processing_mode = "cached"
+            
             # Use multi-step agent executor if available (let it choose the right tool)
-            if self.enable_multi_step and self.agent_executor:
+            elif self.enable_multi_step and self.agent_executor:
                 # Multi-step mode: Use agent executor with RAG tools
                 self.logger.info("Processing with multi-step agent executor")
-                result = self.agent_executor.invoke({
+                result = await self.agent_executor.ainvoke({
                     "input": user_message
                 })
                 response_content = result.get("output", "")
                 processing_mode = "multi-step"
+                await self._cache_answer(user_message, result)
                 
             else:
                 # Simple mode: Use conversation chain directly
                 self.logger.info("Processing with simple conversation chain")
-                config: RunnableConfig = {"configurable": {"session_id": self.conversation_id}}
-                response_content = self.conversation_chain.invoke(
-                    [HumanMessage(content=user_message)],
-                    config=config
+                response_content = await self.conversation_chain.ainvoke(
+                    [HumanMessage(content=user_message)]
                 )
                 processing_mode = "simple"
+                await self._cache_answer(user_message, {"output": response_content})
+            
+            await self._record_turn(user_message, response_content, processing_mode)
             
             # Simple performance tracking
             response_time = time.time() - start_time
@@ -241,7 +263,7 @@ class ChatbotAgent:
                 processing_mode=processing_mode
             )
             
-            return {
+            response = {
                 'content': response_content,
                 'conversation_id': self.conversation_id,
                 'message_count': self._message_count,
@@ -251,25 +273,48 @@ class ChatbotAgent:
                 'used_documents': False,  # Not RAG-based
                 'sources': []
             }
+            if cache_hit is not None:
+                # Provenance of the reused answer
+                response['cache'] = cache_hit.provenance()
+            return response
             
         except Exception as e:
             return self._handle_error(e, user_message, time.time() - start_time)
     
     def stream_response(self, user_message: str, **kwargs):
+        """Stream response synchronously; runs astream_response on the process-wide event loop."""
+        return iterate_sync(self.astream_response(user_message, **kwargs))
+    
+    async def astream_response(self, user_message: str, **kwargs):
         """Stream response using appropriate mode - supports both simple and multi-step."""
         if not user_message.strip():
             yield self._error_response("Please provide a message.")
             return
         
         try:
-            if self.enable_multi_step and self.agent_executor:
+            cache_hit = await self._cached_answer(user_message)
+            if cache_hit is not None:
+                # Cached mode: the reused answer in one chunk, with its provenance
+                await self._record_turn(user_message, cache_hit.answer, 'cached')
+                yield {
+                    'content': cache_hit.answer,
+                    'conversation_id': self.conversation_id,
+                    'is_streaming': True,
+                    'processing_mode': 'cached',
+                    'cache': cache_hit.provenance(),
+                    'timestamp': time.time()
+                }
+            
+            elif self.enable_multi_step and self.agent_executor:
                 # Multi-step mode: Stream from agent executor
                 self.logger.info("Streaming with multi-step agent executor")
-                for chunk in self.agent_executor.stream({
+                async for chunk in self.agent_executor.astream({
                     "input": user_message
                 }):
                     # Agent executor streams structured output
                     if 'output' in chunk:
+                        await self._record_turn(user_message, chunk['output'], 'multi-step')
+                        await self._cache_answer(user_message, chunk)
                         yield {
                             'content': chunk['output'],
                             'conversation_id': self.conversation_id,
@@ -291,12 +336,12 @@ class ChatbotAgent:
             else:
                 # Simple mode: Stream from conversation chain
                 self.logger.info("Streaming with simple conversation chain")
-                config: RunnableConfig = {"configurable": {"session_id": self.conversation_id}}
+                chunks = []
                 
-                for chunk in self.conversation_chain.stream(
-                    [HumanMessage(content=user_message)],
-                    config=config
+                async for chunk in self.conversation_chain.astream(
+                    [HumanMessage(content=user_message)]
                 ):
+                    chunks.append(chunk)
                     yield {
                         'content': chunk,
                         'conversation_id': self.conversation_id,
@@ -304,6 +349,9 @@ class ChatbotAgent:
                         'processing_mode': 'simple',
                         'timestamp': time.time()
                     }
+                
+                await self._record_turn(user_message, "".join(chunks), 'simple')
+                await self._cache_answer(user_message, {"output": "".join(chunks)})
             
             # Final marker
             yield {
@@ -319,6 +367,41 @@ class ChatbotAgent:
     
     
     
+    async def _record_turn(self, user_message: str, response_content: str, processing_mode: str):
+        """
+        Append a completed turn to the stored conversation.
+        
+        The memory window is updated here too, except in multi-step mode, where
+        the executor saves the turn to memory itself.
+        """
+        turn = [HumanMessage(content=user_message), AIMessage(content=response_content)]
+        self.history.add_messages(turn)
+        if processing_mode != "multi-step":
+            await self.memory.aadd_messages(turn)
+    
+    @property
+    def _cache_context(self) -> str:
+        """What cached answers depend on besides the question: prompt, tools and knowledge preference."""
+        return f"{self.system_prompt}\nuse_general_knowledge={self.use_general_knowledge}"
+    
+    async def _cached_answer(self, user_message: str) -> Optional[CacheHit]:
+        """Look the question up in the response cache, if enabled."""
+        if self.response_cache is None:
+            return None
+        return await self.response_cache.lookup(user_message, self._cache_context)
+    
+    async def _cache_answer(self, user_message: str, result: Dict[str, Any]):
+        """
+        Offer a completed answer to the response cache, if enabled.
+        
+        Answers given after a tool failed or the agent stopped early are not reused.
+        """
+        output = result.get("output", "")
+        if self.response_cache is None or result.get("failed_tools") or output == STOPPED_OUTPUT:
+            return
+        tools = [action.tool for action, _ in result.get("intermediate_steps", []) if action.tool != "_Exception"]
+        await self.response_cache.store(user_message, output, self._cache_context, self.conversation_id, tools)
+    
     def update_general_knowledge_preference(self, use_general_knowledge: bool):
         """
         Update the agent's general knowledge preference.
@@ -357,27 +440,27 @@ class ChatbotAgent:
         }
     
     def get_conversation_history(self) -> List[BaseMessage]:
-        """Get conversation history from LangChain."""
-        history = create_session_history(self.conversation_id, self.persistence_file)
-        return history.messages
+        """Get conversation history from the stored conversation."""
+        return self.history.messages
     
     def clear_conversation(self):
         """Clear conversation using LangChain native method."""
-        history = create_session_history(self.conversation_id, self.persistence_file)
-        history.clear()
+        self.history.clear()
+        self.memory.clear()
         self._message_count = 0
         self.logger.info("Conversation cleared")
     
     def get_statistics(self) -> Dict[str, Any]:
         """Simple statistics - Azure monitoring pattern."""
-        history = self.get_conversation_history()
         return {
             'conversation_id': self.conversation_id,
             'message_count': self._message_count,
-            'total_messages': len(history),
+            'total_messages': count_messages(self.history),
             'uptime': time.time() - self._start_time,
             'azure_model': getattr(self.llm, 'model_name', 'unknown'),
-            'persistence': 'file' if self.persistence_file else 'memory'
+            'persistence': 'file' if self.persistence_file else 'memory',
+            'memory': self.memory.get_stats(),
+            'response_cache': self.response_cache.stats() if self.response_cache else None
         }
     
     def health_check(self) -> Dict[str, Any]:
@@ -0,0 +1,379 @@
+"""
+TokenBudgetMemory - Conversation memory bounded by a token budget.
+
+The agent kept the last few exchanges verbatim whatever their size, and the
+simple chain replayed a fixed number of messages, so one pasted call report
+table made every later prompt larger and slower. This memory counts each
+message's tokens once, when it is added, and keeps the conversation within a
+budget:
+
+- the newest turns stay verbatim, up to ``max_turns`` turns and ``max_tokens``
+  tokens including the summary
+- messages longer than ``message_token_limit`` (bulky tool output pasted into
+  an answer, say) are condensed before they are stored
+- turns falling out of the window are folded into a rolling summary, or
+  dropped when rolling summaries are off
+
+Condensed messages and summaries are cached by content, so the same table or
+the same stretch of conversation is only summarized once. Without a
+summarizer model, messages are shortened to their beginning and end and the
+summary lists the opening lines of each turn.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable
+
+logger = structlog.get_logger(__name__)
+
+CONDENSE_PROMPT = (
+    "Condense this {role} message from a banking assistant conversation to at most {words} words. "
+    "Keep bank names, identifiers (RSSD ID, FDIC certificate), report dates and the figures "
+    "most likely to be referred to again.\n\n{text}"
+)
+SUMMARY_PROMPT = (
+    "Update the running summary of a banking assistant conversation with the new turns, "
+    "in at most {words} words. Keep bank names, identifiers, report dates, figures and open questions.\n\n"
+    "Current summary:\n{summary}\n\nNew turns:\n{turns}\n\nUpdated summary:"
+)
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+@dataclass
+class _Turn:
+    """A user message and the replies to it, with their token count."""
+    messages: List[BaseMessage] = field(default_factory=list)
+    tokens: int = 0
+
+
+class TokenBudgetMemory:
+    """
+    Token-budgeted chat history with rolling summarization.
+    
+    Usable as the memory of the multi-step executor (load_memory_variables /
+    save_context and their async forms, key "chat_history") and as the
+    simple chain's history, resumed from a stored conversation (see resume).
+    """
+    
+    memory_key = "chat_history"
+    
+    def __init__(
+        self,
+        max_tokens: Optional[int] = 3000,
+        max_turns: Optional[int] = 20,
+        message_token_limit: Optional[int] = 800,
+        summarizer: Optional[Runnable] = None,
+        rolling_summary: bool = True,
+        token_counter: Callable[[str], int] = estimate_tokens,
+        cache_size: int = 256
+    ):
+        """
+        Initialize token-budgeted memory.
+        
+        Args:
+            max_tokens: Tokens of history (summary included) kept for the prompt (None = unlimited)
+            max_turns: Turns kept verbatim (None = unlimited)
+            message_token_limit: Messages longer than this are condensed (None = never)
+            summarizer: Chat model or runnable writing summaries (optional, extractive without)
+            rolling_summary: Fold turns leaving the window into a summary instead of dropping them
+            token_counter: Function counting the tokens of a text
+            cache_size: Condensed messages and summaries kept in the cache
+        """
+        self.max_tokens = max_tokens
+        self.max_turns = max_turns
+        self.message_token_limit = message_token_limit
+        self.summarizer = summarizer | StrOutputParser() if summarizer is not None else None
+        self.rolling_summary = rolling_summary
+        self.count_tokens = token_counter
+        self.cache_size = cache_size
+        
+        self._turns: List[_Turn] = []
+        self._tokens = 0
+        self._summary = ""
+        self._summary_tokens = 0
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._stats = {"messages": 0, "condensed": 0, "summarized_turns": 0, "dropped_turns": 0, "cache_hits": 0, "summarizer_calls": 0}
+        
+        self.logger = logger.bind(
+            log_type="CONVERSATION",
+            component="token_budget_memory"
+        )
+    
+    @classmethod
+    def from_settings(cls, settings: Any, llm: Optional[Runnable] = None) -> "TokenBudgetMemory":
+        """
+        Create the memory configured by conversation_memory_type.
+        
+        - buffer: everything verbatim
+        - buffer_window: newest turns within the budget, older turns dropped
+        - summary: newest turns within the budget, older turns summarized by llm
+        
+        Args:
+            settings: Settings with the conversation memory fields
+            llm: Chat model writing summaries in summary mode
+        """
+        memory_type = getattr(settings, "conversation_memory_type", "buffer_window")
+        if memory_type == "buffer":
+            return cls(max_tokens=None, max_turns=None, message_token_limit=None, rolling_summary=False)
+        return cls(
+            max_tokens=getattr(settings, "conversation_memory_max_tokens", 3000),
+            max_turns=getattr(settings, "max_conversation_turns", 20),
+            message_token_limit=getattr(settings, "conversation_message_max_tokens", 800),
+            summarizer=llm if memory_type == "summary" else None,
+            rolling_summary=memory_type == "summary"
+        )
+    
+    @property
+    def memory_variables(self) -> List[str]:
+        return [self.memory_key]
+    
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """History for the prompt: the summary, if any, then the verbatim turns."""
+        history: List[BaseMessage] = [SystemMessage(content=SUMMARY_PREFIX + self._summary)] if self._summary else []
+        for turn in self._turns:
+            history.extend(turn.messages)
+        return history
+    
+    @property
+    def token_count(self) -> int:
+        """Tokens of the history returned by messages."""
+        return self._tokens + self._summary_tokens
+    
+    def load_memory_variables(self, inputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {self.memory_key: self.messages}
+    
+    async def aload_memory_variables(self, inputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.load_memory_variables(inputs)
+    
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, Any]) -> None:
+        """Add a user input and the agent's output as one turn."""
+        self.add_messages(_exchange(inputs, outputs))
+    
+    async def asave_context(self, inputs: Dict[str, Any], outputs: Dict[str, Any]) -> None:
+        """Add a user input and the agent's output as one turn, summarizing without blocking the loop."""
+        await self.aadd_messages(_exchange(inputs, outputs))
+    
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """
+        Add messages to the history, condensing and summarizing as needed.
+        
+        Args:
+            messages: New messages; a HumanMessage starts a new turn
+        """
+        for message in messages:
+            tokens = self._message_tokens(message)
+            if self._is_bulky(tokens):
+                message, tokens = self._condensed(message, self._complete(self._condense_prompt(message)))
+            self._append(message, tokens)
+        evicted = self._evict()
+        if evicted:
+            self._set_summary(self._complete(self._summary_prompt(evicted)), evicted)
+    
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Async form of add_messages; summaries are written with the summarizer's async API."""
+        for message in messages:
+            tokens = self._message_tokens(message)
+            if self._is_bulky(tokens):
+                message, tokens = self._condensed(message, await self._acomplete(self._condense_prompt(message)))
+            self._append(message, tokens)
+        evicted = self._evict()
+        if evicted:
+            self._set_summary(await self._acomplete(self._summary_prompt(evicted)), evicted)
+    
+    @property
+    def resume_size(self) -> Optional[int]:
+        """Messages of a stored conversation needed to rebuild the window (None = all)."""
+        return None if self.max_turns is None else self.max_turns * 2
+    
+    def resume(self, messages: Sequence[BaseMessage]) -> None:
+        """
+        Rebuild the window from the end of a stored conversation.
+        
+        Messages are condensed and summarized extractively, so resuming a
+        conversation makes no model calls.
+        
+        Args:
+            messages: Newest messages of the conversation, oldest first (see resume_size)
+        """
+        summarizer, self.summarizer = self.summarizer, None
+        try:
+            self.add_messages(messages)
+        finally:
+            self.summarizer = summarizer
+    
+    def clear(self) -> None:
+        """Forget the history and summary; cached summaries are kept."""
+        self._turns = []
+        self._tokens = 0
+        self._summary = ""
+        self._summary_tokens = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Memory statistics for monitoring."""
+        return {
+            **self._stats,
+            "turns": len(self._turns),
+            "tokens": self.token_count,
+            "summary_tokens": self._summary_tokens,
+            "cached_summaries": len(self._cache)
+        }
+    
+    def _message_tokens(self, message: BaseMessage) -> int:
+        self._stats["messages"] += 1
+        return self.count_tokens(_text(message))
+    
+    def _is_bulky(self, tokens: int) -> bool:
+        return self.message_token_limit is not None and tokens > self.message_token_limit
+    
+    def _append(self, message: BaseMessage, tokens: int) -> None:
+        if isinstance(message, HumanMessage) or not self._turns:
+            self._turns.append(_Turn())
+        turn = self._turns[-1]
+        turn.messages.append(message)
+        turn.tokens += tokens
+        self._tokens += tokens
+    
+    def _evict(self) -> List[_Turn]:
+        """Remove the oldest turns beyond the budget; the newest turn always stays."""
+        evicted = []
+        while len(self._turns) > 1 and (
+            (self.max_turns is not None and len(self._turns) > self.max_turns)
+            or (self.max_tokens is not None and self.token_count > self.max_tokens)
+        ):
+            turn = self._turns.pop(0)
+            self._tokens -= turn.tokens
+            evicted.append(turn)
+        if evicted and not self.rolling_summary:
+            self._stats["dropped_turns"] += len(evicted)
+            return []
+        return evicted
+    
+    def _condense_prompt(self, message: BaseMessage) -> Dict[str, Any]:
+        role = "user" if isinstance(message, HumanMessage) else "assistant"
+        text = _text(message)
+        return {
+            "prompt": CONDENSE_PROMPT.format(role=role, words=self.message_token_limit * 3 // 4, text=text),
+            "fallback": lambda: _shorten(text, self.message_token_limit * 4),
+            "limit": self.message_token_limit
+        }
+    
+    def _condensed(self, message: BaseMessage, content: str) -> Tuple[BaseMessage, int]:
+        self._stats["condensed"] += 1
+        condensed = message.__class__(content=content)
+        return condensed, self.count_tokens(content)
+    
+    def _summary_prompt(self, evicted: List[_Turn]) -> Dict[str, Any]:
+        turns = "\n".join(_transcript_line(message) for turn in evicted for message in turn.messages)
+        budget = self._summary_budget()
+        self._stats["summarized_turns"] += len(evicted)
+        return {
+            "prompt": SUMMARY_PROMPT.format(words=budget * 3 // 4, summary=self._summary or "(none)", turns=turns),
+            "fallback": lambda: _keep_end("\n".join(filter(None, [self._summary, *(
+                _shorten(_transcript_line(message), 400) for turn in evicted for message in turn.messages
+            )])), budget * 4),
+            "limit": budget
+        }
+    
+    def _set_summary(self, summary: str, evicted: List[_Turn]) -> None:
+        self._summary = summary
+        self._summary_tokens = self.count_tokens(SUMMARY_PREFIX + summary)
+        self.logger.debug(
+            "Folded turns into conversation summary",
+            turns=len(evicted),
+            summary_tokens=self._summary_tokens
+        )
+        # A long summary can itself push older verbatim turns out
+        evicted = self._evict()
+        if evicted:
+            self._set_summary(self._summary_prompt(evicted)["fallback"](), evicted)
+    
+    def _summary_budget(self) -> int:
+        """Tokens the summary may use: a quarter of the budget."""
+        return max((self.max_tokens or 2000) // 4, 50)
+    
+    def _complete(self, request: Dict[str, Any]) -> str:
+        cached = self._cached(request)
+        if cached is not None:
+            return cached
+        result = None
+        if self.summarizer is not None:
+            self._stats["summarizer_calls"] += 1
+            try:
+                result = self.summarizer.invoke(request["prompt"])
+            except Exception as e:
+                self.logger.warning("Summarizer failed, shortening text instead", error=str(e))
+        return self._store(request, result)
+    
+    async def _acomplete(self, request: Dict[str, Any]) -> str:
+        cached = self._cached(request)
+        if cached is not None:
+            return cached
+        result = None
+        if self.summarizer is not None:
+            self._stats["summarizer_calls"] += 1
+            try:
+                result = await self.summarizer.ainvoke(request["prompt"])
+            except Exception as e:
+                self.logger.warning("Summarizer failed, shortening text instead", error=str(e))
+        return self._store(request, result)
+    
+    def _cached(self, request: Dict[str, Any]) -> Optional[str]:
+        key = _cache_key(request["prompt"])
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self._stats["cache_hits"] += 1
+        return cached
+    
+    def _store(self, request: Dict[str, Any], result: Optional[str]) -> str:
+        # Summaries over their limit are cut to it, so the budget holds whatever the model wrote
+        if not result or self.count_tokens(result) > request["limit"] * 5 // 4:
+            result = request["fallback"]() if not result else _shorten(result, request["limit"] * 4)
+        self._cache[_cache_key(request["prompt"])] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+
+def _exchange(inputs: Dict[str, Any], outputs: Dict[str, Any]) -> List[BaseMessage]:
+    return [HumanMessage(content=str(inputs["input"])), AIMessage(content=str(outputs["output"]))]
+
+
+def _text(message: BaseMessage) -> str:
+    return message.content if isinstance(message.content, str) else str(message.content)
+
+
+def _transcript_line(message: BaseMessage) -> str:
+    role = "User" if isinstance(message, HumanMessage) else "Assistant"
+    return f"{role}: {_text(message)}"
+
+
+def _shorten(text: str, max_chars: int) -> str:
+    """Keep the beginning (headers, first rows) and end (totals, conclusions) of a long text."""
+    if len(text) <= max_chars:
+        return text
+    head = max_chars * 2 // 3
+    tail = max_chars - head
+    omitted = estimate_tokens(text[head:len(text) - tail])
+    return f"{text[:head]}\n[... about {omitted} tokens omitted ...]\n{text[len(text) - tail:]}"
+
+
+def _keep_end(text: str, max_chars: int) -> str:
+    """Keep the most recent part of a summary."""
+    return text if len(text) <= max_chars else "..." + text[len(text) - max_chars:]
+
+
+def _cache_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
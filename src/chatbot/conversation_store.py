@@ -0,0 +1,229 @@
+"""
+ConversationStore - Append-only conversation log with an offset index.
+
+FileChatMessageHistory kept a conversation as one JSON array, rewriting the
+whole file for every message and re-parsing it for every read, so each turn
+of a long session cost time proportional to the whole session. The store
+keeps one message per line in a JSON-lines log instead, plus an index of
+fixed-width line offsets next to it:
+
+- appending a message writes one line and one index entry
+- the message count is the index size; the last n messages are read by
+  seeking to their offset, without touching the rest of the log
+- a log and index left inconsistent by a crash are repaired on open by
+  rescanning the log
+
+Each conversation has a single writer (the agent holding it); the lock only
+serializes threads within this process.
+"""
+
+import json
+import struct
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import structlog
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+logger = structlog.get_logger(__name__)
+
+INDEX_SUFFIX = ".idx"
+_OFFSET = struct.Struct("<Q")
+
+
+class ConversationStore:
+    """JSON-lines record log with an index of record offsets."""
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) a conversation log.
+        
+        Args:
+            path: Log file path; the index is stored next to it with an .idx suffix
+        """
+        self.path = Path(path)
+        self.index_path = Path(f"{self.path}{INDEX_SUFFIX}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        
+        self.logger = logger.bind(
+            log_type="SYSTEM",
+            component="conversation_store"
+        )
+        with self._lock:
+            self._count = self._check_index()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, records: Sequence[Dict[str, Any]]) -> None:
+        """
+        Append records to the log.
+        
+        Args:
+            records: JSON-serializable records, written in order
+        """
+        if not records:
+            return
+        lines = [json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n" for record in records]
+        with self._lock:
+            with open(self.path, "ab") as log:
+                offset = log.seek(0, 2)
+                log.write(b"".join(lines))
+            offsets = []
+            for line in lines:
+                offsets.append(_OFFSET.pack(offset))
+                offset += len(line)
+            # The index is written after the log, so a crash in between only leaves lines to re-index
+            with open(self.index_path, "ab") as index:
+                index.write(b"".join(offsets))
+            self._count += len(lines)
+    
+    def read(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read a range of records.
+        
+        Args:
+            start: Index of the first record (negative counts from the end)
+            stop: Index after the last record (None = to the end)
+        
+        Returns:
+            Records in log order
+        """
+        return list(self.iter_records(start, stop))
+    
+    def tail(self, count: int) -> List[Dict[str, Any]]:
+        """Read the last count records."""
+        return self.read(max(self._count - count, 0)) if count > 0 else []
+    
+    def iter_records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a range of records, reading the log sequentially from the first one.
+        
+        Args:
+            start: Index of the first record (negative counts from the end)
+            stop: Index after the last record (None = to the end)
+        
+        Yields:
+            Records in log order
+        """
+        with self._lock:
+            start, stop, _ = slice(start, stop).indices(self._count)
+            if start >= stop:
+                return
+            offset = self._offset(start)
+        with open(self.path, "rb") as log:
+            log.seek(offset)
+            for _ in range(stop - start):
+                yield json.loads(log.readline())
+    
+    def clear(self) -> None:
+        """Remove all records."""
+        with self._lock:
+            for path in (self.path, self.index_path):
+                with open(path, "wb"):
+                    pass
+            self._count = 0
+    
+    def _offset(self, position: int) -> int:
+        with open(self.index_path, "rb") as index:
+            index.seek(position * _OFFSET.size)
+            return _OFFSET.unpack(index.read(_OFFSET.size))[0]
+    
+    def _check_index(self) -> int:
+        """Validate the index against the end of the log and rebuild it if they disagree."""
+        log_size = self.path.stat().st_size if self.path.exists() else 0
+        index_size = self.index_path.stat().st_size if self.index_path.exists() else 0
+        count = index_size // _OFFSET.size
+        
+        if index_size % _OFFSET.size == 0 and (count > 0 or log_size == 0):
+            if count == 0:
+                return 0
+            last = self._offset(count - 1)
+            if last < log_size:
+                with open(self.path, "rb") as log:
+                    log.seek(last)
+                    tail = log.read()
+                # The last indexed record must be the last complete line of the log
+                if tail.endswith(b"\n") and tail.count(b"\n") == 1:
+                    return count
+        return self._rebuild_index(log_size)
+    
+    def _rebuild_index(self, log_size: int) -> int:
+        """Re-index the log, dropping a partially written last line."""
+        offsets = []
+        end = 0
+        if log_size:
+            with open(self.path, "rb") as log:
+                for line in iter(log.readline, b""):
+                    if not line.endswith(b"\n"):
+                        break
+                    offsets.append(_OFFSET.pack(end))
+                    end += len(line)
+        if end < log_size:
+            with open(self.path, "r+b") as log:
+                log.truncate(end)
+        with open(self.index_path, "wb") as index:
+            index.write(b"".join(offsets))
+        
+        self.logger.warning(
+            "Rebuilt conversation log index",
+            path=str(self.path),
+            records=len(offsets),
+            truncated_bytes=log_size - end
+        )
+        return len(offsets)
+
+
+class AppendOnlyChatMessageHistory(BaseChatMessageHistory):
+    """
+    LangChain chat history backed by a ConversationStore.
+    
+    Messages are stored with LangChain's message_to_dict format plus a
+    timestamp, one per line.
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a conversation's message history.
+        
+        Args:
+            path: Log file path (.jsonl)
+        """
+        self.store = ConversationStore(path)
+    
+    @property
+    def messages(self) -> List[BaseMessage]:  # type: ignore[override]
+        """All messages, oldest first."""
+        return messages_from_dict(self.store.read())
+    
+    def __len__(self) -> int:
+        return len(self.store)
+    
+    def tail(self, count: int) -> List[BaseMessage]:
+        """The last count messages, read without loading the rest of the log."""
+        return messages_from_dict(self.store.tail(count))
+    
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        self.store.append([{**message_to_dict(message), "timestamp": timestamp} for message in messages])
+    
+    def clear(self) -> None:
+        self.store.clear()
+
+
+def count_messages(history: BaseChatMessageHistory) -> int:
+    """Number of messages in a history, without loading an append-only one."""
+    return len(history) if isinstance(history, AppendOnlyChatMessageHistory) else len(history.messages)
+
+
+def tail_messages(history: BaseChatMessageHistory, count: Optional[int]) -> List[BaseMessage]:
+    """The last count messages of a history (all of them if count is None)."""
+    if count is None:
+        return history.messages
+    if isinstance(history, AppendOnlyChatMessageHistory):
+        return history.tail(count)
+    return history.messages[-count:] if count > 0 else []
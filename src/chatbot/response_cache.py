@@ -0,0 +1,441 @@
+"""
+SemanticResponseCache - Reuse answers to repeated analyst questions.
+
+Analysts often ask nearly the same question ("total assets of Wells Fargo",
+"Wells Fargo total assets?") and each one went through the full model and
+tool pipeline. The cache embeds the normalized question and looks it up in a
+small in-process vector index; an answer to a question at least
+``similarity_threshold`` similar is returned instead, with its provenance.
+
+Answers are only reused within the same scope:
+
+- the report date the answer's data is for: dates named in the question, or
+  the latest quarter whose call report data is published, so "latest"
+  answers expire when a new quarter's data appears
+- the numbers in the question (FDIC certificate, RSSD ID, years), which must
+  match exactly, as they barely move a question's embedding
+- the agent's context (system prompt, which covers prompt type, tools and
+  the general knowledge preference)
+
+Names move an embedding little too ("total assets of Wells Fargo" and "total
+assets of Bank of America" embed close together), so a similar answer is
+only reused when each capitalized name or ticker in either question also
+appears in the other.
+
+Questions referring back to the conversation ("what about its tier 1
+ratio?") depend on more than their text, so they are neither looked up nor
+stored.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+from langchain_core.embeddings import Embeddings
+
+from src.rag_access.search_cache import normalize_query
+
+logger = structlog.get_logger(__name__)
+
+# Words that make a question depend on earlier turns
+REFERENCE_WORDS = frozenset({
+    "it", "its", "they", "them", "their", "theirs", "this", "that", "these", "those",
+    "he", "she", "his", "her", "same", "above", "previous", "earlier", "again", "also", "else"
+})
+
+_QUARTER_ENDS = {1: "03-31", 2: "06-30", 3: "09-30", 4: "12-31"}
+_ISO_DATE = re.compile(r"\b((?:19|20)\d\d)-?(0[1-9]|1[0-2])-?(0[1-9]|[12]\d|3[01])\b")
+_QUARTER = re.compile(r"\b(?:q([1-4])\s*((?:19|20)\d\d)|((?:19|20)\d\d)\s*q([1-4]))\b")
+_NUMBER = re.compile(r"\d+")
+_WORD = re.compile(r"[a-z']+")
+_CAPITALIZED = re.compile(r"\b[A-Z][A-Za-z']*")
+
+# Capitalized words that are not names: question words and sentence starts
+ENTITY_STOP_WORDS = frozenset({
+    "what", "whats", "what's", "which", "who", "whose", "when", "where", "why", "how", "is", "are", "was",
+    "were", "does", "do", "did", "can", "could", "would", "should", "will", "show", "give", "list", "tell",
+    "compare", "find", "get", "please", "i", "me", "my", "the", "a", "an", "of", "for", "in", "on", "and",
+    "or", "to", "as", "at", "by", "from", "with", "total", "q"
+})
+
+
+def latest_report_date(today: Optional[date] = None, publication_lag_days: int = 45) -> str:
+    """
+    Most recent quarter end whose call report data is published.
+    
+    Args:
+        today: Date to compute for (default: today, UTC)
+        publication_lag_days: Days after a quarter end before its data is available
+    
+    Returns:
+        Quarter end as YYYY-MM-DD
+    """
+    available = (today or datetime.now(timezone.utc).date()) - timedelta(days=publication_lag_days)
+    quarter = (available.month - 1) // 3
+    year = available.year
+    if quarter == 0:
+        quarter, year = 4, year - 1
+    return f"{year}-{_QUARTER_ENDS[quarter]}"
+
+
+def question_scope(question: str, publication_lag_days: int = 45) -> Tuple[str, str]:
+    """
+    Report date and identifiers a question's answer depends on.
+    
+    Args:
+        question: Normalized question
+        publication_lag_days: Days after a quarter end before its data is available
+    
+    Returns:
+        (report date(s) as YYYY-MM-DD, comma-separated numbers other than dates)
+    """
+    dates = [f"{y}-{m}-{d}" for y, m, d in _ISO_DATE.findall(question)]
+    dates += [f"{y1 or y2}-{_QUARTER_ENDS[int(q1 or q2)]}" for q1, y1, y2, q2 in _QUARTER.findall(question)]
+    rest = _QUARTER.sub(" ", _ISO_DATE.sub(" ", question))
+    report_date = ",".join(sorted(set(dates))) or latest_report_date(publication_lag_days=publication_lag_days)
+    return report_date, ",".join(sorted(set(_NUMBER.findall(rest))))
+
+
+def question_entities(question: str) -> frozenset:
+    """
+    Names in a question: capitalized words and tickers other than question words.
+    
+    Args:
+        question: Question as asked (before normalization)
+    
+    Returns:
+        Casefolded names, e.g. {"wells", "fargo"}
+    """
+    words = (word.casefold() for word in _CAPITALIZED.findall(question))
+    return frozenset(word for word in words if word not in ENTITY_STOP_WORDS)
+
+
+def is_standalone(question: str) -> bool:
+    """Whether a normalized question can be answered without the conversation before it."""
+    return not REFERENCE_WORDS.intersection(_WORD.findall(question))
+
+
+@dataclass
+class CachedAnswer:
+    """An answer in the cache and where it came from."""
+    question: str
+    answer: str
+    report_date: str
+    conversation_id: Optional[str]
+    tools: List[str]
+    answered_at: str
+    expires_at: float
+    vector: np.ndarray = field(repr=False)
+    entities: frozenset = frozenset()
+    words: frozenset = field(default=frozenset(), repr=False)
+    hits: int = 0
+    
+    def same_entities(self, entities: frozenset, words: frozenset) -> bool:
+        """Whether every name in either question appears in the other."""
+        return self.entities <= words and entities <= self.words
+
+
+@dataclass
+class CacheHit:
+    """A cached answer reused for a question."""
+    entry: CachedAnswer
+    similarity: float
+    
+    @property
+    def answer(self) -> str:
+        return self.entry.answer
+    
+    def provenance(self) -> Dict[str, Any]:
+        """Where the reused answer came from, for the response."""
+        return {
+            "question": self.entry.question,
+            "similarity": round(self.similarity, 4),
+            "report_date": self.entry.report_date,
+            "answered_at": self.entry.answered_at,
+            "conversation_id": self.entry.conversation_id,
+            "tools": list(self.entry.tools),
+            "reuse_count": self.entry.hits
+        }
+
+
+class SemanticResponseCache:
+    """
+    In-process vector index of answers to standalone questions.
+    
+    Entries are grouped by scope; each scope's vectors are kept as one
+    normalized matrix, so a lookup is a single matrix-vector product.
+    Identical normalized questions are found without embedding them.
+    """
+    
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        similarity_threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl_seconds: float = 86400,
+        publication_lag_days: int = 45
+    ):
+        """
+        Initialize response cache.
+        
+        Args:
+            embeddings: Embedding model for questions
+            similarity_threshold: Cosine similarity needed to reuse an answer
+            max_entries: Answers kept (least recently used are evicted)
+            ttl_seconds: Lifetime of cached answers
+            publication_lag_days: Days after a quarter end before its data is the latest
+        """
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.publication_lag_days = publication_lag_days
+        
+        # (scope, normalized question) -> answer, least recently used first
+        self._entries: "OrderedDict[Tuple[str, str], CachedAnswer]" = OrderedDict()
+        # scope -> (keys, matrix of their vectors), rebuilt after the scope changes
+        self._matrices: Dict[str, Tuple[List[Tuple[str, str]], np.ndarray]] = {}
+        # Embeddings of recently looked-up questions, reused when the answer is stored
+        self._recent_vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"lookups": 0, "hits": 0, "exact_hits": 0, "misses": 0, "skipped": 0, "stored": 0, "errors": 0}
+        self._hit_similarity = 0.0
+        
+        self.logger = logger.bind(
+            log_type="CONVERSATION",
+            component="response_cache"
+        )
+    
+    async def lookup(self, question: str, context: str = "") -> Optional[CacheHit]:
+        """
+        Find a cached answer for a question.
+        
+        Args:
+            question: User question
+            context: Text the answer also depends on (the agent's system prompt)
+        
+        Returns:
+            The most similar cached answer at or above the threshold naming
+            the same entities, or None
+        """
+        normalized = normalize_query(question)
+        if not is_standalone(normalized):
+            self._count("skipped")
+            return None
+        scope, _ = self._scope(normalized, context)
+        self._count("lookups")
+        
+        with self._lock:
+            hit = self._record_hit((scope, normalized), 1.0, exact=True) if self._live_entry((scope, normalized)) else None
+        if hit is not None:
+            return hit
+        
+        vector = await self._embed(normalized)
+        if vector is None:
+            self._count("misses")
+            return None
+        entities, words = question_entities(question), frozenset(_WORD.findall(normalized))
+        with self._lock:
+            best = self._nearest(scope, vector, entities, words)
+            hit = self._record_hit(*best) if best is not None and best[1] >= self.similarity_threshold else None
+        if hit is not None:
+            return hit
+        
+        self._count("misses")
+        self.logger.debug(
+            "Response cache miss",
+            best_similarity=round(best[1], 4) if best else None
+        )
+        return None
+    
+    async def store(
+        self,
+        question: str,
+        answer: str,
+        context: str = "",
+        conversation_id: Optional[str] = None,
+        tools: Sequence[str] = ()
+    ) -> bool:
+        """
+        Cache the answer to a question.
+        
+        Args:
+            question: User question
+            answer: Answer to reuse
+            context: Text the answer also depends on (as for lookup)
+            conversation_id: Conversation the answer was given in
+            tools: Tools the answer was produced with
+        
+        Returns:
+            Whether the answer was stored
+        """
+        normalized = normalize_query(question)
+        if not answer.strip() or not is_standalone(normalized):
+            return False
+        vector = await self._embed(normalized)
+        if vector is None:
+            return False
+        scope, report_date = self._scope(normalized, context)
+        
+        with self._lock:
+            self._entries[(scope, normalized)] = CachedAnswer(
+                question=question,
+                answer=answer,
+                report_date=report_date,
+                conversation_id=conversation_id,
+                tools=list(dict.fromkeys(tools)),
+                answered_at=datetime.now(timezone.utc).isoformat(),
+                expires_at=time.monotonic() + self.ttl_seconds,
+                vector=vector,
+                entities=question_entities(question),
+                words=frozenset(_WORD.findall(normalized))
+            )
+            self._entries.move_to_end((scope, normalized))
+            self._matrices.pop(scope, None)
+            while len(self._entries) > self.max_entries:
+                (evicted_scope, _), _ = self._entries.popitem(last=False)
+                self._matrices.pop(evicted_scope, None)
+            self._stats["stored"] += 1
+        return True
+    
+    def clear(self) -> None:
+        """Remove every cached answer; statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+            self._recent_vectors.clear()
+        self.logger.info("Response cache cleared")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate and size of the cache."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        stats["hit_rate"] = round(stats["hits"] / stats["lookups"], 4) if stats["lookups"] else 0.0
+        stats["mean_hit_similarity"] = round(self._hit_similarity / stats["hits"], 4) if stats["hits"] else None
+        return stats
+    
+    def _scope(self, normalized: str, context: str) -> Tuple[str, str]:
+        report_date, identifiers = question_scope(normalized, self.publication_lag_days)
+        context_hash = hashlib.sha256(context.encode("utf-8")).hexdigest()[:16]
+        return f"{context_hash}|{report_date}|{identifiers}", report_date
+    
+    def _live_entry(self, key: Tuple[str, str]) -> Optional[CachedAnswer]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self._matrices.pop(key[0], None)
+            return None
+        return entry
+    
+    def _nearest(
+        self,
+        scope: str,
+        vector: np.ndarray,
+        entities: frozenset,
+        words: frozenset
+    ) -> Optional[Tuple[Tuple[str, str], float]]:
+        """
+        Most similar live entry naming the same entities; once similarities
+        drop below the threshold, the most similar remaining entry (a miss,
+        reported for logging).
+        """
+        if scope not in self._matrices:
+            keys = [key for key in list(self._entries) if key[0] == scope and self._live_entry(key) is not None]
+            if not keys:
+                return None
+            self._matrices[scope] = (keys, np.stack([self._entries[key].vector for key in keys]))
+        keys, matrix = self._matrices[scope]
+        similarities = matrix @ vector
+        for index in np.argsort(-similarities):
+            # Entries expired since the matrix was built are skipped; the next lookup rebuilds it
+            entry = self._live_entry(keys[index])
+            if entry is None:
+                continue
+            similarity = float(similarities[index])
+            if similarity < self.similarity_threshold or entry.same_entities(entities, words):
+                return keys[index], similarity
+        return None
+    
+    def _record_hit(self, key: Tuple[str, str], similarity: float, exact: bool = False) -> CacheHit:
+        """Count a hit on a live entry (called with the lock held)."""
+        entry = self._entries[key]
+        self._entries.move_to_end(key)
+        entry.hits += 1
+        self._stats["hits"] += 1
+        self._stats["exact_hits"] += exact
+        self._hit_similarity += similarity
+        self.logger.info(
+            "Response cache hit",
+            similarity=round(similarity, 4),
+            report_date=entry.report_date,
+            cached_question_length=len(entry.question)
+        )
+        return CacheHit(entry=entry, similarity=similarity)
+    
+    async def _embed(self, normalized: str) -> Optional[np.ndarray]:
+        """Unit-length embedding of a normalized question; None if the embedding model fails."""
+        with self._lock:
+            vector = self._recent_vectors.get(normalized)
+        if vector is not None:
+            return vector
+        try:
+            embedding = await self.embeddings.aembed_query(normalized)
+        except Exception as e:
+            self._count("errors")
+            self.logger.warning("Question embedding failed, response cache skipped", error=str(e))
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        vector = vector / norm if norm else vector
+        with self._lock:
+            self._recent_vectors[normalized] = vector
+            while len(self._recent_vectors) > 64:
+                self._recent_vectors.popitem(last=False)
+        return vector
+    
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+
+_shared_cache: Optional[SemanticResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache(settings: Any) -> Optional[SemanticResponseCache]:
+    """
+    Process-wide response cache configured by settings, shared by all agents.
+    
+    Args:
+        settings: Settings with the response cache fields
+    
+    Returns:
+        The cache, or None when response_cache_enabled is off or embeddings are unavailable
+    """
+    global _shared_cache
+    if not getattr(settings, "response_cache_enabled", False):
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            from src.utils.azure_langchain import create_azure_openai_embeddings
+            try:
+                embeddings = create_azure_openai_embeddings(settings)
+            except Exception as e:
+                logger.warning("Response cache disabled, embeddings unavailable", error=str(e))
+                return None
+            _shared_cache = SemanticResponseCache(
+                embeddings,
+                similarity_threshold=settings.response_cache_similarity_threshold,
+                max_entries=settings.response_cache_max_entries,
+                ttl_seconds=settings.response_cache_ttl_seconds,
+                publication_lag_days=settings.response_cache_publication_lag_days
+            )
+        return _shared_cache
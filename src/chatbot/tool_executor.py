@@ -0,0 +1,182 @@
+"""
+ParallelToolExecutor - Multi-step agent loop running tool calls concurrently.
+
+When the model asked for several tools in one turn (an FDIC lookup and a
+document search for a multi-domain question, say), AgentExecutor.invoke ran
+them one after another, and every banking tool's synchronous shim started its
+own event loop with asyncio.run. This executor drives the same OpenAI tools
+agent on one event loop instead:
+
+- the tool calls of a step are awaited together through the tools' async
+  implementations, so a step takes as long as its slowest tool
+- every tool call has its own timeout; a slow or failing tool becomes an
+  observation the model can react to, and the other results are kept
+- memory, iteration limit and output keys match the AgentExecutor it replaces
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import structlog
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+
+from src.utils.event_loop import iterate_sync, run_sync
+
+logger = structlog.get_logger(__name__)
+
+# Same final answers as AgentExecutor with early_stopping_method="force" and handle_parsing_errors=True
+STOPPED_OUTPUT = "Agent stopped due to iteration limit or time limit."
+PARSING_ERROR_OBSERVATION = "Invalid or incomplete response"
+
+
+class ParallelToolExecutor:
+    """
+    Async agent loop over an OpenAI tools agent runnable.
+    
+    A drop-in for the AgentExecutor used in multi-step mode: ``invoke`` and
+    ``stream`` take {"input": ...} and return or yield chunks with "output"
+    and "intermediate_steps".
+    """
+    
+    def __init__(
+        self,
+        agent: Runnable,
+        tools: Sequence[BaseTool],
+        memory: Optional[Any] = None,
+        max_iterations: int = 5,
+        tool_timeout_seconds: float = 60.0,
+        max_concurrent_tools: int = 4
+    ):
+        """
+        Initialize parallel tool executor.
+        
+        Args:
+            agent: Runnable from create_openai_tools_agent
+            tools: Tools the agent may call
+            memory: LangChain memory providing chat_history (optional)
+            max_iterations: Model calls allowed per turn
+            tool_timeout_seconds: Time allowed per tool call (0 = no limit)
+            max_concurrent_tools: Tool calls of one step run at the same time
+        """
+        self.agent = agent
+        self.tools = {tool.name: tool for tool in tools}
+        self.memory = memory
+        self.max_iterations = max_iterations
+        self.tool_timeout_seconds = tool_timeout_seconds
+        self.max_concurrent_tools = max_concurrent_tools
+        
+        self.logger = logger.bind(
+            log_type="SYSTEM",
+            component="parallel_tool_executor"
+        )
+    
+    def invoke(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one turn synchronously; see ainvoke."""
+        return run_sync(self.ainvoke(inputs))
+    
+    async def ainvoke(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one turn of the agent.
+        
+        Args:
+            inputs: Agent inputs with the user message under "input"
+        
+        Returns:
+            The inputs plus "output" (final answer), "intermediate_steps"
+            ((action, observation) pairs in the order the model requested them)
+            and "failed_tools" (tools that were unknown, timed out or raised)
+        """
+        result = dict(inputs)
+        async for chunk in self.astream(inputs):
+            result.update(chunk)
+        return result
+    
+    def stream(self, inputs: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Run one turn synchronously, yielding the chunks of astream as they are produced."""
+        return iterate_sync(self.astream(inputs))
+    
+    async def astream(self, inputs: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run one turn of the agent, yielding progress.
+        
+        Args:
+            inputs: Agent inputs with the user message under "input"
+        
+        Yields:
+            {"intermediate_steps": steps so far} after every step, then
+            {"output": final answer, "intermediate_steps": all steps, "failed_tools": failed tool names}
+        """
+        agent_inputs = dict(inputs)
+        if self.memory is not None:
+            agent_inputs.update(await self.memory.aload_memory_variables(inputs))
+        
+        # Created per turn: a semaphore must not outlive its event loop
+        limit = asyncio.Semaphore(self.max_concurrent_tools)
+        steps: List[Tuple[AgentAction, Any]] = []
+        failed_tools: List[str] = []
+        output = STOPPED_OUTPUT
+        for iteration in range(self.max_iterations):
+            try:
+                decision = await self.agent.ainvoke({**agent_inputs, "intermediate_steps": steps})
+            except OutputParserException as e:
+                steps.append((AgentAction("_Exception", PARSING_ERROR_OBSERVATION, str(e)), PARSING_ERROR_OBSERVATION))
+                yield {"intermediate_steps": list(steps)}
+                continue
+            
+            if isinstance(decision, AgentFinish):
+                output = decision.return_values.get("output", "")
+                break
+            
+            actions = [decision] if isinstance(decision, AgentAction) else list(decision)
+            start = time.perf_counter()
+            observations = await asyncio.gather(*(self._run_tool(action, limit, failed_tools) for action in actions))
+            self.logger.debug(
+                "Agent step completed",
+                iteration=iteration + 1,
+                tools=[action.tool for action in actions],
+                step_time=time.perf_counter() - start
+            )
+            steps.extend(zip(actions, observations))
+            yield {"intermediate_steps": list(steps)}
+        else:
+            self.logger.warning("Agent stopped at iteration limit", max_iterations=self.max_iterations)
+        
+        if self.memory is not None:
+            await self.memory.asave_context({"input": inputs["input"]}, {"output": output})
+        yield {"output": output, "intermediate_steps": steps, "failed_tools": failed_tools}
+    
+    async def _run_tool(self, action: AgentAction, limit: asyncio.Semaphore, failed_tools: List[str]) -> Any:
+        """Run one tool call, turning unknown tools, timeouts and errors into observations listed in failed_tools."""
+        tool = self.tools.get(action.tool)
+        if tool is None:
+            failed_tools.append(action.tool)
+            return f"{action.tool} is not a valid tool, try one of [{', '.join(self.tools)}]."
+        
+        async with limit:
+            start = time.perf_counter()
+            try:
+                # Tools without an async implementation run on the default thread pool
+                observation = await asyncio.wait_for(
+                    tool.ainvoke(action.tool_input),
+                    self.tool_timeout_seconds or None
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    "Tool call timed out",
+                    tool=action.tool,
+                    timeout_seconds=self.tool_timeout_seconds
+                )
+                failed_tools.append(action.tool)
+                return f"Tool {action.tool} timed out after {self.tool_timeout_seconds} seconds; answer without it or try again."
+            except Exception as e:
+                self.logger.warning("Tool call failed", tool=action.tool, error=str(e))
+                failed_tools.append(action.tool)
+                return f"Tool {action.tool} failed: {e}"
+        
+        self.logger.debug("Tool call completed", tool=action.tool, tool_time=time.perf_counter() - start)
+        return observation
+
@@ -280,6 +280,65 @@ class Settings(BaseSettings):
         env='CONVERSATION_MEMORY_TYPE',
         description="Type of conversation memory (buffer, buffer_window, summary)"
     )
+    conversation_memory_max_tokens: int = Field(
+        3000,
+        ge=200,
+        le=100000,
+        env='CONVERSATION_MEMORY_MAX_TOKENS',
+        description="Tokens of conversation history sent with each prompt in buffer_window and summary memory"
+    )
+    conversation_message_max_tokens: int = Field(
+        800,
+        ge=50,
+        le=100000,
+        env='CONVERSATION_MESSAGE_MAX_TOKENS',
+        description="Messages in history longer than this are condensed (buffer_window and summary memory)"
+    )
+    agent_tool_timeout_seconds: float = Field(
+        60.0,
+        ge=0,
+        env='AGENT_TOOL_TIMEOUT_SECONDS',
+        description="Time allowed per tool call in multi-step mode before the agent continues without it (0 = no limit)"
+    )
+    agent_max_concurrent_tools: int = Field(
+        4,
+        ge=1,
+        le=32,
+        env='AGENT_MAX_CONCURRENT_TOOLS',
+        description="Tool calls of one agent step run at the same time in multi-step mode"
+    )
+    response_cache_enabled: bool = Field(
+        False,
+        env='RESPONSE_CACHE_ENABLED',
+        description="Reuse answers to near-identical standalone questions (semantic response cache)"
+    )
+    response_cache_similarity_threshold: float = Field(
+        0.95,
+        ge=0.8,
+        le=1.0,
+        env='RESPONSE_CACHE_SIMILARITY_THRESHOLD',
+        description="Cosine similarity of question embeddings needed to reuse a cached answer"
+    )
+    response_cache_max_entries: int = Field(
+        1000,
+        ge=1,
+        le=100000,
+        env='RESPONSE_CACHE_MAX_ENTRIES',
+        description="Answers kept in the semantic response cache"
+    )
+    response_cache_ttl_seconds: int = Field(
+        86400,
+        ge=60,
+        env='RESPONSE_CACHE_TTL_SECONDS',
+        description="Lifetime of cached answers in seconds"
+    )
+    response_cache_publication_lag_days: int = Field(
+        45,
+        ge=0,
+        le=180,
+        env='RESPONSE_CACHE_PUBLICATION_LAG_DAYS',
+        description="Days after a quarter end before its call report data counts as the latest (scopes cached answers)"
+    )
     
     # Logging Configuration
     log_level: str = Field(
@@ -355,11 +414,51 @@ class Settings(BaseSettings):
         env='CHROMADB_STORAGE_PATH',
         description="Local ChromaDB storage directory path"
     )
+    chromadb_max_workers: int = Field(
+        4,
+        ge=1,
+        le=64,
+        env='CHROMADB_MAX_WORKERS',
+        description="Worker threads for ChromaDB operations (bounds concurrent reads and writes)"
+    )
+    chromadb_operation_timeout_seconds: float = Field(
+        30.0,
+        ge=0,
+        le=3600,
+        env='CHROMADB_OPERATION_TIMEOUT_SECONDS',
+        description="Timeout for a single ChromaDB operation (0 = no timeout)"
+    )
     enable_rag: bool = Field(
         True,
         env='ENABLE_RAG',
         description="Enable RAG (Retrieval-Augmented Generation) functionality"
     )
+    hybrid_search_enabled: bool = Field(
+        True,
+        env='HYBRID_SEARCH_ENABLED',
+        description="Combine BM25 keyword search with vector search for document retrieval"
+    )
+    hybrid_search_rrf_k: int = Field(
+        60,
+        ge=1,
+        le=1000,
+        env='HYBRID_SEARCH_RRF_K',
+        description="Reciprocal rank fusion constant (higher values flatten rank differences)"
+    )
+    search_cache_ttl_seconds: int = Field(
+        600,
+        ge=0,
+        le=86400,
+        env='SEARCH_CACHE_TTL_SECONDS',
+        description="Lifetime of cached query embeddings and search results (0 = disabled)"
+    )
+    search_cache_max_entries: int = Field(
+        512,
+        ge=1,
+        le=100000,
+        env='SEARCH_CACHE_MAX_ENTRIES',
+        description="Maximum cached query embeddings and search results, each"
+    )
     
     # Document Processing Configuration
     chunk_size: int = Field(
@@ -383,7 +482,73 @@ class Settings(BaseSettings):
         env='MAX_FILE_SIZE_MB',
         description="Maximum file size for document uploads (MB)"
     )
-    
+
+    # Document Ingestion Pipeline Configuration
+    ingestion_extract_workers: int = Field(
+        2,
+        ge=0,
+        le=32,
+        env='INGESTION_EXTRACT_WORKERS',
+        description="Worker processes for text extraction (0 = extract in a thread)"
+    )
+    pdf_pages_per_extraction_task: int = Field(
+        32,
+        ge=1,
+        le=10000,
+        env='PDF_PAGES_PER_EXTRACTION_TASK',
+        description="PDF pages per extraction worker task; longer PDFs are split across workers by page range"
+    )
+    extraction_timeout_seconds: float = Field(
+        300.0,
+        ge=0,
+        env='EXTRACTION_TIMEOUT_SECONDS',
+        description="Time allowed to extract the text of one file in the worker processes (0 = no limit)"
+    )
+    embedding_concurrency: int = Field(
+        4,
+        ge=1,
+        le=64,
+        env='EMBEDDING_CONCURRENCY',
+        description="Embedding requests in flight at once during ingestion"
+    )
+    embedding_batch_size: int = Field(
+        64,
+        ge=1,
+        le=2048,
+        env='EMBEDDING_BATCH_SIZE',
+        description="Chunks embedded per embedding request"
+    )
+    embedding_requests_per_minute: int = Field(
+        1440,
+        ge=0,
+        env='EMBEDDING_REQUESTS_PER_MINUTE',
+        description="Embedding deployment request quota per minute (0 = unlimited)"
+    )
+    embedding_tokens_per_minute: int = Field(
+        240000,
+        ge=0,
+        env='EMBEDDING_TOKENS_PER_MINUTE',
+        description="Embedding deployment token quota per minute (0 = unlimited)"
+    )
+    chromadb_write_batch_size: int = Field(
+        256,
+        ge=1,
+        le=5000,
+        env='CHROMADB_WRITE_BATCH_SIZE',
+        description="Embedded chunks written to ChromaDB per write"
+    )
+    embedding_cache_path: Optional[str] = Field(
+        "./data/embedding_cache",
+        env='EMBEDDING_CACHE_PATH',
+        description="Directory for the persistent chunk embedding cache (empty to disable)"
+    )
+    embedding_cache_max_entries: int = Field(
+        200000,
+        ge=1000,
+        env='EMBEDDING_CACHE_MAX_ENTRIES',
+        description="Maximum number of cached chunk embeddings"
+    )
+
     # Streamlit Configuration
     streamlit_port: int = Field(
         8501,
@@ -506,6 +671,18 @@ class Settings(BaseSettings):
         env='FFIEC_CDR_CACHE_TTL',
         description="FFIEC CDR call report data cache TTL in seconds (5 min to 2 hours)"
     )
+    ffiec_facsimile_cache_path: Optional[str] = Field(
+        "./data/ffiec_facsimiles",
+        env='FFIEC_FACSIMILE_CACHE_PATH',
+        description="Directory for the persistent FFIEC facsimile cache (empty to disable)"
+    )
+    ffiec_facsimile_cache_max_mb: int = Field(
+        512,
+        ge=16,
+        le=16384,
+        env='FFIEC_FACSIMILE_CACHE_MAX_MB',
+        description="Maximum size of the persistent FFIEC facsimile cache in megabytes"
+    )
     
     # Feature Flags
     enable_conversation_logging: bool = Field(
@@ -13,23 +13,35 @@ Used by: Streamlit UI, admin tools, document APIs, bulk operations
 
 from .document_manager import DocumentManager
 from .document_models import (
-    DocumentInfo, DocumentStats, UploadResult, DeleteResult, DocumentStatus,
-    DocumentChunk, Document, RAGQuery, RAGResponse
+    DocumentInfo, DocumentStats, UploadResult, UpdateResult, DeleteResult, DocumentStatus,
+    DocumentChunk, Document, RAGQuery, RAGResponse, IngestionFile
 )
 from .database_manager import DatabaseManager
 from .chromadb_service import ChromaDBService
 from .document_processor import DocumentProcessor
+from .ingestion_pipeline import IngestionPipeline, EmbeddingRateLimiter
+from .embedding_cache import EmbeddingCache, CachedEmbeddings
+from .keyword_index import KeywordIndex
+from .document_catalog import DocumentCatalog
 
 __all__ = [
     'DocumentManager',
     'DocumentInfo', 
     'DocumentStats',
     'UploadResult',
+    'UpdateResult',
     'DeleteResult', 
     'DocumentStatus',
     'DatabaseManager',
     'ChromaDBService',
     'DocumentProcessor',
+    'IngestionPipeline',
+    'EmbeddingRateLimiter',
+    'IngestionFile',
+    'EmbeddingCache',
+    'CachedEmbeddings',
+    'KeywordIndex',
+    'DocumentCatalog',
     'DocumentChunk',
     'Document',
     'RAGQuery', 
@@ -8,14 +8,22 @@ Handles all ChromaDB-specific operations including:
 - Telemetry suppression and error handling
 - Database health and persistence
 
+ChromaDB's client is synchronous, so every call runs on a bounded thread pool
+owned by the service, keeping the event loop free for concurrent requests.
+
 This class contains ONLY ChromaDB-specific logic and has no knowledge of
 document management business logic.
 """
 
 import os
 import asyncio
+import contextvars
+import functools
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import AsyncIterator, Callable, List, Optional, Dict, Any, Tuple, TypeVar
 from datetime import datetime, timezone
 import logging
 import warnings
@@ -29,6 +37,9 @@ from langchain_core.documents import Document as LangChainDocument
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config.settings import Settings
+from .document_catalog import DocumentCatalog
+from .embedding_cache import CachedEmbeddings, EmbeddingCache, chunk_content_hash
+from .keyword_index import KeywordIndex
 
 # Global ChromaDB telemetry suppression - prevent telemetry errors
 os.environ["ANONYMIZED_TELEMETRY"] = "False"
@@ -52,6 +63,28 @@ except ImportError:
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Modification counters per (persist directory, collection), shared by every
+# service instance in the process so caches see writes made through any of them
+_collection_versions: Dict[Tuple[str, str], int] = {}
+_collection_versions_lock = threading.Lock()
+
+# Keyword indexes per index directory, shared the same way so chunks written
+# through one service are keyword-searchable through every other
+_keyword_indexes: Dict[str, KeywordIndex] = {}
+_keyword_indexes_lock = threading.Lock()
+
+
+def _shared_keyword_index(index_dir: Path) -> KeywordIndex:
+    """Return the process-wide keyword index stored in index_dir, loading it on first use."""
+    key = str(index_dir.resolve())
+    with _keyword_indexes_lock:
+        index = _keyword_indexes.get(key)
+        if index is None:
+            index = _keyword_indexes[key] = KeywordIndex(key)
+        return index
+
 
 class ChromaDBService:
     """
@@ -96,9 +129,35 @@ class ChromaDBService:
         # Initialize Azure OpenAI embeddings
         self.embeddings = self._create_embeddings()
         
+        # Reuse embeddings of chunk text that was embedded before
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        if settings.embedding_cache_path:
+            self.embedding_cache = EmbeddingCache(
+                settings.embedding_cache_path,
+                deployment=settings.azure_embedding_deployment,
+                max_entries=settings.embedding_cache_max_entries
+            )
+            self.embeddings = CachedEmbeddings(self.embeddings, self.embedding_cache)
+        
+        # Keyword index for exact identifiers, persisted next to the collection
+        self.keyword_index: Optional[KeywordIndex] = None
+        if settings.hybrid_search_enabled:
+            self.keyword_index = _shared_keyword_index(self.persist_directory / "keyword_index")
+        
+        # Per-file records, so listings never load chunk text
+        self.catalog = DocumentCatalog(str(self.persist_directory))
+        
+        # Blocking ChromaDB calls run here; the pool size bounds concurrent operations
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.chromadb_max_workers,
+            thread_name_prefix="chromadb"
+        )
+        self.operation_timeout = settings.chromadb_operation_timeout_seconds
+        
         # ChromaDB instance (initialized lazily)
         self._db: Optional[Chroma] = None
         self._collection_name = "rag_documents"
+        self._version_key = (str(self.persist_directory.resolve()), self._collection_name)
         
         self.logger.info(
             "ChromaDBService initialized",
@@ -136,6 +195,72 @@ class ChromaDBService:
             )
             raise
     
+    @property
+    def collection_version(self) -> int:
+        """Counter incremented whenever the collection's contents change in this process."""
+        return _collection_versions.get(self._version_key, 0)
+    
+    def _mark_modified(self) -> None:
+        """Record a change to the collection's contents."""
+        with _collection_versions_lock:
+            _collection_versions[self._version_key] = _collection_versions.get(self._version_key, 0) + 1
+    
+    async def _run(self, operation: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking call on the ChromaDB executor.
+        
+        Awaiting callers can be cancelled, and calls still queued when that
+        happens never run. A call that has already started finishes in its
+        worker thread even after a timeout, since threads cannot be interrupted.
+        
+        Args:
+            operation: Operation name used in logs and errors
+            func: Blocking function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The function's return value
+            
+        Raises:
+            TimeoutError: If the call takes longer than the operation timeout
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        timeout = self.operation_timeout or None
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(self._executor, call), timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                "ChromaDB operation timed out",
+                operation=operation,
+                timeout_seconds=timeout
+            )
+            raise TimeoutError(f"ChromaDB {operation} timed out after {timeout} seconds") from None
+    
+    def _open_collection(self) -> Chroma:
+        """Open the persistent client and collection (blocking)."""
+        # Configure ChromaDB settings with telemetry disabled
+        chroma_settings = ChromaSettings(
+            anonymized_telemetry=False,
+            allow_reset=True,
+            is_persistent=True
+        )
+        
+        # Initialize ChromaDB client
+        client = chromadb.PersistentClient(
+            path=str(self.persist_directory),
+            settings=chroma_settings
+        )
+        
+        # Create LangChain Chroma instance
+        return Chroma(
+            client=client,
+            collection_name=self._collection_name,
+            embedding_function=self.embeddings,
+            persist_directory=str(self.persist_directory)
+        )
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
@@ -154,30 +279,21 @@ class ChromaDBService:
             return self._db
         
         try:
-            # Configure ChromaDB settings with telemetry disabled
-            chroma_settings = ChromaSettings(
-                anonymized_telemetry=False,
-                allow_reset=True,
-                is_persistent=True
-            )
-            
-            # Initialize ChromaDB client
-            client = chromadb.PersistentClient(
-                path=str(self.persist_directory),
-                settings=chroma_settings
-            )
-            
-            # Create LangChain Chroma instance
-            self._db = Chroma(
-                client=client,
-                collection_name=self._collection_name,
-                embedding_function=self.embeddings,
-                persist_directory=str(self.persist_directory)
-            )
+            db = await self._run("initialize", self._open_collection)
+            if self._db is not None:
+                # Another caller finished initializing first
+                return self._db
+            self._db = db
             
             # Test the collection
             collection_count = await self._get_collection_count()
             
+            # Rebuild the catalog and keyword index if they are missing chunks or out of sync
+            if await self._run("catalog count", self.catalog.chunk_count) != collection_count:
+                await self._rebuild_catalog()
+            if self.keyword_index is not None and len(self.keyword_index) != collection_count:
+                await self._rebuild_keyword_index()
+            
             self.logger.info(
                 "ChromaDB collection initialized successfully",
                 collection_name=self._collection_name,
@@ -230,8 +346,12 @@ class ChromaDBService:
                 batch = documents[i:i + batch_size]
                 
                 # Add batch to collection
-                batch_ids = db.add_documents(batch)
+                batch_ids = await self._run("add", db.add_documents, batch)
                 added_ids.extend(batch_ids)
+                self._mark_modified()
+                await self._run("catalog add", self.catalog.add, batch_ids, [doc.metadata for doc in batch])
+                if self.keyword_index is not None:
+                    await self._run("keyword index add", self.keyword_index.add, batch_ids, [doc.page_content for doc in batch])
                 
                 self.logger.debug(
                     "Added document batch to ChromaDB",
@@ -259,12 +379,80 @@ class ChromaDBService:
             )
             raise
     
+    async def add_embedded_documents(
+        self,
+        documents: List[LangChainDocument],
+        embeddings: List[List[float]]
+    ) -> List[str]:
+        """
+        Add documents whose embeddings were already computed.
+        
+        Used by the ingestion pipeline, which embeds chunks concurrently and
+        writes them in large batches. The write runs on the ChromaDB executor
+        so embedding requests keep flowing while ChromaDB persists.
+        
+        Args:
+            documents: LangChain documents to add
+            embeddings: One embedding vector per document
+        
+        Returns:
+            List of document IDs that were added
+        """
+        if not documents:
+            return []
+        if len(documents) != len(embeddings):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(documents)} documents")
+        
+        db = await self.initialize_collection()
+        ids = [str(uuid.uuid4()) for _ in documents]
+        
+        try:
+            await self._run(
+                "add",
+                db._collection.add,
+                ids=ids,
+                embeddings=embeddings,
+                documents=[doc.page_content for doc in documents],
+                metadatas=[doc.metadata or None for doc in documents]
+            )
+            self._mark_modified()
+            await self._run("catalog add", self.catalog.add, ids, [doc.metadata for doc in documents])
+            if self.keyword_index is not None:
+                await self._run("keyword index add", self.keyword_index.add, ids, [doc.page_content for doc in documents])
+            
+            self.logger.debug(
+                "Added embedded document batch to ChromaDB",
+                document_count=len(documents)
+            )
+            return ids
+        
+        except Exception as e:
+            self.logger.error(
+                "Failed to add embedded documents to ChromaDB",
+                error=str(e),
+                document_count=len(documents)
+            )
+            raise
+    
+    async def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a search query.
+        
+        Args:
+            query: Search query text
+            
+        Returns:
+            Query embedding
+        """
+        return await self.embeddings.aembed_query(query)
+    
     async def search_similar(
         self,
         query: str,
         k: int = 4,
         score_threshold: float = 0.2,
-        filter_metadata: Optional[Dict[str, Any]] = None
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents in ChromaDB.
@@ -274,6 +462,7 @@ class ChromaDBService:
             k: Number of results to return
             score_threshold: Minimum similarity score
             filter_metadata: Optional metadata filters
+            query_embedding: Precomputed embedding of the query (embedded here if None)
             
         Returns:
             List of search results with content and metadata
@@ -281,9 +470,13 @@ class ChromaDBService:
         db = await self.initialize_collection()
         
         try:
-            # Perform similarity search
-            results = db.similarity_search_with_score(
-                query=query,
+            # Embed with the async client, then search on the executor
+            if query_embedding is None:
+                query_embedding = await self.embed_query(query)
+            results = await self._run(
+                "similarity search",
+                db.similarity_search_by_vector_with_relevance_scores,
+                embedding=query_embedding,
                 k=k,
                 filter=filter_metadata
             )
@@ -293,6 +486,7 @@ class ChromaDBService:
             for doc, score in results:
                 if score >= score_threshold:
                     filtered_results.append({
+                        "id": doc.id,
                         "content": doc.page_content,
                         "metadata": doc.metadata,
                         "score": score,
@@ -317,6 +511,148 @@ class ChromaDBService:
             )
             raise
     
+    async def keyword_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search chunks by keywords with BM25.
+        
+        Args:
+            query: Search query text
+            k: Number of results to return
+            filter_metadata: Optional metadata filters
+            
+        Returns:
+            List of search results with content, metadata and BM25 score, best first
+        """
+        if self.keyword_index is None:
+            return []
+        
+        db = await self.initialize_collection()
+        
+        try:
+            # Filtered searches rank only the chunks matching the filter
+            scoped_ids = None
+            if filter_metadata:
+                matching = await self._run("get", db._collection.get, where=filter_metadata, include=[])
+                scoped_ids = matching['ids']
+                if not scoped_ids:
+                    return []
+            ranked = await self._run("keyword search", self.keyword_index.search, query, k, scoped_ids)
+            if not ranked:
+                return []
+            
+            scores = dict(ranked)
+            stored = await self._run(
+                "get",
+                db._collection.get,
+                ids=list(scores),
+                include=["documents", "metadatas"]
+            )
+            results = [
+                {
+                    "id": chunk_id,
+                    "content": text,
+                    "metadata": metadata or {},
+                    "score": scores[chunk_id],
+                    "source": (metadata or {}).get("source", "unknown")
+                }
+                for chunk_id, text, metadata in zip(stored['ids'], stored['documents'], stored['metadatas'])
+            ]
+            results.sort(key=lambda result: result["score"], reverse=True)
+            
+            self.logger.debug(
+                "Keyword search completed",
+                query_length=len(query),
+                results_found=len(results)
+            )
+            return results[:k]
+            
+        except Exception as e:
+            self.logger.error(
+                "Keyword search failed",
+                error=str(e),
+                query_length=len(query)
+            )
+            raise
+    
+    async def _rebuild_keyword_index(self) -> None:
+        """Rebuild the keyword index from every chunk in the collection."""
+        await self._run("keyword index clear", self.keyword_index.clear)
+        async for page in self._scan_collection(include=["documents"]):
+            await self._run(
+                "keyword index add",
+                self.keyword_index.add,
+                page['ids'],
+                [text or "" for text in page['documents']],
+                journal=False
+            )
+        await self._run("keyword index flush", self.keyword_index.flush, force=True)
+        self.logger.info("Keyword index rebuilt", chunk_count=len(self.keyword_index))
+    
+    async def _rebuild_catalog(self) -> None:
+        """Rebuild the document catalog from the metadata of every chunk."""
+        await self._run("catalog clear", self.catalog.clear)
+        async for page in self._scan_collection(include=["metadatas"]):
+            await self._run("catalog add", self.catalog.add, page['ids'], page['metadatas'])
+        self.logger.info("Document catalog rebuilt", chunk_count=await self._run("catalog count", self.catalog.chunk_count))
+    
+    async def _scan_collection(self, include: List[str], page_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Walk the whole collection in pages.
+        
+        Args:
+            include: Fields to load for each chunk (e.g. ["metadatas"])
+            page_size: Chunks loaded per ChromaDB call
+            
+        Yields:
+            ChromaDB get results of up to page_size chunks
+        """
+        offset = 0
+        while True:
+            page = await self._run(
+                "get",
+                self._db._collection.get,
+                include=include,
+                limit=page_size,
+                offset=offset
+            )
+            if not page['ids']:
+                return
+            yield page
+            offset += len(page['ids'])
+    
+    async def list_documents(self) -> List[Dict[str, Any]]:
+        """
+        Get one record per stored file from the document catalog.
+        
+        Returns:
+            Document records, newest upload first
+        """
+        await self.initialize_collection()
+        return await self._run("catalog list", self.catalog.list_documents)
+    
+    async def get_filenames(
+        self,
+        uploaded_from: Optional[str] = None,
+        uploaded_before: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get the sorted filenames of stored documents from the document catalog.
+        
+        Args:
+            uploaded_from: Only files uploaded at or after this UTC ISO timestamp
+            uploaded_before: Only files uploaded before this UTC ISO timestamp
+        
+        Returns:
+            Filenames, excluding chunks without a filename
+        """
+        await self.initialize_collection()
+        return await self._run("catalog filenames", self.catalog.filenames, uploaded_from, uploaded_before)
+    
     async def delete_documents_by_filter(
         self,
         filter_metadata: Dict[str, Any]
@@ -339,10 +675,14 @@ class ChromaDBService:
             collection = db._collection
             
             # Get documents matching filter
-            results = collection.get(where=filter_metadata)
+            results = await self._run("get", collection.get, where=filter_metadata, include=[])
             
             if results['ids']:
-                collection.delete(ids=results['ids'])
+                await self._run("delete", collection.delete, ids=results['ids'])
+                self._mark_modified()
+                await self._run("catalog remove", self.catalog.remove, results['ids'])
+                if self.keyword_index is not None:
+                    await self._run("keyword index remove", self.keyword_index.remove, results['ids'])
                 await self.persist()
                 
                 self.logger.info(
@@ -383,7 +723,11 @@ class ChromaDBService:
         
         try:
             collection = db._collection
-            collection.delete(ids=document_ids)
+            await self._run("delete", collection.delete, ids=document_ids)
+            self._mark_modified()
+            await self._run("catalog remove", self.catalog.remove, document_ids)
+            if self.keyword_index is not None:
+                await self._run("keyword index remove", self.keyword_index.remove, document_ids)
             await self.persist()
             
             self.logger.info(
@@ -401,6 +745,54 @@ class ChromaDBService:
             )
             return False
     
+    async def get_chunk_metadata(self, filter_metadata: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metadata of every chunk matching a filter, keyed by chunk ID.
+        
+        Chunks stored before content hashes were recorded get their
+        ``content_hash`` computed from the stored text.
+        
+        Args:
+            filter_metadata: Metadata filter criteria
+            
+        Returns:
+            Chunk metadata by ChromaDB ID
+        """
+        db = await self.initialize_collection()
+        collection = db._collection
+        
+        results = await self._run("get", collection.get, where=filter_metadata, include=["metadatas"])
+        chunks = {
+            chunk_id: dict(metadata or {})
+            for chunk_id, metadata in zip(results['ids'], results['metadatas'])
+        }
+        
+        unhashed = [chunk_id for chunk_id, metadata in chunks.items() if 'content_hash' not in metadata]
+        if unhashed:
+            stored = await self._run("get", collection.get, ids=unhashed, include=["documents"])
+            for chunk_id, text in zip(stored['ids'], stored['documents']):
+                chunks[chunk_id]['content_hash'] = chunk_content_hash(text or "")
+        
+        return chunks
+    
+    async def update_chunk_metadata(self, chunk_ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """
+        Replace the metadata of stored chunks without touching their embeddings.
+        
+        Args:
+            chunk_ids: ChromaDB IDs of the chunks
+            metadatas: New metadata, one per chunk
+        """
+        if not chunk_ids:
+            return
+        
+        db = await self.initialize_collection()
+        await self._run("update", db._collection.update, ids=chunk_ids, metadatas=metadatas)
+        self._mark_modified()
+        await self._run("catalog update", self.catalog.add, chunk_ids, metadatas)
+        
+        self.logger.debug("Updated chunk metadata in ChromaDB", chunk_count=len(chunk_ids))
+    
     async def get_all_documents(
         self,
         limit: Optional[int] = None,
@@ -420,7 +812,9 @@ class ChromaDBService:
         
         try:
             collection = db._collection
-            results = collection.get(
+            results = await self._run(
+                "get",
+                collection.get,
                 limit=limit,
                 offset=offset,
                 include=['documents', 'metadatas']  # 'ids' is returned by default
@@ -463,7 +857,7 @@ class ChromaDBService:
         
         try:
             collection = self._db._collection
-            return collection.count()
+            return await self._run("count", collection.count)
         except Exception as e:
             self.logger.warning(
                 "Failed to get collection count",
@@ -494,7 +888,9 @@ class ChromaDBService:
         try:
             # Force persistence - ChromaDB should auto-persist but this ensures it
             if hasattr(self._db, 'persist'):
-                self._db.persist()
+                await self._run("persist", self._db.persist)
+            if self.keyword_index is not None:
+                await self._run("keyword index flush", self.keyword_index.flush)
             
             self.logger.debug("ChromaDB persistence completed")
             return True
@@ -523,7 +919,8 @@ class ChromaDBService:
                 "document_count": doc_count,
                 "embeddings_configured": self.embeddings is not None,
                 "persist_directory_exists": self.persist_directory.exists(),
-                "persist_directory_writable": os.access(self.persist_directory, os.W_OK)
+                "persist_directory_writable": os.access(self.persist_directory, os.W_OK),
+                "embedding_cache": self.embedding_cache.stats() if self.embedding_cache else None
             }
             
             overall_healthy = all([
@@ -559,6 +956,10 @@ class ChromaDBService:
             self.embeddings is not None
         )
     
+    def close(self) -> None:
+        """Shut down the ChromaDB executor, letting running operations finish."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
     def __del__(self):
         """Cleanup ChromaDB resources."""
         try:
@@ -137,47 +137,15 @@ class DatabaseManager:
     
     async def get_documents_summary(self) -> List[Dict[str, Any]]:
         """
-        Get summary of all documents in the database with business logic formatting.
+        Get summary of all documents in the database.
         
         Returns:
-            List of document summaries with metadata
+            List of document summaries (filename, document_id, file_type,
+            size_bytes, upload_timestamp, chunk_count), newest upload first
         """
         try:
-            # Get all documents from ChromaDB service
-            all_docs = await self.chromadb.get_all_documents()
-            
-            if not all_docs:
-                return []
-            
-            # Business logic: Group by filename and format for UI
-            documents = {}
-            for doc in all_docs:
-                metadata = doc.get('metadata', {})
-                filename = metadata.get('filename', 'Unknown')
-                
-                if filename not in documents:
-                    documents[filename] = {
-                        'document_id': metadata.get('document_id', f"doc_{filename}"),
-                        'filename': filename,
-                        'file_type': metadata.get('file_type', 'unknown'),
-                        'size_bytes': metadata.get('file_size', 0),
-                        'upload_timestamp': metadata.get('upload_timestamp'),
-                        'chunk_count': 0,
-                        'chunk_ids': []
-                    }
-                
-                documents[filename]['chunk_count'] += 1
-                if 'chunk_id' in metadata:
-                    documents[filename]['chunk_ids'].append(metadata['chunk_id'])
-            
-            # Sort by upload timestamp (newest first)
-            document_list = list(documents.values())
-            document_list.sort(
-                key=lambda x: x.get('upload_timestamp', ''), 
-                reverse=True
-            )
-            
-            return document_list
+            # Per-file records come from the document catalog; no chunk is loaded
+            return await self.chromadb.list_documents()
             
         except Exception as e:
             self.logger.error("Failed to get documents summary", error=str(e))
@@ -204,7 +172,8 @@ class DatabaseManager:
         query: str,
         max_results: int = 3,
         score_threshold: float = 0.2,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents with business logic formatting.
@@ -214,6 +183,7 @@ class DatabaseManager:
             max_results: Maximum number of results
             score_threshold: Minimum similarity score
             filters: Optional metadata filters
+            query_embedding: Optional precomputed query embedding
             
         Returns:
             List of similar document chunks with scores
@@ -231,22 +201,12 @@ class DatabaseManager:
                 query=query,
                 k=max_results,
                 score_threshold=score_threshold,
-                filter_metadata=search_filters
+                filter_metadata=search_filters,
+                query_embedding=query_embedding
             )
             
             # Business logic: Format results for document management UI
-            formatted_results = []
-            for result in raw_results:
-                formatted_result = {
-                    'content': result.get('content', ''),
-                    'metadata': result.get('metadata', {}),
-                    'score': result.get('score', 0.0),
-                    'chunk_id': result['metadata'].get('chunk_id', f"chunk_{hash(result.get('content', ''))}"),
-                    'source': result.get('source', 'Unknown'),
-                    'filename': result['metadata'].get('filename', 'Unknown'),
-                    'file_type': result['metadata'].get('file_type', 'unknown')
-                }
-                formatted_results.append(formatted_result)
+            formatted_results = self._format_search_results(raw_results)
             
             # Sort by score (highest first)
             formatted_results.sort(key=lambda x: x['score'], reverse=True)
@@ -264,6 +224,55 @@ class DatabaseManager:
             self.logger.error("Document search failed", query=query[:100], error=str(e))
             return []
     
+    async def keyword_search(
+        self,
+        query: str,
+        max_results: int = 3,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search documents by keywords (exact identifiers, codes, names).
+        
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+            filters: Optional metadata filters
+            
+        Returns:
+            List of matching document chunks with BM25 scores, best first
+        """
+        try:
+            if not query or not query.strip():
+                return []
+            
+            raw_results = await self.chromadb.keyword_search(
+                query=query,
+                k=max_results,
+                filter_metadata=filters if filters else None
+            )
+            return self._format_search_results(raw_results)
+            
+        except Exception as e:
+            self.logger.error("Keyword search failed", query=query[:100], error=str(e))
+            return []
+    
+    def _format_search_results(self, raw_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Format raw ChromaDB search results for the search and UI layers."""
+        formatted_results = []
+        for result in raw_results:
+            formatted_result = {
+                'id': result.get('id'),
+                'content': result.get('content', ''),
+                'metadata': result.get('metadata', {}),
+                'score': result.get('score', 0.0),
+                'chunk_id': result['metadata'].get('chunk_id', f"chunk_{hash(result.get('content', ''))}"),
+                'source': result.get('source', 'Unknown'),
+                'filename': result['metadata'].get('filename', 'Unknown'),
+                'file_type': result['metadata'].get('file_type', 'unknown')
+            }
+            formatted_results.append(formatted_result)
+        return formatted_results
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform comprehensive health check on the database manager.
@@ -328,17 +337,23 @@ class DatabaseManager:
     
     # Additional business logic methods
     
-    async def get_unique_filenames(self) -> List[str]:
+    async def get_unique_filenames(
+        self,
+        uploaded_from: Optional[str] = None,
+        uploaded_before: Optional[str] = None
+    ) -> List[str]:
         """
         Get list of unique filenames in the database.
         
+        Args:
+            uploaded_from: Only files uploaded at or after this UTC ISO timestamp
+            uploaded_before: Only files uploaded before this UTC ISO timestamp
+        
         Returns:
             List of unique filenames
         """
         try:
-            documents_summary = await self.get_documents_summary()
-            filenames = [doc['filename'] for doc in documents_summary if doc['filename'] != 'Unknown']
-            return sorted(list(set(filenames)))
+            return await self.chromadb.get_filenames(uploaded_from, uploaded_before)
             
         except Exception as e:
             self.logger.error("Failed to get unique filenames", error=str(e))
@@ -0,0 +1,214 @@
+"""
+DocumentCatalog - Per-file records of the documents stored in ChromaDB.
+
+Listing documents used to load every chunk, including its full text, just to
+group chunks by filename. The catalog is a small SQLite sidecar next to the
+collection holding one record per file plus the ChromaDB IDs of its chunks,
+kept up to date by ChromaDBService on every add, update and delete, so
+listings, counts and filenames never touch chunk text.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+CATALOG_FILENAME = "document_catalog.sqlite3"
+
+UNKNOWN_FILENAME = "Unknown"
+
+_DOCUMENT_COLUMNS = ("filename", "document_id", "file_type", "size_bytes", "upload_timestamp", "chunk_count")
+
+
+class DocumentCatalog:
+    """
+    SQLite catalog of stored documents.
+    
+    Chunks are grouped by their ``filename`` metadata. The document record
+    takes its fields from the most recently written chunk of the file.
+    """
+    
+    def __init__(self, catalog_dir: str):
+        """
+        Initialize document catalog.
+        
+        Args:
+            catalog_dir: Directory holding the SQLite catalog file
+        """
+        self.catalog_dir = Path(catalog_dir)
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.catalog_dir / CATALOG_FILENAME),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "filename TEXT PRIMARY KEY, document_id TEXT, file_type TEXT, size_bytes INTEGER, "
+            "upload_timestamp TEXT, chunk_count INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS chunks (id TEXT PRIMARY KEY, filename TEXT NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS chunks_filename ON chunks (filename)")
+        
+        self.logger = logger.bind(
+            log_type="SYSTEM",
+            component="document_catalog"
+        )
+    
+    def add(self, chunk_ids: Sequence[str], metadatas: Sequence[Optional[Dict[str, Any]]]) -> None:
+        """
+        Record stored chunks, or chunks whose metadata was replaced.
+        
+        Args:
+            chunk_ids: ChromaDB chunk IDs
+            metadatas: Chunk metadata, one per chunk
+        """
+        if not chunk_ids:
+            return
+        
+        records: Dict[str, tuple] = {}
+        chunks = []
+        for chunk_id, metadata in zip(chunk_ids, metadatas):
+            metadata = metadata or {}
+            filename = metadata.get('filename') or UNKNOWN_FILENAME
+            chunks.append((chunk_id, filename))
+            records[filename] = (
+                filename,
+                metadata.get('document_id', f"doc_{filename}"),
+                metadata.get('file_type', 'unknown'),
+                metadata.get('file_size', 0),
+                metadata.get('upload_timestamp')
+            )
+        
+        with self._lock:
+            self._write(lambda: self._add(chunks, records))
+    
+    def remove(self, chunk_ids: Sequence[str]) -> None:
+        """
+        Forget deleted chunks, dropping files left without chunks.
+        
+        Args:
+            chunk_ids: ChromaDB chunk IDs
+        """
+        if not chunk_ids:
+            return
+        
+        with self._lock:
+            self._write(lambda: self._remove(chunk_ids))
+    
+    def clear(self) -> None:
+        """Remove every record."""
+        with self._lock:
+            self._connection.execute("DELETE FROM chunks")
+            self._connection.execute("DELETE FROM documents")
+    
+    def _write(self, operation) -> None:
+        """Run a write in a transaction (lock must be held)."""
+        try:
+            self._connection.execute("BEGIN")
+            operation()
+            self._connection.execute("COMMIT")
+        except sqlite3.Error:
+            self._connection.execute("ROLLBACK")
+            raise
+    
+    def _add(self, chunks: List[tuple], records: Dict[str, tuple]) -> None:
+        previous = self._filenames_of([chunk_id for chunk_id, _ in chunks])
+        self._connection.executemany("INSERT OR REPLACE INTO chunks (id, filename) VALUES (?, ?)", chunks)
+        self._connection.executemany(
+            "INSERT INTO documents (filename, document_id, file_type, size_bytes, upload_timestamp) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (filename) DO UPDATE SET "
+            "document_id = excluded.document_id, file_type = excluded.file_type, "
+            "size_bytes = excluded.size_bytes, upload_timestamp = excluded.upload_timestamp",
+            list(records.values())
+        )
+        self._refresh_counts(previous | set(records))
+    
+    def _remove(self, chunk_ids: Sequence[str]) -> None:
+        filenames = self._filenames_of(chunk_ids)
+        for start in range(0, len(chunk_ids), 500):
+            batch = list(chunk_ids[start:start + 500])
+            self._connection.execute(f"DELETE FROM chunks WHERE id IN ({','.join('?' * len(batch))})", batch)
+        self._refresh_counts(filenames)
+    
+    def _filenames_of(self, chunk_ids: Sequence[str]) -> set:
+        """Filenames currently recorded for chunks (lock must be held)."""
+        filenames = set()
+        for start in range(0, len(chunk_ids), 500):
+            batch = list(chunk_ids[start:start + 500])
+            rows = self._connection.execute(
+                f"SELECT DISTINCT filename FROM chunks WHERE id IN ({','.join('?' * len(batch))})",
+                batch
+            ).fetchall()
+            filenames.update(row[0] for row in rows)
+        return filenames
+    
+    def _refresh_counts(self, filenames: set) -> None:
+        """Recount chunks of files and drop files without chunks (lock must be held)."""
+        self._connection.executemany(
+            "UPDATE documents SET chunk_count = (SELECT COUNT(*) FROM chunks WHERE chunks.filename = documents.filename) "
+            "WHERE filename = ?",
+            [(filename,) for filename in filenames]
+        )
+        self._connection.execute("DELETE FROM documents WHERE chunk_count = 0")
+    
+    def list_documents(self) -> List[Dict[str, Any]]:
+        """
+        Get every document record, newest upload first.
+        
+        Returns:
+            Document records with filename, document_id, file_type, size_bytes,
+            upload_timestamp and chunk_count
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {', '.join(_DOCUMENT_COLUMNS)} FROM documents "
+                "ORDER BY COALESCE(upload_timestamp, '') DESC, filename"
+            ).fetchall()
+        return [dict(zip(_DOCUMENT_COLUMNS, row)) for row in rows]
+    
+    def filenames(self, uploaded_from: Optional[str] = None, uploaded_before: Optional[str] = None) -> List[str]:
+        """
+        Get the sorted filenames of stored documents.
+        
+        Args:
+            uploaded_from: Only files uploaded at or after this UTC ISO timestamp
+            uploaded_before: Only files uploaded before this UTC ISO timestamp
+        
+        Returns:
+            Filenames, excluding chunks without a filename
+        """
+        # Upload timestamps are UTC ISO strings, which sort chronologically
+        conditions = ["filename != ?"]
+        parameters = [UNKNOWN_FILENAME]
+        if uploaded_from is not None:
+            conditions.append("upload_timestamp >= ?")
+            parameters.append(uploaded_from)
+        if uploaded_before is not None:
+            conditions.append("upload_timestamp < ?")
+            parameters.append(uploaded_before)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT filename FROM documents WHERE {' AND '.join(conditions)} ORDER BY filename",
+                parameters
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def chunk_count(self) -> int:
+        """Get the number of cataloged chunks."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._connection.close()
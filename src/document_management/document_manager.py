@@ -7,14 +7,14 @@ Handles all document-related operations independently from AI access layer.
 import asyncio
 import uuid
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Callable, Sequence
 from datetime import datetime, timezone
 
 import structlog
 
 from src.config.settings import Settings
 from .document_models import (
-    DocumentInfo, DocumentStats, UploadResult, DeleteResult, DocumentStatus
+    DocumentInfo, DocumentStats, UploadResult, UpdateResult, DeleteResult, DocumentStatus, IngestionFile
 )
 from .database_manager import DatabaseManager
 
@@ -57,6 +57,9 @@ class DocumentManager:
         # Track upload operations
         self._active_uploads: Dict[str, DocumentStatus] = {}
         
+        # Ingestion pipeline (created on first upload)
+        self._ingestion_pipeline = None
+        
         self.logger.info("Document Manager initialized")
     
     async def upload_document(
@@ -78,8 +81,35 @@ class DocumentManager:
         Returns:
             UploadResult with success status and document info
         """
+        results = await self.upload_documents([
+            IngestionFile(
+                file_path=file_path,
+                file_content=file_content,
+                source_name=source_name,
+                additional_metadata=additional_metadata
+            )
+        ])
+        return results[0]
+    
+    async def upload_documents(
+        self,
+        files: Sequence[IngestionFile],
+        on_result: Optional[Callable[[int, UploadResult], None]] = None
+    ) -> List[UploadResult]:
+        """
+        Upload and process several documents through the ingestion pipeline.
+        
+        Extraction, embedding and storage of the files overlap, and a failing
+        file does not affect the others.
+        
+        Args:
+            files: Files to upload
+            on_result: Optional callback receiving (file index, result) as each file finishes
+            
+        Returns:
+            One UploadResult per file, in input order
+        """
         operation_id = str(uuid.uuid4())
-        start_time = datetime.now(timezone.utc)
         
         try:
             self._active_uploads[operation_id] = DocumentStatus.PROCESSING
@@ -87,79 +117,125 @@ class DocumentManager:
             self.logger.info(
                 "Starting document upload",
                 operation_id=operation_id,
-                file_path=str(file_path),
-                source_name=source_name
+                file_count=len(files),
+                file_paths=[str(file.file_path) for file in files]
             )
             
-            # Import here to avoid circular imports
-            from .document_processor import DocumentProcessor
+            results = await self._get_ingestion_pipeline().ingest(files, on_result=on_result)
             
-            # Process the document into chunks
-            processor = DocumentProcessor(self.settings)
-            chunks = await processor.process_file(
-                file_path=file_path,
-                file_content=file_content,
-                source_name=source_name or file_path.name
+            failed = [result.error for result in results if not result.success]
+            self._active_uploads[operation_id] = (
+                DocumentStatus.FAILED if failed else DocumentStatus.COMPLETED
             )
             
-            if not chunks:
-                self._active_uploads[operation_id] = DocumentStatus.FAILED
-                return UploadResult(
-                    success=False,
-                    error="No content extracted from document"
+            self.logger.info(
+                "Document upload completed",
+                operation_id=operation_id,
+                file_count=len(files),
+                failed_count=len(failed),
+                chunk_count=sum(
+                    result.document_info.chunk_count for result in results if result.success
                 )
-            
-            # Store chunks in database
-            document_ids = await self.database_manager.add_documents(chunks)
-            
-            # Create document info
-            first_chunk_metadata = chunks[0].metadata
-            document_info = DocumentInfo(
-                document_id=first_chunk_metadata.get('document_id'),
-                filename=first_chunk_metadata.get('filename'),
-                file_type=first_chunk_metadata.get('file_type'),
-                size_bytes=first_chunk_metadata.get('file_size', 0),
-                chunk_count=len(chunks),
-                upload_timestamp=first_chunk_metadata.get('upload_timestamp'),
-                status=DocumentStatus.COMPLETED,
-                chunk_ids=document_ids,
-                metadata=additional_metadata
             )
             
-            processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-            self._active_uploads[operation_id] = DocumentStatus.COMPLETED
+            return results
             
-            self.logger.info(
-                "Document upload completed successfully",
+        except Exception as e:
+            self._active_uploads[operation_id] = DocumentStatus.FAILED
+            self.logger.error(
+                "Document upload failed",
                 operation_id=operation_id,
-                document_id=document_info.document_id,
-                filename=document_info.filename,
-                chunk_count=document_info.chunk_count,
-                processing_time=processing_time
+                file_count=len(files),
+                error=str(e)
             )
+            return [UploadResult(success=False, error=str(e)) for _ in files]
+        finally:
+            # Clean up tracking
+            self._active_uploads.pop(operation_id, None)
+    
+    async def update_document(
+        self,
+        file_path: Path,
+        file_content: Optional[bytes] = None,
+        source_name: Optional[str] = None,
+        additional_metadata: Optional[Dict[str, Any]] = None
+    ) -> UpdateResult:
+        """
+        Replace a stored document with a new version, re-embedding only changed chunks.
+        
+        Chunks whose text is unchanged keep their vectors; only chunks that
+        disappeared are deleted and only new chunks are embedded. A document
+        that is not stored yet is uploaded in full.
+        
+        Args:
+            file_path: Path to the new version (its name identifies the document)
+            file_content: Optional file content (for uploaded files)
+            source_name: Optional source name override
+            additional_metadata: Additional metadata to store
+            
+        Returns:
+            UpdateResult with the chunk changes
+        """
+        operation_id = str(uuid.uuid4())
+        file = IngestionFile(
+            file_path=file_path,
+            file_content=file_content,
+            source_name=source_name,
+            additional_metadata=additional_metadata
+        )
+        
+        try:
+            self._active_uploads[operation_id] = DocumentStatus.PROCESSING
+            self.logger.info("Starting document update", operation_id=operation_id, filename=file_path.name)
+            
+            existing_chunks = await self.database_manager.chromadb.get_chunk_metadata(
+                {"filename": file_path.name}
+            )
+            if existing_chunks:
+                result = await self._get_ingestion_pipeline().update(file, existing_chunks)
+            else:
+                self.logger.info("Document not stored yet, uploading", filename=file_path.name)
+                upload = (await self._get_ingestion_pipeline().ingest([file]))[0]
+                result = UpdateResult(
+                    success=upload.success,
+                    document_info=upload.document_info,
+                    added_chunks=upload.document_info.chunk_count if upload.success else 0,
+                    error=upload.error,
+                    processing_time=upload.processing_time
+                )
             
-            return UploadResult(
-                success=True,
-                document_info=document_info,
-                processing_time=processing_time
+            self._active_uploads[operation_id] = (
+                DocumentStatus.COMPLETED if result.success else DocumentStatus.FAILED
             )
+            return result
             
         except Exception as e:
             self._active_uploads[operation_id] = DocumentStatus.FAILED
             self.logger.error(
-                "Document upload failed",
+                "Document update failed",
                 operation_id=operation_id,
-                file_path=str(file_path),
-                error=str(e)
-            )
-            return UploadResult(
-                success=False,
+                filename=file_path.name,
                 error=str(e)
             )
+            return UpdateResult(success=False, error=str(e))
         finally:
             # Clean up tracking
             self._active_uploads.pop(operation_id, None)
     
+    def _get_ingestion_pipeline(self):
+        """Get the ingestion pipeline, creating it on first upload."""
+        if self._ingestion_pipeline is None:
+            # Import here to avoid circular imports
+            from .document_processor import DocumentProcessor
+            from .ingestion_pipeline import IngestionPipeline
+            
+            self._ingestion_pipeline = IngestionPipeline(
+                self.settings,
+                DocumentProcessor(self.settings),
+                self.database_manager.chromadb
+            )
+        return self._ingestion_pipeline
+    
     async def delete_document(self, filename: str) -> DeleteResult:
         """
         Delete a document and all its chunks from the system.
@@ -381,4 +457,10 @@ class DocumentManager:
         try:
             return self.database_manager is not None
         except Exception:
-            return False
\ No newline at end of file
+            return False
+    
+    def close(self) -> None:
+        """Release ingestion worker processes and ChromaDB worker threads."""
+        if self._ingestion_pipeline is not None:
+            self._ingestion_pipeline.close()
+        self.database_manager.chromadb.close()
@@ -3,6 +3,7 @@ Data models for document management system.
 """
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from datetime import datetime
 from enum import Enum
@@ -67,6 +68,27 @@ class UploadResult:
     processing_time: Optional[float] = None
 
 
+@dataclass
+class UpdateResult:
+    """Result of an incremental document update."""
+    success: bool
+    document_info: Optional[DocumentInfo] = None
+    added_chunks: int = 0
+    removed_chunks: int = 0
+    unchanged_chunks: int = 0
+    error: Optional[str] = None
+    processing_time: Optional[float] = None
+
+
+@dataclass
+class IngestionFile:
+    """A file queued for ingestion."""
+    file_path: Path
+    file_content: Optional[bytes] = None
+    source_name: Optional[str] = None
+    additional_metadata: Optional[Dict[str, Any]] = None
+
+
 @dataclass
 class DeleteResult:
     """Result of document deletion operation."""
@@ -4,23 +4,34 @@ Handles file upload, text extraction, and document chunking.
 """
 
 import asyncio
+import codecs
 import io
 import os
+import threading
 import uuid
+import zipfile
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime, timezone
+from xml.etree.ElementTree import iterparse
 
 import structlog
 from pypdf import PdfReader
-from docx import Document as DocxDocument
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document as LangChainDocument
 
 from src.config.settings import Settings
+from .embedding_cache import chunk_content_hash
+from .streaming_splitter import IncrementalTextSplitter, TextChunk
+
+if TYPE_CHECKING:
+    from .extraction_pool import ExtractionPool
 
 logger = structlog.get_logger(__name__)
 
+# WordprocessingML element names
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
 
 class DocumentProcessor:
     """
@@ -35,6 +46,13 @@ class DocumentProcessor:
     SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.txt'}
     MAX_FILE_SIZE_BYTES = 100 * 1024 * 1024  # 100MB default
     
+    # Text placed between extracted segments (pages, paragraphs, blocks)
+    SEGMENT_SEPARATORS = {'.pdf': "\n\n", '.docx': "\n", '.txt': ""}
+    # Streaming extraction splits whenever this many chunks' worth of text is buffered
+    STREAM_BUFFER_CHUNKS = 16
+    TXT_BLOCK_SIZE = 64 * 1024
+    TXT_ENCODINGS = ('utf-8', 'utf-16', 'latin-1', 'cp1252')
+    
     def __init__(self, settings: Settings):
         """
         Initialize document processor with settings.
@@ -59,6 +77,9 @@ class DocumentProcessor:
         # Update max file size from settings
         self.max_file_size_bytes = settings.max_file_size_mb * 1024 * 1024
         
+        self._extraction_pool: Optional["ExtractionPool"] = None
+        self._pool_lock = threading.Lock()
+        
         self.logger.info(
             "DocumentProcessor initialized",
             chunk_size=settings.chunk_size,
@@ -173,20 +194,43 @@ class DocumentProcessor:
     
     async def _extract_pdf_text(self, buffer: io.BytesIO) -> str:
         """Extract text from PDF using pypdf."""
-        try:
-            reader = PdfReader(buffer)
-            text_parts = []
+        return "\n\n".join(text for text, _ in self._iter_pdf_pages(buffer))
+    
+    def _iter_pdf_pages(
+        self,
+        stream: BinaryIO,
+        start: int = 0,
+        stop: Optional[int] = None,
+        require_text: bool = True
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        Yield the text of each PDF page that has any, with its page number.
+        
+        Args:
+            stream: Seekable binary stream of the PDF
+            start: Index of the first page to read
+            stop: Index after the last page to read (all remaining pages if None)
+            require_text: Raise if the pages read contain no text; disabled when
+                reading one page range of a larger document
             
-            # Check if PDF is encrypted
-            if reader.is_encrypted:
-                self.logger.warning("PDF is encrypted/password-protected")
-                raise ValueError("PDF is encrypted and cannot be processed without a password")
+        Yields:
+            (page text, 1-based page number)
+            
+        Raises:
+            ValueError: If the PDF is encrypted, unreadable or has no text
+        """
+        try:
+            reader = self._open_pdf(stream)
             
             total_pages = len(reader.pages)
             self.logger.debug(f"PDF has {total_pages} pages")
+            stop = total_pages if stop is None else min(stop, total_pages)
             
-            for page_num, page in enumerate(reader.pages):
+            pages_with_text = 0
+            total_text_length = 0
+            for page_num in range(start, stop):
                 try:
+                    page = reader.pages[page_num]
                     page_text = page.extract_text()
                     
                     self.logger.debug(
@@ -196,9 +240,6 @@ class DocumentProcessor:
                         has_text=bool(page_text.strip())
                     )
                     
-                    if page_text.strip():  # Only add non-empty pages
-                        text_parts.append(page_text)
-                        
                 except Exception as page_error:
                     self.logger.warning(
                         f"Failed to extract text from page {page_num + 1}",
@@ -206,35 +247,28 @@ class DocumentProcessor:
                         error=str(page_error)
                     )
                     continue
-            
-            text = "\n\n".join(text_parts)
+                
+                finally:
+                    # Drop pypdf's cache of decoded content streams; pages are visited once
+                    reader.resolved_objects.clear()
+                
+                if page_text.strip():  # Only yield non-empty pages
+                    pages_with_text += 1
+                    total_text_length += len(page_text)
+                    yield page_text, page_num + 1
             
             self.logger.info(
                 "PDF text extraction completed",
                 total_pages=total_pages,
-                pages_with_text=len(text_parts),
-                pages_without_text=total_pages - len(text_parts),
-                total_text_length=len(text),
-                extraction_successful=len(text) > 0
+                pages_read=max(stop - start, 0),
+                pages_with_text=pages_with_text,
+                pages_without_text=max(stop - start, 0) - pages_with_text,
+                total_text_length=total_text_length,
+                extraction_successful=total_text_length > 0
             )
             
-            # Provide helpful information if no text was extracted
-            if not text.strip():
-                if total_pages > 0:
-                    self.logger.warning(
-                        "PDF appears to be image-based or scanned",
-                        total_pages=total_pages,
-                        suggestion="Consider using OCR tools to extract text from image-based PDFs"
-                    )
-                    raise ValueError(
-                        "No text content extracted from PDF. This might be an image-based/scanned PDF "
-                        "that requires OCR (Optical Character Recognition) to extract text. "
-                        "Try converting the PDF to a text-based format first."
-                    )
-                else:
-                    raise ValueError("PDF has no pages")
-            
-            return text
+            if require_text and not pages_with_text:
+                self.raise_no_pdf_text(total_pages)
             
         except Exception as e:
             self.logger.error("PDF text extraction failed", error=str(e))
@@ -244,28 +278,116 @@ class DocumentProcessor:
             else:
                 raise ValueError(f"Failed to process PDF file: {str(e)}") from e
     
-    async def _extract_docx_text(self, buffer: io.BytesIO) -> str:
-        """Extract text from DOCX using python-docx."""
+    def _open_pdf(self, stream: BinaryIO) -> PdfReader:
+        """Open a PDF, rejecting encrypted documents."""
+        reader = PdfReader(stream)
+        if reader.is_encrypted:
+            self.logger.warning("PDF is encrypted/password-protected")
+            raise ValueError("PDF is encrypted and cannot be processed without a password")
+        return reader
+    
+    def count_pdf_pages(self, file_path: Union[str, Path], file_content: Optional[bytes] = None) -> int:
+        """
+        Count the pages of a PDF without extracting any text.
+        
+        Raises:
+            ValueError: If the PDF is encrypted or unreadable
+        """
+        stream = io.BytesIO(file_content) if file_content is not None else open(file_path, 'rb')
         try:
-            doc = DocxDocument(buffer)
-            text_parts = []
+            return len(self._open_pdf(stream).pages)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to process PDF file: {str(e)}") from e
+        finally:
+            stream.close()
+    
+    def iter_pdf_page_range(self, file_path: Union[str, Path], start: int, stop: int) -> Iterator[Tuple[str, int]]:
+        """
+        Yield the text of the pages of one range of a PDF on disk.
+        
+        Unlike iter_text, a range without any text is not an error; whether the
+        document as a whole has text is decided once every range is read.
+        
+        Args:
+            file_path: Path to the PDF
+            start: Index of the first page
+            stop: Index after the last page
             
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():  # Only add non-empty paragraphs
-                    text_parts.append(paragraph.text)
+        Yields:
+            (page text, 1-based page number)
+        """
+        with open(file_path, 'rb') as stream:
+            yield from self._iter_pdf_pages(stream, start, stop, require_text=False)
+    
+    def raise_no_pdf_text(self, total_pages: int) -> None:
+        """Raise the error for a PDF without extractable text."""
+        # Provide helpful information if no text was extracted
+        if total_pages > 0:
+            self.logger.warning(
+                "PDF appears to be image-based or scanned",
+                total_pages=total_pages,
+                suggestion="Consider using OCR tools to extract text from image-based PDFs"
+            )
+            raise ValueError(
+                "No text content extracted from PDF. This might be an image-based/scanned PDF "
+                "that requires OCR (Optical Character Recognition) to extract text. "
+                "Try converting the PDF to a text-based format first."
+            )
+        raise ValueError("PDF has no pages")
+    
+    async def _extract_docx_text(self, buffer: io.BytesIO) -> str:
+        """Extract text from DOCX."""
+        return "\n".join(text for text, _ in self._iter_docx_paragraphs(buffer))
+    
+    def _iter_docx_paragraphs(self, stream: BinaryIO) -> Iterator[Tuple[str, None]]:
+        """
+        Yield the text of each non-empty DOCX paragraph.
+        
+        The document XML is parsed incrementally and each paragraph is
+        discarded once yielded, instead of building python-docx's full
+        document tree. Paragraphs inside tables are included.
+        
+        Args:
+            stream: Seekable binary stream of the DOCX file
             
-            text = "\n".join(text_parts)
+        Yields:
+            (paragraph text, None)
+            
+        Raises:
+            ValueError: If the file is not a readable DOCX or has no text
+        """
+        try:
+            total_paragraphs = 0
+            non_empty_paragraphs = 0
+            with zipfile.ZipFile(stream) as archive, archive.open("word/document.xml") as document_xml:
+                parts: List[str] = []
+                for _, element in iterparse(document_xml, events=("end",)):
+                    tag = element.tag
+                    if tag == f"{_W}t":
+                        parts.append(element.text or "")
+                    elif tag == f"{_W}tab":
+                        parts.append("\t")
+                    elif tag in (f"{_W}br", f"{_W}cr"):
+                        parts.append("\n")
+                    elif tag == f"{_W}p":
+                        total_paragraphs += 1
+                        text = "".join(parts)
+                        parts = []
+                        element.clear()
+                        if text.strip():  # Only yield non-empty paragraphs
+                            non_empty_paragraphs += 1
+                            yield text, None
             
             self.logger.debug(
                 "DOCX text extracted",
-                total_paragraphs=len(doc.paragraphs),
-                non_empty_paragraphs=len(text_parts),
-                total_text_length=len(text)
+                total_paragraphs=total_paragraphs,
+                non_empty_paragraphs=non_empty_paragraphs
             )
             
             # Handle DOCX-specific error case
-            if not text.strip():
-                total_paragraphs = len(doc.paragraphs)
+            if not non_empty_paragraphs:
                 self.logger.warning(
                     "DOCX contains no extractable text",
                     total_paragraphs=total_paragraphs,
@@ -276,8 +398,6 @@ class DocumentProcessor:
                     "or contain only images/graphics."
                 )
             
-            return text
-            
         except Exception as e:
             self.logger.error("DOCX text extraction failed", error=str(e))
             # Re-raise ValueError with DOCX-specific context, wrap other exceptions
@@ -286,6 +406,171 @@ class DocumentProcessor:
             else:
                 raise ValueError(f"Failed to process DOCX file: {str(e)}") from e
     
+    def _iter_txt_blocks(self, file_path: Path, file_content: Optional[bytes]) -> Iterator[Tuple[str, None]]:
+        """
+        Yield a TXT file's text in blocks.
+        
+        Encodings are tried in the same order as full-text extraction; each
+        candidate is validated by decoding the whole file incrementally
+        before any text is yielded.
+        
+        Args:
+            file_path: Path to the file (read if file_content is None)
+            file_content: File content as bytes (optional)
+            
+        Yields:
+            (text block, None)
+            
+        Raises:
+            ValueError: If the file has no readable text
+        """
+        def blocks() -> Iterator[bytes]:
+            if file_content is not None:
+                view = memoryview(file_content)
+                for start in range(0, len(view), self.TXT_BLOCK_SIZE):
+                    yield bytes(view[start:start + self.TXT_BLOCK_SIZE])
+                return
+            with open(file_path, 'rb') as f:
+                while block := f.read(self.TXT_BLOCK_SIZE):
+                    yield block
+        
+        def decode(encoding: str, errors: str = 'strict') -> Iterator[str]:
+            decoder = codecs.getincrementaldecoder(encoding)(errors)
+            for block in blocks():
+                yield decoder.decode(block)
+            yield decoder.decode(b"", final=True)
+        
+        chosen = None
+        for encoding in self.TXT_ENCODINGS:
+            try:
+                has_text = False
+                for text in decode(encoding):
+                    has_text = has_text or bool(text.strip())
+                chosen = encoding
+                break
+            except UnicodeDecodeError:
+                continue
+        
+        if chosen is None:
+            self.logger.warning("TXT extraction used fallback encoding")
+            has_text = any(text.strip() for text in decode('utf-8', 'replace'))
+            if not has_text:
+                raise ValueError("TXT file contains no readable text content (encoding issues detected)")
+            chosen_texts = decode('utf-8', 'replace')
+        else:
+            self.logger.debug("TXT text extracted", encoding_used=chosen)
+            if not has_text:
+                self.logger.warning("TXT file is empty or contains only whitespace")
+                raise ValueError("TXT file is empty or contains no readable text content")
+            chosen_texts = decode(chosen)
+        
+        for text in chosen_texts:
+            if text:
+                yield text, None
+    
+    def iter_text(
+        self,
+        file_path: Union[str, Path],
+        file_content: Optional[bytes] = None
+    ) -> Iterator[Tuple[str, Optional[int]]]:
+        """
+        Stream a file's text as pages (PDF), paragraphs (DOCX) or blocks (TXT).
+        
+        Files are read from disk when no content is given, and in-memory
+        content is wrapped without copying, so no full copy of the text is
+        ever built. Joining the segments with SEGMENT_SEPARATORS gives the
+        text extract_text returns.
+        
+        Args:
+            file_path: Path to the file (used for extension detection)
+            file_content: File content as bytes (optional, streamed from file_path if not provided)
+            
+        Yields:
+            (segment text, 1-based page number or None)
+            
+        Raises:
+            ValueError: If the format is unsupported or the file has no readable text
+        """
+        file_path = Path(file_path)
+        extension = file_path.suffix.lower()
+        
+        if extension == '.txt':
+            yield from self._iter_txt_blocks(file_path, file_content)
+            return
+        if extension not in ('.pdf', '.docx'):
+            raise ValueError(f"Unsupported file extension: {extension}")
+        
+        stream = io.BytesIO(file_content) if file_content is not None else open(file_path, 'rb')
+        try:
+            if extension == '.pdf':
+                yield from self._iter_pdf_pages(stream)
+            else:
+                yield from self._iter_docx_paragraphs(stream)
+        finally:
+            stream.close()
+    
+    async def extract_segments(
+        self,
+        file_path: Union[str, Path],
+        file_content: Optional[bytes] = None
+    ) -> List[Tuple[str, Optional[int]]]:
+        """
+        Extract a file's text segments without blocking the event loop.
+        
+        With extraction workers configured (``ingestion_extract_workers``) the
+        file is extracted in the process pool, large PDFs split by page range
+        across several workers; otherwise it is extracted on a thread.
+        
+        Args:
+            file_path: Path to the file (used for extension detection)
+            file_content: File content as bytes (optional, read from file_path if not provided)
+            
+        Returns:
+            (segment text, 1-based page number or None) in document order, as iter_text yields them
+            
+        Raises:
+            ValueError: If the format is unsupported or the file has no readable text
+            TimeoutError: If the extraction workers exceed the per-file timeout
+        """
+        pool = self.get_extraction_pool()
+        if pool is not None:
+            segments = await pool.extract(file_path, file_content)
+        else:
+            segments = await asyncio.to_thread(lambda: list(self.iter_text(file_path, file_content)))
+        
+        self.logger.info(
+            "Text extraction completed",
+            file_path=str(file_path),
+            segment_count=len(segments),
+            text_length=sum(len(text) for text, _ in segments),
+            extraction_workers=pool.workers if pool is not None else 0
+        )
+        return segments
+    
+    def get_extraction_pool(self) -> Optional["ExtractionPool"]:
+        """Get the extraction process pool, creating it on first use (None without extraction workers)."""
+        workers = self.settings.ingestion_extract_workers
+        if workers <= 0:
+            return None
+        with self._pool_lock:
+            if self._extraction_pool is None:
+                # The pool's workers import this module, so it is imported on first use
+                from .extraction_pool import ExtractionPool
+                self._extraction_pool = ExtractionPool(
+                    self,
+                    workers=workers,
+                    pages_per_task=self.settings.pdf_pages_per_extraction_task,
+                    timeout_seconds=self.settings.extraction_timeout_seconds
+                )
+            return self._extraction_pool
+    
+    def close(self) -> None:
+        """Shut down the extraction process pool."""
+        with self._pool_lock:
+            if self._extraction_pool is not None:
+                self._extraction_pool.close()
+                self._extraction_pool = None
+    
     async def _extract_txt_text(self, file_content: bytes) -> str:
         """Extract text from TXT file."""
         try:
@@ -364,6 +649,7 @@ class DocumentProcessor:
                         "source": source,
                         "chunk_index": i,
                         "chunk_length": len(chunk_content),
+                        "content_hash": chunk_content_hash(chunk_content),
                         "created_at": datetime.now(timezone.utc).isoformat()
                     }
                     
@@ -400,6 +686,171 @@ class DocumentProcessor:
             )
             raise
     
+    def iter_chunks(
+        self,
+        file_path: Union[str, Path],
+        file_content: Optional[bytes],
+        source_name: str,
+        file_metadata: Dict[str, Any],
+        segments: Optional[Iterable[Tuple[str, Optional[int]]]] = None
+    ) -> Iterator[LangChainDocument]:
+        """
+        Stream a file's chunks as its text is extracted.
+        
+        Memory stays bounded by the splitter buffer rather than the document
+        size. Chunks of paged formats record the pages they span in ``page``
+        and ``page_end``. Unlike create_chunks, chunks do not carry the
+        document's total chunk count, which is only known at the end.
+        
+        Args:
+            file_path: Path to the file (used for extension detection)
+            file_content: File content as bytes (optional, streamed from file_path if not provided)
+            source_name: Source document identifier
+            file_metadata: Metadata from create_file_metadata (updated in place)
+            segments: Text segments already extracted by extract_segments (extracted
+                from the file while chunking if None)
+            
+        Yields:
+            LangChain Document chunks in document order
+            
+        Raises:
+            ValueError: If text extraction fails or no chunk with content is created
+        """
+        file_metadata["processing_status"] = "completed"
+        if segments is None:
+            segments = self.iter_text(file_path, file_content)
+        for index, chunk in enumerate(self.split_segments(file_path, iter(segments))):
+            yield self.build_chunk(chunk, index, source_name, file_metadata)
+    
+    def split_segments(
+        self,
+        file_path: Union[str, Path],
+        segments: Iterator[Tuple[str, Optional[int]]]
+    ) -> Iterator[TextChunk]:
+        """
+        Split streamed text segments into chunks with page information.
+        
+        Args:
+            file_path: Path to the file (selects the segment separator)
+            segments: (segment text, page number) pairs from iter_text
+            
+        Yields:
+            TextChunk objects with content
+            
+        Raises:
+            ValueError: If no chunk with content is created
+        """
+        splitter = IncrementalTextSplitter(
+            self.text_splitter,
+            buffer_size=self.settings.chunk_size * self.STREAM_BUFFER_CHUNKS,
+            separator=self.SEGMENT_SEPARATORS.get(Path(file_path).suffix.lower(), "\n\n")
+        )
+        chunk_count = 0
+        for text, page in segments:
+            for chunk in splitter.feed(text, page):
+                if chunk.content.strip():
+                    chunk_count += 1
+                    yield chunk
+        for chunk in splitter.finish():
+            if chunk.content.strip():
+                chunk_count += 1
+                yield chunk
+        
+        if not chunk_count:
+            raise ValueError("No valid chunks created from document")
+    
+    def build_chunk(
+        self,
+        chunk: TextChunk,
+        index: int,
+        source_name: str,
+        file_metadata: Dict[str, Any]
+    ) -> LangChainDocument:
+        """
+        Create the LangChain Document for a chunk of a file.
+        
+        Args:
+            chunk: Chunk text and pages
+            index: Position of the chunk in the document
+            source_name: Source document identifier
+            file_metadata: Metadata from create_file_metadata
+            
+        Returns:
+            LangChain Document with complete metadata
+        """
+        metadata = {
+            "chunk_id": f"{source_name}_{index}",
+            "source": source_name,
+            "chunk_index": index,
+            "chunk_length": len(chunk.content),
+            "content_hash": chunk_content_hash(chunk.content),
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }
+        if chunk.page is not None:
+            metadata["page"] = chunk.page
+            metadata["page_end"] = chunk.page_end
+        metadata.update(file_metadata)
+        return LangChainDocument(page_content=chunk.content, metadata=metadata)
+    
+    def create_file_metadata(
+        self,
+        file_path: Path,
+        file_content: Optional[bytes] = None,
+        processing_start: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Create the file metadata embedded in every chunk of a new document.
+        
+        Args:
+            file_path: Path to the file
+            file_content: File content as bytes (optional, file size is read from disk if not provided)
+            processing_start: Upload timestamp (defaults to now)
+            
+        Returns:
+            File metadata with a newly assigned document ID
+        """
+        processing_start = processing_start or datetime.now(timezone.utc)
+        return {
+            "document_id": str(uuid.uuid4()),
+            "filename": file_path.name,
+            "file_type": file_path.suffix.lower(),
+            "file_size": len(file_content) if file_content else file_path.stat().st_size,
+            "upload_timestamp": processing_start.isoformat(),
+            "processing_status": "processing"
+        }
+    
+    async def create_chunks(self, text: str, source_name: str, file_metadata: Dict[str, Any]) -> List[LangChainDocument]:
+        """
+        Chunk extracted text and stamp each chunk with the document's chunk count.
+        
+        Args:
+            text: Extracted document text
+            source_name: Source document identifier
+            file_metadata: Metadata from create_file_metadata (updated in place)
+            
+        Returns:
+            List of LangChain Document chunks
+            
+        Raises:
+            ValueError: If no chunk with content could be created
+        """
+        # Update processing status
+        file_metadata["processing_status"] = "completed"
+        
+        # Create LangChain Document chunks with complete metadata
+        chunks = await self.chunk_document(text, source_name, file_metadata["document_id"], file_metadata)
+        
+        if not chunks:
+            file_metadata["processing_status"] = "failed"
+            file_metadata["error_message"] = "No valid chunks created from document"
+            raise ValueError("No valid chunks created from document")
+        
+        # Add chunk count to metadata
+        for chunk in chunks:
+            chunk.metadata["chunk_count"] = len(chunks)
+        
+        return chunks
+    
     async def process_file(
         self, 
         file_path: Union[str, Path], 
@@ -421,19 +872,10 @@ class DocumentProcessor:
         file_path = Path(file_path)
         processing_start = datetime.now(timezone.utc)
         
-        # Create document metadata
-        document_id = str(uuid.uuid4())
-        source_name = source_name or file_path.name
-        
         # Prepare file metadata to embed in each chunk
-        file_metadata = {
-            "document_id": document_id,
-            "filename": file_path.name,
-            "file_type": file_path.suffix.lower(),
-            "file_size": len(file_content) if file_content else file_path.stat().st_size,
-            "upload_timestamp": processing_start.isoformat(),
-            "processing_status": "processing"
-        }
+        file_metadata = self.create_file_metadata(file_path, file_content, processing_start)
+        document_id = file_metadata["document_id"]
+        source_name = source_name or file_path.name
         
         try:
             # Validate file (allow memory-only processing if file_content is provided)
@@ -446,23 +888,12 @@ class DocumentProcessor:
                 file_size_mb=file_metadata["file_size"] / (1024*1024)
             )
             
-            # Extract text - file-type specific errors are handled in respective methods
-            text = await self.extract_text(file_path, file_content)
-            
-            # Update processing status
-            file_metadata["processing_status"] = "completed"
-            
-            # Create LangChain Document chunks with complete metadata
-            chunks = await self.chunk_document(text, source_name, document_id, file_metadata)
+            # Extract text off the event loop - file-type specific errors are handled in respective methods
+            segments = await self.extract_segments(file_path, file_content)
+            text = self.SEGMENT_SEPARATORS[file_path.suffix.lower()].join(text for text, _ in segments)
+            del segments
             
-            if not chunks:
-                file_metadata["processing_status"] = "failed"
-                file_metadata["error_message"] = "No valid chunks created from document"
-                raise ValueError("No valid chunks created from document")
-            
-            # Add chunk count to metadata
-            for chunk in chunks:
-                chunk.metadata["chunk_count"] = len(chunks)
+            chunks = await self.create_chunks(text, source_name, file_metadata)
             
             processing_time = (datetime.now(timezone.utc) - processing_start).total_seconds()
             
@@ -498,6 +929,10 @@ class DocumentProcessor:
         """
         Process multiple files concurrently.
         
+        Text is extracted in the extraction process pool when workers are
+        configured, so files are parsed in parallel instead of one at a time
+        on the event loop.
+        
         Args:
             file_data: List of (file_path, file_content) tuples
             
@@ -540,3 +975,4 @@ class DocumentProcessor:
             total_chunks=len(all_chunks)
         )
         
+        return all_chunks
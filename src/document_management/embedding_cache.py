@@ -0,0 +1,277 @@
+"""
+EmbeddingCache - Persistent content-hash cache for chunk embeddings.
+
+Embedding chunks through Azure OpenAI is the most expensive step of document
+ingestion, and re-uploading a document (or a revision that only changes a few
+sections) used to re-embed every chunk. Embeddings are stored in SQLite keyed
+by a hash of the embedding deployment and the normalized chunk text, so only
+chunks whose text actually changed reach the embedding API.
+"""
+
+import array
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import structlog
+from langchain_core.embeddings import Embeddings
+
+logger = structlog.get_logger(__name__)
+
+CACHE_FILENAME = "embeddings.sqlite3"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_chunk_text(text: str) -> str:
+    """Normalize text so formatting-only differences share a cache entry."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def chunk_content_hash(text: str) -> str:
+    """Hash identifying a chunk's normalized text."""
+    return hashlib.sha256(normalize_chunk_text(text).encode("utf-8")).hexdigest()
+
+
+def embedding_cache_key(deployment: str, text: str) -> str:
+    """Build the cache key for a chunk embedded by a deployment."""
+    payload = f"{deployment}\n{normalize_chunk_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding store with least-recently-used eviction.
+    
+    Vectors are stored as float32 blobs. Lookups and inserts are batched per
+    embedding request, and the store is trimmed back to ``max_entries`` by
+    last use whenever it grows past it.
+    """
+    
+    def __init__(self, cache_dir: str, deployment: str, max_entries: int = 200000):
+        """
+        Initialize embedding cache.
+        
+        Args:
+            cache_dir: Directory holding the SQLite cache file
+            deployment: Embedding deployment name (part of every key)
+            max_entries: Maximum number of cached embeddings
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.deployment = deployment or "default"
+        self.max_entries = max_entries
+        
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.cache_dir / CACHE_FILENAME),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+        )
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        self.logger = logger.bind(
+            log_type="SYSTEM",
+            component="embedding_cache"
+        )
+        self.logger.info(
+            "Embedding cache initialized",
+            cache_dir=str(self.cache_dir),
+            deployment=self.deployment,
+            cached_embeddings=self._count()
+        )
+    
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up cached embeddings.
+        
+        Args:
+            texts: Chunk texts
+        
+        Returns:
+            One embedding per text, None where not cached
+        """
+        keys = [embedding_cache_key(self.deployment, text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            unique = list(dict.fromkeys(keys))
+            for start in range(0, len(unique), 500):
+                batch = unique[start:start + 500]
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array.array("f", blob).tolist()
+            
+            if found:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+            
+            hits = sum(key in found for key in keys)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return [found.get(key) for key in keys]
+    
+    def put_many(self, texts: Sequence[str], vectors: Sequence[List[float]]) -> None:
+        """
+        Store embeddings, evicting the least recently used beyond max_entries.
+        
+        Args:
+            texts: Chunk texts
+            vectors: One embedding per text
+        """
+        now = time.time()
+        rows = [
+            (embedding_cache_key(self.deployment, text), array.array("f", vector).tobytes(), now)
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock:
+            try:
+                self._connection.execute("BEGIN")
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                    rows
+                )
+                self._evict_over_limit()
+                self._connection.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._connection.execute("ROLLBACK")
+                self.logger.warning("Failed to store embeddings", count=len(rows), error=str(e))
+    
+    def _evict_over_limit(self) -> None:
+        """Delete least recently used embeddings beyond max_entries (lock must be held)."""
+        excess = self._count() - self.max_entries
+        if excess <= 0:
+            return
+        self._connection.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+            (excess,)
+        )
+        self.evictions += excess
+        self.logger.debug("Evicted embeddings from cache", evicted_count=excess)
+    
+    def _count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+    
+    def clear(self) -> None:
+        """Remove every cached embedding."""
+        with self._lock:
+            cleared_count = self._count()
+            self._connection.execute("DELETE FROM embeddings")
+        self.logger.info("Embedding cache cleared", cleared_entries=cleared_count)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get embedding cache statistics."""
+        with self._lock:
+            total_entries = self._count()
+        lookups = self.hits + self.misses
+        return {
+            "total_entries": total_entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions
+        }
+    
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that consults an EmbeddingCache before the API.
+    
+    Only document embeddings are cached; queries are embedded directly.
+    Texts repeated within one request are embedded once.
+    """
+    
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache):
+        """
+        Initialize cached embeddings.
+        
+        Args:
+            embeddings: Underlying embeddings client
+            cache: Embedding cache to read and fill
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+    
+    def _missing(self, texts: List[str], cached: List[Optional[List[float]]]) -> List[str]:
+        """Distinct texts without a cached embedding."""
+        return list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+    
+    def _merge(
+        self,
+        texts: List[str],
+        cached: List[Optional[List[float]]],
+        missing: List[str],
+        vectors: List[List[float]]
+    ) -> List[List[float]]:
+        """Combine cached and freshly computed embeddings in input order."""
+        computed = dict(zip(missing, vectors))
+        return [vector if vector is not None else computed[text] for text, vector in zip(texts, cached)]
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        cached = self.cache.get_many(texts)
+        missing = self._missing(texts, cached)
+        vectors = self.embeddings.embed_documents(missing) if missing else []
+        if missing:
+            self.cache.put_many(missing, vectors)
+        return self._merge(texts, cached, missing, vectors)
+    
+    async def aembed_documents(
+        self,
+        texts: List[str],
+        before_request: Optional[Callable[[List[str]], Awaitable[Any]]] = None
+    ) -> List[List[float]]:
+        """
+        Embed documents, calling the API only for texts not in the cache.
+        
+        Args:
+            texts: Texts to embed
+            before_request: Optional coroutine function awaited with the texts
+                that will be sent to the API (e.g. to apply rate limits)
+        
+        Returns:
+            One embedding per text
+        """
+        cached = await asyncio.to_thread(self.cache.get_many, texts)
+        missing = self._missing(texts, cached)
+        vectors = []
+        if missing:
+            if before_request is not None:
+                await before_request(missing)
+            vectors = await self.embeddings.aembed_documents(missing)
+            await asyncio.to_thread(self.cache.put_many, missing, vectors)
+        return self._merge(texts, cached, missing, vectors)
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+    
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.embeddings.aembed_query(text)
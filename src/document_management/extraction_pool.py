@@ -0,0 +1,299 @@
+"""
+ExtractionPool - Text extraction in worker processes.
+
+pypdf parses pages in pure Python: run on the event loop it stalls every
+other coroutine, and run on threads it is still serialized by the GIL, so a
+batch of PDFs was extracted one page at a time no matter how many cores were
+available. The pool extracts files in worker processes instead:
+
+- small files and DOCX/TXT files are extracted by one worker each
+- large PDFs are split into page ranges extracted by several workers at once
+  and reassembled in page order
+- every file has a timeout; workers still busy with a timed-out file are
+  replaced, so a pathological PDF cannot hold a worker forever
+"""
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import structlog
+
+from .document_processor import DocumentProcessor
+
+logger = structlog.get_logger(__name__)
+
+Segment = Tuple[str, Optional[int]]
+
+
+class ExtractionPool:
+    """
+    Process pool extracting document text, splitting large PDFs by page range.
+    
+    Workers are spawned rather than forked, so they do not inherit ChromaDB
+    or HTTP client threads from this process, and are started on first use.
+    """
+    
+    def __init__(
+        self,
+        processor: DocumentProcessor,
+        workers: int,
+        pages_per_task: int = 32,
+        timeout_seconds: float = 300
+    ):
+        """
+        Initialize extraction pool.
+        
+        Args:
+            processor: Processor whose chunk settings the workers use
+            workers: Number of worker processes
+            pages_per_task: PDF pages extracted per worker task; longer PDFs are split
+            timeout_seconds: Time allowed to extract one file (0 = no limit)
+        """
+        self.processor = processor
+        self.workers = workers
+        self.pages_per_task = pages_per_task
+        self.timeout_seconds = timeout_seconds
+        
+        # Picklable subset of settings for the workers
+        self._processor_settings = SimpleNamespace(
+            chunk_size=processor.settings.chunk_size,
+            chunk_overlap=processor.settings.chunk_overlap,
+            max_file_size_mb=processor.settings.max_file_size_mb
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Workers report their PIDs here on start-up so a restart can terminate them
+        self._worker_pids: Optional[Any] = None
+        self._lock = threading.Lock()
+        
+        self.logger = logger.bind(
+            log_type="SYSTEM",
+            component="extraction_pool"
+        )
+    
+    async def extract(
+        self,
+        file_path: Union[str, Path],
+        file_content: Optional[bytes] = None
+    ) -> List[Segment]:
+        """
+        Extract a file's text segments in the worker processes.
+        
+        Args:
+            file_path: Path to the file (used for extension detection)
+            file_content: File content as bytes (optional, read from file_path if not provided)
+        
+        Returns:
+            (segment text, 1-based page number or None) in document order, as
+            DocumentProcessor.iter_text yields them
+        
+        Raises:
+            ValueError: If the format is unsupported or the file has no readable text
+            TimeoutError: If extraction takes longer than the per-file timeout
+        """
+        file_path = Path(file_path)
+        try:
+            return await asyncio.wait_for(
+                self._extract(file_path, file_content),
+                self.timeout_seconds or None
+            )
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                "Text extraction timed out, replacing extraction workers",
+                filename=file_path.name,
+                timeout_seconds=self.timeout_seconds
+            )
+            self._restart()
+            raise TimeoutError(
+                f"Text extraction of {file_path.name} timed out after {self.timeout_seconds} seconds"
+            ) from None
+    
+    async def _extract(self, file_path: Path, file_content: Optional[bytes]) -> List[Segment]:
+        if file_path.suffix.lower() != '.pdf':
+            return await self._submit(extract_segments_in_worker, self._processor_settings, str(file_path), file_content)
+        
+        # Short PDFs are counted and extracted by one task, so their content is sent to a worker once
+        total_pages, segments = await self._submit(
+            extract_short_pdf_in_worker, self._processor_settings, str(file_path), file_content, self.pages_per_task
+        )
+        if segments is not None:
+            return segments
+        
+        ranges = [
+            (start, min(start + self.pages_per_task, total_pages))
+            for start in range(0, total_pages, self.pages_per_task)
+        ]
+        self.logger.debug(
+            "Splitting PDF across extraction workers",
+            filename=file_path.name,
+            total_pages=total_pages,
+            tasks=len(ranges)
+        )
+        
+        # Every task opens the PDF itself; in-memory content is written to disk once instead of pickled per task
+        spilled = None
+        if file_content is not None:
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as spill:
+                spill.write(file_content)
+            spilled = spill.name
+        try:
+            source = spilled or str(file_path)
+            parts = await asyncio.gather(*(
+                self._submit(extract_pdf_pages_in_worker, self._processor_settings, source, start, stop)
+                for start, stop in ranges
+            ))
+        finally:
+            if spilled is not None:
+                os.unlink(spilled)
+        
+        segments = [segment for part in parts for segment in part]
+        if not segments:
+            self.processor.raise_no_pdf_text(total_pages)
+        return segments
+    
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a worker function, retrying once if the workers were replaced while it was queued or running."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            # Another file's timeout terminated the workers, or a worker crashed
+            self._discard(executor)
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the process pool, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context("spawn")
+                self._worker_pids = context.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_report_worker_pid,
+                    initargs=(self._worker_pids,)
+                )
+            return self._executor
+    
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Forget a broken process pool so the next task starts a new one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                self._worker_pids = None
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _restart(self) -> None:
+        """Stop the current workers, including any still extracting a timed-out file."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            worker_pids, self._worker_pids = self._worker_pids, None
+        if executor is None:
+            return
+        # Running calls cannot be cancelled, so their processes are terminated;
+        # tasks of other files fail with BrokenProcessPool and are retried
+        pids = set()
+        while not worker_pids.empty():
+            pids.add(worker_pids.get())
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._worker_pids = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _report_worker_pid(worker_pids: Any) -> None:
+    """Worker initializer: tell the pool this process's PID."""
+    worker_pids.put(os.getpid())
+
+
+_worker_processors: Dict[tuple, DocumentProcessor] = {}
+
+
+def _worker_processor(processor_settings: Any) -> DocumentProcessor:
+    """Get the processor of this worker process, built once per settings combination."""
+    key = (processor_settings.chunk_size, processor_settings.chunk_overlap, processor_settings.max_file_size_mb)
+    processor = _worker_processors.get(key)
+    if processor is None:
+        processor = _worker_processors[key] = DocumentProcessor(processor_settings)
+    return processor
+
+
+def extract_segments_in_worker(
+    processor_settings: Any,
+    file_path: str,
+    file_content: Optional[bytes] = None
+) -> List[Segment]:
+    """
+    Extract a whole file's text segments inside a worker process.
+    
+    Worker functions are module-level so they can be pickled into the pool.
+    
+    Args:
+        processor_settings: Picklable object with chunk_size, chunk_overlap and max_file_size_mb
+        file_path: Path to the file (used for extension detection)
+        file_content: File content as bytes (optional, read from file_path if not provided)
+    
+    Returns:
+        Text segments in document order
+    """
+    return list(_worker_processor(processor_settings).iter_text(file_path, file_content))
+
+
+def extract_short_pdf_in_worker(
+    processor_settings: Any,
+    file_path: str,
+    file_content: Optional[bytes],
+    max_pages: int
+) -> Tuple[int, Optional[List[Segment]]]:
+    """
+    Count a PDF's pages and, if it is short enough, extract it inside a worker process.
+    
+    Args:
+        processor_settings: Picklable object with chunk_size, chunk_overlap and max_file_size_mb
+        file_path: Path to the PDF (used for extension detection)
+        file_content: PDF content as bytes (optional, read from file_path if not provided)
+        max_pages: Longest PDF extracted whole; longer ones are left for page-range tasks
+    
+    Returns:
+        (page count, text segments), with None for the segments if the PDF has more than max_pages pages
+    """
+    processor = _worker_processor(processor_settings)
+    total_pages = processor.count_pdf_pages(file_path, file_content)
+    if total_pages > max_pages:
+        return total_pages, None
+    return total_pages, list(processor.iter_text(file_path, file_content))
+
+
+def extract_pdf_pages_in_worker(processor_settings: Any, file_path: str, start: int, stop: int) -> List[Segment]:
+    """
+    Extract the text of a PDF page range inside a worker process.
+    
+    Args:
+        processor_settings: Picklable object with chunk_size, chunk_overlap and max_file_size_mb
+        file_path: Path to the PDF on disk
+        start: Index of the first page
+        stop: Index after the last page
+    
+    Returns:
+        (page text, 1-based page number) of the pages in the range that have text
+    """
+    return list(_worker_processor(processor_settings).iter_pdf_page_range(file_path, start, stop))
@@ -0,0 +1,558 @@
+"""
+IngestionPipeline - Concurrent, staged document ingestion.
+
+Uploading documents one at a time ran extraction, chunking, embedding and the
+ChromaDB write strictly in sequence, so the embedding deployment sat idle
+while PDFs were parsed and the parser sat idle while embeddings were computed.
+The pipeline runs the stages concurrently, connected by bounded queues:
+
+- extract and chunk: text streamed page by page into an incremental splitter
+  (or extracted in a process pool, large PDFs split across workers by page
+  range), producing LangChain documents with file and page metadata
+- embed: batches of chunks from any document, embedded concurrently under the
+  deployment's request and token quotas
+- write: embedded chunks written to ChromaDB in large batches
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import structlog
+from langchain_core.documents import Document as LangChainDocument
+
+from src.config.settings import Settings
+from .chromadb_service import ChromaDBService
+from .document_models import DocumentInfo, DocumentStatus, IngestionFile, UpdateResult, UploadResult
+from .document_processor import DocumentProcessor
+from .embedding_cache import CachedEmbeddings
+
+logger = structlog.get_logger(__name__)
+
+# Sentinel closing a stage queue
+_END = None
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count used for quota accounting (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+class EmbeddingRateLimiter:
+    """
+    Token-bucket limiter for embedding requests and tokens per minute.
+    
+    State is guarded by a thread lock and waits use asyncio.sleep, so one
+    limiter can be shared by calls running on different event loops.
+    """
+    
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            requests_per_minute: Request quota per minute (0 = unlimited)
+            tokens_per_minute: Token quota per minute (0 = unlimited)
+        """
+        now = time.monotonic()
+        # [capacity, available, last refill time] per limited quota
+        self._buckets = [
+            [float(capacity), float(capacity), now]
+            for capacity in (requests_per_minute, tokens_per_minute)
+        ]
+        self._lock = threading.Lock()
+    
+    async def acquire(self, tokens: int) -> float:
+        """
+        Wait until one request of the given token count fits both quotas.
+        
+        Args:
+            tokens: Estimated tokens of the request
+        
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = 0.0
+                needed = []
+                for bucket, amount in zip(self._buckets, (1, tokens)):
+                    capacity, available, refilled_at = bucket
+                    if capacity <= 0:
+                        needed.append(0.0)
+                        continue
+                    available = min(capacity, available + (now - refilled_at) * capacity / 60)
+                    bucket[1], bucket[2] = available, now
+                    # Requests larger than a whole minute's quota only wait for a full bucket
+                    amount = min(float(amount), capacity)
+                    needed.append(amount)
+                    wait = max(wait, (amount - available) * 60 / capacity)
+                if wait <= 0:
+                    for bucket, amount in zip(self._buckets, needed):
+                        bucket[1] -= amount
+                    return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+
+@dataclass(eq=False)
+class _IngestionJob:
+    """Progress of one file through the pipeline."""
+    index: int
+    file: IngestionFile
+    started: float
+    file_metadata: Dict[str, Any] = field(default_factory=dict)
+    chunk_count: int = 0
+    # Set once every chunk of the file has been produced
+    chunked: bool = False
+    chunk_ids: Dict[int, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    result: Optional[UploadResult] = None
+    
+    @property
+    def source_name(self) -> str:
+        return self.file.source_name or self.file.file_path.name
+    
+    def build_result(self) -> UploadResult:
+        """Build the upload result from the job's current state."""
+        processing_time = time.perf_counter() - self.started
+        if self.error is not None:
+            return UploadResult(success=False, error=self.error, processing_time=processing_time)
+        
+        metadata = self.file_metadata
+        return UploadResult(
+            success=True,
+            document_info=DocumentInfo(
+                document_id=metadata.get('document_id'),
+                filename=metadata.get('filename'),
+                file_type=metadata.get('file_type'),
+                size_bytes=metadata.get('file_size', 0),
+                chunk_count=self.chunk_count,
+                upload_timestamp=metadata.get('upload_timestamp'),
+                status=DocumentStatus.COMPLETED,
+                chunk_ids=[self.chunk_ids[position] for position in range(self.chunk_count)],
+                metadata=self.file.additional_metadata
+            ),
+            processing_time=processing_time
+        )
+
+
+def _take(iterator: Iterator[Any], count: int) -> List[Any]:
+    """Take up to count items from an iterator."""
+    return list(islice(iterator, count))
+
+
+# (job, chunk position, chunk) waiting for an embedding
+_EmbedItem = Tuple[_IngestionJob, int, LangChainDocument]
+# (job, chunk position, chunk, embedding) waiting for the ChromaDB write
+_WriteItem = Tuple[_IngestionJob, int, LangChainDocument, List[float]]
+
+
+class IngestionPipeline:
+    """
+    Concurrent extract → chunk → embed → write pipeline.
+    
+    Each stage has its own concurrency bound and the stages are connected by
+    bounded queues, so a slow stage applies backpressure instead of letting
+    chunks pile up in memory. Failures are isolated per document: a document
+    whose extraction, embedding or write fails is reported as failed and any
+    of its chunks already written are removed again.
+    """
+    
+    def __init__(
+        self,
+        settings: Settings,
+        processor: DocumentProcessor,
+        chromadb: ChromaDBService,
+        rate_limiter: Optional[EmbeddingRateLimiter] = None
+    ):
+        """
+        Initialize ingestion pipeline.
+        
+        Args:
+            settings: Application settings with ingestion configuration
+            processor: Document processor used for validation and chunking
+            chromadb: ChromaDB service providing embeddings and storage
+            rate_limiter: Embedding quota limiter (built from settings if None)
+        """
+        self.settings = settings
+        self.processor = processor
+        self.chromadb = chromadb
+        
+        self.extract_workers = settings.ingestion_extract_workers
+        self.embed_concurrency = settings.embedding_concurrency
+        self.embed_batch_size = settings.embedding_batch_size
+        self.write_batch_size = settings.chromadb_write_batch_size
+        # Enough queued chunks to keep every embedding slot busy
+        self.queue_size = self.embed_batch_size * (self.embed_concurrency + 1)
+        self.rate_limiter = rate_limiter or EmbeddingRateLimiter(
+            requests_per_minute=settings.embedding_requests_per_minute,
+            tokens_per_minute=settings.embedding_tokens_per_minute
+        )
+
+        
+        self.logger = logger.bind(
+            log_type="SYSTEM",
+            component="ingestion_pipeline"
+        )
+    
+    async def ingest(
+        self,
+        files: Sequence[IngestionFile],
+        on_result: Optional[Callable[[int, UploadResult], None]] = None
+    ) -> List[UploadResult]:
+        """
+        Ingest files through the concurrent pipeline.
+        
+        Args:
+            files: Files to ingest
+            on_result: Optional callback receiving (file index, result) as each file finishes
+        
+        Returns:
+            One UploadResult per file, in input order
+        """
+        started = time.perf_counter()
+        jobs = [_IngestionJob(index=i, file=file, started=started) for i, file in enumerate(files)]
+        if not jobs:
+            return []
+        
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        extract_slots = asyncio.Semaphore(max(self.extract_workers, 1))
+        
+        def finish(job: _IngestionJob, error: Optional[str] = None) -> None:
+            if job.result is not None:
+                return
+            job.error = error
+            job.result = job.build_result()
+            if on_result is not None:
+                on_result(job.index, job.result)
+        
+        embedder = asyncio.create_task(self._embed_stage(embed_queue, write_queue, finish))
+        writer = asyncio.create_task(self._write_stage(write_queue, finish))
+        try:
+            await asyncio.gather(*(self._prepare(job, extract_slots, embed_queue, finish) for job in jobs))
+            await embed_queue.put(_END)
+            await embedder
+            await write_queue.put(_END)
+            await writer
+        finally:
+            embedder.cancel()
+            writer.cancel()
+        
+        await self._discard_failed(jobs)
+        await self.chromadb.persist()
+        
+        results = [job.result for job in jobs]
+        self.logger.info(
+            "Ingestion completed",
+            file_count=len(jobs),
+            successful_count=sum(result.success for result in results),
+            chunk_count=sum(job.chunk_count for job in jobs if job.error is None),
+            processing_time=round(time.perf_counter() - started, 3)
+        )
+        return results
+    
+    async def update(self, file: IngestionFile, existing_chunks: Dict[str, Dict[str, Any]]) -> UpdateResult:
+        """
+        Re-ingest a new version of a stored document, touching only changed chunks.
+        
+        The new version is chunked as usual and matched to the stored chunks
+        by content hash. Matching chunks keep their ChromaDB entry and vector
+        and only get their metadata refreshed; new chunks are embedded and
+        inserted, and stored chunks without a match are deleted. New chunks
+        are written before anything is removed, and a failed update deletes
+        the new chunks and restores the refreshed metadata, so it leaves the
+        previous version in place.
+        
+        Args:
+            file: New version of the document
+            existing_chunks: Metadata of the stored chunks by ChromaDB ID
+        
+        Returns:
+            UpdateResult with the chunk changes
+        """
+        started = time.perf_counter()
+        job = _IngestionJob(index=0, file=file, started=started)
+        added_ids: List[str] = []
+        refreshed_ids: List[str] = []
+        try:
+            job.file_metadata = self.processor.create_file_metadata(file.file_path, file.file_content)
+            # The document keeps its identity across versions
+            document_ids = {metadata.get('document_id') for metadata in existing_chunks.values()} - {None}
+            if len(document_ids) == 1:
+                job.file_metadata['document_id'] = document_ids.pop()
+            self.processor.validate_file(
+                file.file_path,
+                job.file_metadata["file_size"],
+                allow_memory_only=file.file_content is not None
+            )
+            chunks = await self._chunk_file(job)
+            job.chunk_count = len(chunks)
+            
+            # Match new chunks to stored chunks with the same content
+            stored_by_hash: Dict[str, List[str]] = {}
+            for chunk_id, metadata in existing_chunks.items():
+                stored_by_hash.setdefault(metadata.get('content_hash'), []).append(chunk_id)
+            kept: List[Tuple[int, str]] = []
+            added: List[int] = []
+            for position, chunk in enumerate(chunks):
+                candidates = stored_by_hash.get(chunk.metadata['content_hash'])
+                if candidates:
+                    kept.append((position, candidates.pop()))
+                else:
+                    added.append(position)
+            removed_ids = [chunk_id for ids in stored_by_hash.values() for chunk_id in ids]
+            
+            # Embed and insert new chunks first
+            new_chunks = [chunks[position] for position in added]
+            vectors = await self._embed_all([chunk.page_content for chunk in new_chunks])
+            for start in range(0, len(new_chunks), self.write_batch_size):
+                added_ids.extend(await self.chromadb.add_embedded_documents(
+                    new_chunks[start:start + self.write_batch_size],
+                    vectors[start:start + self.write_batch_size]
+                ))
+            
+            refreshed_ids = [chunk_id for _, chunk_id in kept]
+            await self.chromadb.update_chunk_metadata(
+                refreshed_ids,
+                [chunks[position].metadata for position, _ in kept]
+            )
+            if removed_ids and not await self.chromadb.delete_documents_by_ids(removed_ids):
+                raise RuntimeError("Failed to remove outdated chunks")
+        except Exception as e:
+            self.logger.error("Document update failed", filename=file.file_path.name, error=str(e))
+            if added_ids:
+                await self.chromadb.delete_documents_by_ids(added_ids)
+            if refreshed_ids:
+                await self.chromadb.update_chunk_metadata(
+                    refreshed_ids,
+                    [existing_chunks[chunk_id] for chunk_id in refreshed_ids]
+                )
+            return UpdateResult(success=False, error=str(e), processing_time=time.perf_counter() - started)
+        
+        job.chunk_ids = dict(kept)
+        job.chunk_ids.update(zip(added, added_ids))
+        await self.chromadb.persist()
+        
+        result = UpdateResult(
+            success=True,
+            document_info=job.build_result().document_info,
+            added_chunks=len(added),
+            removed_chunks=len(removed_ids),
+            unchanged_chunks=len(kept),
+            processing_time=time.perf_counter() - started
+        )
+        self.logger.info(
+            "Document update completed",
+            filename=file.file_path.name,
+            added_chunks=result.added_chunks,
+            removed_chunks=result.removed_chunks,
+            unchanged_chunks=result.unchanged_chunks,
+            processing_time=round(result.processing_time, 3)
+        )
+        return result
+    
+    async def _embed_all(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in batches, up to embed_concurrency requests at once."""
+        slots = asyncio.Semaphore(self.embed_concurrency)
+        
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with slots:
+                return await self._embed(batch)
+        
+        batches = await asyncio.gather(*(
+            embed_batch(texts[start:start + self.embed_batch_size])
+            for start in range(0, len(texts), self.embed_batch_size)
+        ))
+        return [vector for batch in batches for vector in batch]
+    
+    async def _prepare(
+        self,
+        job: _IngestionJob,
+        extract_slots: asyncio.Semaphore,
+        embed_queue: asyncio.Queue,
+        finish: Callable[..., None]
+    ) -> None:
+        """
+        Extract and chunk one file, queueing its chunks for embedding as they are produced.
+        
+        Chunks are pulled from the processor's chunk iterator in small batches
+        on a worker thread, and the bounded embed queue holds chunking back.
+        Without extraction workers the text is streamed from the file as well,
+        so a large document never sits in memory as a whole; with workers its
+        text is extracted in the process pool first, PDF page ranges in
+        parallel, and then chunked.
+        """
+        file = job.file
+        try:
+            job.file_metadata = self.processor.create_file_metadata(file.file_path, file.file_content)
+            self.processor.validate_file(
+                file.file_path,
+                job.file_metadata["file_size"],
+                allow_memory_only=file.file_content is not None
+            )
+            async with extract_slots:
+                segments = await self._extract_segments(job)
+                chunks = self.processor.iter_chunks(
+                    file.file_path, file.file_content, job.source_name, job.file_metadata, segments
+                )
+                while batch := await asyncio.to_thread(_take, chunks, self.embed_batch_size):
+                    for chunk in batch:
+                        if job.result is not None:
+                            return
+                        await self._queue_chunk(job, chunk, embed_queue)
+        except Exception as e:
+            self.logger.error("Document preparation failed", filename=file.file_path.name, error=str(e))
+            finish(job, str(e))
+            return
+        
+        job.chunked = True
+        if len(job.chunk_ids) == job.chunk_count:
+            # Every chunk was already written while the file was being chunked
+            finish(job)
+    
+    async def _queue_chunk(self, job: _IngestionJob, chunk: LangChainDocument, embed_queue: asyncio.Queue) -> None:
+        """Number a chunk within its document and queue it for embedding."""
+        position = job.chunk_count
+        job.chunk_count += 1
+        await embed_queue.put((job, position, chunk))
+    
+    async def _chunk_file(self, job: _IngestionJob) -> List[LangChainDocument]:
+        """Extract and split a whole file."""
+        file = job.file
+        segments = await self._extract_segments(job)
+        return await asyncio.to_thread(
+            lambda: list(self.processor.iter_chunks(
+                file.file_path, file.file_content, job.source_name, job.file_metadata, segments
+            ))
+        )
+    
+    async def _extract_segments(self, job: _IngestionJob) -> Optional[List[Tuple[str, Optional[int]]]]:
+        """Extract a file's text in the process pool (None to stream it while chunking when no workers are configured)."""
+        if self.extract_workers <= 0:
+            return None
+        return await self.processor.extract_segments(job.file.file_path, job.file.file_content)
+    
+    async def _embed_stage(
+        self,
+        embed_queue: asyncio.Queue,
+        write_queue: asyncio.Queue,
+        finish: Callable[..., None]
+    ) -> None:
+        """Group queued chunks into batches and embed up to embed_concurrency batches at once."""
+        slots = asyncio.Semaphore(self.embed_concurrency)
+        in_flight = set()
+        done = False
+        batch: List[_EmbedItem] = []
+        
+        while not done:
+            item = await embed_queue.get()
+            while True:
+                if item is _END:
+                    done = True
+                    break
+                if item[0].result is None:
+                    batch.append(item)
+                if len(batch) >= self.embed_batch_size or embed_queue.empty():
+                    break
+                item = embed_queue.get_nowait()
+            
+            # Partial batches wait for chunks of the next documents unless the input is exhausted
+            if batch and (done or len(batch) >= self.embed_batch_size):
+                await slots.acquire()
+                task = asyncio.create_task(self._embed_batch(batch, write_queue, slots, finish))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                batch = []
+        
+        if in_flight:
+            await asyncio.gather(*in_flight)
+    
+    async def _embed_batch(
+        self,
+        batch: List[_EmbedItem],
+        write_queue: asyncio.Queue,
+        slots: asyncio.Semaphore,
+        finish: Callable[..., None]
+    ) -> None:
+        """Embed one batch within the rate limits and hand it to the writer."""
+        try:
+            vectors = await self._embed([chunk.page_content for _, _, chunk in batch])
+            
+            self.logger.debug("Embedded chunk batch", batch_size=len(batch))
+            for (job, position, chunk), vector in zip(batch, vectors):
+                await write_queue.put((job, position, chunk, vector))
+        except Exception as e:
+            self.logger.error("Embedding batch failed", batch_size=len(batch), error=str(e))
+            for job, _, _ in batch:
+                finish(job, f"Embedding failed: {e}")
+        finally:
+            slots.release()
+    
+    async def _embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed one request's texts within the rate limits."""
+        embeddings = self.chromadb.embeddings
+        if isinstance(embeddings, CachedEmbeddings):
+            # Cached chunks do not count against the deployment quotas
+            return await embeddings.aembed_documents(texts, before_request=self._acquire_quota)
+        await self._acquire_quota(texts)
+        return await embeddings.aembed_documents(texts)
+    
+    async def _acquire_quota(self, texts: List[str]) -> None:
+        """Wait until an embedding request for the texts fits the rate limits."""
+        await self.rate_limiter.acquire(sum(estimate_tokens(text) for text in texts))
+    
+    async def _write_stage(self, write_queue: asyncio.Queue, finish: Callable[..., None]) -> None:
+        """Write embedded chunks to ChromaDB, batching whatever queued up during the previous write."""
+        done = False
+        while not done:
+            batch: List[_WriteItem] = []
+            item = await write_queue.get()
+            while True:
+                if item is _END:
+                    done = True
+                    break
+                if item[0].result is None:
+                    batch.append(item)
+                if len(batch) >= self.write_batch_size or write_queue.empty():
+                    break
+                item = write_queue.get_nowait()
+            
+            if not batch:
+                continue
+            try:
+                ids = await self.chromadb.add_embedded_documents(
+                    [chunk for _, _, chunk, _ in batch],
+                    [vector for _, _, _, vector in batch]
+                )
+            except Exception as e:
+                self.logger.error("ChromaDB write failed", batch_size=len(batch), error=str(e))
+                for job, _, _, _ in batch:
+                    finish(job, f"Storing chunks failed: {e}")
+                continue
+            
+            for (job, position, _, _), chunk_id in zip(batch, ids):
+                job.chunk_ids[position] = chunk_id
+                if job.chunked and len(job.chunk_ids) == job.chunk_count:
+                    finish(job)
+    
+    async def _discard_failed(self, jobs: List[_IngestionJob]) -> None:
+        """Remove chunks of failed documents that were written before the failure."""
+        orphaned = [
+            chunk_id
+            for job in jobs if job.error is not None
+            for chunk_id in job.chunk_ids.values()
+        ]
+        if orphaned:
+            self.logger.warning("Removing chunks of failed documents", chunk_count=len(orphaned))
+            await self.chromadb.delete_documents_by_ids(orphaned)
+    
+    def close(self) -> None:
+        """Shut down the extraction process pool."""
+        self.processor.close()
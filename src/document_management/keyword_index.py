@@ -0,0 +1,392 @@
+"""
+KeywordIndex - Incremental BM25 inverted index stored next to ChromaDB.
+
+Banking documents are full of exact identifiers (MDRM codes such as
+RCON2170, regulation numbers, schedule names such as RC-R) that embeddings
+match poorly. The keyword index gives the search layer a lexical retriever
+for them.
+
+Postings are compact typed arrays (uint32 document numbers, uint16 term
+frequencies) scored with NumPy. The index is persisted as a snapshot plus an
+append-only journal: every add or remove is appended to the journal, and the
+journal is folded into a new snapshot once it grows large, so updates never
+rewrite the whole index.
+"""
+
+import array
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SNAPSHOT_FILENAME = "index.npz"
+JOURNAL_FILENAME = "journal.jsonl"
+INDEX_VERSION = 1
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[-./][a-z0-9]+)*")
+_TOKEN_SEPARATORS = re.compile(r"[-./]")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this "
+    "to was were will with".split()
+)
+_MAX_TF = 65535
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms.
+    
+    Compound identifiers keep their full form and also index their parts,
+    so "RC-R" matches both "RC-R" and "RC".
+    
+    Args:
+        text: Text to tokenize
+    
+    Returns:
+        Lowercased terms without stopwords
+    """
+    terms = []
+    for match in _TOKEN.finditer(text.lower()):
+        token = match.group()
+        if token in _STOPWORDS:
+            continue
+        terms.append(token)
+        if _TOKEN_SEPARATORS.search(token):
+            terms.extend(
+                part for part in _TOKEN_SEPARATORS.split(token)
+                if len(part) > 1 and part not in _STOPWORDS
+            )
+    return terms
+
+
+class KeywordIndex:
+    """
+    BM25 inverted index over chunk texts, keyed by ChromaDB chunk ID.
+    
+    Removed chunks are tombstoned and dropped from the postings when the
+    index is compacted. All methods are thread-safe.
+    """
+    
+    def __init__(self, index_dir: Optional[str] = None, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize keyword index.
+        
+        Args:
+            index_dir: Directory for the snapshot and journal (in memory only if None)
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.index_dir = Path(index_dir) if index_dir else None
+        self.k1 = k1
+        self.b = b
+        
+        self._lock = threading.Lock()
+        self._reset()
+        self._journal_entries = 0
+        
+        self.logger = logger.bind(
+            log_type="SYSTEM",
+            component="keyword_index"
+        )
+        
+        if self.index_dir is not None:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                self._load()
+    
+    def _reset(self) -> None:
+        """Drop all index contents (lock must be held)."""
+        self._terms: Dict[str, int] = {}
+        self._postings_docs: List[array.array] = []
+        self._postings_tfs: List[array.array] = []
+        self._doc_ids: List[str] = []
+        self._doc_numbers: Dict[str, int] = {}
+        self._doc_lengths = array.array("I")
+        self._live = bytearray()
+        self._live_count = 0
+        self._live_length = 0
+    
+    def __len__(self) -> int:
+        return self._live_count
+    
+    def add(self, chunk_ids: Sequence[str], texts: Sequence[str], journal: bool = True) -> None:
+        """
+        Index chunks, replacing any chunk already indexed under the same ID.
+        
+        Args:
+            chunk_ids: ChromaDB chunk IDs
+            texts: Chunk texts, one per ID
+            journal: Record the chunks in the journal; a rebuild skips it and
+                persists the index with flush(force=True) once every page is added
+        """
+        documents = [
+            (chunk_id, dict(Counter(tokenize(text))))
+            for chunk_id, text in zip(chunk_ids, texts)
+        ]
+        with self._lock:
+            if journal:
+                self._append_journal({"op": "add", "docs": documents})
+            self._apply_add(documents)
+    
+    def remove(self, chunk_ids: Iterable[str]) -> None:
+        """
+        Remove chunks from the index.
+        
+        Args:
+            chunk_ids: ChromaDB chunk IDs
+        """
+        chunk_ids = list(chunk_ids)
+        with self._lock:
+            # Look up under the lock so a concurrent add or remove can't change the answer
+            chunk_ids = [chunk_id for chunk_id in chunk_ids if chunk_id in self._doc_numbers]
+            if not chunk_ids:
+                return
+            self._append_journal({"op": "remove", "ids": chunk_ids})
+            self._apply_remove(chunk_ids)
+    
+    def clear(self) -> None:
+        """Drop every chunk, e.g. before rebuilding the index when it is out of sync with ChromaDB."""
+        with self._lock:
+            self._reset()
+            self._write_snapshot()
+    
+    def search(self, query: str, k: int = 10, chunk_ids: Optional[Iterable[str]] = None) -> List[Tuple[str, float]]:
+        """
+        Rank indexed chunks against a query with BM25.
+        
+        Args:
+            query: Query text
+            k: Maximum number of results
+            chunk_ids: Only rank these chunks (all chunks if None); term
+                statistics still cover the whole index, so scores stay comparable
+        
+        Returns:
+            (chunk ID, score) pairs, best first
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            if not terms or not self._live_count:
+                return []
+            
+            allowed = None
+            if chunk_ids is not None:
+                allowed = np.zeros(len(self._doc_ids), dtype=bool)
+                numbers = [self._doc_numbers[chunk_id] for chunk_id in chunk_ids if chunk_id in self._doc_numbers]
+                if not numbers:
+                    return []
+                allowed[numbers] = True
+            
+            # Copies, so no NumPy view keeps the growable arrays exported after the lock is released
+            lengths = np.frombuffer(self._doc_lengths, dtype=np.uint32).astype(np.float32)
+            live = np.frombuffer(self._live, dtype=np.uint8).astype(bool)
+            average_length = self._live_length / self._live_count
+            scores = np.zeros(len(self._doc_ids), dtype=np.float32)
+            
+            for term in terms:
+                term_id = self._terms.get(term)
+                if term_id is None:
+                    continue
+                docs = np.frombuffer(self._postings_docs[term_id], dtype=np.uint32).copy()
+                live_postings = live[docs]
+                document_frequency = int(live_postings.sum())
+                if not document_frequency:
+                    continue
+                docs = docs[live_postings]
+                tfs = np.frombuffer(self._postings_tfs[term_id], dtype=np.uint16)[live_postings].astype(np.float32)
+                if allowed is not None:
+                    in_scope = allowed[docs]
+                    docs, tfs = docs[in_scope], tfs[in_scope]
+                
+                idf = math.log(1 + (self._live_count - document_frequency + 0.5) / (document_frequency + 0.5))
+                norms = self.k1 * (1 - self.b + self.b * lengths[docs] / average_length)
+                scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norms)
+            
+            matched = np.flatnonzero(scores)
+            if len(matched) > k:
+                matched = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+            ranked = matched[np.argsort(-scores[matched], kind="stable")]
+            return [(self._doc_ids[number], float(scores[number])) for number in ranked]
+    
+    def flush(self, force: bool = False) -> None:
+        """
+        Fold the journal into a new snapshot once it has grown large.
+        
+        Args:
+            force: Write the snapshot regardless, e.g. after a rebuild
+        """
+        if self.index_dir is None:
+            return
+        with self._lock:
+            tombstones = len(self._doc_ids) - self._live_count
+            if force or self._journal_entries > max(1000, self._live_count // 2) or tombstones > max(1000, self._live_count // 4):
+                self._write_snapshot()
+    
+    def _apply_add(self, documents: List[Tuple[str, Dict[str, int]]]) -> None:
+        """Add term counts of documents to the postings (lock must be held)."""
+        self._apply_remove([chunk_id for chunk_id, _ in documents if chunk_id in self._doc_numbers])
+        for chunk_id, counts in documents:
+            number = len(self._doc_ids)
+            self._doc_ids.append(chunk_id)
+            self._doc_numbers[chunk_id] = number
+            length = sum(counts.values())
+            self._doc_lengths.append(length)
+            self._live.append(1)
+            self._live_count += 1
+            self._live_length += length
+            
+            for term, count in counts.items():
+                term_id = self._terms.get(term)
+                if term_id is None:
+                    term_id = self._terms[term] = len(self._postings_docs)
+                    self._postings_docs.append(array.array("I"))
+                    self._postings_tfs.append(array.array("H"))
+                self._postings_docs[term_id].append(number)
+                self._postings_tfs[term_id].append(min(count, _MAX_TF))
+    
+    def _apply_remove(self, chunk_ids: Iterable[str]) -> None:
+        """Tombstone documents (lock must be held)."""
+        for chunk_id in chunk_ids:
+            number = self._doc_numbers.pop(chunk_id, None)
+            if number is None:
+                continue
+            self._live[number] = 0
+            self._live_count -= 1
+            self._live_length -= self._doc_lengths[number]
+    
+    def _append_journal(self, entry: dict) -> None:
+        """Append an operation to the journal (lock must be held)."""
+        if self.index_dir is None:
+            return
+        try:
+            with open(self.index_dir / JOURNAL_FILENAME, "a", encoding="utf-8") as journal:
+                journal.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._journal_entries += len(entry.get("docs") or entry.get("ids") or ())
+        except OSError as e:
+            self.logger.warning("Failed to write keyword index journal", error=str(e))
+    
+    def _write_snapshot(self) -> None:
+        """Write live postings to a new snapshot and truncate the journal (lock must be held)."""
+        if self.index_dir is None:
+            return
+        
+        # Renumber live documents and drop tombstoned postings
+        live = np.frombuffer(self._live, dtype=np.uint8).astype(bool)
+        renumber = np.full(len(self._doc_ids), -1, dtype=np.int64)
+        renumber[live] = np.arange(int(live.sum()))
+        doc_ids = [doc_id for doc_id, is_live in zip(self._doc_ids, live) if is_live]
+        
+        terms, docs, tfs, offsets = [], [], [], [0]
+        for term, term_id in self._terms.items():
+            term_docs = renumber[np.frombuffer(self._postings_docs[term_id], dtype=np.uint32)]
+            kept = term_docs >= 0
+            if not kept.any():
+                continue
+            terms.append(term)
+            docs.append(term_docs[kept].astype(np.uint32))
+            tfs.append(np.frombuffer(self._postings_tfs[term_id], dtype=np.uint16)[kept])
+            offsets.append(offsets[-1] + int(kept.sum()))
+        
+        payload = {
+            "version": np.array([INDEX_VERSION]),
+            "terms": np.frombuffer("\n".join(terms).encode("utf-8"), dtype=np.uint8),
+            "doc_ids": np.frombuffer("\n".join(doc_ids).encode("utf-8"), dtype=np.uint8),
+            "doc_lengths": np.frombuffer(self._doc_lengths, dtype=np.uint32)[live],
+            "offsets": np.array(offsets, dtype=np.uint64),
+            "docs": np.concatenate(docs) if docs else np.array([], dtype=np.uint32),
+            "tfs": np.concatenate(tfs) if tfs else np.array([], dtype=np.uint16),
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_dir, prefix=".tmp-", suffix=".npz")
+            with os.fdopen(fd, "wb") as snapshot:
+                np.savez(snapshot, **payload)
+            os.replace(tmp_path, self.index_dir / SNAPSHOT_FILENAME)
+            # Replaying a journal over a snapshot that already contains it is harmless
+            open(self.index_dir / JOURNAL_FILENAME, "w").close()
+            self._journal_entries = 0
+        except OSError as e:
+            self.logger.warning("Failed to write keyword index snapshot", error=str(e))
+            return
+        
+        self._load_snapshot(payload)
+        self.logger.debug("Keyword index snapshot written", chunk_count=len(doc_ids), term_count=len(terms))
+    
+    def _load(self) -> None:
+        """Load the snapshot and replay the journal (lock must be held)."""
+        snapshot_path = self.index_dir / SNAPSHOT_FILENAME
+        if snapshot_path.exists():
+            try:
+                with np.load(snapshot_path) as snapshot:
+                    if int(snapshot["version"][0]) == INDEX_VERSION:
+                        self._load_snapshot({name: snapshot[name] for name in snapshot.files})
+            except (OSError, ValueError, KeyError) as e:
+                self.logger.warning("Ignoring unreadable keyword index snapshot", error=str(e))
+                self._reset()
+        
+        journal_path = self.index_dir / JOURNAL_FILENAME
+        if journal_path.exists():
+            with open(journal_path, "r", encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Torn final write
+                        break
+                    if entry.get("op") == "add":
+                        self._apply_add([(chunk_id, counts) for chunk_id, counts in entry["docs"]])
+                        self._journal_entries += len(entry["docs"])
+                    elif entry.get("op") == "remove":
+                        self._apply_remove(entry["ids"])
+                        self._journal_entries += len(entry["ids"])
+        
+        self.logger.info(
+            "Keyword index loaded",
+            index_dir=str(self.index_dir),
+            chunk_count=self._live_count,
+            term_count=len(self._terms)
+        )
+    
+    def _load_snapshot(self, payload: Dict[str, np.ndarray]) -> None:
+        """Replace the index contents with snapshot arrays (lock must be held)."""
+        self._reset()
+        terms_blob = payload["terms"].tobytes().decode("utf-8")
+        doc_ids_blob = payload["doc_ids"].tobytes().decode("utf-8")
+        terms = terms_blob.split("\n") if terms_blob else []
+        self._doc_ids = doc_ids_blob.split("\n") if doc_ids_blob else []
+        self._doc_numbers = {doc_id: number for number, doc_id in enumerate(self._doc_ids)}
+        self._doc_lengths = array.array("I", payload["doc_lengths"].astype(np.uint32).tobytes())
+        self._live = bytearray(b"\x01" * len(self._doc_ids))
+        self._live_count = len(self._doc_ids)
+        self._live_length = int(payload["doc_lengths"].sum())
+        
+        offsets = payload["offsets"]
+        docs = payload["docs"].astype(np.uint32)
+        tfs = payload["tfs"].astype(np.uint16)
+        for term_id, term in enumerate(terms):
+            start, end = int(offsets[term_id]), int(offsets[term_id + 1])
+            self._terms[term] = term_id
+            self._postings_docs.append(array.array("I", docs[start:end].tobytes()))
+            self._postings_tfs.append(array.array("H", tfs[start:end].tobytes()))
+    
+    def stats(self) -> Dict[str, int]:
+        """Get index size statistics."""
+        with self._lock:
+            return {
+                "chunk_count": self._live_count,
+                "term_count": len(self._terms),
+                "tombstones": len(self._doc_ids) - self._live_count,
+                "journal_entries": self._journal_entries,
+                "postings_bytes": sum(
+                    docs.itemsize * len(docs) + tfs.itemsize * len(tfs)
+                    for docs, tfs in zip(self._postings_docs, self._postings_tfs)
+                )
+            }
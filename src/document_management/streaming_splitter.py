@@ -0,0 +1,123 @@
+"""
+IncrementalTextSplitter - Chunk text as it is extracted.
+
+Splitting a document used to require its whole text as one string, so large
+PDFs were held in memory several times over (file bytes, page texts, joined
+text and chunks). The incremental splitter is fed one page or paragraph at a
+time, splits whenever its buffer grows past a bound and returns the finished
+chunks together with the pages they came from, keeping only the unfinished
+tail for the next round.
+"""
+
+from bisect import bisect_right
+from typing import List, NamedTuple, Optional, Tuple
+
+from langchain.text_splitter import TextSplitter
+
+
+class TextChunk(NamedTuple):
+    """A chunk of document text and the pages it spans (None for unpaged formats)."""
+    content: str
+    page: Optional[int] = None
+    page_end: Optional[int] = None
+
+
+class IncrementalTextSplitter:
+    """
+    Feed-as-you-go wrapper around a LangChain text splitter.
+    
+    Segments are joined with ``separator``, exactly as a full-text extraction
+    would join them. Each split keeps the last two chunks in the buffer and
+    re-splits from the start of the second to last one, so no chunk is cut
+    short by the buffer end and overlaps are preserved. Boundaries near a
+    re-split can differ slightly from splitting the whole text at once,
+    since the recursive splitter sees a shorter first paragraph there.
+    """
+    
+    # Chunks kept back after each split; the last one may continue in the next segment
+    KEEP_CHUNKS = 2
+    
+    def __init__(self, text_splitter: TextSplitter, buffer_size: int, separator: str = "\n\n"):
+        """
+        Initialize incremental splitter.
+        
+        Args:
+            text_splitter: Splitter producing the chunks
+            buffer_size: Buffered characters that trigger a split
+            separator: Text placed between consecutive segments
+        """
+        self.text_splitter = text_splitter
+        self.buffer_size = buffer_size
+        self.separator = separator
+        self._buffer = ""
+        # (buffer offset, page) where each segment starts
+        self._pages: List[Tuple[int, Optional[int]]] = []
+    
+    def feed(self, text: str, page: Optional[int] = None) -> List[TextChunk]:
+        """
+        Add a segment of text.
+        
+        Args:
+            text: Segment text (a page, paragraph or block)
+            page: Page number of the segment, if the format has pages
+        
+        Returns:
+            Chunks completed by this segment, in document order
+        """
+        if self._buffer:
+            self._buffer += self.separator
+        self._pages.append((len(self._buffer), page))
+        self._buffer += text
+        if len(self._buffer) < self.buffer_size:
+            return []
+        return self._split(final=False)
+    
+    def finish(self) -> List[TextChunk]:
+        """
+        Split whatever is left after the last segment.
+        
+        Returns:
+            Remaining chunks, in document order
+        """
+        chunks = self._split(final=True) if self._buffer else []
+        self._buffer = ""
+        self._pages = []
+        return chunks
+    
+    def _split(self, final: bool) -> List[TextChunk]:
+        pieces = self.text_splitter.split_text(self._buffer)
+        
+        # Locate chunks in the buffer; overlapping chunks start after their predecessor
+        starts = []
+        cursor = 0
+        for piece in pieces:
+            start = self._buffer.find(piece, cursor)
+            if start < 0:
+                start = cursor
+            starts.append(start)
+            cursor = start + 1
+        
+        emitted = len(pieces) if final else len(pieces) - self.KEEP_CHUNKS
+        if emitted <= 0:
+            return []
+        chunks = [
+            TextChunk(piece, self._page_at(start), self._page_at(start + max(len(piece) - 1, 0)))
+            for piece, start in zip(pieces[:emitted], starts[:emitted])
+        ]
+        
+        if not final:
+            self._drop_before(starts[emitted])
+        return chunks
+    
+    def _page_at(self, offset: int) -> Optional[int]:
+        """Page of the segment containing a buffer offset."""
+        index = bisect_right([start for start, _ in self._pages], offset) - 1
+        return self._pages[max(index, 0)][1]
+    
+    def _drop_before(self, offset: int) -> None:
+        """Discard buffered text before an offset."""
+        first = max(bisect_right([start for start, _ in self._pages], offset) - 1, 0)
+        self._pages = [(0, self._pages[first][1])] + [
+            (start - offset, page) for start, page in self._pages[first + 1:]
+        ]
+        self._buffer = self._buffer[offset:]
@@ -36,6 +36,7 @@ from src.config.settings import get_settings, Settings, reload_settings
 from src.services.logging_service import setup_logging, get_logger
 from src.utils.azure_langchain import create_azure_chat_openai
 from src.chatbot.agent import ChatbotAgent
+from src.chatbot.conversation_store import ConversationStore
 from src.chatbot.prompts import SystemPrompts
 from src.utils.console import create_console, get_console
 from src.utils.error_handlers import handle_error, format_error_for_user
@@ -741,19 +742,31 @@ def reload(click_ctx, reload: bool):
     default='text',
     help='Output format'
 )
+@click.option(
+    '--last',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Show only the last N messages'
+)
 @click.pass_context
-def show_conversation(click_ctx, conversation_file: str, output_format: str):
-    """Display a saved conversation."""
+def show_conversation(click_ctx, conversation_file: str, output_format: str, last: Optional[int]):
+    """Display a saved conversation or a conversation log (.jsonl)."""
     console = click_ctx.obj['console']
     
     try:
         # Load conversation data
         import json
-        with open(conversation_file, 'r', encoding='utf-8') as f:
-            conversation_data = json.load(f)
+        if conversation_file.endswith('.jsonl'):
+            conversation_data = _load_conversation_log(conversation_file, last)
+        else:
+            with open(conversation_file, 'r', encoding='utf-8') as f:
+                conversation_data = json.load(f)
+            if last:
+                conversation_data['messages'] = conversation_data.get('messages', [])[-last:]
         
         messages = conversation_data.get('messages', [])
         metadata = conversation_data.get('metadata', {})
+        message_total = metadata.get('message_count', len(messages))
         
         if output_format == 'json':
             click.echo(json.dumps(conversation_data, indent=2, ensure_ascii=False))
@@ -761,7 +774,7 @@ def show_conversation(click_ctx, conversation_file: str, output_format: str):
         elif output_format == 'markdown':
             click.echo(f"# Conversation: {metadata.get('title', 'Untitled')}")
             click.echo(f"**ID:** {metadata.get('conversation_id', 'Unknown')}")
-            click.echo(f"**Messages:** {len(messages)}")
+            click.echo(f"**Messages:** {message_total}")
             click.echo(f"**Created:** {metadata.get('created_at', 'Unknown')}")
             click.echo()
             
@@ -783,7 +796,7 @@ def show_conversation(click_ctx, conversation_file: str, output_format: str):
             # Show metadata
             if metadata:
                 console.print_status(f"ID: {metadata.get('conversation_id', 'Unknown')}", "info")
-                console.print_status(f"Messages: {len(messages)}", "info")
+                console.print_status(f"Messages: {message_total}", "info")
                 console.print_status(f"Total Tokens: {metadata.get('total_tokens', 'Unknown')}", "info")
             
             # Show messages
@@ -800,6 +813,36 @@ def show_conversation(click_ctx, conversation_file: str, output_format: str):
         console.print_error(f"Failed to show conversation: {str(e)}")
 
 
+def _load_conversation_log(log_file: str, last: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Load a conversation log written by the agent in show_conversation's format.
+    
+    The message count comes from the log's index, and --last reads only the
+    end of the log.
+    """
+    store = ConversationStore(log_file)
+    records = store.tail(last) if last else store.iter_records()
+    roles = {'human': 'user', 'ai': 'assistant'}
+    first = store.read(0, 1)
+    
+    return {
+        'metadata': {
+            'title': Path(log_file).stem,
+            'conversation_id': Path(log_file).stem,
+            'message_count': len(store),
+            'created_at': first[0].get('timestamp', 'Unknown') if first else 'Unknown'
+        },
+        'messages': [
+            {
+                'role': roles.get(record['type'], record['type']),
+                'content': record['data'].get('content', ''),
+                'timestamp': record.get('timestamp')
+            }
+            for record in records
+        ]
+    }
+
+
 @cli.command()
 @click.option(
     '--port',
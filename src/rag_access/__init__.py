@@ -14,6 +14,9 @@ from .search_service import SearchService
 from .rag_models import RAGQuery, RAGResponse, SearchResult, SearchContext
 from .rag_tool import RAGSearchTool
 from .rag_prompts import RAGPrompts
+from .search_cache import SearchCache
+from .rank_fusion import reciprocal_rank_fusion
+from .search_scope import SearchScope
 
 __all__ = [
     'SearchService',
@@ -22,5 +25,8 @@ __all__ = [
     'SearchResult',
     'SearchContext',
     'RAGSearchTool',
-    'RAGPrompts'
+    'RAGPrompts',
+    'SearchCache',
+    'reciprocal_rank_fusion',
+    'SearchScope'
 ]
\ No newline at end of file
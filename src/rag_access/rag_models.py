@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
+from .search_scope import SearchScope
+
 
 @dataclass
 class RAGQuery:
@@ -16,6 +18,7 @@ class RAGQuery:
     include_sources: bool = True
     use_general_knowledge: bool = False
     filters: Optional[Dict[str, Any]] = None
+    scope: Optional[SearchScope] = None
     
     def __post_init__(self):
         if self.filters is None:
@@ -2,14 +2,16 @@
 RAGSearchTool - LangChain tool for AI access to RAG system.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from langchain.tools import BaseTool
 
 from src.config.settings import Settings
+from src.utils.event_loop import run_sync
 from .search_service import SearchService
 from .rag_models import RAGQuery, SearchContext
+from .search_scope import SearchScope
 
 
 class RAGSearchInput(BaseModel):
@@ -23,6 +25,26 @@ class RAGSearchInput(BaseModel):
         default=False,
         description="Whether to supplement with general knowledge if documents are insufficient"
     )
+    filenames: Optional[List[str]] = Field(
+        default=None,
+        description="Only search these documents (exact filenames, e.g. 'loan_policy.pdf')"
+    )
+    file_types: Optional[List[str]] = Field(
+        default=None,
+        description="Only search documents of these file types ('pdf', 'docx', 'txt')"
+    )
+    document_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Only search documents with these document IDs"
+    )
+    uploaded_after: Optional[str] = Field(
+        default=None,
+        description="Only search documents uploaded on or after this date (YYYY-MM-DD)"
+    )
+    uploaded_before: Optional[str] = Field(
+        default=None,
+        description="Only search documents uploaded on or before this date (YYYY-MM-DD)"
+    )
 
 
 class RAGSearchTool(BaseTool):
@@ -62,26 +84,9 @@ class RAGSearchTool(BaseTool):
             Formatted document context for agent to use in response generation
         """
         # This will be called by LangChain in sync context
-        import asyncio
-        
         try:
-            # Run async method in sync context
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                # No event loop in current thread
-                return asyncio.run(self._arun(query, max_chunks, use_general_knowledge, **kwargs))
-            
-            if loop.is_running():
-                # We're in an async context, need to handle carefully
-                # For now, just run in new event loop (may need nest_asyncio in some contexts)
-                return asyncio.run(self._arun(query, max_chunks, use_general_knowledge, **kwargs))
-            else:
-                # No running loop, can use run_until_complete
-                return loop.run_until_complete(
-                    self._arun(query, max_chunks, use_general_knowledge, **kwargs)
-                )
-            return result
+            # Run async method on the process-wide event loop
+            return run_sync(self._arun(query, max_chunks, use_general_knowledge, **kwargs))
         except Exception as e:
             return f"RAG search error: {str(e)}"
     
@@ -90,6 +95,11 @@ class RAGSearchTool(BaseTool):
         query: str,
         max_chunks: int = 3,
         use_general_knowledge: bool = False,
+        filenames: Optional[List[str]] = None,
+        file_types: Optional[List[str]] = None,
+        document_ids: Optional[List[str]] = None,
+        uploaded_after: Optional[str] = None,
+        uploaded_before: Optional[str] = None,
         **kwargs: Any
     ) -> str:
         """
@@ -99,6 +109,11 @@ class RAGSearchTool(BaseTool):
             query: Search query
             max_chunks: Maximum chunks to retrieve
             use_general_knowledge: Whether to use general knowledge (passed to agent)
+            filenames: Only search these documents
+            file_types: Only search documents of these file types
+            document_ids: Only search documents with these IDs
+            uploaded_after: Only search documents uploaded on or after this date
+            uploaded_before: Only search documents uploaded on or before this date
             
         Returns:
             Formatted document context for agent to use in response generation
@@ -111,12 +126,26 @@ class RAGSearchTool(BaseTool):
             # Clamp max_chunks to reasonable range
             max_chunks = max(1, min(10, max_chunks))
             
+            # Limit the search to the requested documents
+            scope = SearchScope(
+                filenames=filenames or [],
+                file_types=file_types or [],
+                document_ids=document_ids or [],
+                uploaded_after=uploaded_after,
+                uploaded_before=uploaded_before
+            )
+            try:
+                scope.upload_bounds()
+            except ValueError as e:
+                return str(e)
+            
             # Create RAG query
             rag_query = RAGQuery(
                 query=query.strip(),
                 max_chunks=max_chunks,
                 score_threshold=0.2,
-                use_general_knowledge=use_general_knowledge
+                use_general_knowledge=use_general_knowledge,
+                scope=scope
             )
             
             # Create search context
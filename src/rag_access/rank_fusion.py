@@ -0,0 +1,35 @@
+"""
+Reciprocal rank fusion of ranked result lists.
+
+Vector and keyword retrieval produce scores on unrelated scales (distances
+and BM25), so hybrid search combines them by rank instead: each list
+contributes 1 / (k + rank) for every result it contains.
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Sequence[Sequence[Dict[str, Any]]],
+    k: int = 60,
+    key: Callable[[Dict[str, Any]], Hashable] = lambda result: result['id']
+) -> List[Tuple[Dict[str, Any], float]]:
+    """
+    Fuse ranked result lists with reciprocal rank fusion.
+    
+    Args:
+        ranked_lists: Result lists, each ordered best first
+        k: Fusion constant; larger values flatten the advantage of top ranks
+        key: Identity of a result across lists
+    
+    Returns:
+        (result, fused score) pairs, best first; a result found by several
+        lists is represented by its entry from the first list containing it
+    """
+    fused: Dict[Hashable, List[Any]] = {}
+    for results in ranked_lists:
+        for rank, result in enumerate(results, start=1):
+            entry = fused.setdefault(key(result), [result, 0.0])
+            entry[1] += 1.0 / (k + rank)
+    
+    return sorted(((result, score) for result, score in fused.values()), key=lambda item: item[1], reverse=True)
@@ -0,0 +1,110 @@
+"""
+SearchCache - Query embedding and search result cache for RAG searches.
+
+Multi-step agent runs often issue the same document search several times in
+one conversation. The cache keeps two levels:
+
+- normalized query text -> query embedding, so repeated queries are not
+  embedded again
+- (query embedding, k, score threshold, filters, collection version) ->
+  search results, so repeated searches skip ChromaDB entirely
+
+Result entries include the collection version, which ChromaDBService bumps on
+every add, update or delete, so results cached before a change are never
+served after it.
+"""
+
+import hashlib
+import json
+import re
+import struct
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from src.utils.lru_cache import ResponseCache
+
+logger = structlog.get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so case and spacing variants share cache entries."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", query)).strip().casefold()
+
+
+def results_cache_key(
+    embedding: List[float],
+    k: int,
+    score_threshold: float,
+    filters: Optional[Dict[str, Any]],
+    collection_version: int
+) -> str:
+    """Build the result cache key for a search."""
+    digest = hashlib.sha256(struct.pack(f"{len(embedding)}d", *embedding))
+    digest.update(json.dumps(
+        [k, score_threshold, filters or None, collection_version],
+        sort_keys=True,
+        default=str
+    ).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SearchCache:
+    """
+    Two-level cache for query embeddings and search results.
+    """
+    
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 600):
+        """
+        Initialize search cache.
+        
+        Args:
+            max_entries: Maximum entries per level
+            ttl_seconds: Lifetime of cached entries
+        """
+        self.embeddings: ResponseCache[List[float]] = ResponseCache(
+            default_ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            component="search_cache"
+        )
+        self.results: ResponseCache[List[Any]] = ResponseCache(
+            default_ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            component="search_cache"
+        )
+        self.logger = logger.bind(
+            log_type="SYSTEM",
+            component="search_cache"
+        )
+    
+    def get_embedding(self, query: str) -> Optional[List[float]]:
+        """Get the cached embedding of a query."""
+        return self.embeddings.get(normalize_query(query))
+    
+    def put_embedding(self, query: str, embedding: List[float]) -> None:
+        """Cache the embedding of a query."""
+        self.embeddings.put(normalize_query(query), embedding)
+    
+    def get_results(self, key: str) -> Optional[List[Any]]:
+        """Get cached search results (see results_cache_key)."""
+        return self.results.get(key)
+    
+    def put_results(self, key: str, results: List[Any]) -> None:
+        """Cache search results (see results_cache_key)."""
+        self.results.put(key, results)
+    
+    def clear(self) -> None:
+        """Remove every cached embedding and result."""
+        self.embeddings.clear()
+        self.results.clear()
+        self.logger.info("Search cache cleared")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get hit rates of both cache levels."""
+        return {
+            "query_embeddings": self.embeddings.stats(),
+            "search_results": self.results.stats()
+        }
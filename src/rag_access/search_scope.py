@@ -0,0 +1,134 @@
+"""
+SearchScope - Restrict RAG searches to some documents.
+
+Without a scope every search ranked the whole collection and the agent had
+to pick the relevant documents out of the results. A scope names the
+documents to search by filename, file type, document ID and upload date, and
+is turned into a ChromaDB ``where`` clause, so both retrievers only rank
+chunks of those documents.
+
+ChromaDB compares numbers only, so upload date ranges are resolved to the
+matching filenames through the document catalog first.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class SearchScope:
+    """
+    Documents a search is limited to; empty fields do not restrict it.
+    
+    Upload bounds are ISO dates or datetimes and both are inclusive; a date
+    bound covers the whole day (UTC).
+    """
+    filenames: List[str] = field(default_factory=list)
+    file_types: List[str] = field(default_factory=list)
+    document_ids: List[str] = field(default_factory=list)
+    uploaded_after: Optional[str] = None
+    uploaded_before: Optional[str] = None
+    
+    def is_empty(self) -> bool:
+        """Whether the scope leaves the search unrestricted."""
+        return not (
+            self.filenames or self.file_types or self.document_ids
+            or self.uploaded_after or self.uploaded_before
+        )
+    
+    def has_upload_range(self) -> bool:
+        """Whether the scope limits upload dates."""
+        return bool(self.uploaded_after or self.uploaded_before)
+    
+    def upload_bounds(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get the upload range as UTC ISO timestamps.
+        
+        Returns:
+            (inclusive lower bound, exclusive upper bound), None where unbounded
+        
+        Raises:
+            ValueError: If a bound is not an ISO date or datetime
+        """
+        lower = _parse_bound(self.uploaded_after, upper=False) if self.uploaded_after else None
+        upper = _parse_bound(self.uploaded_before, upper=True) if self.uploaded_before else None
+        return lower, upper
+    
+    def where_clauses(self) -> List[Dict[str, Any]]:
+        """ChromaDB conditions for the filename, file type and document ID fields."""
+        clauses = []
+        if self.filenames:
+            clauses.append(_any_of("filename", self.filenames))
+        if self.file_types:
+            clauses.append(_any_of("file_type", [_normalize_file_type(file_type) for file_type in self.file_types]))
+        if self.document_ids:
+            clauses.append(_any_of("document_id", self.document_ids))
+        return clauses
+
+
+def build_where(
+    filters: Optional[Dict[str, Any]],
+    scope_clauses: Sequence[Dict[str, Any]] = ()
+) -> Optional[Dict[str, Any]]:
+    """
+    Combine metadata filters and scope conditions into one ChromaDB ``where`` clause.
+    
+    Args:
+        filters: Metadata filters; several plain fields mean all must match
+        scope_clauses: Further conditions, all of which must match
+    
+    Returns:
+        Where clause, or None if nothing restricts the search
+    """
+    clauses = []
+    for key, value in (filters or {}).items():
+        if key == "$and":
+            clauses.extend(value)
+        else:
+            clauses.append({key: value})
+    clauses.extend(scope_clauses)
+    
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+def filename_clause(filenames: Sequence[str]) -> Dict[str, Any]:
+    """ChromaDB condition matching any of some filenames."""
+    return _any_of("filename", filenames)
+
+
+def _any_of(key: str, values: Sequence[str]) -> Dict[str, Any]:
+    values = list(dict.fromkeys(values))
+    if len(values) == 1:
+        return {key: values[0]}
+    return {key: {"$in": values}}
+
+
+def _normalize_file_type(file_type: str) -> str:
+    """File types are stored as lowercase extensions with the dot ('.pdf')."""
+    file_type = file_type.strip().lower()
+    return file_type if file_type.startswith(".") else f".{file_type}"
+
+
+def _parse_bound(value: str, upper: bool) -> str:
+    """Convert an ISO date or datetime bound to a UTC ISO timestamp."""
+    try:
+        if len(value.strip()) == 10:
+            day = date.fromisoformat(value.strip())
+            if upper:
+                day += timedelta(days=1)
+            moment = datetime.combine(day, time(), tzinfo=timezone.utc)
+        else:
+            moment = datetime.fromisoformat(value.strip())
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+            if upper:
+                # Inclusive datetime bound; timestamps carry microseconds
+                moment += timedelta(microseconds=1)
+    except ValueError:
+        raise ValueError(f"Invalid upload date '{value}': expected YYYY-MM-DD or an ISO datetime") from None
+    return moment.astimezone(timezone.utc).isoformat()
@@ -5,6 +5,7 @@ Handles AI queries and response generation using document context.
 """
 
 import asyncio
+import dataclasses
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
@@ -14,6 +15,9 @@ from src.config.settings import Settings
 from src.document_management.database_manager import DatabaseManager
 from .rag_models import RAGQuery, RAGResponse, SearchResult, SearchContext
 from .rag_prompts import RAGPrompts
+from .search_cache import SearchCache, results_cache_key
+from .rank_fusion import reciprocal_rank_fusion
+from .search_scope import build_where, filename_clause
 
 
 logger = structlog.get_logger(__name__)
@@ -48,6 +52,14 @@ class SearchService:
         # Initialize database manager for search
         self.database_manager = DatabaseManager(settings)
         
+        # Cache query embeddings and results of repeated searches
+        self.search_cache: Optional[SearchCache] = None
+        if settings.search_cache_ttl_seconds > 0:
+            self.search_cache = SearchCache(
+                max_entries=settings.search_cache_max_entries,
+                ttl_seconds=settings.search_cache_ttl_seconds
+            )
+        
         self.logger.info("Search Service initialized")
     
     async def search_and_generate(
@@ -103,7 +115,8 @@ class SearchService:
                     "search_params": {
                         "max_chunks": query.max_chunks,
                         "score_threshold": query.score_threshold,
-                        "use_general_knowledge": query.use_general_knowledge
+                        "use_general_knowledge": query.use_general_knowledge,
+                        "scope": dataclasses.asdict(query.scope) if query.scope else None
                     },
                     "context": context.__dict__ if context else None,
                     "documents_found": len(search_results),
@@ -141,6 +154,11 @@ class SearchService:
         """
         Search for relevant documents.
         
+        A search scope is pushed down into the metadata filters, so only
+        chunks of the documents in scope are ranked. Repeated queries reuse
+        the cached query embedding, and repeated searches against an
+        unchanged collection reuse the cached results.
+        
         Args:
             query: RAG query with search parameters
             
@@ -148,13 +166,100 @@ class SearchService:
             List of search results
         """
         try:
-            # Use database manager for similarity search
-            raw_results = await self.database_manager.search_similar(
-                query=query.query,
-                max_results=query.max_chunks,
-                score_threshold=query.score_threshold,
-                filters=query.filters
+            if query.scope is not None and not query.scope.is_empty():
+                query = await self._apply_scope(query)
+                if query is None:
+                    self.logger.debug("Search scope matches no documents")
+                    return []
+            
+            if self.search_cache is None or not query.query.strip():
+                return await self._run_search(query)
+            
+            chromadb = self.database_manager.chromadb
+            query_embedding = self.search_cache.get_embedding(query.query)
+            if query_embedding is None:
+                query_embedding = await chromadb.embed_query(query.query)
+                self.search_cache.put_embedding(query.query, query_embedding)
+            
+            cache_key = results_cache_key(
+                query_embedding,
+                query.max_chunks,
+                query.score_threshold,
+                query.filters,
+                chromadb.collection_version
             )
+            search_results = self.search_cache.get_results(cache_key)
+            if search_results is None:
+                search_results = await self._run_search(query, query_embedding)
+                # Empty results may come from a failed search, so they are not kept
+                if search_results:
+                    self.search_cache.put_results(cache_key, search_results)
+            else:
+                self.logger.debug("Search results served from cache", query=query.query)
+            
+            # Callers may annotate results, so hand out copies
+            return [
+                dataclasses.replace(result, metadata=dict(result.metadata))
+                for result in search_results
+            ]
+            
+        except Exception as e:
+            self.logger.error("Document search failed", query=query.query, error=str(e))
+            return []
+    
+    async def _apply_scope(self, query: RAGQuery) -> Optional[RAGQuery]:
+        """
+        Fold a query's search scope into its metadata filters.
+        
+        Args:
+            query: RAG query with a search scope
+            
+        Returns:
+            Query whose filters carry the scope, or None if no stored document is in scope
+        """
+        clauses = query.scope.where_clauses()
+        if query.scope.has_upload_range():
+            uploaded_from, uploaded_before = query.scope.upload_bounds()
+            filenames = await self.database_manager.get_unique_filenames(uploaded_from, uploaded_before)
+            if not filenames:
+                return None
+            clauses.append(filename_clause(filenames))
+        
+        return dataclasses.replace(query, filters=build_where(query.filters, clauses) or {}, scope=None)
+    
+    async def _run_search(
+        self,
+        query: RAGQuery,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[SearchResult]:
+        """
+        Run a similarity search against the database.
+        
+        With hybrid search enabled, vector and BM25 keyword candidates are
+        retrieved concurrently and merged with reciprocal rank fusion, so
+        exact identifiers such as MDRM codes or schedule names are found even
+        when their embeddings are not close to the query. Fused results carry
+        the fusion score.
+        
+        Args:
+            query: RAG query with search parameters
+            query_embedding: Optional precomputed query embedding
+            
+        Returns:
+            List of search results
+        """
+        try:
+            if self.settings.hybrid_search_enabled:
+                raw_results = await self._hybrid_search(query, query_embedding)
+            else:
+                # Use database manager for similarity search
+                raw_results = await self.database_manager.search_similar(
+                    query=query.query,
+                    max_results=query.max_chunks,
+                    score_threshold=query.score_threshold,
+                    filters=query.filters,
+                    query_embedding=query_embedding
+                )
             
             # Convert to SearchResult objects
             search_results = []
@@ -176,6 +281,52 @@ class SearchService:
     
    
     
+    async def _hybrid_search(
+        self,
+        query: RAGQuery,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve vector and keyword candidates and fuse them by rank.
+        
+        Args:
+            query: RAG query with search parameters
+            query_embedding: Optional precomputed query embedding
+            
+        Returns:
+            Fused results, best first
+        """
+        candidates = max(query.max_chunks * 3, 10)
+        vector_results, keyword_results = await asyncio.gather(
+            self.database_manager.search_similar(
+                query=query.query,
+                max_results=candidates,
+                score_threshold=query.score_threshold,
+                filters=query.filters,
+                query_embedding=query_embedding
+            ),
+            self.database_manager.keyword_search(
+                query=query.query,
+                max_results=candidates,
+                filters=query.filters
+            )
+        )
+        
+        # Vector scores are Chroma distances, so the nearest chunk ranks first
+        vector_results.sort(key=lambda result: result['score'])
+        fused = reciprocal_rank_fusion(
+            [vector_results, keyword_results],
+            k=self.settings.hybrid_search_rrf_k
+        )
+        
+        self.logger.debug(
+            "Hybrid search fused",
+            vector_results=len(vector_results),
+            keyword_results=len(keyword_results),
+            fused_results=len(fused)
+        )
+        return [dict(result, score=score) for result, score in fused[:query.max_chunks]]
+    
     async def get_available_documents(self) -> List[Dict[str, Any]]:
         """
         Get list of available documents for search.
@@ -207,7 +358,8 @@ class SearchService:
                     "database_manager": db_health["status"],
                     "search_service": "active"
                 },
-                "database_health": db_health
+                "database_health": db_health,
+                "search_cache": self.search_cache.stats() if self.search_cache else None
             }
             
         except Exception as e:
@@ -5,7 +5,6 @@ Clean, focused tool for retrieving financial data using FDIC BankFind Suite Fina
 Requires CERT number from institution search tool.
 """
 
-import asyncio
 from typing import Optional, Type, Dict, Any
 from datetime import datetime, timezone
 
@@ -17,6 +16,8 @@ from langchain.callbacks.manager import (
     CallbackManagerForToolRun,
 )
 
+from src.utils.event_loop import run_sync
+
 from ..infrastructure.banking.fdic_financial_api import FDICFinancialAPI
 from ..infrastructure.banking.fdic_financial_models import FDICFinancialData
 
@@ -170,11 +171,12 @@ Output Format:
         from src.config.settings import get_settings
         settings = kwargs.get('settings') or get_settings()
         
-        # Initialize FDIC Financial API client
+        # Initialize FDIC Financial API client, reusing the toolset's pooled HTTP session if provided
         object.__setattr__(self, '_financial_client', FDICFinancialAPI(
             api_key=settings.fdic_api_key,
             timeout=settings.fdic_financial_api_timeout,
-            cache_ttl=settings.fdic_financial_cache_ttl
+            cache_ttl=settings.fdic_financial_cache_ttl,
+            http_session=kwargs.get('http_session')
         ))
         
         logger.info("FDIC financial data tool initialized")
@@ -192,19 +194,8 @@ Output Format:
         report_date: Optional[str] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> str:
-        """Synchronous execution wrapper."""
-        try:
-            loop = asyncio.get_running_loop()
-            import concurrent.futures
-            
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    lambda: asyncio.run(self._arun(cert_id, analysis_type, quarters, report_date, None))
-                )
-                return future.result()
-                
-        except RuntimeError:
-            return asyncio.run(self._arun(cert_id, analysis_type, quarters, report_date, None))
+        """Synchronous execution wrapper, run on the process-wide event loop."""
+        return run_sync(self._arun(cert_id, analysis_type, quarters, report_date, None))
     
     async def _arun(
         self,
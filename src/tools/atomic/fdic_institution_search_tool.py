@@ -5,7 +5,6 @@ Clean, focused tool for searching FDIC institutions using the BankFind Suite API
 Returns structured data with CERT numbers for use in financial data queries.
 """
 
-import asyncio
 from typing import Optional, Type, List, Dict, Any
 from datetime import datetime, timezone
 
@@ -17,6 +16,8 @@ from langchain.callbacks.manager import (
     CallbackManagerForToolRun,
 )
 
+from src.utils.event_loop import run_sync
+
 from ..infrastructure.banking.fdic_api_client import FDICAPIClient
 from ..infrastructure.banking.fdic_models import FDICInstitution
 
@@ -119,10 +120,12 @@ Output is structured JSON, not text - no parsing required for downstream tools."
         settings = kwargs.get('settings') or get_settings()
         
         # Initialize FDIC client - use private attribute to avoid Pydantic conflicts
+        # Reuses the toolset's pooled HTTP session when one is provided
         object.__setattr__(self, '_fdic_client', FDICAPIClient(
             api_key=settings.fdic_api_key,
             timeout=getattr(settings, 'fdic_api_timeout', 30.0),  # Use default if not available
-            cache_ttl=getattr(settings, 'fdic_cache_ttl', 900)     # Use default if not available
+            cache_ttl=getattr(settings, 'fdic_cache_ttl', 900),    # Use default if not available
+            http_session=kwargs.get('http_session')
         ))
         
         logger.info("FDIC institution search tool initialized")
@@ -141,19 +144,8 @@ Output is structured JSON, not text - no parsing required for downstream tools."
         limit: int = 5,
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> str:
-        """Synchronous execution wrapper."""
-        try:
-            loop = asyncio.get_running_loop()
-            import concurrent.futures
-            
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    lambda: asyncio.run(self._arun(name, city, state, active_only, limit, None))
-                )
-                return future.result()
-                
-        except RuntimeError:
-            return asyncio.run(self._arun(name, city, state, active_only, limit, None))
+        """Synchronous execution wrapper, run on the process-wide event loop."""
+        return run_sync(self._arun(name, city, state, active_only, limit, None))
     
     async def _arun(
         self,
@@ -8,6 +8,7 @@ Requires RSSD ID from institution search tool.
 import asyncio
 import json
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from typing import Optional, Type, Dict, Any, List
 from datetime import datetime, timezone
 
@@ -19,12 +20,65 @@ from langchain.callbacks.manager import (
     CallbackManagerForToolRun,
 )
 
+from src.utils.event_loop import run_sync
+from src.utils.lru_cache import ResponseCache
+
 from ..infrastructure.banking.ffiec_cdr_api_client import FFIECCDRAPIClient
 from ..infrastructure.banking.ffiec_cdr_models import FFIECCallReportRequest
+from ..infrastructure.banking.ffiec_cdr_constants import (
+    FFIEC_CDR_CACHE_CONFIG,
+    SDF_SCHEDULE_DESCRIPTIONS,
+    build_ffiec_cache_key,
+    build_parsed_report_cache_key
+)
+from ..infrastructure.banking.xbrl_stream_parser import (
+    extract_xbrl_facts,
+    call_report_concept,
+    ubpr_concept
+)
 
 logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
 
 
+@lru_cache(maxsize=4096)
+def _classify_line_item(definition: str) -> Optional[str]:
+    """
+    Map a lower-cased MDRM short definition to its semantic metric name.
+    
+    Definitions repeat across schedules, banks and periods, so the rule chain
+    is memoized rather than re-evaluated for every line item.
+    
+    Args:
+        definition: Lower-cased short definition of the line item
+        
+    Returns:
+        Semantic metric name, or None if the line item is not a key metric
+    """
+    if 'total assets' in definition and 'consolidated' not in definition:
+        return 'total_assets'
+    if 'total deposits' in definition:
+        return 'total_deposits'
+    if 'total equity capital' in definition:
+        return 'total_equity'
+    if 'interest income' in definition and 'net' not in definition and 'after' not in definition:
+        return 'interest_income'
+    if 'interest expense' in definition:
+        return 'interest_expense'
+    if 'net interest income' in definition and 'after' not in definition:
+        return 'net_interest_income'
+    if 'provision for loan losses' in definition or 'provision for credit losses' in definition:
+        return 'credit_loss_provision'
+    if 'net income' in definition and 'interest' not in definition and 'applicable' not in definition:
+        return 'net_income'
+    if 'total loans' in definition and 'net' not in definition:
+        return 'total_loans'
+    if 'total securities' in definition:
+        return 'total_securities'
+    if 'cash and balances' in definition:
+        return 'cash_and_equivalents'
+    return None
+
+
 class FFIECCallReportDataTool(BaseTool):
     """
     Atomic tool for retrieving FFIEC Call Report data.
@@ -190,7 +244,9 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                 api_key=settings.ffiec_cdr_api_key,
                 username=settings.ffiec_cdr_username,
                 timeout=getattr(settings, 'ffiec_cdr_timeout_seconds', 30),
-                cache_ttl=getattr(settings, 'ffiec_cdr_cache_ttl', 3600)
+                cache_ttl=getattr(settings, 'ffiec_cdr_cache_ttl', 3600),
+                disk_cache_path=getattr(settings, 'ffiec_facsimile_cache_path', None),
+                disk_cache_max_mb=getattr(settings, 'ffiec_facsimile_cache_max_mb', 512)
             ))
             object.__setattr__(self, '_is_available', True)
         else:
@@ -198,6 +254,23 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
             object.__setattr__(self, '_is_available', False)
             logger.warning("FFIEC CDR API credentials not configured - tool will not be available")
         
+        # Parsed reports keyed by (rssd, period, format, schedules) so repeat questions skip parsing
+        object.__setattr__(self, '_parsed_report_cache', ResponseCache(
+            default_ttl_seconds=FFIEC_CDR_CACHE_CONFIG["parsed_report_ttl"],
+            max_entries=FFIEC_CDR_CACHE_CONFIG["max_parsed_reports"],
+            max_bytes=FFIEC_CDR_CACHE_CONFIG["max_parsed_report_bytes"],
+            # Raw payload length tracks report size without serializing the parse again
+            size_estimator=lambda entry: entry["data_size"],
+            component="ffiec_parsed_report_cache"
+        ))
+        
+        # Periods the quarter fallback found no filing for, so misses aren't re-probed within the TTL
+        object.__setattr__(self, '_missing_filing_cache', ResponseCache(
+            default_ttl_seconds=FFIEC_CDR_CACHE_CONFIG["missing_filing_ttl"],
+            max_entries=FFIEC_CDR_CACHE_CONFIG["max_missing_filings"],
+            component="ffiec_missing_filing_cache"
+        ))
+        
         logger.info("FFIEC Call Report data tool initialized", 
                    available=self.is_available())
     
@@ -210,16 +283,24 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
         """Check if FFIEC CDR service is available."""
         return getattr(self, '_is_available', False) and self.ffiec_client is not None
     
-    async def _get_most_recent_filing(self, rssd_id: str, max_periods_back: int = 8) -> tuple[Optional[str], Optional[bytes]]:
+    async def _get_most_recent_filing(self,
+                                      rssd_id: str,
+                                      max_periods_back: int = 8,
+                                      max_concurrency: Optional[int] = None) -> tuple[Optional[str], Optional[bytes]]:
         """
         Simple fallback method to find recent filings when FFIEC Discovery API fails.
         
-        Checks standard quarterly reporting periods going backwards from current date.
-        This is a simplified fallback since the FFIEC Discovery API is the primary method.
+        Probes standard quarterly reporting periods going backwards from the current date.
+        Candidate quarters are requested in parallel (newest first, at most ``max_concurrency``
+        at a time); the newest quarter with a filing wins and older probes still in flight
+        are cancelled. Periods the CDR reports no filing for are remembered per bank for
+        ``missing_filing_ttl`` seconds and skipped by later searches; periods whose request
+        failed are retried next time.
         
         Args:
             rssd_id: Bank RSSD identifier
             max_periods_back: Number of quarters to check backwards
+            max_concurrency: Maximum parallel facsimile requests, defaults to the configured limit
             
         Returns:
             Tuple of (reporting_period, call_report_data) or (None, None) if not found
@@ -228,6 +309,10 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
         
         logger.info(f"Using simple quarter-based fallback search", rssd_id=rssd_id)
         
+        if not self.ffiec_client:
+            logger.warning("FFIEC client not initialized - cannot search recent filings", rssd_id=rssd_id)
+            return None, None
+        
         # Generate standard quarter end dates going backwards
         # Q1 (Mar 31), Q2 (Jun 30), Q3 (Sep 30), Q4 (Dec 31)
         today = date.today()
@@ -247,21 +332,52 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
         # Only check quarters that are definitely past (no need for complex filing deadline logic)
         recent_quarters = [q for q in quarter_dates if q < today][:max_periods_back]
         
+        candidate_periods = []
         for quarter_date in recent_quarters:
             period_str = quarter_date.strftime("%Y-%m-%d")
-            
-            try:
+            if self._missing_filing_cache.get(build_ffiec_cache_key(rssd_id, period_str, "SDF")):
+                logger.debug(f"Skipping period {period_str} with no recent filing", rssd_id=rssd_id)
+                continue
+            candidate_periods.append(period_str)
+        
+        semaphore = asyncio.Semaphore(max_concurrency or FFIEC_CDR_CACHE_CONFIG["filing_probe_concurrency"])
+        # Index of the newest quarter found so far; older quarters not yet started are skipped
+        newest_found = [len(candidate_periods)]
+        
+        async def probe(index: int, period_str: str) -> Optional[bytes]:
+            async with semaphore:
+                if index > newest_found[0]:
+                    return None
                 logger.debug(f"Checking period {period_str}", rssd_id=rssd_id)
+                try:
+                    filing_data = await self.ffiec_client.retrieve_facsimile(
+                        rssd_id=rssd_id,
+                        reporting_period=period_str,
+                        format_type="SDF",
+                        raise_on_error=True
+                    )
+                except Exception as e:
+                    # A fault or outage says nothing about the filing, so don't remember it
+                    logger.debug(
+                        f"Filing check failed for period {period_str}",
+                        rssd_id=rssd_id,
+                        period=period_str,
+                        error=str(e)
+                    )
+                    return None
                 
-                if not self.ffiec_client:
-                    raise ValueError("FFIEC client not initialized")
-                
-                filing_data = await self.ffiec_client.retrieve_facsimile(
-                    rssd_id=rssd_id,
-                    reporting_period=period_str,
-                    format_type="SDF"
-                )
-                
+                if filing_data:
+                    newest_found[0] = min(newest_found[0], index)
+                else:
+                    self._missing_filing_cache.put(build_ffiec_cache_key(rssd_id, period_str, "SDF"), True)
+                return filing_data
+        
+        # Semaphore waiters are served in order, so newer quarters are requested first
+        probes = [asyncio.create_task(probe(index, period_str)) for index, period_str in enumerate(candidate_periods)]
+        try:
+            # Await newest first: a success is only final once every newer quarter has missed
+            for period_str, task in zip(candidate_periods, probes):
+                filing_data = await task
                 if filing_data:
                     logger.info(
                         f"Found filing for period {period_str}",
@@ -270,25 +386,30 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                         data_size=len(filing_data)
                     )
                     return period_str, filing_data
-                    
-            except Exception as e:
-                logger.debug(
-                    f"No filing found for period {period_str}",
-                    rssd_id=rssd_id,
-                    period=period_str,
-                    error=str(e)
-                )
-                continue
+        finally:
+            pending = [task for task in probes if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         
         logger.warning(f"No recent filings found in last {max_periods_back} quarters", rssd_id=rssd_id)
         return None, None
     
-    def _parse_xbrl_data(self, xbrl_data: bytes) -> Dict[str, Any]:
+    def _parse_xbrl_data(
+        self,
+        xbrl_data: bytes,
+        concepts: Optional[List[str]] = None,
+        reporting_period: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Parse XBRL data to extract balance sheet information.
         
         Args:
             xbrl_data: Raw XBRL data as bytes
+            concepts: Optional concept codes (e.g. ['RCON2170']); parsing stops
+                once all of them are found for reporting_period
+            reporting_period: Reporting period (YYYY-MM-DD) of the filing
             
         Returns:
             Dictionary containing parsed balance sheet data
@@ -387,100 +508,26 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                                 }
                             }
             
-            # Now try to decode the text with multiple encoding strategies
-            xbrl_str = None
-            encoding_tried = []
-            
-            # List of encodings to try in order of likelihood for financial data
-            encodings_to_try = [
-                'utf-8', 
-                'utf-8-sig',  # UTF-8 with BOM
-                'latin-1',    # Common for older financial systems
-                'cp1252',     # Windows Western European
-                'iso-8859-1', # Latin-1
-                'ascii'       # Last resort
-            ]
-            
-            for encoding in encodings_to_try:
-                try:
-                    xbrl_str = xbrl_data.decode(encoding)
-                    logger.debug(f"Successfully decoded XBRL data using {encoding} encoding")
-                    break
-                except UnicodeDecodeError as decode_error:
-                    encoding_tried.append(f"{encoding}: {str(decode_error)}")
-                    continue
-                except Exception as e:
-                    encoding_tried.append(f"{encoding}: {str(e)}")
-                    continue
-            
-            # If all encodings failed, try to decode with error handling
-            if xbrl_str is None:
-                try:
-                    xbrl_str = xbrl_data.decode('utf-8', errors='replace')
-                    logger.warning("Decoded with error replacement - some characters may be corrupted")
-                except Exception as final_error:
-                    logger.error(
-                        "All encoding attempts failed", 
-                        encodings_tried=encoding_tried,
-                        final_error=str(final_error),
-                        data_start=xbrl_data[:50].hex() if len(xbrl_data) >= 50 else xbrl_data.hex()
-                    )
-                    return {
-                        'parsing_successful': False,
-                        'error': f"Failed to decode XBRL data. Tried encodings: {', '.join([e.split(':')[0] for e in encoding_tried])}. Data appears to be binary or unsupported encoding.",
-                        'debug_info': {
-                            'data_size': len(xbrl_data),
-                            'data_start_hex': xbrl_data[:20].hex() if len(xbrl_data) >= 20 else xbrl_data.hex(),
-                            'encoding_attempts': encoding_tried
-                        }
-                    }
-            
-            # Parse the XML
-            root = ET.fromstring(xbrl_str)
-            
-            # Define correct namespace mappings for Call Report XBRL
-            namespaces = {
-                'xbrli': 'http://www.xbrl.org/2003/instance',
-                'xbrl': 'http://www.xbrl.org/2003/instance',
-                'ffiec_call': 'http://www.ffiec.gov/xbrl/call/concepts',
-                'link': 'http://www.xbrl.org/2003/linkbase'
-            }
-            
             logger.debug("Starting comprehensive Call Report XBRL parsing")
             
+            # Stream facts straight from the bytes; expat handles the declared encoding
+            all_call_elements, elements_scanned = extract_xbrl_facts(
+                xbrl_data,
+                call_report_concept,
+                concepts=concepts,
+                stop_early=concepts is not None,
+                period=reporting_period
+            )
+            
             # Extract ALL available Call Report elements dynamically
             balance_sheet_data = {}
             
-            # Discover all Call Report elements in the XML
-            all_call_elements = {}
-            
-            # Find all elements in the FFIEC call namespace
-            for elem in root.iter():
-                if 'ffiec.gov/xbrl/call/concepts' in elem.tag:
-                    tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                    if elem.text and elem.text.strip():
-                        context_ref = elem.get('contextRef', '')
-                        unit_ref = elem.get('unitRef', '')
-                        
-                        # Group by element code and select most recent context
-                        if tag_name not in all_call_elements:
-                            all_call_elements[tag_name] = {
-                                'element': elem,
-                                'context': context_ref,
-                                'unit': unit_ref,
-                                'value': elem.text.strip()
-                            }
-                        else:
-                            # Keep the one with the most recent context
-                            if context_ref > all_call_elements[tag_name]['context']:
-                                all_call_elements[tag_name] = {
-                                    'element': elem,
-                                    'context': context_ref,
-                                    'unit': unit_ref,
-                                    'value': elem.text.strip()
-                                }
-            
-            logger.debug("Found total Call Report elements", total_found=len(all_call_elements))
+            logger.debug(
+                "Found total Call Report elements",
+                total_found=len(all_call_elements),
+                elements_scanned=elements_scanned,
+                decompression_method=decompression_method
+            )
             
             # Process all discovered Call Report elements
             elements_found = 0
@@ -489,7 +536,6 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
             for element_code, element_info in all_call_elements.items():
                 try:
                     # Use the already discovered element info
-                    element = element_info['element']
                     value = element_info['value']
                     unit_ref = element_info['unit']
                     context_ref = element_info['context']
@@ -580,17 +626,17 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
             return balance_sheet_data
             
         except ET.ParseError as parse_error:
+            xml_snippet = xbrl_data[:200].decode('utf-8', errors='replace')
             logger.error(
                 "XBRL parsing failed - invalid XML structure", 
                 error=str(parse_error),
-                xml_snippet=xbrl_str[:200] if xbrl_str else "Could not decode data"
+                xml_snippet=xml_snippet
             )
             return {
                 'parsing_successful': False,
                 'error': f"Invalid XBRL XML format: {str(parse_error)}",
                 'debug_info': {
-                    'xml_decode_successful': xbrl_str is not None,
-                    'xml_snippet': xbrl_str[:200] if xbrl_str else None
+                    'xml_snippet': xml_snippet
                 }
             }
         except UnicodeDecodeError as unicode_error:
@@ -657,121 +703,6 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
             call_report_data = {}
             metadata: Dict[str, Any] = {}
             
-            # Schedule metadata with comprehensive descriptions using actual FFIEC codes
-            schedule_descriptions = {
-                'RCA': {
-                    'name': 'Balance Sheet - Assets',
-                    'category': 'balance_sheet',
-                    'description': 'Cash, securities, loans, and other assets'
-                },
-                'RCB': {
-                    'name': 'Securities',
-                    'category': 'balance_sheet',
-                    'description': 'Investment securities portfolio details'
-                },
-                'RCCI': {
-                    'name': 'Loans and Lease Financing Receivables',
-                    'category': 'balance_sheet',
-                    'description': 'Loan portfolio composition and quality'
-                },
-                'RCD': {
-                    'name': 'Trading Assets and Liabilities',
-                    'category': 'balance_sheet',
-                    'description': 'Trading account assets and liabilities'
-                },
-                'RCE': {
-                    'name': 'Deposit Liabilities',
-                    'category': 'balance_sheet',
-                    'description': 'Customer deposits and funding sources'
-                },
-                'RCF': {
-                    'name': 'Other Assets',
-                    'category': 'balance_sheet',
-                    'description': 'Premises, goodwill, and other assets'
-                },
-                'RCG': {
-                    'name': 'Other Liabilities',
-                    'category': 'balance_sheet',
-                    'description': 'Subordinated debt and other liabilities'
-                },
-                'RCH': {
-                    'name': 'Selected Balance Sheet Items',
-                    'category': 'balance_sheet',
-                    'description': 'Additional balance sheet detail'
-                },
-                'RCK': {
-                    'name': 'Quarterly Averages',
-                    'category': 'balance_sheet',
-                    'description': 'Average balances for ratio calculations'
-                },
-                'RCL': {
-                    'name': 'Derivatives & Off-Balance Sheet',
-                    'category': 'balance_sheet',
-                    'description': 'Trading assets, commitments, and off-balance sheet items'
-                },
-                'RCM': {
-                    'name': 'Memoranda',
-                    'category': 'balance_sheet',
-                    'description': 'Supplemental asset/liability details'
-                },
-                'RCN': {
-                    'name': 'Past Due Assets',
-                    'category': 'balance_sheet',
-                    'description': 'Nonperforming loans and charge-offs'
-                },
-                'RCO': {
-                    'name': 'Other Data',
-                    'category': 'other',
-                    'description': 'Employees, offices, fiduciary activities'
-                },
-                'RCRI': {
-                    'name': 'Regulatory Capital',
-                    'category': 'balance_sheet',
-                    'description': 'Capital adequacy and regulatory ratios'
-                },
-                'RCS': {
-                    'name': 'Servicing, Securitization & Asset Sales',
-                    'category': 'other',
-                    'description': 'Mortgage servicing and securitization activities'
-                },
-                'RCT': {
-                    'name': 'Fiduciary & Related Services',
-                    'category': 'other',
-                    'description': 'Trust and fiduciary service activities'
-                },
-                'RCV': {
-                    'name': 'Variable Interest Entities',
-                    'category': 'other',
-                    'description': 'Variable interest entity disclosures'
-                },
-                'RI': {
-                    'name': 'Income Statement',
-                    'category': 'income_statement',
-                    'description': 'Revenue, expenses, and profitability metrics'
-                },
-                'RIA': {
-                    'name': 'Changes in Bank Equity Capital',
-                    'category': 'income_statement',
-                    'description': 'Changes in equity capital during the period'
-                },
-                # Legacy mappings for backward compatibility
-                'RC-A': {
-                    'name': 'Balance Sheet - Assets (Legacy Code)',
-                    'category': 'balance_sheet',
-                    'description': 'Use "RCA" instead of "RC-A"'
-                },
-                'RC-E': {
-                    'name': 'Deposit Liabilities (Legacy Code)',
-                    'category': 'balance_sheet',
-                    'description': 'Use "RCE" instead of "RC-E"'
-                },
-                'RC-R': {
-                    'name': 'Regulatory Capital (Legacy Code)',
-                    'category': 'balance_sheet',
-                    'description': 'Use "RCRI" instead of "RC-R"'
-                }
-            }
-            
             lines = sdf_str.split('\n')
             logger.info(f"Processing SDF with {len(lines)} lines")
             
@@ -780,74 +711,62 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
             data_rows = 0
             total_elements = 0
             
+            # Hot loop: set membership for the schedule filter, no per-row logging
+            wanted_schedules = set(requested_schedules) if requested_schedules is not None else None
+            format_currency = self._format_currency
+            
             for line_num, line in enumerate(lines, 1):
                 line = line.strip()
                 if not line:
                     continue
                 
                 # Handle MDRM lines directly (tab-delimited format)
-                if line.startswith('MDRM\t') or line.startswith('RIAD'):
-                    # Split by tabs for MDRM format
-                    parts = [p.strip() for p in line.split('\t')]
-                    if len(parts) >= 6:  # MDRM format: Type, MDRM_Code, Schedule, Description, Value, Date
-                        data_rows += 1
-                        
-                        try:
-                            # MDRM format: MDRM	RCON2170	RC-A	Total assets	9500000000	20230630
-                            record_type = parts[0] if len(parts) > 0 else ''
-                            mdrm_code = parts[1].upper() if len(parts) > 1 else ''
-                            call_schedule = parts[2] if len(parts) > 2 else ''
-                            short_definition = parts[3] if len(parts) > 3 else ''
-                            value_str = parts[4] if len(parts) > 4 else ''
-                            call_date = parts[5] if len(parts) > 5 else ''
-                            
-                            # Skip if specific schedules requested and this isn't one of them
-                            if requested_schedules is not None and call_schedule not in requested_schedules:
-                                continue
-                            
-                            # Convert value to number
-                            try:
-                                value = float(value_str.replace(',', '').replace('$', '').strip()) if value_str else 0.0
-                                formatted_value = self._format_currency(value) if value != 0 else "$0"
-                            except (ValueError, TypeError):
-                                value = value_str
-                                formatted_value = value_str
-                            
-                            # Initialize schedule if not exists
-                            if call_schedule not in call_report_data:
-                                call_report_data[call_schedule] = {
-                                    'schedule_info': schedule_descriptions.get(call_schedule, {
-                                        'name': call_schedule,
-                                        'category': 'other',
-                                        'description': f'Call Report schedule {call_schedule}'
-                                    }),
-                                    'line_items': []
-                                }
-                            
-                            # Create comprehensive line item
-                            line_item = {
-                                'mdrm_code': mdrm_code,
-                                'short_definition': short_definition,
-                                'value': value,
-                                'formatted_value': formatted_value,
-                                'call_date': call_date
-                            }
-                            
-                            call_report_data[call_schedule]['line_items'].append(line_item)
-                            total_elements += 1
-                            
-                            # Store metadata from first line
-                            if not metadata:
-                                metadata = {
-                                    'call_date': call_date,
-                                    'parsing_timestamp': datetime.now(timezone.utc).isoformat()
-                                }
-                            
-                            logger.debug(f"Captured {mdrm_code} in {call_schedule}: {short_definition} = {formatted_value}")
-                        
-                        except Exception as row_error:
-                            logger.debug(f"Error parsing MDRM row {line_num}", error=str(row_error), line_preview=line[:100])
-                            continue
+                if line.startswith(('MDRM\t', 'RIAD')):
+                    # MDRM format: MDRM	RCON2170	RC-A	Total assets	9500000000	20230630
+                    parts = line.split('\t')
+                    if len(parts) < 6:
+                        continue
+                    data_rows += 1
+                    
+                    call_schedule = parts[2].strip()
+                    
+                    # Skip if specific schedules requested and this isn't one of them
+                    if wanted_schedules is not None and call_schedule not in wanted_schedules:
+                        continue
+                    
+                    mdrm_code = parts[1].strip().upper()
+                    short_definition = parts[3].strip()
+                    value_str = parts[4].strip()
+                    call_date = parts[5].strip()
+                    
+                    # Convert value to number
+                    try:
+                        value = float(value_str.replace(',', '').replace('$', '').strip()) if value_str else 0.0
+                        formatted_value = format_currency(value) if value != 0 else "$0"
+                    except (ValueError, TypeError):
+                        value = value_str
+                        formatted_value = value_str
+                    
+                    schedule = call_report_data.get(call_schedule)
+                    if schedule is None:
+                        schedule = call_report_data[call_schedule] = self._new_sdf_schedule(call_schedule)
+                    
+                    # Create comprehensive line item
+                    schedule['line_items'].append({
+                        'mdrm_code': mdrm_code,
+                        'short_definition': short_definition,
+                        'value': value,
+                        'formatted_value': formatted_value,
+                        'call_date': call_date
+                    })
+                    total_elements += 1
+                    
+                    # Store metadata from first line
+                    if not metadata:
+                        metadata = {
+                            'call_date': call_date,
+                            'parsing_timestamp': datetime.now(timezone.utc).isoformat()
+                        }
                     continue
                 
                 # Check for legacy semicolon-delimited format 
@@ -858,83 +777,66 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                 
                 # Handle semicolon-delimited format (fallback)
                 if header_found and ';' in line:
-                    parts = [p.strip() for p in line.split(';')]
-                    if len(parts) >= 7:  # Need all fields: Date, RSSD, MDRM, Value, Update, Definition, Schedule
-                        data_rows += 1
-                        
-                        try:
-                            # SDF format: Call Date;Bank RSSD Identifier;MDRM #;Value;Last Update;Short Definition;Call Schedule;Line Number
-                            call_date = parts[0] if len(parts) > 0 else ''
-                            rssd_id_check = parts[1] if len(parts) > 1 else ''
-                            mdrm_code = parts[2].upper() if len(parts) > 2 else ''
-                            value_str = parts[3] if len(parts) > 3 else ''
-                            last_update = parts[4] if len(parts) > 4 else ''
-                            short_definition = parts[5] if len(parts) > 5 else ''
-                            call_schedule = parts[6] if len(parts) > 6 else ''
-                            line_number = parts[7] if len(parts) > 7 else ''
-                            
-                            # Skip if specific schedules requested and this isn't one of them
-                            if requested_schedules is not None and call_schedule not in requested_schedules:
-                                continue
-                            
-                            # Verify this is the right bank
-                            if rssd_id and rssd_id_check != rssd_id:
-                                continue
-                            
-                            # Convert value to number
-                            try:
-                                value = float(value_str.replace(',', '').replace('$', '').strip()) if value_str else 0.0
-                                formatted_value = self._format_currency(value) if value != 0 else "$0"
-                            except (ValueError, TypeError):
-                                value = value_str
-                                formatted_value = value_str
-                            
-                            # Initialize schedule if not exists
-                            if call_schedule not in call_report_data:
-                                call_report_data[call_schedule] = {
-                                    'schedule_info': schedule_descriptions.get(call_schedule, {
-                                        'name': call_schedule,
-                                        'category': 'other',
-                                        'description': f'Call Report schedule {call_schedule}'
-                                    }),
-                                    'line_items': []
-                                }
-                            
-                            # Create comprehensive line item
-                            line_item = {
-                                'mdrm_code': mdrm_code,
-                                'line_number': line_number,
-                                'short_definition': short_definition,
-                                'value': value,
-                                'formatted_value': formatted_value,
-                                'last_update': last_update
-                            }
-                            
-                            call_report_data[call_schedule]['line_items'].append(line_item)
-                            total_elements += 1
-                            
-                            # Store metadata from first line
-                            if not metadata:
-                                metadata = {
-                                    'rssd_id': rssd_id_check,
-                                    'call_date': call_date,
-                                    'parsing_timestamp': datetime.now(timezone.utc).isoformat()
-                                }
-                            
-                            logger.debug(f"Captured {mdrm_code} in {call_schedule}: {short_definition} = {formatted_value}")
-                        
-                        except Exception as row_error:
-                            logger.debug(f"Error parsing SDF row {line_num}", error=str(row_error), line_preview=line[:100])
-                            continue
+                    # SDF format: Call Date;Bank RSSD Identifier;MDRM #;Value;Last Update;Short Definition;Call Schedule;Line Number
+                    parts = line.split(';')
+                    if len(parts) < 7:
+                        continue
+                    data_rows += 1
+                    
+                    call_schedule = parts[6].strip()
+                    
+                    # Skip if specific schedules requested and this isn't one of them
+                    if wanted_schedules is not None and call_schedule not in wanted_schedules:
+                        continue
+                    
+                    # Verify this is the right bank
+                    rssd_id_check = parts[1].strip()
+                    if rssd_id and rssd_id_check != rssd_id:
+                        continue
+                    
+                    call_date = parts[0].strip()
+                    mdrm_code = parts[2].strip().upper()
+                    value_str = parts[3].strip()
+                    last_update = parts[4].strip()
+                    short_definition = parts[5].strip()
+                    line_number = parts[7].strip() if len(parts) > 7 else ''
+                    
+                    # Convert value to number
+                    try:
+                        value = float(value_str.replace(',', '').replace('$', '').strip()) if value_str else 0.0
+                        formatted_value = format_currency(value) if value != 0 else "$0"
+                    except (ValueError, TypeError):
+                        value = value_str
+                        formatted_value = value_str
+                    
+                    schedule = call_report_data.get(call_schedule)
+                    if schedule is None:
+                        schedule = call_report_data[call_schedule] = self._new_sdf_schedule(call_schedule)
+                    
+                    # Create comprehensive line item
+                    schedule['line_items'].append({
+                        'mdrm_code': mdrm_code,
+                        'line_number': line_number,
+                        'short_definition': short_definition,
+                        'value': value,
+                        'formatted_value': formatted_value,
+                        'last_update': last_update
+                    })
+                    total_elements += 1
+                    
+                    # Store metadata from first line
+                    if not metadata:
+                        metadata = {
+                            'rssd_id': rssd_id_check,
+                            'call_date': call_date,
+                            'parsing_timestamp': datetime.now(timezone.utc).isoformat()
+                        }
             
             # Calculate summary statistics
             metadata['total_line_items'] = total_elements
             metadata['schedules_included'] = list(call_report_data.keys())
             metadata['data_rows_processed'] = data_rows
             
-            # Generate semantic field mappings for AI agents
-            semantic_mappings = self._generate_semantic_mappings(call_report_data)
-            
             # Check if this is a summary request (no specific schedules requested)
             if requested_schedules is None:
                 # Return a summary of available schedules instead of full data
@@ -943,7 +845,7 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                     available_schedules[schedule_code] = {
                         'schedule_info': schedule_data['schedule_info'],
                         'line_item_count': len(schedule_data['line_items']),
-                        'sample_items': schedule_data['line_items'][:3] if schedule_data['line_items'] else []
+                        'sample_items': schedule_data['line_items'][:3]
                     }
                 
                 summary_data = {
@@ -981,6 +883,11 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                 
                 return summary_data
             
+            # Generate semantic field mappings for AI agents
+            semantic_mappings = self._generate_semantic_mappings(
+                call_report_data, self._build_mdrm_index(call_report_data)
+            )
+            
             # Create comprehensive response structure for specific schedules
             comprehensive_data = {
                 'parsing_successful': True,
@@ -1019,105 +926,76 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                 'format_used': 'SDF_DYNAMIC_SCHEDULE_GROUPED'
             }
     
-    def _generate_semantic_mappings(self, call_report_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _new_sdf_schedule(self, call_schedule: str) -> Dict[str, Any]:
+        """Start an SDF schedule entry with its description and no line items."""
+        return {
+            'schedule_info': dict(SDF_SCHEDULE_DESCRIPTIONS.get(call_schedule, {
+                'name': call_schedule,
+                'category': 'other',
+                'description': f'Call Report schedule {call_schedule}'
+            })),
+            'line_items': []
+        }
+    
+    def _build_mdrm_index(self, call_report_schedules: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Index parsed line items by MDRM code.
+        
+        Args:
+            call_report_schedules: Parsed call report data organized by schedule
+            
+        Returns:
+            Mapping of MDRM (or line) code to every occurrence of it in schedule order;
+            each occurrence holds its schedule, line item and position across all schedules
+        """
+        mdrm_index: Dict[str, List[Dict[str, Any]]] = {}
+        position = 0
+        for schedule_id, schedule in call_report_schedules.items():
+            for item in schedule.get('line_items', []):
+                field_code = item.get('mdrm_code') or item.get('line_code')
+                if field_code:
+                    mdrm_index.setdefault(field_code, []).append(
+                        {'schedule': schedule_id, 'item': item, 'position': position}
+                    )
+                position += 1
+        return mdrm_index
+    
+    def _generate_semantic_mappings(self,
+                                    call_report_data: Dict[str, Any],
+                                    mdrm_index: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """
         Generate semantic field mappings for AI agents from call report data.
         
         Args:
             call_report_data: Parsed call report data organized by schedule
+            mdrm_index: Precomputed MDRM code index, built from call_report_data if None
             
         Returns:
-            Dictionary of semantic field mappings for key financial metrics
+            Dictionary of semantic field mappings for key financial metrics; the last
+            matching line item in schedule order wins
         """
         semantic_mappings = {}
         
         try:
-            # Iterate through all schedules and line items
-            for schedule_id, schedule in call_report_data.items():
-                for item in schedule.get('line_items', []):
-                    definition = item.get('short_definition', '').lower()
-                    mdrm_code = item.get('mdrm_code', '')
-                    value = item.get('value', 0)
-                    formatted_value = item.get('formatted_value', '')
-                    
-                    # Semantic mapping rules for key financial metrics
-                    if 'total assets' in definition and 'consolidated' not in definition:
-                        semantic_mappings['total_assets'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'total deposits' in definition:
-                        semantic_mappings['total_deposits'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'total equity capital' in definition:
-                        semantic_mappings['total_equity'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'interest income' in definition and 'net' not in definition and 'after' not in definition:
-                        semantic_mappings['interest_income'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'interest expense' in definition:
-                        semantic_mappings['interest_expense'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'net interest income' in definition and 'after' not in definition:
-                        semantic_mappings['net_interest_income'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'provision for loan losses' in definition or 'provision for credit losses' in definition:
-                        semantic_mappings['credit_loss_provision'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'net income' in definition and 'interest' not in definition and 'applicable' not in definition:
-                        semantic_mappings['net_income'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'total loans' in definition and 'net' not in definition:
-                        semantic_mappings['total_loans'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'total securities' in definition:
-                        semantic_mappings['total_securities'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
-                    elif 'cash and balances' in definition:
-                        semantic_mappings['cash_and_equivalents'] = {
-                            'value': value,
-                            'formatted_value': formatted_value,
-                            'mdrm_code': mdrm_code,
-                            'schedule': schedule_id
-                        }
+            if mdrm_index is None:
+                mdrm_index = self._build_mdrm_index(call_report_data)
+            
+            matches = []
+            for entries in mdrm_index.values():
+                for entry in entries:
+                    semantic_key = _classify_line_item(entry['item'].get('short_definition', '').lower())
+                    if semantic_key:
+                        matches.append((entry['position'], semantic_key, entry))
+            
+            # Apply matches in schedule order so key order and winners follow the report
+            for _, semantic_key, entry in sorted(matches, key=lambda match: match[0]):
+                item = entry['item']
+                semantic_mappings[semantic_key] = {
+                    'value': item.get('value', 0),
+                    'formatted_value': item.get('formatted_value', ''),
+                    'mdrm_code': item.get('mdrm_code', ''),
+                    'schedule': entry['schedule']
+                }
             
             # Calculate derived financial ratios if we have the base metrics
             if 'total_equity' in semantic_mappings and 'total_assets' in semantic_mappings:
@@ -1152,72 +1030,44 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
         
         return semantic_mappings
     
-    def _parse_ubpr_xbrl_data(self, ubpr_data: bytes) -> Dict[str, Any]:
+    def _parse_ubpr_xbrl_data(
+        self,
+        ubpr_data: bytes,
+        concepts: Optional[List[str]] = None,
+        reporting_period: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Parse UBPR XBRL data to extract ALL available performance ratios and metrics.
         
         Args:
             ubpr_data: Raw UBPR XBRL data as bytes
+            concepts: Optional UBPR concept codes (e.g. ['UBPRE013']); parsing
+                stops once all of them are found for reporting_period
+            reporting_period: Reporting period (YYYY-MM-DD) of the filing
             
         Returns:
             Dictionary containing parsed UBPR performance data
         """
         try:
             logger.debug("Starting comprehensive UBPR XBRL parsing", data_size=len(ubpr_data))
-            # Parse UBPR XBRL XML
-            ubpr_str = ubpr_data.decode('utf-8')
-            
-            # Remove BOM if present
-            if ubpr_str.startswith('\ufeff'):
-                ubpr_str = ubpr_str[1:]
-            
-            logger.debug("Parsing XML", xml_length=len(ubpr_str))
-            root = ET.fromstring(ubpr_str)
-            logger.debug("XML parsed successfully")
-            
-            # Define correct namespace mappings for UBPR XBRL (based on actual Wells Fargo data analysis)
-            namespaces = {
-                'xbrli': 'http://www.xbrl.org/2003/instance',
-                'xbrl': 'http://www.xbrl.org/2003/instance',  
-                'ubpr': 'http://www.cdr.ffiec.gov/xbrl/ubpr/v174/Concepts',
-                'ubpr_src': 'http://www.cdr.ffiec.gov/xbrl/ubpr/v174/SourceConcepts',
-                'ubpr_core': 'http://www.cdr.ffiec.gov/xbrl/ubpr/v174/Core',
-                'link': 'http://www.xbrl.org/2003/linkbase'
-            }
+            # Stream UBPR facts straight from the bytes (BOM and encoding handled by expat)
+            all_ubpr_elements, elements_scanned = extract_xbrl_facts(
+                ubpr_data,
+                ubpr_concept,
+                concepts=concepts,
+                stop_early=concepts is not None,
+                strip_values=False,
+                period=reporting_period
+            )
             
             # Extract ALL available UBPR elements dynamically
             ubpr_parsed_data = {}
             
-            # Discover all UBPR elements in the XML
-            logger.debug("Discovering all UBPR elements in XML")
-            all_ubpr_elements = {}
-            
-            # Find all elements that start with 'UBPR'
-            for elem in root.iter():
-                tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                if tag_name.startswith('UBPR') and elem.text:
-                    context_ref = elem.get('contextRef', '')
-                    unit_ref = elem.get('unitRef', '')
-                    
-                    # Group by element code and select most recent context
-                    if tag_name not in all_ubpr_elements:
-                        all_ubpr_elements[tag_name] = {
-                            'element': elem,
-                            'context': context_ref,
-                            'unit': unit_ref,
-                            'value': elem.text
-                        }
-                    else:
-                        # Keep the one with the most recent context (sorted alphabetically, latest wins)
-                        if context_ref > all_ubpr_elements[tag_name]['context']:
-                            all_ubpr_elements[tag_name] = {
-                                'element': elem,
-                                'context': context_ref,
-                                'unit': unit_ref,
-                                'value': elem.text
-                            }
-            
-            logger.debug("Found total UBPR elements", total_found=len(all_ubpr_elements))
+            logger.debug(
+                "Found total UBPR elements",
+                total_found=len(all_ubpr_elements),
+                elements_scanned=elements_scanned
+            )
             
             # Process all discovered UBPR elements
             elements_found = 0
@@ -1226,7 +1076,6 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
             for element_code, element_info in all_ubpr_elements.items():
                 try:
                     # Use the already discovered element info
-                    element = element_info['element']
                     value = element_info['value']
                     unit_ref = element_info['unit']
                     context_ref = element_info['context']
@@ -1369,25 +1218,8 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
              schedules: Optional[List[str]] = None,
              specific_fields: Optional[List[str]] = None,
              run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
-        """Synchronous wrapper for async call report retrieval."""
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If loop is running, we need to create a task
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._arun(rssd_id, reporting_period, facsimile_format, data_type, schedules, specific_fields, None)
-                    )
-                    return future.result()
-            else:
-                # Loop exists but not running, we can use asyncio.run
-                return asyncio.run(self._arun(rssd_id, reporting_period, facsimile_format, data_type, schedules, specific_fields, None))
-        except RuntimeError:
-            # No event loop, safe to use asyncio.run
-            return asyncio.run(self._arun(rssd_id, reporting_period, facsimile_format, data_type, schedules, specific_fields, None))
+        """Synchronous wrapper for async call report retrieval, run on the process-wide event loop."""
+        return run_sync(self._arun(rssd_id, reporting_period, facsimile_format, data_type, schedules, specific_fields, None))
     
     async def _arun(self,
                    rssd_id: str,
@@ -1506,29 +1338,40 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                         rssd_id=rssd_id,
                         discovered_period=actual_period
                     )
-                    
-                    # Retrieve data for discovered period based on data type
-                    if data_type == "ubpr":
-                        call_report_data = await client.retrieve_ubpr_facsimile(
-                            rssd_id=rssd_id,
-                            reporting_period=actual_period
-                        )
-                    else:
-                        call_report_data = await client.retrieve_facsimile(
-                            rssd_id=rssd_id,
-                            reporting_period=actual_period,
-                            format_type=facsimile_format.upper()
-                        )
-            else:
-                # Retrieve data for specified period based on data type
-                if not self.ffiec_client:
-                    return self._format_error(
-                        "FFIEC client not initialized - check configuration",
-                        error_code="CLIENT_NOT_INITIALIZED"
-                    )
-                
+            elif not self.ffiec_client:
+                return self._format_error(
+                    "FFIEC client not initialized - check configuration",
+                    error_code="CLIENT_NOT_INITIALIZED"
+                )
+            
+            # Reuse a previously parsed report for the same bank, period, format and schedules
+            parsed_cache_key = build_parsed_report_cache_key(
+                rssd_id,
+                actual_period,
+                data_type,
+                facsimile_format,
+                schedules if facsimile_format.upper() == "SDF" and data_type != "ubpr" else None
+            )
+            cached_report = self._parsed_report_cache.get(parsed_cache_key)
+            if cached_report is not None:
+                logger.info(
+                    "Using cached parsed call report",
+                    rssd_id=rssd_id,
+                    reporting_period=actual_period,
+                    format=cached_report["format"]
+                )
+                return self._format_parsed_report(
+                    rssd_id=rssd_id,
+                    reporting_period=actual_period,
+                    report=cached_report,
+                    start_time=start_time,
+                    discovered_period=period_discovered,
+                    specific_fields=specific_fields
+                )
+            
+            # Retrieve data for the period unless the fallback search already did
+            if not call_report_data:
                 client = self.ffiec_client
-                
                 if data_type == "ubpr":
                     call_report_data = await client.retrieve_ubpr_facsimile(
                         rssd_id=rssd_id,
@@ -1549,11 +1392,14 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                     reporting_period=actual_period
                 )
             
+            # XBRL parses stop as soon as every requested field has been seen for the period
+            concepts = specific_fields or None
+            
             # Parse structured data based on data type and format
             parsed_data = None
             if data_type == "ubpr":
                 logger.info("Parsing UBPR XBRL data for performance metrics extraction", rssd_id=rssd_id)
-                parsed_data = self._parse_ubpr_xbrl_data(call_report_data)
+                parsed_data = self._parse_ubpr_xbrl_data(call_report_data, concepts, actual_period)
             elif facsimile_format.upper() == "SDF":
                 logger.info("Parsing SDF data for balance sheet extraction", rssd_id=rssd_id)
                 parsed_data = self._parse_sdf_data(call_report_data, rssd_id, schedules)
@@ -1570,7 +1416,7 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                         )
                         if xbrl_data:
                             logger.info("Successfully retrieved XBRL format, parsing...", rssd_id=rssd_id)
-                            xbrl_parsed_data = self._parse_xbrl_data(xbrl_data)
+                            xbrl_parsed_data = self._parse_xbrl_data(xbrl_data, concepts, actual_period)
                             if xbrl_parsed_data and xbrl_parsed_data.get("parsing_successful", False):
                                 parsed_data = xbrl_parsed_data
                                 # Update format type to reflect what was actually used
@@ -1581,7 +1427,7 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                         logger.warning("XBRL fallback also failed", error=str(xbrl_error), rssd_id=rssd_id)
             elif facsimile_format.upper() == "XBRL":
                 logger.info("Parsing XBRL data for balance sheet extraction", rssd_id=rssd_id)
-                parsed_data = self._parse_xbrl_data(call_report_data)
+                parsed_data = self._parse_xbrl_data(call_report_data, concepts, actual_period)
                 
                 # If XBRL parsing failed completely, try SDF format as fallback
                 if parsed_data and not parsed_data.get("parsing_successful", False):
@@ -1605,22 +1451,28 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                     except Exception as sdf_error:
                         logger.warning("SDF fallback also failed", error=str(sdf_error), rssd_id=rssd_id)
             
-            # Calculate execution time
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            report = {
+                "parsed_data": parsed_data,
+                "mdrm_index": self._build_mdrm_index(
+                    (parsed_data or {}).get("call_report_schedules", {})
+                ),
+                "format": facsimile_format.upper(),
+                "data_size": len(call_report_data)
+            }
             
-            # Apply field filtering if requested
-            if specific_fields and parsed_data:
-                parsed_data = self._filter_specific_fields(parsed_data, specific_fields)
+            # Only complete, successful parses are worth keeping; a parse that stopped at the
+            # requested fields would be served short to later requests for other fields
+            partial_parse = concepts is not None and (data_type == "ubpr" or facsimile_format.upper() == "XBRL")
+            if parsed_data and parsed_data.get("parsing_successful", False) and not partial_parse:
+                self._parsed_report_cache.put(parsed_cache_key, report)
             
-            # Format successful response with parsed data
-            return self._format_success(
+            return self._format_parsed_report(
                 rssd_id=rssd_id,
                 reporting_period=actual_period,
-                format_type=facsimile_format.upper(),
-                data_size=len(call_report_data),
-                execution_time=execution_time,
+                report=report,
+                start_time=start_time,
                 discovered_period=period_discovered,
-                parsed_data=parsed_data
+                specific_fields=specific_fields
             )
             
         except ValueError as validation_error:
@@ -1651,6 +1503,47 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
                 reporting_period=reporting_period
             )
     
+    def _format_parsed_report(self,
+                              rssd_id: str,
+                              reporting_period: str,
+                              report: Dict[str, Any],
+                              start_time: datetime,
+                              discovered_period: bool,
+                              specific_fields: Optional[List[str]] = None) -> str:
+        """
+        Format a parsed (possibly cached) call report as the tool response.
+        
+        Args:
+            rssd_id: Bank RSSD identifier
+            reporting_period: Reporting period used
+            report: Parsed report with its MDRM index, format and raw data size
+            start_time: Request start time for execution timing
+            discovered_period: Whether period was discovered automatically
+            specific_fields: Optional field codes to filter the response to
+            
+        Returns:
+            JSON formatted success response
+        """
+        parsed_data = report["parsed_data"]
+        
+        # Apply field filtering if requested
+        if specific_fields and parsed_data:
+            parsed_data = self._filter_specific_fields(parsed_data, specific_fields, report["mdrm_index"])
+        
+        # Calculate execution time
+        execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+        
+        # Format successful response with parsed data
+        return self._format_success(
+            rssd_id=rssd_id,
+            reporting_period=reporting_period,
+            format_type=report["format"],
+            data_size=report["data_size"],
+            execution_time=execution_time,
+            discovered_period=discovered_period,
+            parsed_data=parsed_data
+        )
+    
     def _format_success(self,
                        rssd_id: str,
                        reporting_period: str,
@@ -1748,13 +1641,17 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
         
         return json.dumps(response, indent=2)
     
-    def _filter_specific_fields(self, parsed_data: Dict[str, Any], specific_fields: List[str]) -> Dict[str, Any]:
+    def _filter_specific_fields(self,
+                                parsed_data: Dict[str, Any],
+                                specific_fields: List[str],
+                                mdrm_index: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """
         Filter parsed data to only include specific RCON/RCOA field codes.
         
         Args:
             parsed_data: Full parsed call report data
             specific_fields: List of field codes to extract (e.g., ['RCON8274', 'RCON7273'])
+            mdrm_index: Precomputed MDRM code index, built from parsed_data if None
             
         Returns:
             Filtered data with only requested fields
@@ -1783,24 +1680,26 @@ Returns: Targeted JSON with only requested schedule data, semantic mappings, and
             "RCON7204": {"name": "Tier 1 Leverage Ratio", "type": "ratio"}
         }
         
-        # Extract specific fields from all schedules
-        call_report_schedules = parsed_data.get("call_report_schedules", {})
+        # Look up each requested field in the MDRM index
+        if mdrm_index is None:
+            mdrm_index = self._build_mdrm_index(parsed_data.get("call_report_schedules", {}))
         
-        for schedule_name, schedule_data in call_report_schedules.items():
-            line_items = schedule_data.get("line_items", [])
+        for field_code in specific_fields:
+            entries = mdrm_index.get(field_code)
+            if not entries:
+                continue
             
-            for item in line_items:
-                field_code = item.get("mdrm_code") or item.get("line_code")
-                if field_code in specific_fields:
-                    field_info = field_mappings.get(field_code, {"name": field_code, "type": "unknown"})
-                    
-                    filtered_data["capital_ratios"][field_code] = {
-                        "name": field_info["name"],
-                        "value": item.get("value"),
-                        "formatted_value": item.get("formatted_value"),
-                        "type": field_info["type"],
-                        "schedule": schedule_name
-                    }
+            # A code reported in several schedules resolves to its last occurrence
+            entry = entries[-1]
+            item = entry["item"]
+            field_info = field_mappings.get(field_code, {"name": field_code, "type": "unknown"})
+            filtered_data["capital_ratios"][field_code] = {
+                "name": field_info["name"],
+                "value": item.get("value"),
+                "formatted_value": item.get("formatted_value"),
+                "type": field_info["type"],
+                "schedule": entry["schedule"]
+            }
         
         # Add summary
         filtered_data["summary"] = {
@@ -18,11 +18,15 @@ from langchain.callbacks.manager import (
     CallbackManagerForToolRun,
 )
 
+from src.utils.event_loop import run_sync
+
 from ..atomic.fdic_institution_search_tool import FDICInstitutionSearchTool
 from ..atomic.ffiec_call_report_data_tool import FFIECCallReportDataTool
+from ..infrastructure.banking.banking_http_session import BankingHTTPSession
 from ..infrastructure.banking.fdic_financial_api import FDICFinancialAPI
 from ..infrastructure.banking.fdic_financial_models import BankFinancialAnalysisInput
-from ..infrastructure.banking.fdic_financial_constants import format_financial_value
+from ..infrastructure.banking.fdic_financial_constants import FDIC_BATCH_CONFIG, format_financial_value
+from ..infrastructure.banking.fdic_peer_analysis import PEER_RATIO_LABELS
 from ..infrastructure.banking.fdic_models import BankAnalysisInput
 
 logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
@@ -55,6 +59,7 @@ Analysis Types:
 - basic_info: Bank identification, assets, deposits, equity, and basic ratios
 - financial_summary: Comprehensive balance sheet and income statement data
 - key_ratios: Detailed profitability, capital, and asset quality ratios
+- peer_ranking: Percentile and z-score of each ratio among all FDIC banks of similar asset size
 
 Search by Bank Name (Recommended):
 - bank_name: Institution name with intelligent matching (e.g., "Wells Fargo", "JPMorgan Chase")
@@ -76,6 +81,15 @@ Example Usage:
    - state: "NY"
    - query_type: "basic_info"
 
+Batch Mode (peer groups of up to 50 banks in ONE call - do not loop over banks):
+- cert_ids: List of FDIC certificate numbers (fastest, e.g. ["3511", "628", "7213"])
+- bank_names: List of bank names to look up (optional state applies to all)
+- Returns one compact comparison table (assets, deposits, net income, ROA, ROE, capital and liquidity ratios)
+
+4. Compare a peer group:
+   - cert_ids: ["3511", "628", "7213"]
+   - bank_names: ["First Merchants Bank", "Old National Bank"]
+
 Returns: Professional financial analysis using real FDIC regulatory data with formatted metrics and ratios."""
     
     args_schema: Type[BaseModel] = BankAnalysisInput
@@ -88,12 +102,18 @@ Returns: Professional financial analysis using real FDIC regulatory data with fo
         from src.config.settings import get_settings
         settings = kwargs.get('settings') or get_settings()
         
+        # Component clients share one pooled HTTP session so lookup and financial calls reuse connections
+        http_session = kwargs.get('http_session') or BankingHTTPSession(
+            timeout=settings.fdic_financial_api_timeout
+        )
+        
         # Initialize component tools - use private attributes to avoid Pydantic conflicts
-        object.__setattr__(self, '_bank_lookup', FDICInstitutionSearchTool(settings=settings))
+        object.__setattr__(self, '_bank_lookup', FDICInstitutionSearchTool(settings=settings, http_session=http_session))
         object.__setattr__(self, '_financial_client', FDICFinancialAPI(
             api_key=settings.fdic_api_key,
             timeout=settings.fdic_financial_api_timeout,
-            cache_ttl=settings.fdic_financial_cache_ttl
+            cache_ttl=settings.fdic_financial_cache_ttl,
+            http_session=http_session
         ))
         
         # Initialize FFIEC Call Report tool if available
@@ -134,25 +154,12 @@ Returns: Professional financial analysis using real FDIC regulatory data with fo
         query_type: str = "basic_info",
         city: Optional[str] = None,
         state: Optional[str] = None,
+        cert_ids: Optional[List[str]] = None,
+        bank_names: Optional[List[str]] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> str:
-        """Synchronous execution with enhanced FDIC search support."""
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_running_loop()
-            # If we're in an event loop, we need to handle this differently
-            import concurrent.futures
-            
-            # Create a new event loop in a thread pool
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    lambda: asyncio.run(self._arun(bank_name, query_type, city, state, run_manager))
-                )
-                return future.result()
-                
-        except RuntimeError:
-            # No event loop running, safe to use asyncio.run
-            return asyncio.run(self._arun(bank_name, query_type, city, state, run_manager))
+        """Synchronous execution with enhanced FDIC search support, run on the process-wide event loop."""
+        return run_sync(self._arun(bank_name, query_type, city, state, cert_ids, bank_names, run_manager))
     
     async def _arun(
         self,
@@ -160,21 +167,28 @@ Returns: Professional financial analysis using real FDIC regulatory data with fo
         query_type: str = "basic_info",
         city: Optional[str] = None,
         state: Optional[str] = None,
+        cert_ids: Optional[List[str]] = None,
+        bank_names: Optional[List[str]] = None,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> str:
         """
         Execute comprehensive bank analysis with clean FDIC integration.
         
         Args:
-            bank_name: Bank name to search for (required)
-            query_type: Type of analysis to perform ("basic_info", "financial_summary", "key_ratios")
+            bank_name: Bank name to search for (required unless in batch mode)
+            query_type: Type of analysis to perform ("basic_info", "financial_summary", "key_ratios", "peer_ranking")
             city: City to help identify the bank
             state: State abbreviation to help identify the bank
+            cert_ids: Batch mode - FDIC certificate numbers to compare
+            bank_names: Batch mode - bank names to look up and compare
             run_manager: Optional callback manager
             
         Returns:
             Formatted analysis results using structured FDIC data
         """
+        if cert_ids or bank_names:
+            return await self._analyze_batch(cert_ids or [], bank_names or [], state)
+        
         try:
             logger.info(
                 "Executing enhanced bank analysis with FDIC integration",
@@ -250,8 +264,10 @@ The bank name must match an active FDIC-insured institution."""
                 return await self._get_financial_summary(bank_info, cert_id)
             elif query_type == "key_ratios":
                 return await self._get_key_ratios(bank_info, cert_id)
+            elif query_type == "peer_ranking":
+                return await self._get_peer_ranking(bank_info, cert_id)
             else:
-                return f"Error: Unknown query_type '{query_type}'. Use 'basic_info', 'financial_summary', or 'key_ratios'"
+                return f"Error: Unknown query_type '{query_type}'. Use 'basic_info', 'financial_summary', 'key_ratios', or 'peer_ranking'"
                 
         except Exception as e:
             logger.error("Bank analysis failed", error=str(e))
@@ -463,6 +479,167 @@ Additional Data Sources Available:
             logger.error("Key ratios calculation failed", error=str(e), cert_id=cert_id)
             return f"Error calculating financial ratios: {str(e)}"
     
+    async def _get_peer_ranking(self, bank_info: Dict[str, Any], cert_id: str) -> str:
+        """Rank the bank's ratios among its asset-size peers from the cached peer matrix."""
+        try:
+            logger.info("Getting peer ranking with FDIC peer engine", cert_id=cert_id)
+            
+            ranking = await self.financial_client.peer_groups.rank_bank(cert_id)
+            if ranking is None:
+                return f"""Bank Analysis - Peer Ranking:
+
+Bank: {bank_info.get('name', 'Unknown')}
+FDIC Certificate: {cert_id}
+
+Error: The bank did not report financial data for the latest report date
+
+Data Source: FDIC BankFind Suite Financial API"""
+            
+            lower, upper = ranking["asset_range"] or (None, None)
+            if lower is None:
+                peer_group = "All reporting banks"
+            elif upper is None:
+                peer_group = f"Total assets of {format_financial_value(lower)} or more"
+            else:
+                peer_group = f"Total assets {format_financial_value(lower)} to {format_financial_value(upper)}"
+            
+            lines = []
+            for ratio_name, stats in ranking["ratios"].items():
+                label = PEER_RATIO_LABELS[ratio_name]
+                if stats["value"] is None:
+                    lines.append(f"- {label}: Not available")
+                    continue
+                z_score = f"{stats['z_score']:+.2f}" if stats["z_score"] is not None else "N/A"
+                lines.append(
+                    f"- {label}: {stats['value']:.2f}% | percentile {stats['percentile']:.0f} | "
+                    f"z-score {z_score} | peer median {stats['peer_median']:.2f}% ({stats['peer_count']} peers)"
+                )
+            ratio_lines = "\n".join(lines)
+            
+            return f"""Bank Analysis - Peer Ranking:
+
+Bank: {bank_info.get('name', 'Unknown')}
+FDIC Certificate: {cert_id}
+Report Date: {ranking['report_date']}
+Peer Group: {peer_group} ({ranking['peer_count']} banks)
+
+Ratio Rankings (percentile = share of peers at or below the bank):
+{ratio_lines}
+
+Note: Efficiency ratio is better when lower; other ratios are better when higher, within prudent limits.
+Data Source: FDIC BankFind Suite Financial API
+Analysis Type: Peer Ranking"""
+            
+        except Exception as e:
+            logger.error("Peer ranking failed", error=str(e), cert_id=cert_id)
+            return f"Error calculating peer ranking: {str(e)}"
+    
+    async def _analyze_batch(self, cert_ids: List[str], bank_names: List[str], state: Optional[str] = None) -> str:
+        """
+        Compare many banks in one call.
+        
+        Bank names are resolved to certificates with bounded concurrency, then the
+        latest financials of all banks are fetched with combined CERT filter queries.
+        
+        Args:
+            cert_ids: FDIC certificate numbers
+            bank_names: Bank names to look up
+            state: State abbreviation applied to every name lookup
+            
+        Returns:
+            Compact comparison table of the banks' latest financials
+        """
+        try:
+            logger.info(
+                "Executing batch bank analysis",
+                cert_count=len(cert_ids),
+                name_count=len(bank_names),
+                state=state
+            )
+            
+            # Certificate -> display name (None until known)
+            banks: Dict[str, Optional[str]] = {str(int(cert)): None for cert in cert_ids if cert.strip().isdigit()}
+            unresolved = [cert for cert in cert_ids if not cert.strip().isdigit()]
+            
+            semaphore = asyncio.Semaphore(FDIC_BATCH_CONFIG["max_concurrency"])
+            
+            async def lookup(name: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    try:
+                        result_data = json.loads(await self.bank_lookup._arun(name=name, state=state, limit=1))
+                    except Exception as e:
+                        logger.warning("Failed to lookup certificate ID", error=str(e), bank_name=name)
+                        return None
+                if result_data.get('success') and result_data.get('institutions'):
+                    return result_data['institutions'][0]
+                return None
+            
+            institutions = await asyncio.gather(*(lookup(name) for name in bank_names))
+            for name, institution in zip(bank_names, institutions):
+                if institution and institution.get('cert'):
+                    banks.setdefault(str(institution['cert']), institution.get('name', name))
+                else:
+                    unresolved.append(name)
+            
+            if not banks:
+                return "Error: None of the requested banks could be identified by FDIC certificate number or name."
+            
+            records = await self.financial_client.get_financial_data_for_banks(list(banks))
+            return self._format_batch_table(banks, records, unresolved)
+            
+        except Exception as e:
+            logger.error("Batch bank analysis failed", error=str(e))
+            return f"Error: Batch bank analysis failed - {str(e)}"
+    
+    def _format_batch_table(self,
+                            banks: Dict[str, Optional[str]],
+                            records: Dict[str, Any],
+                            unresolved: List[str]) -> str:
+        """Format the latest financials of several banks as one table."""
+        def format_ratio(value: Optional[Decimal]) -> str:
+            return f"{value:.2f}%" if value is not None else "N/A"
+        
+        def format_amount(value: Optional[Decimal]) -> str:
+            return format_financial_value(value) if value is not None else "N/A"
+        
+        rows = [
+            "| Bank | Cert | Report Date | Total Assets | Total Deposits | Net Income | ROA | ROE "
+            "| Equity/Assets | Loans/Deposits | Tier 1 Ratio |",
+            "|---|---|---|---|---|---|---|---|---|---|---|"
+        ]
+        no_data = []
+        for cert, name in banks.items():
+            record = records.get(cert)
+            if record is None:
+                no_data.append(name or f"Cert {cert}")
+                continue
+            # Banks given by certificate get their name from the FDIC record
+            name = name or getattr(record, "name", None)
+            ratios = record.calculate_derived_ratios()
+            roa = record.roa if record.roa is not None else ratios.get("calculated_roa")
+            roe = record.roe if record.roe is not None else ratios.get("calculated_roe")
+            rows.append(
+                f"| {name or 'N/A'} | {cert} | {record.repdte} | {format_amount(record.asset)} "
+                f"| {format_amount(record.dep)} | {format_amount(record.netinc)} | {format_ratio(roa)} "
+                f"| {format_ratio(roe)} | {format_ratio(ratios.get('equity_to_assets'))} "
+                f"| {format_ratio(ratios.get('loans_to_deposits'))} | {format_ratio(record.tier1r)} |"
+            )
+        
+        notes = []
+        if unresolved:
+            notes.append(f"Not found: {', '.join(unresolved)}")
+        if no_data:
+            notes.append(f"No financial data: {', '.join(no_data)}")
+        
+        table = "\n".join(rows)
+        notes_text = "\n".join(notes) + "\n\n" if notes else ""
+        return f"""Bank Analysis - Batch Comparison ({len(banks) - len(no_data)} of {len(banks)} banks with data):
+
+{table}
+
+{notes_text}Data Source: FDIC BankFind Suite Financial API
+Analysis Type: Batch Comparison"""
+    
     def _get_data_sources_summary(self, rssd_id: Optional[str] = None) -> str:
         """Get summary of available data sources for this bank."""
         sources = []
@@ -216,7 +216,10 @@ class ServiceAvailabilityChecker:
                 return False
             
             # Perform health check
-            health_check_result = await client.health_check()
+            try:
+                health_check_result = await client.health_check()
+            finally:
+                await client.close()
             
             self.logger.debug(
                 "FDIC API availability check completed",
@@ -261,7 +264,10 @@ class ServiceAvailabilityChecker:
                 return False
             
             # Perform health check
-            health_check_result = await client.health_check()
+            try:
+                health_check_result = await client.health_check()
+            finally:
+                await client.close()
             
             self.logger.debug(
                 "FDIC Financial API availability check completed",
@@ -0,0 +1,188 @@
+"""
+Shared, connection-pooled HTTP session for FDIC API clients.
+
+Provides a long-lived aiohttp session with keep-alive, per-host connection
+limits and DNS caching so that FDIC API calls reuse TCP/TLS connections
+instead of paying a new handshake on every request.
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Dict, Optional
+import aiohttp
+import structlog
+
+from .fdic_constants import FDIC_HTTP_POOL_CONFIG
+
+logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
+
+
+async def _close_at_loop_shutdown(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+    """
+    Close a session when its event loop shuts down.
+
+    Event loops finalize their open async generators before closing
+    (asyncio.run calls shutdown_asyncgens), so a generator suspended here
+    closes the session while its connections can still be shut down cleanly.
+    """
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+class BankingHTTPSession:
+    """
+    Lazily created, connection-pooled aiohttp session.
+
+    aiohttp sessions are bound to the event loop they were created on, so the
+    pooled session is created on first use and transparently recreated when
+    it is requested from a different event loop (for example by an async
+    caller's own loop after the process-wide loop of src.utils.event_loop,
+    which the synchronous ``_run`` shims use). A single instance is
+    meant to be shared by every FDIC client in a toolset. A session is closed
+    when the event loop it belongs to shuts down, so callers using
+    ``asyncio.run`` do not leave its connections open.
+    """
+
+    def __init__(
+        self,
+        connection_limit: int = FDIC_HTTP_POOL_CONFIG["connection_limit"],
+        connection_limit_per_host: int = FDIC_HTTP_POOL_CONFIG["connection_limit_per_host"],
+        dns_cache_ttl: int = FDIC_HTTP_POOL_CONFIG["dns_cache_ttl_seconds"],
+        keepalive_timeout: float = FDIC_HTTP_POOL_CONFIG["keepalive_timeout_seconds"],
+        timeout: float = FDIC_HTTP_POOL_CONFIG["default_timeout_seconds"]
+    ):
+        """
+        Initialize shared HTTP session settings.
+
+        Args:
+            connection_limit: Maximum number of open connections
+            connection_limit_per_host: Maximum open connections per host
+            dns_cache_ttl: DNS cache time-to-live in seconds
+            keepalive_timeout: Idle keep-alive time for pooled connections in seconds
+            timeout: Default total timeout for requests in seconds
+        """
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Async generator that closes the session at its loop's shutdown
+        self._session_closer: Optional[AsyncIterator[None]] = None
+        self._session_lock = threading.Lock()
+        self._sessions_created = 0
+
+        self.logger = logger.bind(component="banking_http_session")
+
+        self.logger.info(
+            "Banking HTTP session pool initialized",
+            connection_limit=connection_limit,
+            connection_limit_per_host=connection_limit_per_host,
+            dns_cache_ttl_seconds=dns_cache_ttl,
+            keepalive_timeout_seconds=keepalive_timeout
+        )
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled session for the running event loop.
+
+        Returns:
+            Open aiohttp ClientSession bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._session_lock:
+            session = self._session
+            if session is not None and not session.closed and self._session_loop is loop:
+                return session
+
+            if session is not None and not session.closed:
+                self._release_stale_session(session, self._session_loop)
+
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._session_loop = loop
+            # Runs up to its first yield without suspending, registering it with the loop
+            self._session_closer = _close_at_loop_shutdown(self._session)
+            await self._session_closer.__anext__()
+            self._sessions_created += 1
+
+            self.logger.debug(
+                "Created pooled HTTP session",
+                sessions_created=self._sessions_created
+            )
+            return self._session
+
+    def _release_stale_session(
+        self,
+        session: aiohttp.ClientSession,
+        session_loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """
+        Release a session that belongs to a different event loop.
+
+        Args:
+            session: Session created on another event loop
+            session_loop: Event loop the session was created on
+        """
+        if session_loop is not None and session_loop.is_running():
+            # Close it on its own loop; it may still be serving requests there
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        else:
+            # The owning loop stopped without shutting down its async generators;
+            # close the connector's transports without waiting on that loop
+            connector = session.connector
+            session.detach()
+            close_transports = getattr(connector, "_close", None)  # aiohttp >= 3.9
+            if close_transports is not None:
+                close_transports()
+            elif connector is not None:
+                connector.close()
+
+        self.logger.debug("Released HTTP session bound to another event loop")
+
+    async def close(self) -> None:
+        """Close the pooled session and release all connections."""
+        with self._session_lock:
+            session = self._session
+            session_loop = self._session_loop
+            self._session = None
+            self._session_loop = None
+
+        if session is None or session.closed:
+            return
+
+        try:
+            if session_loop is asyncio.get_running_loop():
+                await session.close()
+            else:
+                self._release_stale_session(session, session_loop)
+            self.logger.info("Banking HTTP session closed")
+        except Exception as e:
+            self.logger.warning("Error closing banking HTTP session", error=str(e))
+
+    @property
+    def closed(self) -> bool:
+        """Check whether there is no open pooled session."""
+        return self._session is None or self._session.closed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics for monitoring."""
+        return {
+            "session_open": not self.closed,
+            "sessions_created": self._sessions_created,
+            "connection_limit": self.connection_limit,
+            "connection_limit_per_host": self.connection_limit_per_host,
+            "dns_cache_ttl_seconds": self.dns_cache_ttl,
+            "keepalive_timeout_seconds": self.keepalive_timeout
+        }
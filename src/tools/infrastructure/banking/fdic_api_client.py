@@ -7,18 +7,18 @@ proper caching, validation, and error handling following existing patterns.
 
 import asyncio
 import hashlib
-import threading
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 import aiohttp
 import structlog
 
+from src.utils.lru_cache import ResponseCache
+from .banking_http_session import BankingHTTPSession
 from .fdic_models import (
     FDICInstitution,
     FDICAPIResponse,
-    FDICSearchFilters, 
-    FDICCacheEntry
+    FDICSearchFilters
 )
 from .fdic_constants import (
     FDIC_API_BASE_URL,
@@ -34,139 +34,42 @@ from .fdic_constants import (
 logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
 
 
-class FDICAPICache:
+class FDICAPICache(ResponseCache[FDICAPIResponse]):
     """
     Thread-safe cache for FDIC API responses.
     
-    Implements caching similar to the credential cache pattern
-    in the existing codebase for performance optimization.
+    Thin configuration of the shared ResponseCache engine (O(1) LRU
+    lookups, heap-based TTL expiry, entry and byte limits).
     """
     
-    def __init__(self, default_ttl_seconds: int = 3600, max_entries: int = 1000):
+    def __init__(
+        self,
+        default_ttl_seconds: int = 3600,
+        max_entries: int = FDIC_CACHE_CONFIG["max_cache_entries"],
+        max_bytes: Optional[int] = FDIC_CACHE_CONFIG["max_cache_bytes"]
+    ):
         """
         Initialize FDIC API cache.
         
         Args:
             default_ttl_seconds: Default time-to-live for cache entries
             max_entries: Maximum number of cache entries to maintain
+            max_bytes: Maximum estimated size of cached responses in bytes
         """
-        self._cache: Dict[str, FDICCacheEntry] = {}
-        self._cache_lock = threading.Lock()
-        self.default_ttl = default_ttl_seconds
-        self.max_entries = max_entries
-        self.logger = logger.bind(component="fdic_api_cache")
+        super().__init__(
+            default_ttl_seconds=default_ttl_seconds,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            component="fdic_api_cache"
+        )
         
         self.logger.info(
             "FDIC API cache initialized",
             default_ttl_seconds=default_ttl_seconds,
-            max_entries=max_entries
+            max_entries=max_entries,
+            max_bytes=max_bytes
         )
-    
-    def get(self, cache_key: str) -> Optional[FDICAPIResponse]:
-        """
-        Get cached response if available and not expired.
-        
-        Args:
-            cache_key: Cache key to lookup
-            
-        Returns:
-            Cached FDICAPIResponse if available and fresh, None otherwise
-        """
-        with self._cache_lock:
-            entry = self._cache.get(cache_key)
-            if not entry:
-                return None
-                
-            if entry.is_expired():
-                self.logger.debug("Cache entry expired", cache_key=cache_key)
-                del self._cache[cache_key]
-                return None
-                
-            self.logger.debug(
-                "Cache hit",
-                cache_key=cache_key,
-                ttl_remaining=entry.time_to_expiry()
-            )
-            return entry.response
-    
-    def put(self, cache_key: str, response: FDICAPIResponse, ttl_seconds: Optional[int] = None) -> None:
-        """
-        Cache a response with specified TTL.
-        
-        Args:
-            cache_key: Cache key to store under
-            response: FDIC API response to cache
-            ttl_seconds: Time-to-live override, uses default if None
-        """
-        ttl = ttl_seconds or self.default_ttl
-        now = datetime.now()
-        
-        entry = FDICCacheEntry(
-            response=response,
-            query_hash=cache_key,
-            cached_at=now,
-            expires_at=now + timedelta(seconds=ttl)
-        )
-        
-        with self._cache_lock:
-            # Evict expired entries if at capacity
-            if len(self._cache) >= self.max_entries:
-                self._evict_expired_entries()
-                
-                # If still at capacity after eviction, remove oldest
-                if len(self._cache) >= self.max_entries:
-                    oldest_key = min(self._cache.keys(), 
-                                   key=lambda k: self._cache[k].cached_at)
-                    del self._cache[oldest_key]
-                    self.logger.debug("Evicted oldest cache entry", evicted_key=oldest_key)
-            
-            self._cache[cache_key] = entry
-            self.logger.debug(
-                "Cached response",
-                cache_key=cache_key,
-                ttl_seconds=ttl,
-                cache_size=len(self._cache)
-            )
-    
-    def _evict_expired_entries(self) -> int:
-        """
-        Remove expired entries from cache.
-        
-        Returns:
-            Number of entries evicted
-        """
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if entry.is_expired()
-        ]
-        
-        for key in expired_keys:
-            del self._cache[key]
-            
-        if expired_keys:
-            self.logger.debug(
-                "Evicted expired cache entries",
-                evicted_count=len(expired_keys)
-            )
-            
-        return len(expired_keys)
-    
-    def clear(self) -> None:
-        """Clear all cache entries."""
-        with self._cache_lock:
-            self._cache.clear()
-            self.logger.info("Cache cleared")
-    
-    def stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        with self._cache_lock:
-            expired_count = sum(1 for entry in self._cache.values() if entry.is_expired())
-            return {
-                "total_entries": len(self._cache),
-                "expired_entries": expired_count,
-                "active_entries": len(self._cache) - expired_count,
-                "max_entries": self.max_entries
-            }
+
 
 
 class FDICAPIClient:
@@ -181,7 +84,8 @@ class FDICAPIClient:
         self, 
         api_key: Optional[str] = None, 
         timeout: float = 30.0,
-        cache_ttl: int = FDIC_CACHE_CONFIG["institution_data_ttl"]
+        cache_ttl: int = FDIC_CACHE_CONFIG["institution_data_ttl"],
+        http_session: Optional[BankingHTTPSession] = None
     ):
         """
         Initialize FDIC API client.
@@ -190,11 +94,14 @@ class FDICAPIClient:
             api_key: FDIC API key (optional - API works without key but with limits)
             timeout: HTTP request timeout in seconds
             cache_ttl: Default cache TTL in seconds
+            http_session: Shared pooled HTTP session (a private one is created if None)
         """
         self.api_key = api_key
         self.base_url = FDIC_API_BASE_URL
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.cache = FDICAPICache(default_ttl_seconds=cache_ttl)
+        self._owns_http_session = http_session is None
+        self.http_session = http_session or BankingHTTPSession(timeout=timeout)
         
         self.logger = logger.bind(component="fdic_api_client")
         
@@ -331,40 +238,40 @@ class FDICAPIClient:
             aiohttp.ClientError: For HTTP-related errors
         """
         url = f"{self.base_url}{endpoint}"
+        session = await self.http_session.get_session()
         
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
-            async with session.get(url, params=params) as response:
-                
-                # Handle FDIC-specific error status codes
-                if response.status == 400:
-                    error_text = await response.text()
-                    raise ValueError(f"Invalid FDIC API request parameters: {error_text}")
-                elif response.status == 401:
-                    raise ValueError("FDIC API authentication failed - check API key")
-                elif response.status == 429:
-                    raise ValueError("FDIC API rate limit exceeded - try again later")
-                elif response.status >= 500:
-                    error_msg = get_error_message(response.status)
-                    raise ValueError(f"FDIC API server error - {error_msg}")
-                
-                # Raise for other HTTP errors
-                response.raise_for_status()
-                
-                # Parse JSON response
-                try:
-                    data = await response.json()
-                except aiohttp.ContentTypeError as e:
-                    response_text = await response.text()
-                    raise ValueError(f"FDIC API returned invalid JSON: {response_text[:200]}") from e
-                
-                self.logger.debug(
-                    "FDIC API request successful",
-                    status=response.status,
-                    url=url,
-                    params_count=len(params)
-                )
-                
-                return data
+        async with session.get(url, params=params, timeout=self.timeout) as response:
+            
+            # Handle FDIC-specific error status codes
+            if response.status == 400:
+                error_text = await response.text()
+                raise ValueError(f"Invalid FDIC API request parameters: {error_text}")
+            elif response.status == 401:
+                raise ValueError("FDIC API authentication failed - check API key")
+            elif response.status == 429:
+                raise ValueError("FDIC API rate limit exceeded - try again later")
+            elif response.status >= 500:
+                error_msg = get_error_message(response.status)
+                raise ValueError(f"FDIC API server error - {error_msg}")
+            
+            # Raise for other HTTP errors
+            response.raise_for_status()
+            
+            # Parse JSON response
+            try:
+                data = await response.json()
+            except aiohttp.ContentTypeError as e:
+                response_text = await response.text()
+                raise ValueError(f"FDIC API returned invalid JSON: {response_text[:200]}") from e
+            
+            self.logger.debug(
+                "FDIC API request successful",
+                status=response.status,
+                url=url,
+                params_count=len(params)
+            )
+            
+            return data
     
     async def _process_response(self, raw_data: Dict[str, Any]) -> FDICAPIResponse:
         """
@@ -552,4 +459,9 @@ class FDICAPIClient:
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring."""
-        return self.cache.stats()
\ No newline at end of file
+        return self.cache.stats()
+    
+    async def close(self) -> None:
+        """Close the HTTP session if this client owns it."""
+        if self._owns_http_session:
+            await self.http_session.close()
\ No newline at end of file
@@ -178,7 +178,17 @@ FDIC_CACHE_CONFIG = {
     "default_ttl_seconds": 3600,  # 1 hour
     "institution_data_ttl": 86400,  # 24 hours (institution data changes slowly)
     "search_results_ttl": 1800,  # 30 minutes
-    "max_cache_entries": 1000
+    "max_cache_entries": 1000,
+    "max_cache_bytes": 64 * 1024 * 1024  # 64 MB of cached responses
+}
+
+# Shared HTTP connection pool configuration (used by all FDIC API clients)
+FDIC_HTTP_POOL_CONFIG = {
+    "connection_limit": 100,           # Total open connections across all hosts
+    "connection_limit_per_host": 20,   # Open connections per FDIC host
+    "dns_cache_ttl_seconds": 300,      # Cache DNS lookups for 5 minutes
+    "keepalive_timeout_seconds": 30,   # Keep idle connections open for reuse
+    "default_timeout_seconds": 30.0    # Session-level timeout when none is given per request
 }
 
 # Valid search fields for validation
@@ -7,23 +7,26 @@ with proper caching, validation, and error handling following existing patterns.
 
 import asyncio
 import hashlib
-import threading
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union
 import aiohttp
 import structlog
 
+from src.utils.lru_cache import ResponseCache
+from .banking_http_session import BankingHTTPSession
+from .fdic_peer_analysis import FDICPeerGroupEngine
 from .fdic_financial_models import (
     FDICFinancialData,
-    FDICFinancialAPIResponse,
-    FDICFinancialCacheEntry
+    FDICFinancialAPIResponse
 )
 from .fdic_financial_constants import (
     FDIC_FINANCIAL_API_BASE_URL,
     FDIC_FINANCIAL_ENDPOINT,
     FDIC_FINANCIAL_API_CONFIG,
     FDIC_FINANCIAL_CACHE_CONFIG,
+    FDIC_BATCH_CONFIG,
+    FDIC_PEER_ANALYSIS_CONFIG,
     FDIC_FINANCIAL_ERROR_CODES,
     build_financial_query_params,
     build_financial_cache_key,
@@ -34,61 +37,42 @@ from .fdic_financial_constants import (
 logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
 
 
-class FDICFinancialAPICache:
+class FDICFinancialAPICache(ResponseCache[FDICFinancialAPIResponse]):
     """
     Thread-safe cache for FDIC Financial API responses.
     
-    Implements caching similar to the existing FDIC institution cache pattern
-    for performance optimization with financial data.
+    Thin configuration of the shared ResponseCache engine that keeps error
+    responses only briefly.
     """
     
-    def __init__(self, default_ttl_seconds: int = 1800, max_entries: int = 1000):
+    def __init__(
+        self,
+        default_ttl_seconds: int = 1800,
+        max_entries: int = FDIC_FINANCIAL_CACHE_CONFIG["max_cache_size"],
+        max_bytes: Optional[int] = FDIC_FINANCIAL_CACHE_CONFIG["max_cache_bytes"]
+    ):
         """
         Initialize FDIC Financial API cache.
         
         Args:
             default_ttl_seconds: Default time-to-live for cache entries
             max_entries: Maximum number of cache entries to maintain
+            max_bytes: Maximum estimated size of cached responses in bytes
         """
-        self._cache: Dict[str, FDICFinancialCacheEntry] = {}
-        self._cache_lock = threading.Lock()
-        self.default_ttl = default_ttl_seconds
-        self.max_entries = max_entries
-        self.logger = logger.bind(component="fdic_financial_cache")
+        super().__init__(
+            default_ttl_seconds=default_ttl_seconds,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            component="fdic_financial_cache"
+        )
         
         self.logger.info(
             "FDIC Financial API cache initialized",
             default_ttl_seconds=default_ttl_seconds,
-            max_entries=max_entries
+            max_entries=max_entries,
+            max_bytes=max_bytes
         )
     
-    def get(self, cache_key: str) -> Optional[FDICFinancialAPIResponse]:
-        """
-        Get cached response if available and not expired.
-        
-        Args:
-            cache_key: Cache key to lookup
-            
-        Returns:
-            Cached FDICFinancialAPIResponse if available and fresh, None otherwise
-        """
-        with self._cache_lock:
-            entry = self._cache.get(cache_key)
-            if not entry:
-                return None
-                
-            if entry.is_expired():
-                self.logger.debug("Financial cache entry expired", cache_key=cache_key)
-                del self._cache[cache_key]
-                return None
-                
-            self.logger.debug(
-                "Financial cache hit",
-                cache_key=cache_key,
-                ttl_remaining=entry.time_to_expiry()
-            )
-            return entry.response
-    
     def put(self, cache_key: str, response: FDICFinancialAPIResponse, ttl_seconds: Optional[int] = None, query_params: Optional[Dict] = None) -> None:
         """
         Cache a response with specified TTL.
@@ -103,77 +87,8 @@ class FDICFinancialAPICache:
         if not response.success:
             ttl_seconds = FDIC_FINANCIAL_CACHE_CONFIG.get("error_response_ttl", 300)
         
-        ttl = ttl_seconds or self.default_ttl
-        now = datetime.now()
-        
-        entry = FDICFinancialCacheEntry(
-            response=response,
-            query_hash=cache_key,
-            cached_at=now,
-            expires_at=now + timedelta(seconds=ttl),
-            query_params=query_params
-        )
-        
-        with self._cache_lock:
-            # Evict expired entries if at capacity
-            if len(self._cache) >= self.max_entries:
-                self._evict_expired_entries()
-                
-                # If still at capacity after eviction, remove oldest
-                if len(self._cache) >= self.max_entries:
-                    oldest_key = min(self._cache.keys(), 
-                                   key=lambda k: self._cache[k].cached_at)
-                    del self._cache[oldest_key]
-                    self.logger.debug("Evicted oldest financial cache entry", evicted_key=oldest_key)
-            
-            self._cache[cache_key] = entry
-            self.logger.debug(
-                "Cached financial response",
-                cache_key=cache_key,
-                ttl_seconds=ttl,
-                cache_size=len(self._cache),
-                success=response.success
-            )
-    
-    def _evict_expired_entries(self) -> int:
-        """
-        Remove expired entries from cache.
-        
-        Returns:
-            Number of entries evicted
-        """
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if entry.is_expired()
-        ]
-        
-        for key in expired_keys:
-            del self._cache[key]
-            
-        if expired_keys:
-            self.logger.debug(
-                "Evicted expired financial cache entries",
-                evicted_count=len(expired_keys)
-            )
-            
-        return len(expired_keys)
-    
-    def clear(self) -> None:
-        """Clear all cache entries."""
-        with self._cache_lock:
-            self._cache.clear()
-            self.logger.info("Financial cache cleared")
-    
-    def stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        with self._cache_lock:
-            expired_count = sum(1 for entry in self._cache.values() if entry.is_expired())
-            return {
-                "total_entries": len(self._cache),
-                "expired_entries": expired_count,
-                "active_entries": len(self._cache) - expired_count,
-                "max_entries": self.max_entries
-            }
+        super().put(cache_key, response, ttl_seconds=ttl_seconds)
+
 
 
 class FDICFinancialAPI:
@@ -188,7 +103,8 @@ class FDICFinancialAPI:
         self, 
         api_key: Optional[str] = None, 
         timeout: float = 30.0,
-        cache_ttl: int = FDIC_FINANCIAL_CACHE_CONFIG["financial_data_ttl"]
+        cache_ttl: int = FDIC_FINANCIAL_CACHE_CONFIG["financial_data_ttl"],
+        http_session: Optional[BankingHTTPSession] = None
     ):
         """
         Initialize FDIC Financial API client.
@@ -197,11 +113,15 @@ class FDICFinancialAPI:
             api_key: FDIC API key (optional - API works without key but with limits)
             timeout: HTTP request timeout in seconds
             cache_ttl: Default cache TTL in seconds
+            http_session: Shared pooled HTTP session (a private one is created if None)
         """
         self.api_key = api_key
         self.base_url = FDIC_FINANCIAL_API_BASE_URL
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.cache = FDICFinancialAPICache(default_ttl_seconds=cache_ttl)
+        self._owns_http_session = http_session is None
+        self.http_session = http_session or BankingHTTPSession(timeout=timeout)
+        self.peer_groups = FDICPeerGroupEngine(self)
         
         self.logger = logger.bind(component="fdic_financial_api")
         
@@ -220,7 +140,8 @@ class FDICFinancialAPI:
         fields: Optional[List[str]] = None,
         quarters: int = 1,
         report_date: Optional[str] = None,
-        analysis_type: Optional[str] = None
+        analysis_type: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> FDICFinancialAPIResponse:
         """
         Get financial data from FDIC BankFind Suite Financial API.
@@ -232,6 +153,7 @@ class FDICFinancialAPI:
             quarters: Number of recent quarters (default 1)
             report_date: Specific report date filter (YYYY-MM-DD)
             analysis_type: Predefined field selection (basic_info, financial_summary, key_ratios)
+            limit: Maximum result rows, derived from quarters if None
             
         Returns:
             FDICFinancialAPIResponse with financial data
@@ -256,7 +178,8 @@ class FDICFinancialAPI:
                 fields=fields,
                 quarters=quarters,
                 report_date=report_date,
-                analysis_type=analysis_type
+                analysis_type=analysis_type,
+                limit=limit
             )
             
             # Check cache first
@@ -326,7 +249,8 @@ class FDICFinancialAPI:
         fields: Optional[List[str]] = None,
         quarters: int = 1,
         report_date: Optional[str] = None,
-        analysis_type: Optional[str] = None
+        analysis_type: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> Dict[str, str]:
         """
         Build query parameters for FDIC Financial API request.
@@ -338,6 +262,7 @@ class FDICFinancialAPI:
             quarters: Number of recent quarters
             report_date: Specific report date filter
             analysis_type: Predefined field selection
+            limit: Maximum result rows, derived from quarters if None
             
         Returns:
             Dictionary of query parameters
@@ -365,7 +290,7 @@ class FDICFinancialAPI:
             cert_id=cert_id if not all_filters else None,  # Don't double-add cert filter
             filters=" AND ".join(all_filters) if all_filters else None,
             fields=fields,
-            limit=min(quarters * 10, FDIC_FINANCIAL_API_CONFIG["max_results_per_query"])  # Buffer for multiple banks
+            limit=min(limit or quarters * 10, FDIC_FINANCIAL_API_CONFIG["max_results_per_query"])  # Buffer for multiple banks
         )
         
         # Add API key if available
@@ -394,46 +319,46 @@ class FDICFinancialAPI:
             aiohttp.ClientError: For HTTP-related errors
         """
         url = f"{self.base_url}{endpoint}"
+        session = await self.http_session.get_session()
         
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
-            async with session.get(url, params=params) as response:
-                
-                # Handle FDIC-specific error status codes
-                if response.status in FDIC_FINANCIAL_ERROR_CODES:
-                    error_msg = get_financial_error_message(response.status)
-                    if response.status == 400:
-                        error_text = await response.text()
-                        raise ValueError(f"Invalid FDIC Financial API request parameters: {error_text}")
-                    elif response.status == 401:
-                        raise ValueError("FDIC Financial API authentication failed - check API key")
-                    elif response.status == 429:
-                        raise ValueError("FDIC Financial API rate limit exceeded - try again later")
-                    else:
-                        raise ValueError(f"FDIC Financial API error - {error_msg}")
-                
-                # Raise for other HTTP errors
-                response.raise_for_status()
-                
-                # Parse JSON response
-                try:
-                    data = await response.json()
-                except aiohttp.ContentTypeError as e:
-                    response_text = await response.text()
-                    raise ValueError(f"FDIC Financial API returned invalid JSON: {response_text[:200]}") from e
-                
-                # CRITICAL: Check for API-level errors in response body
-                # FDIC API can return 200 with error in body
-                if isinstance(data, dict) and "error" in data:
-                    raise ValueError(f"FDIC Financial API error: {data['error']}")
-                
-                self.logger.debug(
-                    "FDIC Financial API request successful",
-                    status=response.status,
-                    url=url,
-                    params_count=len(params)
-                )
-                
-                return data
+        async with session.get(url, params=params, timeout=self.timeout) as response:
+            
+            # Handle FDIC-specific error status codes
+            if response.status in FDIC_FINANCIAL_ERROR_CODES:
+                error_msg = get_financial_error_message(response.status)
+                if response.status == 400:
+                    error_text = await response.text()
+                    raise ValueError(f"Invalid FDIC Financial API request parameters: {error_text}")
+                elif response.status == 401:
+                    raise ValueError("FDIC Financial API authentication failed - check API key")
+                elif response.status == 429:
+                    raise ValueError("FDIC Financial API rate limit exceeded - try again later")
+                else:
+                    raise ValueError(f"FDIC Financial API error - {error_msg}")
+            
+            # Raise for other HTTP errors
+            response.raise_for_status()
+            
+            # Parse JSON response
+            try:
+                data = await response.json()
+            except aiohttp.ContentTypeError as e:
+                response_text = await response.text()
+                raise ValueError(f"FDIC Financial API returned invalid JSON: {response_text[:200]}") from e
+            
+            # CRITICAL: Check for API-level errors in response body
+            # FDIC API can return 200 with error in body
+            if isinstance(data, dict) and "error" in data:
+                raise ValueError(f"FDIC Financial API error: {data['error']}")
+            
+            self.logger.debug(
+                "FDIC Financial API request successful",
+                status=response.status,
+                url=url,
+                params_count=len(params)
+            )
+            
+            return data
     
     async def _process_response(self, raw_data: Dict[str, Any], query_params: Dict[str, str]) -> FDICFinancialAPIResponse:
         """
@@ -619,6 +544,154 @@ class FDICFinancialAPI:
             quarters=quarters
         )
     
+    async def get_financial_data_for_banks(
+        self,
+        cert_ids: List[str],
+        analysis_type: str = "batch_comparison",
+        report_date: Optional[str] = None,
+        max_concurrency: int = FDIC_BATCH_CONFIG["max_concurrency"]
+    ) -> Dict[str, Optional[FDICFinancialData]]:
+        """
+        Get the latest financial record for many banks with as few requests as possible.
+        
+        Certificates are combined into ``CERT:(a OR b OR ...)`` filter queries of
+        up to ``certs_per_query`` banks. Banks missing from a combined result (for
+        example one whose latest filing is older than its peers') are fetched one
+        by one. All requests share a ``max_concurrency`` limit.
+        
+        Args:
+            cert_ids: FDIC certificate numbers
+            analysis_type: Predefined field selection
+            report_date: Specific report date filter (YYYY-MM-DD)
+            max_concurrency: Maximum parallel FDIC requests
+            
+        Returns:
+            Latest record per distinct numeric certificate in input order, None where no data was found
+        """
+        # Drop duplicates and leading zeros so certificates match the API's records
+        certs = list(dict.fromkeys(str(int(cert)) for cert in cert_ids if cert.strip().isdigit()))
+        if len(certs) < len(cert_ids):
+            self.logger.debug("Ignoring duplicate or non-numeric certificates", requested=len(cert_ids), unique=len(certs))
+        chunk_size = FDIC_BATCH_CONFIG["certs_per_query"]
+        chunks = [certs[i:i + chunk_size] for i in range(0, len(certs), chunk_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def query_chunk(chunk: List[str]) -> FDICFinancialAPIResponse:
+            async with semaphore:
+                return await self.get_financial_data(
+                    filters=f"CERT:({' OR '.join(chunk)})",
+                    analysis_type=analysis_type,
+                    report_date=report_date,
+                    limit=len(chunk) * FDIC_BATCH_CONFIG["records_per_bank"]
+                )
+        
+        async def query_bank(cert: str) -> FDICFinancialAPIResponse:
+            async with semaphore:
+                return await self.get_financial_data(
+                    cert_id=cert,
+                    analysis_type=analysis_type,
+                    report_date=report_date,
+                    quarters=1
+                )
+        
+        latest: Dict[str, FDICFinancialData] = {}
+        for response in await asyncio.gather(*(query_chunk(chunk) for chunk in chunks)):
+            for record in response.financial_records:
+                current = latest.get(record.cert)
+                if current is None or record.repdte > current.repdte:
+                    latest[record.cert] = record
+        
+        missing = [cert for cert in certs if cert not in latest]
+        if missing:
+            self.logger.info(
+                "Fetching banks missing from combined query individually",
+                missing_count=len(missing)
+            )
+            for cert, response in zip(missing, await asyncio.gather(*(query_bank(cert) for cert in missing))):
+                record = response.get_latest_record()
+                if record is not None:
+                    latest[cert] = record
+        
+        self.logger.info(
+            "Batch financial data retrieved",
+            banks_requested=len(certs),
+            banks_found=len(latest),
+            combined_queries=len(chunks),
+            individual_queries=len(missing)
+        )
+        
+        return {cert: latest.get(cert) for cert in certs}
+    
+    async def get_financial_rows(
+        self,
+        filters: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        sort_by: str = "CERT",
+        max_rows: int = FDIC_PEER_ANALYSIS_CONFIG["max_rows"],
+        max_concurrency: int = FDIC_PEER_ANALYSIS_CONFIG["page_concurrency"]
+    ) -> List[Dict[str, Any]]:
+        """
+        Page through every financial record matching a filter.
+        
+        Intended for bulk loads that are converted to arrays by the caller, so
+        rows are returned as raw field dictionaries without response caching or
+        model validation. The first page reports the total row count and the
+        remaining pages are requested concurrently.
+        
+        Args:
+            filters: Elasticsearch query filters
+            fields: Fields to retrieve
+            sort_by: Field giving the pages a stable order
+            max_rows: Maximum rows to load
+            max_concurrency: Maximum parallel page requests
+            
+        Returns:
+            Raw records keyed by FDIC field name
+            
+        Raises:
+            ValueError: If a page request fails
+        """
+        page_size = FDIC_FINANCIAL_API_CONFIG["max_results_per_query"]
+        base_params = build_financial_query_params(
+            filters=filters,
+            fields=fields,
+            sort_by=sort_by,
+            sort_order="ASC",
+            limit=page_size
+        )
+        if self.api_key:
+            base_params["api_key"] = self.api_key
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_page(offset: int) -> tuple:
+            async with semaphore:
+                raw_data = await self._make_request(FDIC_FINANCIAL_ENDPOINT, {**base_params, "offset": str(offset)})
+            records = raw_data.get("data", []) if isinstance(raw_data, dict) else raw_data
+            return raw_data, [record.get("data", record) for record in records]
+        
+        first_page, rows = await fetch_page(0)
+        metadata = (first_page.get("meta") or first_page.get("metadata") or {}) if isinstance(first_page, dict) else {}
+        total = metadata.get("total")
+        
+        if total is not None:
+            offsets = range(page_size, min(int(total), max_rows), page_size)
+            for _, page_rows in await asyncio.gather(*(fetch_page(offset) for offset in offsets)):
+                rows.extend(page_rows)
+        else:
+            # Without a reported total, page until a short page comes back
+            page_rows = rows
+            while len(page_rows) == page_size and len(rows) < max_rows:
+                _, page_rows = await fetch_page(len(rows))
+                rows.extend(page_rows)
+        
+        self.logger.info(
+            "FDIC financial rows loaded",
+            filters=filters,
+            rows=len(rows),
+            total=total
+        )
+        return rows[:max_rows]
+    
     async def health_check(self) -> bool:
         """
         Check if FDIC Financial API is available and responding.
@@ -654,14 +727,20 @@ class FDICFinancialAPI:
         return bool(self.base_url and self.timeout)
     
     def clear_cache(self) -> None:
-        """Clear the response cache."""
+        """Clear the response cache and cached peer matrices."""
         self.cache.clear()
+        self.peer_groups.clear()
         self.logger.info("FDIC Financial API cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring."""
         return self.cache.stats()
     
+    async def close(self) -> None:
+        """Close the HTTP session if this client owns it."""
+        if self._owns_http_session:
+            await self.http_session.close()
+    
     async def get_peer_comparison_data(
         self,
         asset_range: tuple,
@@ -671,6 +750,9 @@ class FDICFinancialAPI:
         """
         Get financial data for peer comparison based on asset size.
         
+        Returns at most ``peer_count`` validated records. For rankings against
+        the full peer universe use ``peer_groups`` (FDICPeerGroupEngine).
+        
         Args:
             asset_range: Tuple of (min_assets, max_assets) in thousands
             report_date: Specific report date or None for latest
@@ -686,5 +768,6 @@ class FDICFinancialAPI:
             filters=filters,
             analysis_type="key_ratios",
             quarters=1,
-            report_date=report_date
+            report_date=report_date,
+            limit=peer_count
         )
\ No newline at end of file
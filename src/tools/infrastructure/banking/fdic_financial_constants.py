@@ -29,7 +29,33 @@ FDIC_FINANCIAL_CACHE_CONFIG = {
     "financial_data_ttl": 1800,  # 30 minutes for financial data
     "field_metadata_ttl": 3600,  # 1 hour for field definitions
     "error_response_ttl": 300,   # 5 minutes for error responses
-    "max_cache_size": 1000
+    "max_cache_size": 1000,
+    "max_cache_bytes": 64 * 1024 * 1024  # 64 MB of cached responses
+}
+
+# Batch (multi-bank) query configuration
+FDIC_BATCH_CONFIG = {
+    "max_banks": 50,              # Banks accepted per batch analysis call
+    "certs_per_query": 25,        # Certificates combined into one CERT:(a OR b ...) filter
+    "records_per_bank": 2,        # Result rows requested per certificate in a combined query
+    "max_concurrency": 5          # Parallel FDIC requests for chunks, fallbacks and name lookups
+}
+
+# Peer group analysis configuration
+FDIC_PEER_ANALYSIS_CONFIG = {
+    "page_concurrency": 4,           # Parallel page requests when loading a report date's peer universe
+    "max_rows": 50000,               # Upper bound on rows loaded for one report date
+    "matrix_ttl": 6 * 3600,          # Quarterly data - peer matrices stay valid for hours
+    "max_matrices": 8,               # Report dates kept in memory
+    "latest_report_date_ttl": 3600,  # How long the resolved latest report date is reused
+    # Asset-size peer groups in thousands of dollars (lower bound inclusive, None = unbounded)
+    "asset_size_groups": [
+        (0, 100_000),
+        (100_000, 1_000_000),
+        (1_000_000, 10_000_000),
+        (10_000_000, 250_000_000),
+        (250_000_000, None)
+    ]
 }
 
 # Common Financial Fields - over 1,100 fields available, these are most important
@@ -202,6 +228,14 @@ FIELD_SELECTION_TEMPLATES = {
     ],
     "call_report_information": [
         "CERT", "REPDTE", "FORM31", "DOCKET"
+    ],
+    "batch_comparison": [
+        "CERT", "REPDTE", "NAME", "RSSD", "ASSET", "DEP", "LNLS", "EQ", "NETINC", 
+        "NETINTINC", "NONII", "NONIX", "ROA", "ROE", "TIER1R", "NPTLA"
+    ],
+    "peer_analysis": [
+        "CERT", "REPDTE", "ASSET", "DEP", "LNLS", "EQ", "NETINC", "INTINC",
+        "EINTEXP", "NETINTINC", "NONII", "NONIX"
     ]
 }
 
@@ -5,7 +5,7 @@ Provides type-safe models for FDIC financial data processing,
 validation, and serialization following FDIC Financial API standards.
 """
 
-from datetime import date, datetime, timedelta
+from datetime import date
 from decimal import Decimal
 from typing import Dict, List, Optional, Union, Any
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -527,52 +527,6 @@ class FDICFinancialAPIResponse(BaseModel):
         }
 
 
-class FDICFinancialCacheEntry(BaseModel):
-    """
-    Model for FDIC Financial API response cache entries.
-    
-    Stores cached financial API responses with metadata for cache management.
-    """
-    
-    response: FDICFinancialAPIResponse = Field(
-        ...,
-        description="Cached FDIC Financial API response"
-    )
-    query_hash: str = Field(
-        ...,
-        description="Hash of the original query parameters"
-    )
-    cached_at: datetime = Field(
-        ...,
-        description="When the response was cached"
-    )
-    expires_at: datetime = Field(
-        ...,
-        description="When the cache entry expires"
-    )
-    query_params: Optional[Dict[str, Any]] = Field(
-        None,
-        description="Original query parameters for debugging"
-    )
-    
-    model_config = ConfigDict(
-        validate_assignment=True,
-        extra="forbid"
-    )
-    
-    def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        return datetime.now() > self.expires_at
-    
-    def time_to_expiry(self) -> float:
-        """Get time until expiry in seconds."""
-        return (self.expires_at - datetime.now()).total_seconds()
-    
-    def refresh_expiry(self, ttl_seconds: int) -> None:
-        """Refresh the expiry time for the cache entry."""
-        self.expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
-
-
 class BankFinancialAnalysisInput(BaseModel):
     """
     Enhanced input schema for bank financial analysis with FDIC Financial API.
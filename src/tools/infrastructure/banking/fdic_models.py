@@ -5,12 +5,14 @@ Provides type-safe models for FDIC institution data processing,
 validation, and serialization following FDIC API standards.
 """
 
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 from typing import Dict, List, Optional, Union
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import structlog
 
+from .fdic_financial_constants import FDIC_BATCH_CONFIG
+
 logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
 
 
@@ -375,44 +377,6 @@ class FDICAPIResponse(BaseModel):
         return self.success and bool(self.institutions)
 
 
-class FDICCacheEntry(BaseModel):
-    """
-    Model for FDIC API response cache entries.
-    
-    Stores cached FDIC API responses with metadata for cache management.
-    """
-    
-    response: FDICAPIResponse = Field(
-        ...,
-        description="Cached FDIC API response"
-    )
-    query_hash: str = Field(
-        ...,
-        description="Hash of the original query parameters"
-    )
-    cached_at: datetime = Field(
-        ...,
-        description="When the response was cached"
-    )
-    expires_at: datetime = Field(
-        ...,
-        description="When the cache entry expires"
-    )
-    
-    model_config = ConfigDict(
-        validate_assignment=True,
-        extra="forbid"
-    )
-    
-    def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        return datetime.now() > self.expires_at
-    
-    def time_to_expiry(self) -> float:
-        """Get time until expiry in seconds."""
-        return (self.expires_at - datetime.now()).total_seconds()
-
-
 class BankLookupInput(BaseModel):
     """
     Enhanced input schema for bank lookup tool with FDIC API support.
@@ -528,7 +492,7 @@ class BankAnalysisInput(BaseModel):
     )
     query_type: str = Field(
         "basic_info",
-        description="Type of analysis: 'basic_info', 'financial_summary', or 'key_ratios'"
+        description="Type of analysis: 'basic_info', 'financial_summary', 'key_ratios', or 'peer_ranking'"
     )
     
     # New FDIC search fields
@@ -541,6 +505,18 @@ class BankAnalysisInput(BaseModel):
         description="State abbreviation to help identify the bank (e.g., 'CA', 'TX')"
     )
     
+    # Batch mode: compare many banks in one call
+    cert_ids: Optional[List[str]] = Field(
+        None,
+        description="Batch mode: FDIC certificate numbers of banks to compare in one table",
+        max_length=FDIC_BATCH_CONFIG["max_banks"]
+    )
+    bank_names: Optional[List[str]] = Field(
+        None,
+        description="Batch mode: bank names to look up and compare in one table (state applies to all)",
+        max_length=FDIC_BATCH_CONFIG["max_banks"]
+    )
+    
     model_config = ConfigDict(
         str_strip_whitespace=True,
         validate_assignment=True,
@@ -559,6 +535,23 @@ class BankAnalysisInput(BaseModel):
             
         return v.upper()
     
+    @field_validator('cert_ids')
+    @classmethod
+    def validate_cert_ids(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate FDIC certificate numbers in batch mode."""
+        if v is None:
+            return None
+        
+        invalid = [cert for cert in v if not cert.isdigit()]
+        if invalid:
+            raise ValueError(f"FDIC Certificate numbers must contain only digits: {', '.join(invalid)}")
+        
+        return v
+    
     def has_bank_identifier(self) -> bool:
         """Check if bank can be identified with provided parameters."""
-        return bool(self.bank_name or self.rssd_id)
\ No newline at end of file
+        return bool(self.bank_name or self.rssd_id or self.is_batch())
+    
+    def is_batch(self) -> bool:
+        """Check if the request compares several banks."""
+        return bool(self.cert_ids or self.bank_names)
\ No newline at end of file
@@ -0,0 +1,400 @@
+"""
+Peer group analysis over FDIC financial data held in NumPy arrays.
+
+Ranking a bank against its peers used to mean fetching a handful of peer
+records and validating each one into a Pydantic model. The peer engine loads
+the whole peer universe of a report date once, computes the derived ratios of
+every bank as array operations and caches the resulting matrix, so
+percentiles, z-scores and medians for any bank are answered from memory.
+"""
+
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+import numpy as np
+import structlog
+
+from src.utils.lru_cache import ResponseCache
+from .fdic_financial_constants import (
+    FDIC_PEER_ANALYSIS_CONFIG,
+    get_fields_for_analysis_type
+)
+
+if TYPE_CHECKING:
+    from .fdic_financial_api import FDICFinancialAPI
+
+logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
+
+# Ratios computed for every bank, named as in FDICFinancialData.calculate_derived_ratios()
+PEER_RATIOS: Tuple[str, ...] = (
+    "calculated_roa",
+    "calculated_roe",
+    "calculated_nim",
+    "calculated_efficiency",
+    "equity_to_assets",
+    "loans_to_deposits"
+)
+
+PEER_RATIO_LABELS = {
+    "calculated_roa": "Return on Assets (ROA)",
+    "calculated_roe": "Return on Equity (ROE)",
+    "calculated_nim": "Net Interest Margin",
+    "calculated_efficiency": "Efficiency Ratio",
+    "equity_to_assets": "Equity to Assets",
+    "loans_to_deposits": "Loans to Deposits"
+}
+
+AssetRange = Tuple[float, Optional[float]]
+
+
+def _to_float(value: Any) -> float:
+    """Convert a raw FDIC amount to float, NaN when missing or not numeric."""
+    if value is None or value == "":
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def derive_ratio_columns(amounts: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Compute the derived ratios for many banks at once.
+
+    Mirrors FDICFinancialData.calculate_derived_ratios(): a ratio is NaN where
+    an input is missing or its denominator is not positive.
+
+    Args:
+        amounts: Float arrays keyed by FDIC field name (ASSET, NETINC, ...)
+
+    Returns:
+        Matrix of shape (banks, len(PEER_RATIOS)) in percent
+    """
+    asset, eq, dep = amounts["ASSET"], amounts["EQ"], amounts["DEP"]
+    netinc, netintinc, nonii, nonix = amounts["NETINC"], amounts["NETINTINC"], amounts["NONII"], amounts["NONIX"]
+
+    # Net interest income falls back to its components when not reported
+    net_interest = np.where(np.isnan(netintinc), amounts["INTINC"] - amounts["EINTEXP"], netintinc)
+    # Efficiency is only defined when net interest income itself is reported
+    revenue = netintinc + nonii
+
+    def ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        valid = denominator > 0
+        return np.divide(numerator * 100, denominator, out=np.full(len(numerator), np.nan), where=valid)
+
+    return np.column_stack([
+        ratio(netinc, asset),
+        ratio(netinc, eq),
+        ratio(net_interest, asset),
+        ratio(nonix, revenue),
+        ratio(eq, asset),
+        ratio(amounts["LNLS"], dep)
+    ])
+
+
+class _PeerStatistics:
+    """Sorted ratio columns and moments for one peer group."""
+
+    __slots__ = ("sorted_columns", "counts", "medians", "means", "stds")
+
+    def __init__(self, ratios: np.ndarray):
+        self.sorted_columns: List[np.ndarray] = [np.sort(column[~np.isnan(column)]) for column in ratios.T]
+        self.counts = np.array([len(column) for column in self.sorted_columns])
+        self.medians = np.array([np.median(c) if len(c) else np.nan for c in self.sorted_columns])
+        self.means = np.array([c.mean() if len(c) else np.nan for c in self.sorted_columns])
+        self.stds = np.array([c.std() if len(c) else np.nan for c in self.sorted_columns])
+
+    def percentiles(self, values: np.ndarray) -> np.ndarray:
+        """Share of peers (in percent) at or below each value, NaN for missing values."""
+        result = np.full(values.shape, np.nan)
+        for j, column in enumerate(self.sorted_columns):
+            present = ~np.isnan(values[:, j])
+            if len(column):
+                result[present, j] = np.searchsorted(column, values[present, j], side="right") / len(column) * 100
+        return result
+
+    def z_scores(self, values: np.ndarray) -> np.ndarray:
+        """Standard scores of each value against its ratio's peer distribution."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = (values - self.means) / self.stds
+        return np.where(self.stds > 0, scores, np.nan)
+
+
+class PeerMatrix:
+    """
+    Derived ratios of every bank filing for one report date.
+
+    Rows are banks, columns are PEER_RATIOS. Statistics per peer group (an
+    asset range) are computed on first use and kept with the matrix.
+    """
+
+    def __init__(self, report_date: str, certs: np.ndarray, assets: np.ndarray, ratios: np.ndarray):
+        """
+        Initialize a peer matrix.
+
+        Args:
+            report_date: Report date the rows belong to (FDIC REPDTE format)
+            certs: FDIC certificate numbers as strings
+            assets: Total assets in thousands
+            ratios: Matrix of shape (banks, len(PEER_RATIOS))
+        """
+        self.report_date = report_date
+        self.certs = certs
+        self.assets = assets
+        self.ratios = ratios
+        self.built_at = time.time()
+        self._rows = {cert: row for row, cert in enumerate(certs.tolist())}
+        self._statistics: Dict[AssetRange, _PeerStatistics] = {}
+
+    @classmethod
+    def from_rows(cls, report_date: str, rows: Sequence[Dict[str, Any]]) -> "PeerMatrix":
+        """
+        Build a matrix from raw FDIC financial records.
+
+        Args:
+            report_date: Report date the rows belong to
+            rows: Raw records keyed by FDIC field name
+
+        Returns:
+            Peer matrix with one row per distinct certificate
+        """
+        rows = list({str(row["CERT"]): row for row in rows if row.get("CERT") is not None}.values())
+        amounts = {
+            field: np.fromiter((_to_float(row.get(field)) for row in rows), dtype=float, count=len(rows))
+            for field in get_fields_for_analysis_type("peer_analysis")
+            if field not in ("CERT", "REPDTE")
+        }
+        certs = np.array([str(row["CERT"]) for row in rows], dtype=str)
+        return cls(report_date, certs, amounts["ASSET"], derive_ratio_columns(amounts))
+
+    def __len__(self) -> int:
+        return len(self.certs)
+
+    def __contains__(self, cert_id: object) -> bool:
+        return str(cert_id) in self._rows
+
+    @staticmethod
+    def asset_size_group(total_assets: float) -> AssetRange:
+        """Get the configured asset-size peer group containing an asset total."""
+        for lower, upper in FDIC_PEER_ANALYSIS_CONFIG["asset_size_groups"]:
+            if total_assets >= lower and (upper is None or total_assets < upper):
+                return (lower, upper)
+        return FDIC_PEER_ANALYSIS_CONFIG["asset_size_groups"][0]
+
+    def peer_mask(self, asset_range: Optional[AssetRange] = None) -> np.ndarray:
+        """Boolean row mask of the banks in an asset range (all banks if None)."""
+        if asset_range is None:
+            return np.ones(len(self), dtype=bool)
+        lower, upper = asset_range
+        mask = self.assets >= lower
+        if upper is not None:
+            mask &= self.assets < upper
+        return mask
+
+    def _peer_statistics(self, asset_range: Optional[AssetRange]) -> _PeerStatistics:
+        """Get (and memoize) the statistics of a peer group."""
+        statistics = self._statistics.get(asset_range)
+        if statistics is None:
+            statistics = self._statistics[asset_range] = _PeerStatistics(self.ratios[self.peer_mask(asset_range)])
+        return statistics
+
+    def rank(self, cert_id: str, asset_range: Optional[AssetRange] = None) -> Optional[Dict[str, Any]]:
+        """
+        Rank one bank against its peers on every ratio.
+
+        Args:
+            cert_id: FDIC certificate number
+            asset_range: Peer group (min, max) assets in thousands; defaults to
+                the bank's asset-size group
+
+        Returns:
+            Peer group description and per-ratio value, percentile, z-score and
+            peer median, or None if the bank has no row for this report date
+        """
+        row = self._rows.get(str(int(cert_id))) if str(cert_id).strip().isdigit() else None
+        if row is None:
+            return None
+        if asset_range is None and not np.isnan(self.assets[row]):
+            asset_range = self.asset_size_group(self.assets[row])
+
+        statistics = self._peer_statistics(asset_range)
+        values = self.ratios[row:row + 1]
+        percentiles = statistics.percentiles(values)[0]
+        z_scores = statistics.z_scores(values)[0]
+
+        def optional(value: float) -> Optional[float]:
+            return None if np.isnan(value) else float(value)
+
+        return {
+            "cert": self.certs[row],
+            "report_date": self.report_date,
+            "asset_range": asset_range,
+            "peer_count": int(self.peer_mask(asset_range).sum()),
+            "ratios": {
+                name: {
+                    "value": optional(values[0, j]),
+                    "percentile": optional(percentiles[j]),
+                    "z_score": optional(z_scores[j]),
+                    "peer_median": optional(statistics.medians[j]),
+                    "peer_count": int(statistics.counts[j])
+                }
+                for j, name in enumerate(PEER_RATIOS)
+            }
+        }
+
+    def percentile_matrix(self, asset_range: Optional[AssetRange] = None) -> np.ndarray:
+        """
+        Percentile of every bank in a peer group on every ratio.
+
+        Args:
+            asset_range: Peer group (min, max) assets in thousands, None for all banks
+
+        Returns:
+            Matrix of shape (peer banks, len(PEER_RATIOS)) in peer_mask order
+        """
+        return self._peer_statistics(asset_range).percentiles(self.ratios[self.peer_mask(asset_range)])
+
+    def summary(self, asset_range: Optional[AssetRange] = None) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Distribution of every ratio within a peer group.
+
+        Args:
+            asset_range: Peer group (min, max) assets in thousands, None for all banks
+
+        Returns:
+            Per-ratio count, mean, standard deviation and quartiles
+        """
+        statistics = self._peer_statistics(asset_range)
+        summary = {}
+        for j, name in enumerate(PEER_RATIOS):
+            column = statistics.sorted_columns[j]
+            quartiles = np.percentile(column, [25, 50, 75]) if len(column) else [None] * 3
+            summary[name] = {
+                "count": int(statistics.counts[j]),
+                "mean": float(statistics.means[j]) if len(column) else None,
+                "std": float(statistics.stds[j]) if len(column) else None,
+                "p25": float(quartiles[0]) if len(column) else None,
+                "median": float(quartiles[1]) if len(column) else None,
+                "p75": float(quartiles[2]) if len(column) else None
+            }
+        return summary
+
+    def estimated_size(self) -> int:
+        """Approximate memory held by the matrix in bytes."""
+        return int(self.ratios.nbytes + self.assets.nbytes + self.certs.nbytes + 64 * len(self._rows))
+
+
+class FDICPeerGroupEngine:
+    """
+    Loads and caches peer matrices per report date.
+
+    The latest report date is resolved with a one-row query and remembered
+    briefly; matrices are kept for hours since the data changes quarterly.
+    """
+
+    def __init__(
+        self,
+        financial_api: "FDICFinancialAPI",
+        matrix_ttl_seconds: int = FDIC_PEER_ANALYSIS_CONFIG["matrix_ttl"],
+        max_matrices: int = FDIC_PEER_ANALYSIS_CONFIG["max_matrices"]
+    ):
+        """
+        Initialize the peer group engine.
+
+        Args:
+            financial_api: FDIC Financial API client used to load peer records
+            matrix_ttl_seconds: How long a loaded peer matrix is reused
+            max_matrices: Maximum report dates kept in memory
+        """
+        self.financial_api = financial_api
+        self.matrices: ResponseCache[PeerMatrix] = ResponseCache(
+            default_ttl_seconds=matrix_ttl_seconds,
+            max_entries=max_matrices,
+            size_estimator=PeerMatrix.estimated_size,
+            component="fdic_peer_matrices"
+        )
+        self.latest_report_dates: ResponseCache[str] = ResponseCache(
+            default_ttl_seconds=FDIC_PEER_ANALYSIS_CONFIG["latest_report_date_ttl"],
+            max_entries=1,
+            component="fdic_peer_latest_date"
+        )
+        self.logger = logger.bind(component="fdic_peer_engine")
+
+    async def latest_report_date(self) -> str:
+        """
+        Get the most recent report date with published financial data.
+
+        Raises:
+            ValueError: If the FDIC API returns no records
+        """
+        report_date = self.latest_report_dates.get("latest")
+        if report_date is None:
+            response = await self.financial_api.get_financial_data(fields=["CERT", "REPDTE"], limit=1)
+            record = response.get_latest_record() if response.success else None
+            if record is None:
+                raise ValueError(response.error_message or "No FDIC financial data available")
+            report_date = record.repdte.strftime("%Y%m%d")
+            self.latest_report_dates.put("latest", report_date)
+        return report_date
+
+    async def get_peer_matrix(self, report_date: Optional[str] = None) -> PeerMatrix:
+        """
+        Get the peer matrix of every bank filing for a report date.
+
+        Args:
+            report_date: FDIC report date (YYYYMMDD), None for the latest
+
+        Returns:
+            Cached or freshly loaded peer matrix
+        """
+        report_date = (report_date or await self.latest_report_date()).replace("-", "")
+        matrix = self.matrices.get(report_date)
+        if matrix is not None:
+            return matrix
+
+        started = time.perf_counter()
+        rows = await self.financial_api.get_financial_rows(
+            filters=f"REPDTE:{report_date}",
+            fields=get_fields_for_analysis_type("peer_analysis")
+        )
+        matrix = PeerMatrix.from_rows(report_date, rows)
+        self.matrices.put(report_date, matrix)
+
+        self.logger.info(
+            "Peer matrix loaded",
+            report_date=report_date,
+            banks=len(matrix),
+            load_seconds=round(time.perf_counter() - started, 3)
+        )
+        return matrix
+
+    async def rank_bank(
+        self,
+        cert_id: str,
+        report_date: Optional[str] = None,
+        asset_range: Optional[AssetRange] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Rank a bank among its peers for a report date.
+
+        Args:
+            cert_id: FDIC certificate number
+            report_date: FDIC report date (YYYYMMDD), None for the latest
+            asset_range: Peer group (min, max) assets in thousands; defaults to
+                the bank's asset-size group
+
+        Returns:
+            Ranking as described by PeerMatrix.rank(), or None if the bank did
+            not report for the date
+        """
+        matrix = await self.get_peer_matrix(report_date)
+        return matrix.rank(cert_id, asset_range)
+
+    def clear(self) -> None:
+        """Drop cached peer matrices and the resolved latest report date."""
+        self.matrices.clear()
+        self.latest_report_dates.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get peer matrix cache statistics for monitoring."""
+        return self.matrices.stats()
@@ -8,9 +8,8 @@ with proper authentication, session-based caching, and comprehensive error handl
 import asyncio
 import base64
 import hashlib
-import threading
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union
 import structlog
 
@@ -20,143 +19,68 @@ from zeep.transports import AsyncTransport
 from zeep.exceptions import Fault as SOAPFault, TransportError
 import httpx
 
+from src.utils.lru_cache import ResponseCache
+from .ffiec_facsimile_disk_cache import FFIECFacsimileDiskCache
+from .ffiec_filer_index import FFIECFilerIndex, get_filer_index
 from .ffiec_cdr_models import (
     FFIECCallReportData,
     FFIECDiscoveryResult,
-    FFIECCDRAPIResponse,
-    FFIECCDRCacheEntry
+    FFIECCDRAPIResponse
 )
 from .ffiec_cdr_constants import (
     FFIEC_CDR_WSDL_URL,
     FFIEC_CDR_API_CONFIG,
     FFIEC_CDR_CACHE_CONFIG,
     FFIEC_CDR_ERROR_CODES,
+    FFIEC_FILER_INDEX_CONFIG,
     FFIEC_SOAP_FAULT_CODES,
     FFIEC_DATA_SERIES,
     FFIEC_FI_ID_TYPES,
     FFIEC_UBPR_CONFIG,
     build_ffiec_cache_key,
-    build_discovery_cache_key,
     get_ffiec_error_message
 )
 
 logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
 
 
-class FFIECCDRAPICache:
+class FFIECCDRAPICache(ResponseCache[FFIECCDRAPIResponse]):
     """
     Thread-safe cache for FFIEC CDR API responses.
     
-    Implements session-based caching for call report data and discovery results
-    to improve performance and reduce API load.
+    Session-based cache for call report data and discovery results built on
+    the shared ResponseCache engine, bounded by entry count and bytes since
+    facsimile payloads can be large.
     """
     
-    def __init__(self, default_ttl_seconds: int = 3600, max_entries: int = 500):
+    def __init__(
+        self,
+        default_ttl_seconds: int = 3600,
+        max_entries: int = FFIEC_CDR_CACHE_CONFIG["max_cache_size"],
+        max_bytes: Optional[int] = FFIEC_CDR_CACHE_CONFIG["max_cache_bytes"]
+    ):
         """
         Initialize FFIEC CDR API cache.
         
         Args:
             default_ttl_seconds: Default time-to-live for cache entries
             max_entries: Maximum number of cache entries to maintain
+            max_bytes: Maximum estimated size of cached responses in bytes
         """
-        self._cache: Dict[str, FFIECCDRCacheEntry] = {}
-        self._cache_lock = threading.Lock()
-        self.default_ttl = default_ttl_seconds
-        self.max_entries = max_entries
-        self.logger = logger.bind(component="ffiec_cdr_cache")
+        super().__init__(
+            default_ttl_seconds=default_ttl_seconds,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            component="ffiec_cdr_cache"
+        )
         
         self.logger.info(
             "FFIEC CDR API cache initialized",
             default_ttl_seconds=default_ttl_seconds,
-            max_entries=max_entries
+            max_entries=max_entries,
+            max_bytes=max_bytes
         )
-    
-    def get(self, cache_key: str) -> Optional[FFIECCDRAPIResponse]:
-        """
-        Get cached response if available and not expired.
-        
-        Args:
-            cache_key: Cache key to lookup
-            
-        Returns:
-            Cached FFIECCDRAPIResponse if available and fresh, None otherwise
-        """
-        with self._cache_lock:
-            entry = self._cache.get(cache_key)
-            if not entry:
-                return None
-                
-            if entry.is_expired():
-                self.logger.debug("Cache entry expired", cache_key=cache_key)
-                del self._cache[cache_key]
-                return None
-                
-            # Mark as accessed and return
-            entry.mark_accessed()
-            self.logger.debug(
-                "Cache hit",
-                cache_key=cache_key,
-                ttl_remaining=entry.time_to_expiry(),
-                access_count=entry.access_count
-            )
-            return entry.response
-    
-    def put(self, cache_key: str, response: FFIECCDRAPIResponse, ttl_seconds: Optional[int] = None) -> None:
-        """
-        Cache a response with specified TTL.
-        
-        Args:
-            cache_key: Cache key to store under
-            response: FFIEC CDR API response to cache
-            ttl_seconds: Time-to-live override, uses default if None
-        """
-        with self._cache_lock:
-            # Clean up expired entries if cache is getting full
-            if len(self._cache) >= self.max_entries:
-                self._cleanup_expired_entries()
-            
-            # Remove oldest entry if still at limit
-            if len(self._cache) >= self.max_entries:
-                oldest_key = min(self._cache.keys(), 
-                               key=lambda k: self._cache[k].cache_timestamp)
-                del self._cache[oldest_key]
-                self.logger.debug("Removed oldest cache entry", cache_key=oldest_key)
-            
-            # Store new entry
-            ttl = ttl_seconds or self.default_ttl
-            entry = FFIECCDRCacheEntry(response=response, ttl_seconds=ttl)
-            self._cache[cache_key] = entry
-            
-            self.logger.debug(
-                "Cached response",
-                cache_key=cache_key,
-                ttl_seconds=ttl,
-                cache_size=len(self._cache)
-            )
-    
-    def _cleanup_expired_entries(self):
-        """Remove all expired cache entries."""
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if entry.is_expired()
-        ]
-        
-        for key in expired_keys:
-            del self._cache[key]
-        
-        if expired_keys:
-            self.logger.debug(
-                "Cleaned up expired cache entries",
-                expired_count=len(expired_keys),
-                remaining_count=len(self._cache)
-            )
-    
-    def clear(self):
-        """Clear all cache entries."""
-        with self._cache_lock:
-            cleared_count = len(self._cache)
-            self._cache.clear()
-            self.logger.info("Cache cleared", cleared_entries=cleared_count)
+
 
 
 class FFIECCDRAPIClient:
@@ -171,7 +95,10 @@ class FFIECCDRAPIClient:
                  api_key: str, 
                  username: str,
                  timeout: int = 30,
-                 cache_ttl: int = 3600):
+                 cache_ttl: int = 3600,
+                 disk_cache_path: Optional[str] = None,
+                 disk_cache_max_mb: int = FFIEC_CDR_CACHE_CONFIG["disk_cache_max_mb"],
+                 filer_index: Optional[FFIECFilerIndex] = None):
         """
         Initialize FFIEC CDR API client.
         
@@ -180,11 +107,21 @@ class FFIECCDRAPIClient:
             username: FFIEC CDR username
             timeout: Request timeout in seconds
             cache_ttl: Cache TTL in seconds
+            disk_cache_path: Directory for the persistent facsimile cache (disabled if None)
+            disk_cache_max_mb: Size limit of the persistent facsimile cache in megabytes
+            filer_index: Filer index for discovery, the process-wide one if None
         """
         self.api_key = api_key
         self.username = username
         self.timeout = timeout
         self.cache = FFIECCDRAPICache(default_ttl_seconds=cache_ttl)
+        self.disk_cache: Optional[FFIECFacsimileDiskCache] = None
+        if disk_cache_path:
+            self.disk_cache = FFIECFacsimileDiskCache(
+                disk_cache_path,
+                max_bytes=disk_cache_max_mb * 1024 * 1024
+            )
+        self.filer_index = filer_index or get_filer_index(FFIEC_DATA_SERIES["call_reports"])
         
         self.logger = logger.bind(component="ffiec_cdr_api_client")
         
@@ -242,80 +179,28 @@ class FFIECCDRAPIClient:
         """
         Discover the latest call report filing for a bank.
         
+        Looks the bank up in the shared filer index, which holds the filer sets
+        of the most recent reporting periods and is refreshed in the background.
+        
         Args:
             rssd_id: Bank RSSD identifier
             
         Returns:
             Latest reporting period string or None if not found
         """
-        cache_key = build_discovery_cache_key(rssd_id)
-        
-        # Check cache first
-        cached_response = self.cache.get(cache_key)
-        if cached_response and cached_response.discovery_result:
-            self.logger.debug("Using cached discovery result", rssd_id=rssd_id)
-            return cached_response.discovery_result.latest_period
-        
         try:
-            self.logger.info("Discovering latest filing", rssd_id=rssd_id)
-            
-            # Get available reporting periods
-            periods = await self._soap_client.service.RetrieveReportingPeriods(
-                dataSeries=FFIEC_DATA_SERIES["call_reports"]
-            )
+            latest_period = await self.filer_index.latest_period(rssd_id, self._load_recent_filers)
             
-            if not periods:
-                self.logger.warning("No reporting periods available")
+            if latest_period is None:
+                self.logger.warning("No recent filings found", rssd_id=rssd_id)
                 return None
             
-            # Sort periods newest to oldest
-            sorted_periods = sorted(periods, reverse=True)
-            
-            # Check recent periods for this bank
-            for period in sorted_periods[:4]:  # Check last 4 periods
-                try:
-                    filers = await self._soap_client.service.RetrieveFilersSinceDate(
-                        dataSeries=FFIEC_DATA_SERIES["call_reports"],
-                        reportingPeriodEndDate=period,
-                        lastUpdateDateTime=period
-                    )
-                    
-                    if filers and int(rssd_id) in filers:
-                        # Create and cache discovery result
-                        discovery_result = FFIECDiscoveryResult(
-                            rssd_id=rssd_id,
-                            available_periods=[period],
-                            latest_period=period
-                        )
-                        
-                        response = FFIECCDRAPIResponse(
-                            success=True,
-                            discovery_result=discovery_result
-                        )
-                        
-                        self.cache.put(cache_key, response, ttl_seconds=FFIEC_CDR_CACHE_CONFIG["discovery_data_ttl"])
-                        
-                        # Convert period to standard YYYY-MM-DD format if needed
-                        standardized_period = self._standardize_date_format(period)
-                        
-                        self.logger.info(
-                            "Latest filing discovered",
-                            rssd_id=rssd_id,
-                            latest_period=period,
-                            standardized_period=standardized_period
-                        )
-                        return standardized_period
-                        
-                except Exception as period_error:
-                    self.logger.warning(
-                        "Error checking period",
-                        period=period,
-                        error=str(period_error)
-                    )
-                    continue
-            
-            self.logger.warning("No recent filings found", rssd_id=rssd_id)
-            return None
+            self.logger.info(
+                "Latest filing discovered",
+                rssd_id=rssd_id,
+                latest_period=latest_period
+            )
+            return latest_period
             
         except SOAPFault as soap_error:
             error_msg = self._handle_soap_fault(soap_error)
@@ -326,10 +211,53 @@ class FFIECCDRAPIClient:
             self.logger.error("Discovery failed", error=str(e), rssd_id=rssd_id)
             return None
     
+    async def _load_recent_filers(self) -> Dict[str, frozenset]:
+        """
+        Load the filer sets of the most recent call report periods for the filer index.
+        
+        Returns:
+            Mapping of reporting period (YYYY-MM-DD) to the RSSD IDs that filed for it
+        """
+        periods = await self._soap_client.service.RetrieveReportingPeriods(
+            dataSeries=FFIEC_DATA_SERIES["call_reports"]
+        )
+        
+        if not periods:
+            self.logger.warning("No reporting periods available")
+            return {}
+        
+        # Sort periods newest to oldest by date; the service may return M/D/YYYY strings
+        recent_periods = sorted(
+            periods, key=self._standardize_date_format, reverse=True
+        )[:FFIEC_FILER_INDEX_CONFIG["periods_indexed"]]
+        
+        filer_lists = await asyncio.gather(*(
+            self._soap_client.service.RetrieveFilersSinceDate(
+                dataSeries=FFIEC_DATA_SERIES["call_reports"],
+                reportingPeriodEndDate=period,
+                lastUpdateDateTime=period
+            )
+            for period in recent_periods
+        ), return_exceptions=True)
+        
+        filers_by_period = {}
+        for period, filers in zip(recent_periods, filer_lists):
+            if isinstance(filers, Exception):
+                self.logger.warning(
+                    "Error checking period",
+                    period=period,
+                    error=str(filers)
+                )
+                continue
+            filers_by_period[self._standardize_date_format(period)] = frozenset(int(rssd) for rssd in filers or ())
+        
+        return filers_by_period
+    
     async def retrieve_facsimile(self, 
                                 rssd_id: str, 
                                 reporting_period: str, 
-                                format_type: str = "PDF") -> Optional[bytes]:
+                                format_type: str = "PDF",
+                                raise_on_error: bool = False) -> Optional[bytes]:
         """
         Retrieve call report facsimile data.
         
@@ -337,9 +265,15 @@ class FFIECCDRAPIClient:
             rssd_id: Bank RSSD identifier
             reporting_period: Reporting period (YYYY-MM-DD)
             format_type: Format type (PDF, XBRL, SDF)
+            raise_on_error: Re-raise SOAP faults and transport errors instead of
+                returning None, so callers can tell them apart from "no filing"
             
         Returns:
             Call report data as bytes or None if not available
+            
+        Raises:
+            SOAPFault: If raise_on_error is set and the service returns a fault
+            Exception: If raise_on_error is set and the request fails
         """
         cache_key = build_ffiec_cache_key(rssd_id, reporting_period, format_type)
         
@@ -354,6 +288,19 @@ class FFIECCDRAPIClient:
             )
             return cached_response.call_report_data.data
         
+        # Then the persistent disk tier, promoting hits into the memory cache
+        if self.disk_cache is not None:
+            disk_data = await asyncio.to_thread(self.disk_cache.get, cache_key)
+            if disk_data is not None:
+                self.logger.debug(
+                    "Using call report data from disk cache",
+                    rssd_id=rssd_id,
+                    reporting_period=reporting_period,
+                    format_type=format_type
+                )
+                self._cache_facsimile(cache_key, rssd_id, reporting_period, format_type, disk_data)
+                return disk_data
+        
         try:
             self.logger.info(
                 "Retrieving call report facsimile",
@@ -419,24 +366,12 @@ class FFIECCDRAPIClient:
                 )
                 return None
             
-            # Create call report data model
-            # Standardize the date format before parsing
-            standardized_period = self._standardize_date_format(reporting_period)
-            call_report_data = FFIECCallReportData(
-                rssd_id=rssd_id,
-                reporting_period=datetime.strptime(standardized_period, "%Y-%m-%d").date(),
-                report_format=format_type.upper(),
-                data=decoded_data,
-                data_size=len(decoded_data)
-            )
-            
-            # Cache the response
-            response = FFIECCDRAPIResponse(
-                success=True,
-                call_report_data=call_report_data
+            call_report_data = self._cache_facsimile(
+                cache_key, rssd_id, reporting_period, format_type, decoded_data
             )
             
-            self.cache.put(cache_key, response, ttl_seconds=FFIEC_CDR_CACHE_CONFIG["call_report_data_ttl"])
+            if self.disk_cache is not None:
+                await asyncio.to_thread(self.disk_cache.put, cache_key, decoded_data)
             
             self.logger.info(
                 "Call report facsimile retrieved successfully",
@@ -456,6 +391,8 @@ class FFIECCDRAPIClient:
                 rssd_id=rssd_id,
                 reporting_period=reporting_period
             )
+            if raise_on_error:
+                raise
             return None
             
         except Exception as e:
@@ -465,8 +402,47 @@ class FFIECCDRAPIClient:
                 rssd_id=rssd_id,
                 reporting_period=reporting_period
             )
+            if raise_on_error:
+                raise
             return None
     
+    def _cache_facsimile(self,
+                         cache_key: str,
+                         rssd_id: str,
+                         reporting_period: str,
+                         format_type: str,
+                         data: bytes) -> FFIECCallReportData:
+        """
+        Wrap facsimile bytes in a call report model and store it in the memory cache.
+        
+        Args:
+            cache_key: Cache key for the facsimile
+            rssd_id: Bank RSSD identifier
+            reporting_period: Reporting period (YYYY-MM-DD)
+            format_type: Format type (PDF, XBRL, SDF)
+            data: Facsimile bytes
+            
+        Returns:
+            Call report data model for the facsimile
+        """
+        # Standardize the date format before parsing
+        standardized_period = self._standardize_date_format(reporting_period)
+        call_report_data = FFIECCallReportData(
+            rssd_id=rssd_id,
+            reporting_period=datetime.strptime(standardized_period, "%Y-%m-%d").date(),
+            report_format=format_type.upper(),
+            data=data,
+            data_size=len(data)
+        )
+        
+        response = FFIECCDRAPIResponse(
+            success=True,
+            call_report_data=call_report_data
+        )
+        
+        self.cache.put(cache_key, response, ttl_seconds=FFIEC_CDR_CACHE_CONFIG["call_report_data_ttl"])
+        return call_report_data
+    
     async def retrieve_ubpr_reporting_periods(self) -> Optional[List[str]]:
         """
         Retrieve available UBPR reporting periods.
@@ -903,6 +879,14 @@ class FFIECCDRAPIClient:
         """Clear all cached data."""
         self.cache.clear()
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        stats = self.cache.stats()
+        stats["filer_index"] = self.filer_index.stats()
+        if self.disk_cache is not None:
+            stats["disk_cache"] = self.disk_cache.stats()
+        return stats
+    
     async def close(self):
         """Close the SOAP client and clean up resources."""
         if self._soap_client and hasattr(self._soap_client.transport, 'client'):
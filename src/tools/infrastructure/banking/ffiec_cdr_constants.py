@@ -24,12 +24,143 @@ FFIEC_CDR_API_CONFIG = {
     "verify_ssl": True
 }
 
-# Cache Configuration - Session-based only
+# Cache Configuration - in-memory session cache plus optional on-disk facsimile tier
 FFIEC_CDR_CACHE_CONFIG = {
     "call_report_data_ttl": 3600,  # 1 hour for call report data
     "discovery_data_ttl": 1800,    # 30 minutes for discovery results
     "error_response_ttl": 300,     # 5 minutes for error responses
-    "max_cache_size": 500          # Reasonable limit for session cache
+    "max_cache_size": 500,         # Reasonable limit for session cache
+    "max_cache_bytes": 256 * 1024 * 1024,  # 256 MB; facsimiles are large
+    "disk_cache_max_mb": 512,      # Compressed facsimiles kept on disk
+    "disk_cache_compression_level": 6,
+    "parsed_report_ttl": 3600,     # 1 hour for parsed call reports
+    "max_parsed_reports": 200,
+    "max_parsed_report_bytes": 64 * 1024 * 1024,
+    "missing_filing_ttl": 1800,    # 30 minutes before re-probing a period with no filing
+    "max_missing_filings": 2000,
+    "filing_probe_concurrency": 4  # Parallel RetrieveFacsimile calls in the quarter fallback
+}
+
+# Process-wide filer index used for latest-filing discovery
+FFIEC_FILER_INDEX_CONFIG = {
+    "periods_indexed": 4,               # Most recent reporting periods whose filers are loaded
+    "refresh_interval_seconds": 1800,   # Refresh in the background after 30 minutes
+    "max_stale_seconds": 6 * 3600       # Lookups wait for a refresh beyond 6 hours
+}
+
+# Call report schedule descriptions for SDF parsing, keyed by FFIEC schedule code
+SDF_SCHEDULE_DESCRIPTIONS = {
+    'RCA': {
+        'name': 'Balance Sheet - Assets',
+        'category': 'balance_sheet',
+        'description': 'Cash, securities, loans, and other assets'
+    },
+    'RCB': {
+        'name': 'Securities',
+        'category': 'balance_sheet',
+        'description': 'Investment securities portfolio details'
+    },
+    'RCCI': {
+        'name': 'Loans and Lease Financing Receivables',
+        'category': 'balance_sheet',
+        'description': 'Loan portfolio composition and quality'
+    },
+    'RCD': {
+        'name': 'Trading Assets and Liabilities',
+        'category': 'balance_sheet',
+        'description': 'Trading account assets and liabilities'
+    },
+    'RCE': {
+        'name': 'Deposit Liabilities',
+        'category': 'balance_sheet',
+        'description': 'Customer deposits and funding sources'
+    },
+    'RCF': {
+        'name': 'Other Assets',
+        'category': 'balance_sheet',
+        'description': 'Premises, goodwill, and other assets'
+    },
+    'RCG': {
+        'name': 'Other Liabilities',
+        'category': 'balance_sheet',
+        'description': 'Subordinated debt and other liabilities'
+    },
+    'RCH': {
+        'name': 'Selected Balance Sheet Items',
+        'category': 'balance_sheet',
+        'description': 'Additional balance sheet detail'
+    },
+    'RCK': {
+        'name': 'Quarterly Averages',
+        'category': 'balance_sheet',
+        'description': 'Average balances for ratio calculations'
+    },
+    'RCL': {
+        'name': 'Derivatives & Off-Balance Sheet',
+        'category': 'balance_sheet',
+        'description': 'Trading assets, commitments, and off-balance sheet items'
+    },
+    'RCM': {
+        'name': 'Memoranda',
+        'category': 'balance_sheet',
+        'description': 'Supplemental asset/liability details'
+    },
+    'RCN': {
+        'name': 'Past Due Assets',
+        'category': 'balance_sheet',
+        'description': 'Nonperforming loans and charge-offs'
+    },
+    'RCO': {
+        'name': 'Other Data',
+        'category': 'other',
+        'description': 'Employees, offices, fiduciary activities'
+    },
+    'RCRI': {
+        'name': 'Regulatory Capital',
+        'category': 'balance_sheet',
+        'description': 'Capital adequacy and regulatory ratios'
+    },
+    'RCS': {
+        'name': 'Servicing, Securitization & Asset Sales',
+        'category': 'other',
+        'description': 'Mortgage servicing and securitization activities'
+    },
+    'RCT': {
+        'name': 'Fiduciary & Related Services',
+        'category': 'other',
+        'description': 'Trust and fiduciary service activities'
+    },
+    'RCV': {
+        'name': 'Variable Interest Entities',
+        'category': 'other',
+        'description': 'Variable interest entity disclosures'
+    },
+    'RI': {
+        'name': 'Income Statement',
+        'category': 'income_statement',
+        'description': 'Revenue, expenses, and profitability metrics'
+    },
+    'RIA': {
+        'name': 'Changes in Bank Equity Capital',
+        'category': 'income_statement',
+        'description': 'Changes in equity capital during the period'
+    },
+    # Legacy mappings for backward compatibility
+    'RC-A': {
+        'name': 'Balance Sheet - Assets (Legacy Code)',
+        'category': 'balance_sheet',
+        'description': 'Use "RCA" instead of "RC-A"'
+    },
+    'RC-E': {
+        'name': 'Deposit Liabilities (Legacy Code)',
+        'category': 'balance_sheet',
+        'description': 'Use "RCE" instead of "RC-E"'
+    },
+    'RC-R': {
+        'name': 'Regulatory Capital (Legacy Code)',
+        'category': 'balance_sheet',
+        'description': 'Use "RCRI" instead of "RC-R"'
+    }
 }
 
 # FFIEC CDR Data Series Types
@@ -134,6 +265,29 @@ def build_discovery_cache_key(rssd_id: str) -> str:
     return f"discovery_{rssd_id}"
 
 
+def build_parsed_report_cache_key(rssd_id: str,
+                                  reporting_period: str,
+                                  data_type: str,
+                                  format_type: str,
+                                  schedules: Optional[List[str]] = None) -> str:
+    """
+    Build cache key for a parsed call report.
+    
+    Args:
+        rssd_id: Bank RSSD identifier
+        reporting_period: Reporting period in YYYY-MM-DD format
+        data_type: Data type (call_report or ubpr)
+        format_type: Requested format type (PDF, XBRL, SDF)
+        schedules: Requested schedules, None for the schedule summary
+        
+    Returns:
+        Unique cache key string (independent of schedule order)
+    """
+    schedule_part = ",".join(sorted(set(schedules))) if schedules is not None else "*"
+    key_components = f"{rssd_id}_{reporting_period}_{data_type}_{format_type.upper()}_{schedule_part}"
+    return hashlib.md5(key_components.encode()).hexdigest()
+
+
 def validate_rssd_id(rssd_id: str) -> bool:
     """
     Validate RSSD ID format.
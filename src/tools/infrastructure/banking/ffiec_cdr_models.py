@@ -261,47 +261,3 @@ class FFIECCDRAPIResponse(BaseModel):
             summary["error_code"] = self.error_code
         
         return summary
-
-
-class FFIECCDRCacheEntry(BaseModel):
-    """
-    Model for FFIEC CDR cache entries.
-    
-    Represents a cached response from the FFIEC CDR API
-    with expiration and metadata tracking.
-    """
-    
-    response: FFIECCDRAPIResponse = Field(
-        ...,
-        description="Cached API response"
-    )
-    cache_timestamp: datetime = Field(
-        default_factory=datetime.now,
-        description="When this entry was cached"
-    )
-    ttl_seconds: int = Field(
-        default=3600,
-        description="Time-to-live in seconds"
-    )
-    access_count: int = Field(
-        default=0,
-        description="Number of times this entry was accessed"
-    )
-    
-    def is_expired(self) -> bool:
-        """Check if cache entry has expired."""
-        expiry_time = self.cache_timestamp + timedelta(seconds=self.ttl_seconds)
-        return datetime.now() > expiry_time
-    
-    def time_to_expiry(self) -> int:
-        """Get time until expiry in seconds."""
-        if self.is_expired():
-            return 0
-        
-        expiry_time = self.cache_timestamp + timedelta(seconds=self.ttl_seconds)
-        delta = expiry_time - datetime.now()
-        return max(0, int(delta.total_seconds()))
-    
-    def mark_accessed(self):
-        """Mark this entry as accessed (increment counter)."""
-        self.access_count += 1
\ No newline at end of file
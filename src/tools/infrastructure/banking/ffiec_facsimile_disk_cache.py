@@ -0,0 +1,335 @@
+"""
+Persistent on-disk cache tier for FFIEC call report facsimiles.
+
+Call reports for a closed quarter do not change, so downloaded facsimiles are
+kept on disk as zlib-compressed blobs keyed by ``build_ffiec_cache_key``. A
+JSON index tracks sizes and content hashes so the store can be bounded by
+size. Reads record access on the blob's modification time rather than in the
+index, and eviction removes the least recently used blobs by that time. Blobs
+are read through ``mmap`` to avoid copying the compressed payload into a
+Python buffer first.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+import structlog
+
+try:
+    import fcntl
+except ImportError:  # Windows: index updates are serialized per process only
+    fcntl = None
+
+from .ffiec_cdr_constants import FFIEC_CDR_CACHE_CONFIG
+
+logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
+
+INDEX_FILENAME = "index.json"
+INDEX_LOCK_FILENAME = ".index.lock"
+INDEX_VERSION = 1
+BLOB_SUFFIX = ".zlib"
+
+
+class FFIECFacsimileDiskCache:
+    """
+    Size-bounded, compressed on-disk store for facsimile payloads.
+
+    Intended as an L2 below the in-memory ``FFIECCDRAPICache``: it survives
+    process restarts and can be shared by several worker processes pointing at
+    the same directory. Index and blob writes are atomic (write to a temporary
+    file, then rename), index updates re-read the index under an exclusive
+    file lock so concurrent writers don't drop each other's entries, and the
+    index is reloaded whenever another process has rewritten it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = FFIEC_CDR_CACHE_CONFIG["disk_cache_max_mb"] * 1024 * 1024,
+        compression_level: int = FFIEC_CDR_CACHE_CONFIG["disk_cache_compression_level"]
+    ):
+        """
+        Initialize the facsimile disk cache.
+
+        Args:
+            cache_dir: Directory holding the index and compressed blobs
+            max_bytes: Maximum total size of compressed blobs on disk
+            compression_level: zlib compression level (1-9)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+
+        self._index_path = self.cache_dir / INDEX_FILENAME
+        self._index_lock_path = self.cache_dir / INDEX_LOCK_FILENAME
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._index_mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.logger = logger.bind(component="ffiec_facsimile_disk_cache")
+
+        with self._lock:
+            self._refresh_index()
+
+        self.logger.info(
+            "FFIEC facsimile disk cache initialized",
+            cache_dir=str(self.cache_dir),
+            max_bytes=max_bytes,
+            cached_facsimiles=len(self._entries)
+        )
+
+    def get(self, cache_key: str) -> Optional[bytes]:
+        """
+        Read a cached facsimile.
+
+        Args:
+            cache_key: Key built with ``build_ffiec_cache_key``
+
+        Returns:
+            Decompressed facsimile bytes, or None if not cached or unreadable
+        """
+        with self._lock:
+            self._refresh_index()
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            blob_path = self._blob_path(cache_key)
+            try:
+                with open(blob_path, "rb") as blob_file:
+                    with mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        data = zlib.decompress(mapped)
+            except (OSError, ValueError, zlib.error) as e:
+                self.logger.warning(
+                    "Discarding unreadable facsimile blob",
+                    cache_key=cache_key,
+                    error=str(e)
+                )
+                self._discard(cache_key)
+                self.misses += 1
+                return None
+
+            if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                self.logger.warning("Discarding corrupt facsimile blob", cache_key=cache_key)
+                self._discard(cache_key)
+                self.misses += 1
+                return None
+
+            self._touch(blob_path)
+            self.hits += 1
+
+            self.logger.debug(
+                "Facsimile disk cache hit",
+                cache_key=cache_key,
+                data_size=len(data)
+            )
+            return data
+
+    def put(self, cache_key: str, data: bytes) -> None:
+        """
+        Store a facsimile, evicting least recently used blobs if over budget.
+
+        Args:
+            cache_key: Key built with ``build_ffiec_cache_key``
+            data: Raw facsimile bytes
+        """
+        compressed = zlib.compress(data, self.compression_level)
+        if len(compressed) > self.max_bytes:
+            self.logger.debug(
+                "Facsimile larger than disk cache budget, not cached",
+                cache_key=cache_key,
+                stored_size=len(compressed)
+            )
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.logger.warning("Failed to create facsimile cache directory", error=str(e))
+            return
+
+        with self._index_transaction():
+            blob_path = self._blob_path(cache_key)
+            try:
+                self._atomic_write(blob_path, compressed)
+                self._touch(blob_path)
+            except OSError as e:
+                self.logger.warning("Failed to write facsimile blob", cache_key=cache_key, error=str(e))
+                return
+
+            self._entries[cache_key] = {
+                "size": len(data),
+                "stored_size": len(compressed),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "created_at": time.time()
+            }
+            self._evict_over_budget(protect_key=cache_key)
+
+            self.logger.debug(
+                "Cached facsimile on disk",
+                cache_key=cache_key,
+                data_size=len(data),
+                stored_size=len(compressed)
+            )
+
+    def _evict_over_budget(self, protect_key: Optional[str] = None) -> None:
+        """Evict least recently used blobs, by modification time, until the store fits ``max_bytes``."""
+        total = sum(entry["stored_size"] for entry in self._entries.values())
+        if total <= self.max_bytes:
+            return
+
+        by_age = sorted(self._entries.items(), key=lambda item: self._last_access_ns(item[0]))
+        for cache_key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            if cache_key == protect_key:
+                continue
+            total -= entry["stored_size"]
+            self._drop(cache_key)
+            self.evictions += 1
+            self.logger.debug("Evicted facsimile from disk cache", evicted_key=cache_key)
+
+    def _discard(self, cache_key: str) -> None:
+        """Remove an unusable entry and persist the index (thread lock must be held)."""
+        if not self.cache_dir.exists():
+            return
+        with self._index_transaction(thread_locked=True):
+            self._drop(cache_key)
+
+    def _drop(self, cache_key: str) -> None:
+        """Remove an entry and its blob (lock must be held)."""
+        self._entries.pop(cache_key, None)
+        try:
+            self._blob_path(cache_key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning("Failed to remove facsimile blob", cache_key=cache_key, error=str(e))
+
+    def _blob_path(self, cache_key: str) -> Path:
+        return self.cache_dir / f"{cache_key}{BLOB_SUFFIX}"
+
+    def _touch(self, blob_path: Path) -> None:
+        """Record an access on the blob; explicit times keep sub-tick ordering."""
+        now_ns = time.time_ns()
+        try:
+            os.utime(blob_path, ns=(now_ns, now_ns))
+        except OSError as e:
+            self.logger.debug("Failed to record facsimile access", blob=str(blob_path), error=str(e))
+
+    def _last_access_ns(self, cache_key: str) -> int:
+        """Blob modification time, or 0 so blobs that vanished are evicted first."""
+        try:
+            return self._blob_path(cache_key).stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    @contextmanager
+    def _index_transaction(self, thread_locked: bool = False) -> Iterator[None]:
+        """
+        Read-modify-write the index under the thread lock and an exclusive file lock.
+
+        The index is re-read from disk once the locks are held, so entries written
+        by other processes since the last refresh are kept, and written back
+        atomically when the block exits.
+        """
+        if not thread_locked:
+            self._lock.acquire()
+        try:
+            with open(self._index_lock_path, "a+b") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    self._refresh_index(force=True)
+                    yield
+                    self._write_index()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            if not thread_locked:
+                self._lock.release()
+
+    def _refresh_index(self, force: bool = False) -> None:
+        """Load the index if it is new or was rewritten by another process."""
+        try:
+            mtime_ns = self._index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+
+        if mtime_ns == self._index_mtime_ns and not force:
+            return
+
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable facsimile cache index", error=str(e))
+            return
+
+        if index.get("version") != INDEX_VERSION:
+            self.logger.warning("Ignoring facsimile cache index with unknown version")
+            return
+
+        self._entries = index.get("entries", {})
+        self._index_mtime_ns = mtime_ns
+
+    def _write_index(self) -> None:
+        """Persist the index atomically (index transaction must be held)."""
+        payload = json.dumps({"version": INDEX_VERSION, "entries": self._entries}).encode("utf-8")
+        try:
+            self._atomic_write(self._index_path, payload)
+            self._index_mtime_ns = self._index_path.stat().st_mtime_ns
+        except OSError as e:
+            self.logger.warning("Failed to write facsimile cache index", error=str(e))
+
+    def _atomic_write(self, path: Path, payload: bytes) -> None:
+        """Write a file via a temporary sibling and rename it into place."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def clear(self) -> None:
+        """Remove every cached facsimile and the index."""
+        if not self.cache_dir.exists():
+            return
+        with self._index_transaction():
+            cleared_count = len(self._entries)
+            for cache_key in list(self._entries):
+                self._drop(cache_key)
+        self.logger.info("Facsimile disk cache cleared", cleared_entries=cleared_count)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get disk cache statistics."""
+        with self._lock:
+            self._refresh_index()
+            return {
+                "total_entries": len(self._entries),
+                "stored_bytes": sum(entry["stored_size"] for entry in self._entries.values()),
+                "uncompressed_bytes": sum(entry["size"] for entry in self._entries.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,211 @@
+"""
+Process-wide index of FFIEC call report filers by reporting period.
+
+Latest-filing discovery used to fetch the reporting periods and the filer
+lists of several periods for every RSSD lookup, only to scan the lists for a
+single bank. The filer index loads the filer sets of the most recent periods
+once per refresh interval, shares them across all clients in the process and
+resolves the latest filed period for any bank with a dictionary lookup.
+Stale snapshots keep answering while a refresh runs in the background.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+import structlog
+
+from .ffiec_cdr_constants import FFIEC_FILER_INDEX_CONFIG
+
+logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
+
+# Loads {reporting period (YYYY-MM-DD): RSSD IDs that filed for it}
+FilerLoader = Callable[[], Awaitable[Dict[str, Iterable[int]]]]
+
+
+class _FilerSnapshot:
+    """Immutable filer sets for the indexed periods."""
+
+    __slots__ = ("periods", "filers", "latest_period", "built_at")
+
+    def __init__(self, filers_by_period: Dict[str, Iterable[int]], built_at: float):
+        self.periods: Tuple[str, ...] = tuple(sorted(filers_by_period, reverse=True))
+        self.filers: Dict[str, FrozenSet[int]] = {
+            period: frozenset(filers_by_period[period]) for period in self.periods
+        }
+        # Oldest first so each bank ends up mapped to its newest period
+        self.latest_period: Dict[int, str] = {}
+        for period in reversed(self.periods):
+            self.latest_period.update(dict.fromkeys(self.filers[period], period))
+        self.built_at = built_at
+
+
+class FFIECFilerIndex:
+    """
+    Shared, periodically refreshed filer index for one FFIEC data series.
+
+    Snapshots are swapped atomically, so lookups never block on each other.
+    A lookup against a snapshot older than ``refresh_interval_seconds``
+    answers from it and starts a background refresh; one older than
+    ``max_stale_seconds`` (or no snapshot at all) waits for the refresh.
+    Concurrent refreshes on an event loop are coalesced into one load.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        refresh_interval_seconds: float = FFIEC_FILER_INDEX_CONFIG["refresh_interval_seconds"],
+        max_stale_seconds: float = FFIEC_FILER_INDEX_CONFIG["max_stale_seconds"]
+    ):
+        """
+        Initialize an empty filer index.
+
+        Args:
+            name: Data series the index covers, used for logging
+            refresh_interval_seconds: Snapshot age after which a background refresh starts
+            max_stale_seconds: Snapshot age after which lookups wait for a refresh
+        """
+        self.name = name
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_stale_seconds = max_stale_seconds
+
+        self._snapshot: Optional[_FilerSnapshot] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+        self.logger = logger.bind(component="ffiec_filer_index", data_series=name)
+
+    async def latest_period(self, rssd_id: str, loader: FilerLoader) -> Optional[str]:
+        """
+        Resolve the most recent indexed period a bank filed for.
+
+        Args:
+            rssd_id: Bank RSSD identifier
+            loader: Coroutine function loading the filer sets on refresh
+
+        Returns:
+            Reporting period in YYYY-MM-DD format, or None if the bank filed in none of them
+
+        Raises:
+            Exception: Whatever the loader raised, if there is no snapshot to fall back on
+        """
+        snapshot = await self._current_snapshot(loader)
+        self.lookups += 1
+        return snapshot.latest_period.get(int(rssd_id))
+
+    async def refresh(self, loader: FilerLoader) -> None:
+        """
+        Reload the filer sets now, joining a refresh already running on this loop.
+
+        Args:
+            loader: Coroutine function loading the filer sets
+        """
+        await asyncio.shield(self._start_refresh(loader))
+
+    async def _current_snapshot(self, loader: FilerLoader) -> _FilerSnapshot:
+        """Get a usable snapshot, refreshing it as its age requires."""
+        snapshot = self._snapshot
+        age = time.monotonic() - snapshot.built_at if snapshot is not None else None
+
+        if snapshot is None or age > self.max_stale_seconds:
+            try:
+                return await asyncio.shield(self._start_refresh(loader))
+            except Exception:
+                if snapshot is None:
+                    raise
+                self.logger.warning("Filer index refresh failed, using stale snapshot", age_seconds=round(age))
+                return snapshot
+
+        if age > self.refresh_interval_seconds:
+            self._start_refresh(loader)
+        return snapshot
+
+    def _start_refresh(self, loader: FilerLoader) -> "asyncio.Task[_FilerSnapshot]":
+        """Start a refresh on the running loop unless one is already in flight there."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._refresh_task
+            if task is not None and not task.done() and task.get_loop() is loop:
+                return task
+            task = loop.create_task(self._load(loader))
+            task.add_done_callback(self._refresh_done)
+            self._refresh_task = task
+            return task
+
+    async def _load(self, loader: FilerLoader) -> _FilerSnapshot:
+        """Load filer sets and install them as the current snapshot."""
+        started = time.monotonic()
+        filers_by_period = await loader()
+        if not filers_by_period:
+            raise ValueError(f"No {self.name} filers available to index")
+
+        snapshot = _FilerSnapshot(filers_by_period, built_at=time.monotonic())
+        self._snapshot = snapshot
+        self.refreshes += 1
+
+        self.logger.info(
+            "Filer index refreshed",
+            periods=list(snapshot.periods),
+            banks_indexed=len(snapshot.latest_period),
+            load_seconds=round(snapshot.built_at - started, 3)
+        )
+        return snapshot
+
+    def _refresh_done(self, task: "asyncio.Task[_FilerSnapshot]") -> None:
+        """Record failures of refreshes nobody may be awaiting."""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.refresh_failures += 1
+            self.logger.warning("Filer index refresh failed", error=str(error))
+
+    def clear(self) -> None:
+        """Drop the current snapshot."""
+        with self._lock:
+            self._snapshot = None
+            self._refresh_task = None
+
+    def stats(self) -> Dict[str, object]:
+        """Get index statistics for monitoring."""
+        snapshot = self._snapshot
+        return {
+            "data_series": self.name,
+            "periods": list(snapshot.periods) if snapshot is not None else [],
+            "banks_indexed": len(snapshot.latest_period) if snapshot is not None else 0,
+            "age_seconds": round(time.monotonic() - snapshot.built_at, 1) if snapshot is not None else None,
+            "lookups": self.lookups,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures
+        }
+
+
+_filer_indexes: Dict[str, FFIECFilerIndex] = {}
+_filer_indexes_lock = threading.Lock()
+
+
+def get_filer_index(data_series: str) -> FFIECFilerIndex:
+    """
+    Get the process-wide filer index for a data series.
+
+    Args:
+        data_series: FFIEC data series name (e.g. "Call")
+
+    Returns:
+        Filer index shared by every client in the process
+    """
+    with _filer_indexes_lock:
+        index = _filer_indexes.get(data_series)
+        if index is None:
+            index = _filer_indexes[data_series] = FFIECFilerIndex(data_series)
+        return index
+
+
+def reset_filer_indexes() -> None:
+    """Drop all process-wide filer indexes."""
+    with _filer_indexes_lock:
+        _filer_indexes.clear()
@@ -0,0 +1,178 @@
+"""
+Streaming XBRL fact extraction for FFIEC call report and UBPR instance documents.
+
+Walks the raw XBRL byte stream with ``iterparse`` instead of decoding the whole
+payload to a string and building a full element tree. Element tags are resolved
+to concept names once per distinct tag, finished elements are cleared as the
+parse advances, and the walk can stop as soon as every requested concept has
+been seen for the requested reporting period.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import structlog
+
+logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
+
+CALL_REPORT_CONCEPTS_NAMESPACE = "ffiec.gov/xbrl/call/concepts"
+UBPR_CONCEPT_PREFIX = "UBPR"
+
+_XML_DECLARATION_ENCODING = re.compile(rb'^(\s*<\?xml[^>]*?)\s+encoding=["\'][^"\']*["\']')
+
+
+def call_report_concept(tag: str) -> Optional[str]:
+    """
+    Resolve an element tag to a Call Report concept name.
+
+    Args:
+        tag: Element tag in ``{namespace}local`` form
+
+    Returns:
+        Local concept name if the tag is in the FFIEC call concepts namespace
+    """
+    if CALL_REPORT_CONCEPTS_NAMESPACE in tag:
+        return tag.rsplit('}', 1)[-1]
+    return None
+
+
+def ubpr_concept(tag: str) -> Optional[str]:
+    """
+    Resolve an element tag to a UBPR concept name.
+
+    UBPR taxonomies are versioned (``.../ubpr/v174/...``), so concepts are
+    matched on their ``UBPR`` local-name prefix rather than a fixed namespace.
+
+    Args:
+        tag: Element tag in ``{namespace}local`` form
+
+    Returns:
+        Local concept name if it is a UBPR concept
+    """
+    local_name = tag.rsplit('}', 1)[-1]
+    if local_name.startswith(UBPR_CONCEPT_PREFIX):
+        return local_name
+    return None
+
+
+def extract_xbrl_facts(
+    xbrl_data: bytes,
+    resolve_concept: Callable[[str], Optional[str]],
+    concepts: Optional[Iterable[str]] = None,
+    stop_early: bool = False,
+    strip_values: bool = True,
+    period: Optional[str] = None
+) -> Tuple[Dict[str, Dict[str, str]], int]:
+    """
+    Extract the latest-context fact for each concept from an XBRL instance.
+
+    Instances list facts for several contexts, often oldest first, so the
+    latest context is only known once a concept's facts have all been seen.
+    An early stop therefore needs the reporting period: a fact whose
+    contextRef names it is the one kept for its concept.
+
+    Args:
+        xbrl_data: Uncompressed XBRL instance document bytes
+        resolve_concept: Maps an element tag to a concept name, or None to skip it
+        concepts: Optional concept names to keep; all resolved concepts if None
+        stop_early: Stop once every requested concept has a fact for ``period``;
+            without a period the whole document is read
+        strip_values: Strip whitespace from fact values
+        period: Reporting period (YYYY-MM-DD) whose facts are kept in
+            preference to the latest context
+
+    Returns:
+        Tuple of (concept name -> {'context', 'unit', 'value'}, elements scanned)
+
+    Raises:
+        ET.ParseError: If the document is not well-formed XML
+    """
+    wanted = {concept.upper() for concept in concepts} if concepts is not None else None
+    try:
+        return _iterparse_facts(BytesIO(xbrl_data), resolve_concept, wanted, stop_early, strip_values, period)
+    except ET.ParseError:
+        # Legacy filings may hold Latin-1 bytes without declaring an encoding
+        fallback = _reencode_as_utf8(xbrl_data)
+        if fallback is None:
+            raise
+        logger.debug("Retrying XBRL parse with Latin-1 re-encoding")
+        return _iterparse_facts(BytesIO(fallback), resolve_concept, wanted, stop_early, strip_values, period)
+
+
+def _iterparse_facts(
+    stream: BytesIO,
+    resolve_concept: Callable[[str], Optional[str]],
+    wanted: Optional[set],
+    stop_early: bool,
+    strip_values: bool,
+    period: Optional[str]
+) -> Tuple[Dict[str, Dict[str, str]], int]:
+    """Run the incremental parse over a byte stream."""
+    facts: Dict[str, Dict[str, str]] = {}
+    # Concepts whose fact for the requested period has been found
+    settled = set()
+    # Tag -> concept name (or None); each distinct tag is classified once
+    tag_concepts: Dict[str, Optional[str]] = {}
+    remaining = set(wanted) if wanted is not None and stop_early and period else None
+
+    root = None
+    depth = 0
+    scanned = 0
+
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+
+        depth -= 1
+        scanned += 1
+        tag = elem.tag
+
+        concept = tag_concepts.get(tag, False)
+        if concept is False:
+            concept = resolve_concept(tag) if isinstance(tag, str) else None
+            if concept is not None and wanted is not None and concept.upper() not in wanted:
+                concept = None
+            tag_concepts[tag] = concept
+
+        if concept is not None and elem.text:
+            value = elem.text.strip() if strip_values else elem.text
+            if value or not strip_values:
+                context_ref = elem.get('contextRef', '')
+                existing = facts.get(concept)
+                in_period = period is not None and period in context_ref
+                if existing is None or (concept not in settled and (in_period or context_ref > existing['context'])):
+                    facts[concept] = {
+                        'context': context_ref,
+                        'unit': elem.get('unitRef', ''),
+                        'value': value
+                    }
+                if in_period:
+                    settled.add(concept)
+                    if remaining is not None:
+                        remaining.discard(concept.upper())
+
+        # Drop finished subtrees so memory stays flat as the document streams by
+        if depth == 1 and root is not None:
+            root.clear()
+        else:
+            elem.clear()
+
+        if remaining is not None and not remaining:
+            break
+
+    return facts, scanned
+
+
+def _reencode_as_utf8(xbrl_data: bytes) -> Optional[bytes]:
+    """Re-encode undeclared Latin-1 bytes as UTF-8, or None if already valid UTF-8."""
+    try:
+        xbrl_data.decode('utf-8')
+        return None
+    except UnicodeDecodeError:
+        pass
+    text = xbrl_data.decode('latin-1').encode('utf-8')
+    return _XML_DECLARATION_ENCODING.sub(rb'\1', text, count=1)
@@ -10,6 +10,7 @@ import structlog
 from langchain.tools import BaseTool
 
 from src.config.settings import Settings
+from ..banking.banking_http_session import BankingHTTPSession
 from ...atomic.fdic_institution_search_tool import FDICInstitutionSearchTool
 from ...atomic.fdic_financial_data_tool import FDICFinancialDataTool
 from ...atomic.ffiec_call_report_data_tool import FFIECCallReportDataTool
@@ -40,6 +41,9 @@ class BankingToolset:
         self.settings = settings
         self.logger = logger.bind(component="banking_toolset")
         
+        # One pooled HTTP session shared by every FDIC client in this toolset
+        self.http_session = BankingHTTPSession(timeout=settings.fdic_financial_api_timeout)
+        
         # Initialize tools
         self._tools = None
         self._initialize_tools()
@@ -59,8 +63,14 @@ class BankingToolset:
             tools = []
             
             # Create clean atomic FDIC tools
-            fdic_institution_search = FDICInstitutionSearchTool(settings=self.settings)
-            fdic_financial_data = FDICFinancialDataTool(settings=self.settings)
+            fdic_institution_search = FDICInstitutionSearchTool(
+                settings=self.settings,
+                http_session=self.http_session
+            )
+            fdic_financial_data = FDICFinancialDataTool(
+                settings=self.settings,
+                http_session=self.http_session
+            )
             tools.extend([fdic_institution_search, fdic_financial_data])
             
             # Add FFIEC Call Report tool if enabled and configured
@@ -172,9 +182,20 @@ class BankingToolset:
             "fdic_financial_available": fdic_financial_tool.is_available() if fdic_financial_tool else False,
             "fdic_integration": True,
             "has_fdic_api_key": bool(self.settings.fdic_api_key),
+            "http_session_pool": self.http_session.get_stats(),
             "toolset_type": "atomic_fdic_and_ffiec_tools"
         }
     
+    async def close(self) -> None:
+        """Close shared HTTP connections and FFIEC SOAP client resources."""
+        await self.http_session.close()
+        
+        ffiec_tool = self.get_tool_by_name("ffiec_call_report_data")
+        if ffiec_tool is not None and ffiec_tool.ffiec_client is not None:
+            await ffiec_tool.ffiec_client.close()
+        
+        self.logger.info("Banking toolset resources closed")
+    
     def get_schemas(self) -> List[Dict[str, Any]]:
         """
         Get schemas for all tools (for OpenAI function calling).
@@ -8,7 +8,6 @@ This application allows users to choose between:
 The user can toggle this setting in real-time to control the chatbot behavior.
 """
 
-import asyncio
 import os
 import sys
 from pathlib import Path
@@ -24,9 +23,10 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from src.config.settings import get_settings, clear_settings_cache
 from src.chatbot.agent import ChatbotAgent
+from src.utils.event_loop import run_sync
 
 # Import new separated RAG architecture components
-from src.document_management import DocumentManager
+from src.document_management import DocumentManager, IngestionFile
 from src.tools.atomic.rag_search_tool import RAGSearchTool
 from src.services.response_formatter import ResponseFormattingService
 
@@ -369,7 +369,7 @@ class FlexibleRAGStreamlitApp:
             with st.spinner("Loading documents..."):
                 try:
                     import time
-                    documents = asyncio.run(st.session_state.document_manager.list_documents())
+                    documents = run_sync(st.session_state.document_manager.list_documents())
                     st.session_state.documents_cache = documents
                     st.session_state.documents_cache_timestamp = time.time()
                     st.session_state.force_documents_refresh = False
@@ -412,23 +412,55 @@ class FlexibleRAGStreamlitApp:
         
         try:
             total_files = len(uploaded_files)
+            status_text.text(f"Processing {total_files} documents...")
             
-            for i, uploaded_file in enumerate(uploaded_files):
-                status_text.text(f"Processing {uploaded_file.name}...")
-                progress_bar.progress((i + 1) / total_files)
-                
-                # Read file content
-                file_content = uploaded_file.read()
-                
-                # Use the new DocumentManager to upload and process
-                result = asyncio.run(
-                    st.session_state.document_manager.upload_document(
+            # Documents already in the store are updated in place, re-embedding only changed chunks
+            stored_filenames = {
+                doc.get('filename') for doc in (st.session_state.documents_cache or [])
+            }
+            new_files = [f for f in uploaded_files if f.name not in stored_filenames]
+            replaced_files = [f for f in uploaded_files if f.name in stored_filenames]
+            finished = []
+            
+            def report_progress(name: str):
+                finished.append(name)
+                progress_bar.progress(len(finished) / total_files)
+                status_text.text(f"Processed {name} ({len(finished)}/{total_files})")
+            
+            for uploaded_file in replaced_files:
+                result = run_sync(
+                    st.session_state.document_manager.update_document(
                         file_path=Path(uploaded_file.name),
-                        file_content=file_content,
+                        file_content=uploaded_file.read(),
                         source_name=uploaded_file.name
                     )
                 )
-                
+                report_progress(uploaded_file.name)
+                if result.success:
+                    st.success(
+                        f"🔄 Updated {uploaded_file.name} - {result.added_chunks} new, "
+                        f"{result.removed_chunks} removed, {result.unchanged_chunks} unchanged chunks"
+                    )
+                else:
+                    st.warning(f"⚠️ Failed to update {uploaded_file.name}: {result.error}")
+            
+            # Read file contents and upload them together so extraction and embedding overlap
+            files = [
+                IngestionFile(
+                    file_path=Path(uploaded_file.name),
+                    file_content=uploaded_file.read(),
+                    source_name=uploaded_file.name
+                )
+                for uploaded_file in new_files
+            ]
+            results = run_sync(
+                st.session_state.document_manager.upload_documents(
+                    files,
+                    on_result=lambda index, result: report_progress(new_files[index].name)
+                )
+            ) if files else []
+            
+            for uploaded_file, result in zip(new_files, results):
                 if result.success:
                     chunk_count = result.document_info.chunk_count if result.document_info else 0
                     st.success(f"✅ Processed {uploaded_file.name} - {chunk_count} chunks")
@@ -461,7 +493,7 @@ class FlexibleRAGStreamlitApp:
         try:
             st.info(f"🗑️ Attempting to delete: {filename}")
             with st.spinner(f"Deleting {filename}..."):
-                result = asyncio.run(
+                result = run_sync(
                     st.session_state.document_manager.delete_document(filename)
                 )
             
@@ -602,7 +634,7 @@ class FlexibleRAGStreamlitApp:
             st.metric("RAG Tool", "✅ Available" if rag_available else "❌ Not Available")
             
             try:
-                stats = asyncio.run(st.session_state.document_manager.get_statistics())
+                stats = run_sync(st.session_state.document_manager.get_statistics())
                 st.metric("Total Chunks", stats.total_chunks)
             except Exception:
                 st.metric("Total Chunks", "Error")
@@ -3,7 +3,7 @@ Simple utility to create AzureChatOpenAI client directly without wrapper.
 This eliminates the complex azure_client.py wrapper and uses LangChain directly.
 """
 
-from langchain_openai import AzureChatOpenAI
+from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
 from src.config.settings import Settings
 import structlog
 
@@ -55,4 +55,45 @@ def create_azure_chat_openai(settings: Settings) -> AzureChatOpenAI:
             error=str(e),
             deployment=settings.azure_openai_deployment
         )
-        raise ValueError(f"Failed to initialize Azure OpenAI client: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Failed to initialize Azure OpenAI client: {str(e)}")
+
+
+def create_azure_openai_embeddings(settings: Settings) -> AzureOpenAIEmbeddings:
+    """
+    Create AzureOpenAIEmbeddings client for the embedding deployment.
+    
+    Args:
+        settings: Application settings
+        
+    Returns:
+        Configured AzureOpenAIEmbeddings client
+        
+    Raises:
+        ValueError: If Azure OpenAI configuration is incomplete
+    """
+    if not settings.has_azure_openai_config():
+        raise ValueError("Azure OpenAI configuration is incomplete")
+    
+    try:
+        client = AzureOpenAIEmbeddings(
+            azure_endpoint=settings.azure_openai_endpoint,
+            api_key=settings.azure_openai_api_key,
+            azure_deployment=settings.azure_embedding_deployment,
+            api_version=settings.azure_openai_api_version,
+            max_retries=3
+        )
+        
+        logger.info(
+            "AzureOpenAIEmbeddings client created",
+            deployment=settings.azure_embedding_deployment
+        )
+        
+        return client
+        
+    except Exception as e:
+        logger.error(
+            "Failed to create AzureOpenAIEmbeddings client",
+            error=str(e),
+            deployment=settings.azure_embedding_deployment
+        )
+        raise ValueError(f"Failed to initialize Azure OpenAI embeddings: {str(e)}")
@@ -0,0 +1,93 @@
+"""
+Process-wide event loop for synchronous callers.
+
+Streamlit, the CLI and the tools' synchronous shims ran every async call with
+asyncio.run, often on a throwaway thread, so each call paid for a new event
+loop and lost everything bound to the previous one, like the pooled banking
+HTTP session and its open connections. run_sync and iterate_sync submit the
+work to one long-lived loop on a daemon thread instead; async callers await
+the coroutines directly.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, AsyncIterable, Coroutine, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide event loop, starting its thread on first use.
+    
+    Returns:
+        Running event loop shared by all synchronous callers
+    """
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed() or not _thread.is_alive():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="event-loop", daemon=True)
+            _thread.start()
+        return _loop
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the process-wide event loop and wait for its result.
+    
+    Args:
+        coroutine: Coroutine to run
+    
+    Returns:
+        The coroutine's result; its exceptions are re-raised here
+    """
+    loop = get_event_loop()
+    if _on_loop_thread(loop):
+        # Blocking the shared loop on its own work would deadlock; fall back to a private loop
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, coroutine).result()
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+
+def iterate_sync(iterable: AsyncIterable[T]) -> Iterator[T]:
+    """
+    Iterate an async iterable from synchronous code on the process-wide event loop.
+    
+    Args:
+        iterable: Async iterable, such as an async generator
+    
+    Yields:
+        Its items as they are produced
+    
+    Raises:
+        RuntimeError: If called from the process-wide loop itself (iterate with async for there)
+    """
+    loop = get_event_loop()
+    if _on_loop_thread(loop):
+        raise RuntimeError("iterate_sync cannot block the process-wide event loop; use async for instead")
+    
+    iterator = iterable.__aiter__()
+    try:
+        while True:
+            try:
+                item = asyncio.run_coroutine_threadsafe(iterator.__anext__(), loop).result()
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            asyncio.run_coroutine_threadsafe(aclose(), loop).result()
+
+
+def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
@@ -0,0 +1,277 @@
+"""
+Shared LRU/TTL cache engine.
+
+Provides the storage used by the FDIC institution, FDIC financial and FFIEC CDR
+API caches, the parsed call report cache and the RAG search cache: an ordered
+map for O(1) lookups and LRU eviction, plus an expiry min-heap so expired
+entries are purged in O(log n) each instead of by scanning the whole cache.
+"""
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+import structlog
+
+logger = structlog.get_logger(__name__).bind(log_type="SYSTEM")
+
+T = TypeVar("T")
+
+
+def estimate_size_bytes(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value.
+
+    Pydantic response models are measured by their JSON serialization, which
+    tracks payload size (e.g. base64 facsimile data) far better than
+    ``sys.getsizeof`` on the model object.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if hasattr(value, "model_dump_json"):
+        try:
+            return len(value.model_dump_json())
+        except Exception:
+            pass
+    return sys.getsizeof(value)
+
+
+class _CacheEntry:
+    """Internal cache slot; kept deliberately small since one exists per key."""
+
+    __slots__ = ("value", "expires_at", "size_bytes", "sequence")
+
+    def __init__(self, value: Any, expires_at: float, size_bytes: int, sequence: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size_bytes = size_bytes
+        self.sequence = sequence
+
+
+class ResponseCache(Generic[T]):
+    """
+    Thread-safe LRU cache with per-entry TTL and entry/byte limits.
+
+    ``get`` and ``put`` are O(1) apart from purging expired entries, which
+    costs O(log n) per expired entry via the expiry heap. Overwritten keys
+    leave stale heap records that are skipped lazily and compacted once they
+    outnumber live entries.
+    """
+
+    def __init__(
+        self,
+        default_ttl_seconds: float = 3600,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        size_estimator: Callable[[Any], int] = estimate_size_bytes,
+        component: str = "response_cache"
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            default_ttl_seconds: Default time-to-live for cache entries
+            max_entries: Maximum number of cache entries to maintain
+            max_bytes: Maximum total estimated size of cached values, unbounded if None
+            size_estimator: Callable returning the size in bytes of a cached value
+            component: Component name used for structured logging
+        """
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._cache_lock = threading.Lock()
+        self._size_estimator = size_estimator
+        self._total_bytes = 0
+
+        self.default_ttl = default_ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self.logger = logger.bind(component=component)
+
+    def get(self, cache_key: str) -> Optional[T]:
+        """
+        Get cached value if available and not expired.
+
+        Args:
+            cache_key: Cache key to lookup
+
+        Returns:
+            Cached value if available and fresh, None otherwise
+        """
+        now = time.monotonic()
+
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= now:
+                self._remove(cache_key)
+                self.expirations += 1
+                self.misses += 1
+                self.logger.debug("Cache entry expired", cache_key=cache_key)
+                return None
+
+            self._cache.move_to_end(cache_key)
+            self.hits += 1
+            self.logger.debug(
+                "Cache hit",
+                cache_key=cache_key,
+                ttl_remaining=round(entry.expires_at - now, 3)
+            )
+            return entry.value
+
+    def put(self, cache_key: str, value: T, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Cache a value with specified TTL.
+
+        Args:
+            cache_key: Cache key to store under
+            value: Value to cache
+            ttl_seconds: Time-to-live override, uses default if None
+        """
+        ttl = self.default_ttl if ttl_seconds is None else ttl_seconds
+        size_bytes = self._size_estimator(value)
+
+        if self.max_bytes is not None and size_bytes > self.max_bytes:
+            self.logger.debug(
+                "Value larger than cache byte limit, not cached",
+                cache_key=cache_key,
+                size_bytes=size_bytes,
+                max_bytes=self.max_bytes
+            )
+            with self._cache_lock:
+                if cache_key in self._cache:
+                    self._remove(cache_key)
+            return
+
+        now = time.monotonic()
+        expires_at = now + ttl
+
+        with self._cache_lock:
+            if cache_key in self._cache:
+                self._remove(cache_key)
+
+            sequence = next(self._sequence)
+            self._cache[cache_key] = _CacheEntry(value, expires_at, size_bytes, sequence)
+            self._total_bytes += size_bytes
+            heapq.heappush(self._expiry_heap, (expires_at, sequence, cache_key))
+
+            self._purge_expired(now)
+            self._enforce_limits()
+            self._compact_heap()
+
+            self.logger.debug(
+                "Cached response",
+                cache_key=cache_key,
+                ttl_seconds=ttl,
+                cache_size=len(self._cache)
+            )
+
+    def _remove(self, cache_key: str) -> _CacheEntry:
+        """Remove an entry and release its byte budget (lock must be held)."""
+        entry = self._cache.pop(cache_key)
+        self._total_bytes -= entry.size_bytes
+        return entry
+
+    def _purge_expired(self, now: float) -> int:
+        """
+        Remove expired entries from the front of the expiry heap.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            Number of entries expired
+        """
+        expired = 0
+        heap = self._expiry_heap
+
+        while heap and heap[0][0] <= now:
+            _, sequence, cache_key = heapq.heappop(heap)
+            entry = self._cache.get(cache_key)
+            # Skip heap records left behind by overwritten or evicted keys
+            if entry is not None and entry.sequence == sequence:
+                self._remove(cache_key)
+                expired += 1
+
+        if expired:
+            self.expirations += expired
+            self.logger.debug("Evicted expired cache entries", evicted_count=expired)
+
+        return expired
+
+    def _enforce_limits(self) -> None:
+        """Evict least recently used entries until within entry and byte limits."""
+        while self._cache and (
+            len(self._cache) > self.max_entries
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            evicted_key, entry = self._cache.popitem(last=False)
+            self._total_bytes -= entry.size_bytes
+            self.evictions += 1
+            self.logger.debug("Evicted least recently used cache entry", evicted_key=evicted_key)
+
+    def _compact_heap(self) -> None:
+        """Drop stale heap records once they outnumber live entries."""
+        if len(self._expiry_heap) <= 2 * len(self._cache) + 64:
+            return
+
+        self._expiry_heap = [
+            (entry.expires_at, entry.sequence, cache_key)
+            for cache_key, entry in self._cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._cache_lock:
+            cleared_count = len(self._cache)
+            self._cache.clear()
+            self._expiry_heap.clear()
+            self._total_bytes = 0
+            self.logger.info("Cache cleared", cleared_entries=cleared_count)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Expired entries are purged before counting, so ``expired_entries``
+        reports the total number of entries removed by TTL expiry.
+        """
+        with self._cache_lock:
+            self._purge_expired(time.monotonic())
+            lookups = self.hits + self.misses
+            return {
+                "total_entries": len(self._cache),
+                "expired_entries": self.expirations,
+                "active_entries": len(self._cache),
+                "max_entries": self.max_entries,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
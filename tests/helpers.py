@@ -0,0 +1,109 @@
+"""
+Shared helpers for document ingestion and search tests.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from langchain_core.embeddings import Embeddings
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management.chromadb_service import ChromaDBService
+from document_management.document_models import IngestionFile
+from document_management.document_processor import DocumentProcessor
+from document_management.ingestion_pipeline import IngestionPipeline
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic embeddings with a simulated request latency."""
+
+    def __init__(self, latency: float = 0.0, fail_on: str = None):
+        self.latency = latency
+        self.fail_on = fail_on
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    def _vector(self, text: str) -> list:
+        return [float(len(text)), float(sum(map(ord, text)) % 997), 1.0]
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        time.sleep(self.latency)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+    async def aembed_documents(self, texts):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.fail_on and any(self.fail_on in text for text in texts):
+                raise RuntimeError("deployment unavailable")
+            return [self._vector(text) for text in texts]
+        finally:
+            self.active -= 1
+
+
+class LocalChromaDBService(ChromaDBService):
+    """ChromaDB service using local embeddings instead of Azure OpenAI."""
+
+    def __init__(self, settings, embeddings: FakeEmbeddings):
+        self._local_embeddings = embeddings
+        super().__init__(settings)
+
+    def _create_embeddings(self):
+        return self._local_embeddings
+
+
+def make_settings(tmp_path: Path, **overrides) -> SimpleNamespace:
+    values = dict(
+        chromadb_storage_path=str(tmp_path / "chromadb"),
+        chromadb_max_workers=4,
+        chromadb_operation_timeout_seconds=30.0,
+        azure_openai_endpoint="https://example.openai.azure.com/",
+        azure_openai_api_key="test-key",
+        azure_embedding_deployment="text-embedding-ada-002",
+        azure_openai_api_version="2024-02-01",
+        chunk_size=200,
+        chunk_overlap=20,
+        max_file_size_mb=10,
+        ingestion_extract_workers=0,
+        pdf_pages_per_extraction_task=32,
+        extraction_timeout_seconds=300.0,
+        embedding_concurrency=4,
+        embedding_batch_size=8,
+        embedding_requests_per_minute=0,
+        embedding_tokens_per_minute=0,
+        chromadb_write_batch_size=32,
+        embedding_cache_path=str(tmp_path / "embedding_cache"),
+        embedding_cache_max_entries=1000,
+        hybrid_search_enabled=True,
+        hybrid_search_rrf_k=60,
+        search_cache_ttl_seconds=600,
+        search_cache_max_entries=64
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def make_pipeline(tmp_path: Path, embeddings: FakeEmbeddings, **overrides) -> IngestionPipeline:
+    settings = make_settings(tmp_path, **overrides)
+    chromadb = LocalChromaDBService(settings, embeddings)
+    return IngestionPipeline(settings, DocumentProcessor(settings), chromadb)
+
+
+def text_file(name: str, paragraphs: int) -> IngestionFile:
+    text = "\n\n".join(
+        f"{name} paragraph {i}: " + "quarterly deposit growth and loan quality " * 3
+        for i in range(paragraphs)
+    )
+    return IngestionFile(file_path=Path(f"{name}.txt"), file_content=text.encode(), source_name=f"{name}.txt")
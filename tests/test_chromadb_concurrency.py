@@ -0,0 +1,99 @@
+"""
+Tests for running ChromaDB operations off the event loop.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tests.helpers import FakeEmbeddings, make_pipeline, text_file
+
+
+class SlowCalls:
+    """Wrap a blocking function with a fixed delay, tracking overlapping calls."""
+
+    def __init__(self, func, delay: float):
+        self.func = func
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            return self.func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+async def searchable_service(tmp_path, delay: float, **overrides):
+    """ChromaDB service holding one document, with similarity searches slowed down."""
+    pipeline = make_pipeline(tmp_path, FakeEmbeddings(), hybrid_search_enabled=False, **overrides)
+    await pipeline.ingest([text_file("handbook", 10)])
+    chromadb = pipeline.chromadb
+    slow = SlowCalls(chromadb._db.similarity_search_by_vector_with_relevance_scores, delay)
+    chromadb._db.similarity_search_by_vector_with_relevance_scores = slow
+    return chromadb, slow
+
+
+class TestChromaDBConcurrency:
+    """Test the ChromaDB executor, timeouts and cancellation."""
+
+    SEARCHES = 16
+    DELAY = 0.05
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_progress_in_parallel(self, tmp_path):
+        """Searches run on the executor side by side, up to the worker limit."""
+        chromadb, slow = await searchable_service(tmp_path, self.DELAY, chromadb_max_workers=4)
+
+        results = await asyncio.gather(*(
+            chromadb.search_similar(f"question {i}", k=3, score_threshold=0.0) for i in range(self.SEARCHES)
+        ))
+
+        assert all(len(result) == 3 for result in results)
+        assert slow.calls == self.SEARCHES
+        # Blocking calls made on the event loop would never overlap
+        assert slow.max_active == 4
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, tmp_path):
+        """Slow operations raise TimeoutError and the service stays usable."""
+        chromadb, slow = await searchable_service(tmp_path, 0.3)
+        chromadb.operation_timeout = 0.05
+
+        with pytest.raises(TimeoutError, match="similarity search timed out"):
+            await chromadb.search_similar("question", k=3, score_threshold=0.0)
+
+        chromadb.operation_timeout = 5
+        assert len(await chromadb.search_similar("question", k=3, score_threshold=0.0)) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_operation_never_runs(self, tmp_path):
+        """Cancelling a caller drops its operation if no worker has picked it up."""
+        chromadb, slow = await searchable_service(tmp_path, 0.2, chromadb_max_workers=1)
+
+        running = asyncio.create_task(chromadb.search_similar("first", k=3, score_threshold=0.0))
+        queued = asyncio.create_task(chromadb.search_similar("second", k=3, score_threshold=0.0))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+
+        assert len(await running) == 3
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await asyncio.sleep(0.05)
+        assert slow.calls == 1
@@ -0,0 +1,162 @@
+"""
+Tests for token-budgeted conversation memory.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.chatbot.agent import ChatbotAgent
+from src.chatbot.conversation_memory import SUMMARY_PREFIX, TokenBudgetMemory, estimate_tokens
+
+
+def call_report_table(rssd_id: int, rows: int = 400) -> str:
+    """Schedule RC-R style table an answer might paste into the conversation."""
+    lines = [f"Call report for RSSD {rssd_id}, 2024-12-31", "Item | Description | Amount (thousands)"]
+    lines += [f"RCFA{7200 + row} | Capital component {row} | {rssd_id * 7 + row * 113:,}" for row in range(rows)]
+    lines.append(f"Total | Tier 1 capital | {rssd_id * 11:,}")
+    return "\n".join(lines)
+
+
+def recording_summarizer(calls):
+    """Summarizer runnable recording its prompts and answering briefly."""
+    def summarize(prompt):
+        calls.append(prompt)
+        return f"summary {len(calls)}"
+    return RunnableLambda(summarize)
+
+
+def session(turns: int, table_every: int = 3):
+    """A banking session where every few answers paste a call report table."""
+    for turn in range(turns):
+        answer = call_report_table(1000 + turn) if turn % table_every == table_every - 1 else f"Bank {turn} has total assets of ${turn * 3.2:.1f}B."
+        yield f"Question {turn} about bank {turn}", answer
+
+
+class TestTokenBudgetMemory:
+    """Test budgeting, condensing and summarizing history."""
+
+    def test_window_keeps_newest_turns_within_budget(self):
+        """Older turns are dropped to honour the token and turn limits; the newest stay verbatim."""
+        memory = TokenBudgetMemory(max_tokens=200, max_turns=4, message_token_limit=None, rolling_summary=False)
+        for turn in range(10):
+            memory.save_context({"input": f"question {turn} " * 10}, {"output": f"answer {turn} " * 10})
+
+        contents = [message.content for message in memory.load_memory_variables({})["chat_history"]]
+
+        assert memory.token_count <= 200 and memory.token_count == sum(estimate_tokens(text) for text in contents)
+        assert contents[-1] == "answer 9 " * 10 and len(contents) == 6
+        assert memory.get_stats()["dropped_turns"] == 7
+
+        memory.max_tokens = None
+        memory.save_context({"input": "q"}, {"output": "a"})
+        assert memory.get_stats()["turns"] == 4
+
+    def test_bulky_messages_condensed_once(self):
+        """A pasted table is condensed by the summarizer, and the same table again comes from the cache."""
+        calls = []
+        memory = TokenBudgetMemory(max_tokens=5000, message_token_limit=300, summarizer=recording_summarizer(calls))
+        table = call_report_table(480228)
+
+        memory.save_context({"input": "Show the RC-R schedule"}, {"output": table})
+        memory.save_context({"input": "Show it again"}, {"output": table})
+
+        history = memory.load_memory_variables({})["chat_history"]
+        assert [message.content for message in history[1::2]] == ["summary 1", "summary 1"]
+        assert "480228" in calls[0] and "at most 225 words" in calls[0]
+        assert memory.get_stats()["summarizer_calls"] == 1 and memory.get_stats()["cache_hits"] == 1
+
+    def test_extractive_condensing_keeps_head_and_tail(self):
+        """Without a summarizer, long messages keep their beginning and end."""
+        memory = TokenBudgetMemory(message_token_limit=100)
+        table = call_report_table(852218)
+
+        memory.add_messages([HumanMessage(content="capital?"), AIMessage(content=table)])
+        condensed = memory.messages[1].content
+
+        assert condensed.startswith("Call report for RSSD 852218") and condensed.endswith(f"Tier 1 capital | {852218 * 11:,}")
+        assert "tokens omitted" in condensed and estimate_tokens(condensed) <= 110
+
+    @pytest.mark.asyncio
+    async def test_rolling_summary(self):
+        """Turns leaving the window are folded into a summary placed before the verbatim turns."""
+        calls = []
+        memory = TokenBudgetMemory(max_tokens=400, max_turns=3, summarizer=recording_summarizer(calls))
+        for question, answer in session(8, table_every=100):
+            await memory.asave_context({"input": question}, {"output": answer})
+
+        history = memory.messages
+        assert isinstance(history[0], SystemMessage) and history[0].content == SUMMARY_PREFIX + f"summary {len(calls)}"
+        assert [message.content for message in history[1::2]] == ["Question 5 about bank 5", "Question 6 about bank 6", "Question 7 about bank 7"]
+        assert "User: Question 0 about bank 0" in calls[0] and "Current summary:\nsummary 1" in calls[1]
+
+    def test_summary_fallbacks(self):
+        """A failing or missing summarizer still yields a bounded summary."""
+        def fail(prompt):
+            raise RuntimeError("model unavailable")
+
+        for summarizer in (None, RunnableLambda(fail)):
+            memory = TokenBudgetMemory(max_tokens=200, max_turns=2, summarizer=summarizer)
+            for question, answer in session(12, table_every=100):
+                memory.save_context({"input": question}, {"output": answer})
+
+            summary = memory.messages[0].content
+            assert "Assistant: Bank 9 has total assets" in summary and "Question 0" not in summary
+            assert memory.token_count <= 200 + 20
+
+    def test_resume_makes_no_model_calls(self):
+        """Resuming from a stored conversation condenses and summarizes extractively."""
+        calls = []
+        memory = TokenBudgetMemory(max_tokens=400, max_turns=3, message_token_limit=100, summarizer=recording_summarizer(calls))
+        stored = [message for question, answer in session(6) for message in (HumanMessage(content=question), AIMessage(content=answer))]
+
+        memory.resume(stored[-memory.resume_size:])
+
+        assert calls == [] and memory.summarizer is not None
+        assert memory.messages[-1].content.startswith("Call report for RSSD 1005") and "tokens omitted" in memory.messages[-1].content
+        assert memory.token_count <= 400
+
+    def test_from_settings(self):
+        """conversation_memory_type selects the behaviour; the budget comes from settings."""
+        settings = SimpleNamespace(conversation_memory_type="summary", max_conversation_turns=7, conversation_memory_max_tokens=1500, conversation_message_max_tokens=500)
+        llm = GenericFakeChatModel(messages=iter([]))
+
+        summary = TokenBudgetMemory.from_settings(settings, llm)
+        window = TokenBudgetMemory.from_settings(SimpleNamespace(**{**vars(settings), "conversation_memory_type": "buffer_window"}), llm)
+        buffer = TokenBudgetMemory.from_settings(SimpleNamespace(**{**vars(settings), "conversation_memory_type": "buffer"}), llm)
+
+        assert (summary.max_tokens, summary.max_turns, summary.message_token_limit, summary.rolling_summary) == (1500, 7, 500, True)
+        assert summary.summarizer is not None and window.summarizer is None and not window.rolling_summary
+        assert buffer.max_tokens is None and buffer.max_turns is None and buffer.message_token_limit is None
+
+    def test_simple_chain_prompt_bounded(self, tmp_path):
+        """The simple conversation chain sends the budgeted history, not the whole session."""
+        prompts = []
+
+        class RecordingModel(GenericFakeChatModel):
+            def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+                prompts.append(messages)
+                return super()._generate(messages, stop, run_manager, **kwargs)
+
+        answers = [answer for _, answer in session(10)]
+        settings = SimpleNamespace(
+            conversation_memory_type="buffer_window", max_conversation_turns=20,
+            conversation_memory_max_tokens=1000, conversation_message_max_tokens=300
+        )
+        with patch("src.chatbot.agent.create_azure_chat_openai", return_value=RecordingModel(messages=iter(answers))):
+            agent = ChatbotAgent(settings, persistence_file=str(tmp_path / "conversation"))
+        for question, _ in session(10):
+            agent.process_message(question)
+
+        assert len(agent.get_conversation_history()) == 20
+        assert max(sum(estimate_tokens(message.content) for message in prompt[1:]) for prompt in prompts) <= 1000
+        assert prompts[-1][-1].content == "Question 9 about bank 9"
@@ -0,0 +1,119 @@
+"""
+Tests for the append-only conversation store.
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, message_to_dict
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.chatbot.agent import ChatbotAgent
+from src.chatbot.conversation_store import AppendOnlyChatMessageHistory, ConversationStore
+from src.main import _load_conversation_log
+
+from tests.test_conversation_memory import session
+
+
+def make_agent(persistence_file, conversation_id="session-1", answers=()):
+    settings = SimpleNamespace(
+        conversation_memory_type="buffer_window", max_conversation_turns=3,
+        conversation_memory_max_tokens=3000, conversation_message_max_tokens=800
+    )
+    model = GenericFakeChatModel(messages=iter(answers))
+    with patch("src.chatbot.agent.create_azure_chat_openai", return_value=model):
+        return ChatbotAgent(settings, conversation_id=conversation_id, persistence_file=str(persistence_file))
+
+
+class TestConversationStore:
+    """Test the log, its index and recovery."""
+
+    def test_append_read_and_tail(self, tmp_path):
+        """Records are read back by range and from the end, also after reopening."""
+        store = ConversationStore(tmp_path / "log.jsonl")
+        store.append([{"n": i, "text": f"message {i} é"} for i in range(5)])
+        store.append([{"n": 5}])
+
+        reopened = ConversationStore(tmp_path / "log.jsonl")
+
+        assert len(store) == len(reopened) == 6
+        assert [record["n"] for record in reopened.read()] == list(range(6))
+        assert [record["n"] for record in reopened.read(2, 4)] == [2, 3]
+        assert [record["n"] for record in reopened.tail(2)] == [4, 5]
+        assert reopened.read(-1)[0]["n"] == 5 and reopened.tail(0) == [] and reopened.read(6) == []
+        assert (tmp_path / "log.jsonl.idx").stat().st_size == 6 * 8
+
+        reopened.clear()
+        assert len(reopened) == 0 and reopened.read() == [] and len(ConversationStore(tmp_path / "log.jsonl")) == 0
+
+    def test_index_rebuilt_after_interrupted_write(self, tmp_path):
+        """A missing index entry or a partially written line is repaired on open."""
+        path = tmp_path / "log.jsonl"
+        store = ConversationStore(path)
+        store.append([{"n": i} for i in range(3)])
+
+        # The log was written but the index was not
+        with open(path, "ab") as log:
+            log.write(b'{"n": 3}\n')
+        assert [record["n"] for record in ConversationStore(path).tail(2)] == [2, 3]
+
+        # A line cut short, and a lost index
+        with open(path, "ab") as log:
+            log.write(b'{"n": 4')
+        (tmp_path / "log.jsonl.idx").unlink()
+        store = ConversationStore(path)
+        store.append([{"n": 5}])
+
+        assert [record["n"] for record in store.read()] == [0, 1, 2, 3, 5]
+
+
+class TestPersistedConversations:
+    """Test agents and the CLI using the store."""
+
+    def test_agent_resumes_from_log(self, tmp_path):
+        """Turns are appended to the log, and a new agent resumes the window from its end."""
+        agent = make_agent(tmp_path / "conversation", answers=[answer for _, answer in session(5, table_every=100)])
+        for question, _ in session(5, table_every=100):
+            agent.process_message(question)
+
+        resumed = make_agent(tmp_path / "conversation", answers=["resumed answer"])
+        resumed.process_message("And bank 5?")
+
+        history = resumed.get_conversation_history()
+        assert len(history) == 12 and resumed.get_statistics()["total_messages"] == 12
+        assert history[-1].content == "resumed answer" and isinstance(history[0], HumanMessage)
+        assert [message.content for message in resumed.memory.messages[::2]] == ["Question 3 about bank 3", "Question 4 about bank 4", "And bank 5?"]
+
+        resumed.clear_conversation()
+        assert len(make_agent(tmp_path / "conversation").get_conversation_history()) == 0
+
+    def test_legacy_history_imported(self, tmp_path):
+        """A session saved as a JSON array is moved into the log on first use."""
+        legacy = tmp_path / "conversation_session-1.json"
+        legacy.write_text(json.dumps([message_to_dict(HumanMessage(content="hi")), message_to_dict(AIMessage(content="hello"))]))
+
+        agent = make_agent(tmp_path / "conversation")
+
+        assert [message.content for message in agent.get_conversation_history()] == ["hi", "hello"]
+        assert not legacy.exists() and (tmp_path / "conversation_session-1.jsonl").exists()
+        assert [message.content for message in agent.memory.messages] == ["hi", "hello"]
+
+    def test_show_conversation_log(self, tmp_path):
+        """show_conversation lists a log, or just its last messages."""
+        history = AppendOnlyChatMessageHistory(tmp_path / "conversation_abc.jsonl")
+        history.add_messages([HumanMessage(content="What is Wells Fargo's RSSD ID?"), AIMessage(content="451965")])
+
+        full = _load_conversation_log(str(tmp_path / "conversation_abc.jsonl"))
+        last = _load_conversation_log(str(tmp_path / "conversation_abc.jsonl"), last=1)
+
+        assert [(message["role"], message["content"]) for message in full["messages"]] == [
+            ("user", "What is Wells Fargo's RSSD ID?"), ("assistant", "451965")
+        ]
+        assert last["messages"] == full["messages"][1:] and last["metadata"]["message_count"] == 2
+        assert full["metadata"]["created_at"] == full["messages"][0]["timestamp"]
@@ -0,0 +1,102 @@
+"""
+Tests for the document catalog behind document listings and statistics.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management.database_manager import DatabaseManager
+from document_management.document_catalog import CATALOG_FILENAME, DocumentCatalog
+from document_management.document_models import IngestionFile
+
+from tests.helpers import FakeEmbeddings, LocalChromaDBService, make_pipeline, make_settings, text_file
+
+
+def make_database_manager(tmp_path, pipeline) -> DatabaseManager:
+    manager = DatabaseManager(make_settings(tmp_path))
+    manager.chromadb = pipeline.chromadb
+    return manager
+
+
+def refuse_chunk_loads(chromadb, monkeypatch):
+    """Make any listing that loads chunks fail."""
+    async def get_all_documents(*args, **kwargs):
+        raise AssertionError("chunks loaded for a listing")
+    monkeypatch.setattr(chromadb, "get_all_documents", get_all_documents)
+
+
+class TestDocumentCatalog:
+    """Test catalog records and their use by DatabaseManager."""
+
+    def test_records_follow_chunks(self, tmp_path):
+        """Counts follow added, moved and removed chunks; empty files disappear."""
+        catalog = DocumentCatalog(str(tmp_path))
+        catalog.add(["a", "b", "c"], [
+            {"filename": "call_report.pdf", "file_type": ".pdf", "file_size": 2048, "upload_timestamp": "2026-01-02"},
+            {"filename": "call_report.pdf", "file_type": ".pdf", "file_size": 2048, "upload_timestamp": "2026-01-02"},
+            {"filename": "policy.txt", "file_type": ".txt", "file_size": 10, "upload_timestamp": "2026-01-03"},
+        ])
+        catalog.add(["b"], [{"filename": "policy.txt", "file_type": ".txt", "file_size": 12, "upload_timestamp": "2026-01-04"}])
+        catalog.remove(["a"])
+
+        assert [(doc["filename"], doc["chunk_count"], doc["size_bytes"]) for doc in catalog.list_documents()] == [
+            ("policy.txt", 2, 12)
+        ]
+        catalog.add(["d"], [None])
+        assert catalog.filenames() == ["policy.txt"]
+        assert catalog.chunk_count() == 3
+
+    @pytest.mark.asyncio
+    async def test_listing_and_stats_without_loading_chunks(self, tmp_path, monkeypatch):
+        """Summaries, filenames and statistics come from the catalog."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        await pipeline.ingest([text_file("alpha", 3)])
+        await pipeline.ingest([text_file("beta", 5)])
+        manager = make_database_manager(tmp_path, pipeline)
+        refuse_chunk_loads(pipeline.chromadb, monkeypatch)
+
+        summary = await manager.get_documents_summary()
+        stats = await manager.get_document_stats()
+
+        assert [(doc["filename"], doc["chunk_count"]) for doc in summary] == [("beta.txt", 5), ("alpha.txt", 3)]
+        assert summary[0]["file_type"] == ".txt" and summary[0]["document_id"]
+        assert await manager.get_unique_filenames() == ["alpha.txt", "beta.txt"]
+        assert (stats["total_files"], stats["total_chunks"], stats["file_types"]) == (2, 8, {".txt": 2})
+        assert stats["total_size_bytes"] == sum(doc["size_bytes"] for doc in summary)
+
+    @pytest.mark.asyncio
+    async def test_deletes_and_updates_keep_catalog_in_sync(self, tmp_path):
+        """Deleting and incrementally updating a document update its record."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        original = text_file("handbook", 6)
+        await pipeline.ingest([original, text_file("obsolete", 2)])
+        manager = make_database_manager(tmp_path, pipeline)
+
+        await manager.delete_document_by_filename("obsolete.txt")
+        shorter = "\n\n".join(original.file_content.decode().split("\n\n")[:4])
+        await pipeline.update(
+            IngestionFile(file_path=original.file_path, file_content=shorter.encode()),
+            await pipeline.chromadb.get_chunk_metadata({"filename": "handbook.txt"})
+        )
+
+        summary = await manager.get_documents_summary()
+        assert [(doc["filename"], doc["chunk_count"], doc["size_bytes"]) for doc in summary] == [
+            ("handbook.txt", 4, len(shorter.encode()))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_catalog_is_rebuilt(self, tmp_path):
+        """A collection without a catalog gets one from a paged metadata scan."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        await pipeline.ingest([text_file("alpha", 3), text_file("beta", 5)])
+        expected = await pipeline.chromadb.list_documents()
+        (Path(make_settings(tmp_path).chromadb_storage_path) / CATALOG_FILENAME).unlink()
+
+        reopened = LocalChromaDBService(make_settings(tmp_path), FakeEmbeddings())
+
+        assert await reopened.list_documents() == expected
@@ -0,0 +1,115 @@
+"""
+Tests for the persistent chunk embedding cache.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management.embedding_cache import CachedEmbeddings, EmbeddingCache, embedding_cache_key
+from document_management.document_models import IngestionFile
+
+from tests.helpers import FakeEmbeddings, make_pipeline, text_file
+
+
+class RecordingEmbeddings(FakeEmbeddings):
+    """Fake embeddings remembering which texts reached the API."""
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(latency)
+        self.texts = []
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return super().embed_documents(texts)
+
+    async def aembed_documents(self, texts):
+        self.texts.extend(texts)
+        return await super().aembed_documents(texts)
+
+
+class TestEmbeddingCache:
+    """Test the SQLite embedding store."""
+
+    def test_keys_normalize_whitespace_and_include_deployment(self):
+        """Formatting-only differences share a key; deployments do not."""
+        assert embedding_cache_key("ada", "Tier 1  capital\n ratio ") == embedding_cache_key("ada", "Tier 1 capital ratio")
+        assert embedding_cache_key("ada", "capital") != embedding_cache_key("ada", "Capital")
+        assert embedding_cache_key("ada", "capital") != embedding_cache_key("large", "capital")
+
+    def test_round_trip_and_persistence(self, tmp_path):
+        """Stored embeddings are found again after reopening the cache."""
+        cache = EmbeddingCache(str(tmp_path), deployment="ada")
+        cache.put_many(["alpha", "beta"], [[0.5, 1.0], [2.0, -0.25]])
+        cache.close()
+
+        reopened = EmbeddingCache(str(tmp_path), deployment="ada")
+        other_deployment = EmbeddingCache(str(tmp_path), deployment="large")
+
+        assert reopened.get_many(["beta", "gamma", "alpha"]) == [[2.0, -0.25], None, [0.5, 1.0]]
+        assert other_deployment.get_many(["alpha"]) == [None]
+        assert reopened.stats()["hit_rate"] == pytest.approx(2 / 3, abs=1e-3)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Entries used least recently are evicted beyond max_entries."""
+        cache = EmbeddingCache(str(tmp_path), deployment="ada", max_entries=3)
+        cache.put_many(["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        time.sleep(0.01)
+        cache.get_many(["a"])
+        time.sleep(0.01)
+        cache.put_many(["d", "e"], [[4.0], [5.0]])
+
+        assert cache.get_many(["a", "b", "c", "d", "e"]) == [[1.0], None, None, [4.0], [5.0]]
+        assert cache.stats()["evictions"] == 2
+        assert cache.stats()["total_entries"] == 3
+
+
+class TestCachedEmbeddings:
+    """Test the embeddings wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_only_missing_texts_reach_the_api(self, tmp_path):
+        """Cached and repeated texts are not sent again."""
+        api = RecordingEmbeddings()
+        embeddings = CachedEmbeddings(api, EmbeddingCache(str(tmp_path), deployment="ada"))
+        requested = []
+
+        async def before_request(texts):
+            requested.append(list(texts))
+
+        first = embeddings.embed_documents(["loan growth", "deposit mix"])
+        second = await embeddings.aembed_documents(
+            ["deposit mix", "net interest margin", "net interest margin"],
+            before_request=before_request
+        )
+
+        assert api.texts == ["loan growth", "deposit mix", "net interest margin"]
+        assert requested == [["net interest margin"]]
+        assert second[0] == pytest.approx(first[1])
+        assert second[1] == second[2]
+
+    @pytest.mark.asyncio
+    async def test_reingesting_revision_embeds_changed_chunks_only(self, tmp_path):
+        """Re-uploading a revised document only embeds the chunks that changed."""
+        api = RecordingEmbeddings()
+        pipeline = make_pipeline(tmp_path, api)
+        original = text_file("manual", 20)
+        revised_text = original.file_content.decode().replace("manual paragraph 7:", "manual paragraph 7 (revised):")
+        revised = IngestionFile(file_path=original.file_path, file_content=revised_text.encode())
+
+        first = await pipeline.ingest([original])
+        first_calls = len(api.texts)
+        await pipeline.ingest([original])
+        repeat_calls = len(api.texts) - first_calls
+        third = await pipeline.ingest([revised])
+
+        assert first[0].success and third[0].success
+        assert first_calls == first[0].document_info.chunk_count
+        assert repeat_calls == 0
+        assert 0 < len(api.texts) - first_calls <= 2
+        assert pipeline.chromadb.embedding_cache.stats()["hits"] >= 2 * first_calls - 2
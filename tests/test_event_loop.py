@@ -0,0 +1,66 @@
+"""
+Tests for the process-wide event loop used by synchronous callers.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.utils.event_loop import get_event_loop, iterate_sync, run_sync
+
+
+
+async def running_loop():
+    return asyncio.get_running_loop()
+
+
+class TestEventLoop:
+    """Test running coroutines from synchronous code."""
+
+    def test_calls_share_one_loop(self):
+        """Every synchronous call runs on the same long-lived loop and thread."""
+        loops = {run_sync(running_loop()) for _ in range(3)}
+
+        assert loops == {get_event_loop()}
+        assert get_event_loop().is_running()
+        with pytest.raises(ValueError, match="bad"):
+            run_sync(_fail("bad"))
+
+    @pytest.mark.asyncio
+    async def test_callers_inside_event_loops(self):
+        """Callers in other loops and on the shared loop itself do not deadlock."""
+        async def nested():
+            # A synchronous shim called from code running on the shared loop
+            return run_sync(running_loop())
+
+        assert run_sync(running_loop()) is get_event_loop()
+        assert run_sync(nested()) is not get_event_loop()
+
+    def test_iterate_sync(self):
+        """Async generators are driven on the shared loop and closed early."""
+        closed = []
+
+        async def numbers():
+            try:
+                for i in range(5):
+                    yield i, asyncio.get_running_loop()
+            finally:
+                closed.append(True)
+
+        items = []
+        for i, loop in iterate_sync(numbers()):
+            items.append(i)
+            if i == 2:
+                break
+
+        assert items == [0, 1, 2] and loop is get_event_loop()
+        assert closed == [True]
+
+
+async def _fail(message):
+    raise ValueError(message)
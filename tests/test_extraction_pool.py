@@ -0,0 +1,175 @@
+"""
+Tests for process-pool text extraction with PDF page-range splitting.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management.document_models import IngestionFile
+
+from tests.helpers import FakeEmbeddings, make_pipeline
+from tests.test_streaming_extraction import make_pdf, make_processor, manual_pages
+
+
+class TestExtractionPool:
+    """Test extraction in worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_page_ranges_reassembled_in_order(self, tmp_path):
+        """A PDF split across workers yields the same pages as extracting it whole."""
+        content = make_pdf(manual_pages(10, lines=3)[:4] + [[]] + manual_pages(10, lines=3)[5:])
+        path = tmp_path / "manual.pdf"
+        path.write_bytes(content)
+        processor = make_processor(tmp_path, ingestion_extract_workers=2, pdf_pages_per_extraction_task=3)
+        expected = list(processor.iter_text(path))
+        try:
+            from_memory = await processor.extract_segments(Path("manual.pdf"), content)
+            from_disk = await processor.extract_segments(path)
+        finally:
+            processor.close()
+
+        assert from_memory == from_disk == expected
+        assert [page for _, page in expected] == [1, 2, 3, 4, 6, 7, 8, 9, 10]
+
+    @pytest.mark.asyncio
+    async def test_short_pdf_sent_to_one_worker_task(self, tmp_path):
+        """A PDF within pages_per_task is counted and extracted by a single task."""
+        processor = make_processor(tmp_path, ingestion_extract_workers=1, pdf_pages_per_extraction_task=4)
+        pool = processor.get_extraction_pool()
+        submitted = []
+        submit = pool._submit
+
+        async def record_submit(func, *args):
+            submitted.append(func.__name__)
+            return await submit(func, *args)
+
+        pool._submit = record_submit
+        try:
+            segments = await processor.extract_segments(Path("short.pdf"), make_pdf(manual_pages(3, lines=3)))
+        finally:
+            processor.close()
+
+        assert [page for _, page in segments] == [1, 2, 3]
+        assert submitted == ["extract_short_pdf_in_worker"]
+
+    @pytest.mark.asyncio
+    async def test_errors_and_other_formats(self, tmp_path):
+        """Extraction errors surface from the workers; TXT files are extracted whole."""
+        processor = make_processor(tmp_path, ingestion_extract_workers=1, pdf_pages_per_extraction_task=2)
+        try:
+            with pytest.raises(ValueError, match="No text content extracted from PDF"):
+                await processor.extract_segments(Path("scanned.pdf"), make_pdf([[], [], [], [], []]))
+            with pytest.raises(ValueError, match="empty"):
+                await processor.extract_segments(Path("blank.txt"), b"   \n")
+            segments = await processor.extract_segments(Path("notes.txt"), b"call report notes")
+        finally:
+            processor.close()
+
+        assert segments == [("call report notes", None)]
+
+    @pytest.mark.asyncio
+    async def test_timeout_replaces_workers(self, tmp_path):
+        """A file over its time limit fails and the pool keeps serving other files."""
+        content = make_pdf(manual_pages(6, lines=3))
+        processor = make_processor(tmp_path, ingestion_extract_workers=1, extraction_timeout_seconds=0.001)
+        try:
+            with pytest.raises(TimeoutError, match="timed out"):
+                await processor.extract_segments(Path("slow.pdf"), content)
+            processor.get_extraction_pool().timeout_seconds = 300
+            segments = await processor.extract_segments(Path("slow.pdf"), content)
+        finally:
+            processor.close()
+
+        assert len(segments) == 6
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, tmp_path):
+        """process_multiple_files parses PDFs in the pool while other coroutines keep running."""
+        files = [(Path(f"manual{i}.pdf"), make_pdf(manual_pages(30))) for i in range(3)]
+        processor = make_processor(tmp_path, ingestion_extract_workers=2, pdf_pages_per_extraction_task=10)
+        await processor.extract_segments(Path("warmup.txt"), b"warm up")
+        gaps = []
+
+        async def heartbeat():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.005)
+                gaps.append(time.perf_counter() - last)
+                last = time.perf_counter()
+
+        ticker = asyncio.create_task(heartbeat())
+        try:
+            chunks = await processor.process_multiple_files(files)
+        finally:
+            ticker.cancel()
+            processor.close()
+
+        assert {chunk.metadata["filename"] for chunk in chunks} == {path.name for path, _ in files}
+        assert max(gaps) < 0.5
+
+    @pytest.mark.asyncio
+    async def test_pipeline_splits_large_pdf(self, tmp_path):
+        """The ingestion pipeline chunks PDFs extracted by page range with their page numbers."""
+        pipeline = make_pipeline(
+            tmp_path, FakeEmbeddings(), ingestion_extract_workers=2, pdf_pages_per_extraction_task=4
+        )
+        try:
+            results = await pipeline.ingest([
+                IngestionFile(file_path=Path("manual.pdf"), file_content=make_pdf(manual_pages(12, lines=10)))
+            ])
+            stored = await pipeline.chromadb.get_chunk_metadata({"filename": "manual.pdf"})
+        finally:
+            pipeline.close()
+
+        assert results[0].success
+        assert {metadata["page"] for metadata in stored.values()} == set(range(1, 13))
+
+
+@pytest.mark.slow
+class TestExtractionPoolBenchmark:
+    """Compare extraction on a thread with extraction in worker processes."""
+
+    FILES = 6
+    PAGES = 60
+
+    def test_multi_file_corpus(self, tmp_path):
+        """Extraction throughput scales with the worker processes available."""
+        corpus = [(Path(f"manual{i}.pdf"), make_pdf(manual_pages(self.PAGES))) for i in range(self.FILES)]
+        large = [(Path("large.pdf"), make_pdf(manual_pages(self.PAGES * self.FILES)))]
+        workers = os.cpu_count() or 1
+
+        def measure(files, **settings):
+            processor = make_processor(tmp_path, **settings)
+            if processor.get_extraction_pool() is not None:
+                # Start the workers and load the extraction modules before timing
+                asyncio.run(processor.process_multiple_files([(Path(f"warmup{i}.txt"), b"warm up") for i in range(workers)]))
+            try:
+                start = time.perf_counter()
+                chunks = asyncio.run(processor.process_multiple_files(files))
+                return time.perf_counter() - start, len(chunks)
+            finally:
+                processor.close()
+
+        timings = {}
+        for label, files in (("corpus", corpus), ("large", large)):
+            thread_seconds, thread_chunks = measure(files, ingestion_extract_workers=0)
+            pool_seconds, pool_chunks = measure(
+                files, ingestion_extract_workers=workers, pdf_pages_per_extraction_task=self.PAGES // 2
+            )
+            assert pool_chunks == thread_chunks
+            timings[label] = (thread_seconds, pool_seconds)
+
+        # A single core only shows that the pool adds little overhead
+        if workers < 2:
+            assert timings["corpus"][1] < timings["corpus"][0] * 1.5
+        else:
+            assert timings["corpus"][1] < timings["corpus"][0] * 0.8
+            assert timings["large"][1] < timings["large"][0] * 0.8
@@ -0,0 +1,260 @@
+"""
+Tests for the BM25 keyword index and hybrid retrieval.
+"""
+
+import hashlib
+import random
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management import chromadb_service
+from document_management.document_models import IngestionFile
+from document_management.keyword_index import KeywordIndex, tokenize
+from rag_access.rag_models import RAGQuery
+from rag_access.rank_fusion import reciprocal_rank_fusion
+from rag_access.search_service import SearchService
+
+from tests.helpers import FakeEmbeddings, LocalChromaDBService, make_pipeline, make_settings
+
+
+class BagOfWordsEmbeddings(FakeEmbeddings):
+    """
+    Hashed bag-of-words embeddings that blur identifiers.
+
+    Digits are dropped before hashing, so "RCON2170" and "RCON3210" embed
+    alike, much as real embedding models treat codes they have no meaning for.
+    """
+
+    DIMENSIONS = 256
+
+    def _vector(self, text):
+        vector = np.zeros(self.DIMENSIONS)
+        for word in re.findall(r"[a-z]+", text.lower()):
+            vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.DIMENSIONS] += 1
+        norm = np.linalg.norm(vector)
+        return list(vector / norm) if norm else list(vector)
+
+
+def call_report_corpus(count: int, seed: int = 3) -> list:
+    """Synthetic call report instructions, one MDRM code per paragraph."""
+    rng = random.Random(seed)
+    schedules = ["RC", "RC-B", "RC-C", "RC-E", "RC-N", "RC-R", "RI", "RI-A"]
+    topics = ["loans secured by real estate", "deposits of individuals", "available-for-sale securities",
+              "past due and nonaccrual loans", "regulatory capital components", "interest income on loans"]
+    codes = rng.sample(range(10000, 99999), count)
+    return [
+        (f"RCON{code}", f"Schedule {rng.choice(schedules)} item {i}: report {rng.choice(topics)} "
+                        f"in RCON{code}, consistent with the instructions for {rng.choice(topics)}.")
+        for i, code in enumerate(codes)
+    ]
+
+
+class TestKeywordIndex:
+    """Test tokenizing, ranking and persistence."""
+
+    def test_tokenize_identifiers(self):
+        """Codes and compound identifiers are kept whole and split into parts."""
+        assert tokenize("Schedule RC-R, item RCON2170 under 12 CFR 225.4") == [
+            "schedule", "rc-r", "rc", "item", "rcon2170", "under", "12", "cfr", "225.4", "225"
+        ]
+
+    def test_bm25_ranking(self):
+        """Rare identifiers outrank common words."""
+        index = KeywordIndex()
+        index.add(["a", "b", "c"], [
+            "total assets reported in RCON2170",
+            "total assets and total deposits",
+            "total deposits reported in RCON2200",
+        ])
+
+        assert index.search("RCON2170 total assets")[0][0] == "a"
+        assert {chunk_id for chunk_id, _ in index.search("deposits")} == {"b", "c"}
+        assert index.search("unrelated") == []
+
+    def test_remove_and_replace(self):
+        """Removed chunks stop matching and re-added IDs replace their text."""
+        index = KeywordIndex()
+        index.add(["a", "b"], ["net interest margin", "net charge-offs"])
+        index.remove(["a"])
+        index.add(["b"], ["tier 1 leverage ratio"])
+
+        assert index.search("net") == []
+        assert [chunk_id for chunk_id, _ in index.search("leverage")] == ["b"]
+        assert len(index) == 1
+
+    def test_journal_and_snapshot_persistence(self, tmp_path):
+        """Reopened indexes replay the journal; flushing compacts tombstones."""
+        corpus = call_report_corpus(2500)
+        index = KeywordIndex(str(tmp_path))
+        index.add([code for code, _ in corpus], [text for _, text in corpus])
+        index.remove([code for code, _ in corpus[:1200]])
+        expected = index.search(f"{corpus[2000][0]} regulatory capital", k=5)
+
+        replayed = KeywordIndex(str(tmp_path))
+        assert replayed.search(f"{corpus[2000][0]} regulatory capital", k=5) == expected
+        assert replayed.stats()["tombstones"] == 1200
+
+        replayed.flush()
+        assert replayed.stats()["tombstones"] == 0
+        assert replayed.stats()["journal_entries"] == 0
+        reopened = KeywordIndex(str(tmp_path))
+        assert len(reopened) == 1300
+        assert [chunk_id for chunk_id, _ in reopened.search(corpus[2000][0], k=1)] == [corpus[2000][0]]
+        assert reopened.search(corpus[5][0]) == []
+
+
+class TestHybridSearch:
+    """Test keyword search in ChromaDB and rank fusion in SearchService."""
+
+    def test_reciprocal_rank_fusion(self):
+        """Results found by both retrievers rise to the top."""
+        vector = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        keyword = [{"id": "c"}, {"id": "d"}]
+
+        fused = reciprocal_rank_fusion([vector, keyword], k=60)
+
+        assert [result["id"] for result, _ in fused] == ["c", "a", "b", "d"]
+        assert fused[0][1] == pytest.approx(1 / 63 + 1 / 61)
+
+    @pytest.mark.asyncio
+    async def test_index_follows_collection(self, tmp_path):
+        """Ingestion and deletes keep the keyword index in sync, and a lost index is rebuilt."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        corpus = call_report_corpus(30)
+        text = "\n\n".join(text for _, text in corpus)
+        await pipeline.ingest([IngestionFile(file_path=Path("instructions.txt"), file_content=text.encode())])
+        chromadb = pipeline.chromadb
+        code = corpus[17][0]
+
+        hits = await chromadb.keyword_search(code, k=3)
+        assert code in hits[0]["content"]
+        assert hits[0]["id"] and hits[0]["metadata"]["filename"] == "instructions.txt"
+        assert await chromadb.keyword_search(code, k=3, filter_metadata={"filename": "other.txt"}) == []
+
+        # A lost index is noticed when the next process opens the collection, and rebuilt page by page
+        index_dir = Path(make_settings(tmp_path).chromadb_storage_path) / "keyword_index"
+        shutil.rmtree(index_dir)
+        chromadb_service._keyword_indexes.clear()
+        page_sizes = []
+        scan = LocalChromaDBService._scan_collection
+
+        async def small_pages(self, include, page_size=1000):
+            async for page in scan(self, include, page_size=8):
+                page_sizes.append(len(page["ids"]))
+                yield page
+
+        with patch.object(LocalChromaDBService, "_scan_collection", small_pages):
+            rebuilt = LocalChromaDBService(make_settings(tmp_path), FakeEmbeddings())
+            assert code in (await rebuilt.keyword_search(code, k=1))[0]["content"]
+        assert len(page_sizes) > 1 and max(page_sizes) <= 8
+        assert sum(page_sizes) == len(rebuilt.keyword_index) == chromadb._db._collection.count()
+        assert (index_dir / "journal.jsonl").stat().st_size == 0
+
+        await chromadb.delete_documents_by_filter({"filename": "instructions.txt"})
+        assert await chromadb.keyword_search(code) == []
+
+    @pytest.mark.asyncio
+    async def test_uploads_visible_to_other_services(self, tmp_path):
+        """Chunks written through one service are keyword-searchable through a service opened earlier."""
+        searcher = LocalChromaDBService(make_settings(tmp_path), FakeEmbeddings())
+        assert await searcher.keyword_search("RCON2170") == []
+
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        text = "Report total assets in RCON2170 on Schedule RC."
+        await pipeline.ingest([IngestionFile(file_path=Path("schedule_rc.txt"), file_content=text.encode())])
+
+        hits = await searcher.keyword_search("RCON2170", k=1)
+        assert searcher.keyword_index is pipeline.chromadb.keyword_index
+        assert hits and hits[0]["metadata"]["filename"] == "schedule_rc.txt"
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_finds_identifiers(self, tmp_path):
+        """A query for an MDRM code retrieves its paragraph."""
+        corpus = call_report_corpus(60)
+        text = "\n\n".join(text for _, text in corpus)
+        pipeline = make_pipeline(tmp_path, BagOfWordsEmbeddings())
+        await pipeline.ingest([IngestionFile(file_path=Path("instructions.txt"), file_content=text.encode())])
+
+        settings = make_settings(tmp_path)
+        service = SearchService(settings)
+        service.database_manager.chromadb = LocalChromaDBService(settings, BagOfWordsEmbeddings())
+        results = await service._search_documents(
+            RAGQuery(query=f"What belongs in {corpus[42][0]}?", max_chunks=3, score_threshold=0.0)
+        )
+
+        assert any(corpus[42][0] in result.content for result in results)
+        assert results[0].score > results[-1].score
+
+
+@pytest.mark.slow
+class TestHybridSearchBenchmark:
+    """Latency and recall of keyword and hybrid retrieval on a local corpus."""
+
+    CHUNKS = 20000
+    QUERIES = 50
+
+    def test_keyword_index_latency(self, tmp_path):
+        """Indexed BM25 search is far faster than scanning chunk texts."""
+        corpus = call_report_corpus(self.CHUNKS)
+        ids, texts = [code for code, _ in corpus], [text for _, text in corpus]
+        queries = [f"{code} real estate" for code, _ in random.Random(5).sample(corpus, self.QUERIES)]
+
+        start = time.perf_counter()
+        index = KeywordIndex(str(tmp_path))
+        for batch in range(0, self.CHUNKS, 256):
+            index.add(ids[batch:batch + 256], texts[batch:batch + 256])
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [index.search(query, k=5) for query in queries]
+        search_seconds = (time.perf_counter() - start) / self.QUERIES
+
+        # Baseline: count query term occurrences in every chunk
+        start = time.perf_counter()
+        for query in queries[:5]:
+            terms = tokenize(query)
+            sorted(range(len(texts)), key=lambda i: -sum(texts[i].lower().count(term) for term in terms))[:5]
+        scan_seconds = (time.perf_counter() - start) / 5
+
+        assert all(result[0][0] == query.split()[0] for result, query in zip(results, queries))
+        assert search_seconds * 10 < scan_seconds
+        assert build_seconds < 30
+
+    @pytest.mark.asyncio
+    async def test_identifier_recall(self, tmp_path):
+        """Hybrid retrieval finds identifier paragraphs that vector search misses."""
+        corpus = call_report_corpus(400)
+        text = "\n\n".join(text for _, text in corpus)
+        pipeline = make_pipeline(tmp_path, BagOfWordsEmbeddings())
+        await pipeline.ingest([IngestionFile(file_path=Path("instructions.txt"), file_content=text.encode())])
+        targets = random.Random(11).sample(corpus, 25)
+
+        recall, latency = {}, {}
+        for hybrid in (False, True):
+            settings = make_settings(tmp_path, hybrid_search_enabled=hybrid, search_cache_ttl_seconds=0)
+            service = SearchService(settings)
+            service.database_manager.chromadb = LocalChromaDBService(settings, BagOfWordsEmbeddings())
+            found = 0
+            start = time.perf_counter()
+            for code, _ in targets:
+                results = await service._search_documents(
+                    RAGQuery(query=f"How is {code} reported?", max_chunks=5, score_threshold=0.0)
+                )
+                found += any(code in result.content for result in results)
+            latency[hybrid] = (time.perf_counter() - start) / len(targets)
+            recall[hybrid] = found / len(targets)
+
+        assert recall[True] == 1.0
+        assert recall[True] > recall[False]
+        # Fusing in the keyword index costs far less than the vector search it complements
+        assert latency[True] < latency[False] * 3
@@ -0,0 +1,135 @@
+"""
+Tests for incremental document re-ingestion with chunk diffing.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management.document_manager import DocumentManager
+from document_management.document_models import IngestionFile
+
+from tests.test_embedding_cache import RecordingEmbeddings
+from tests.helpers import FakeEmbeddings, LocalChromaDBService, make_pipeline, make_settings, text_file
+
+
+def revise(file: IngestionFile, old: str, new: str) -> IngestionFile:
+    text = file.file_content.decode()
+    assert old in text
+    return IngestionFile(file_path=file.file_path, file_content=text.replace(old, new).encode())
+
+
+async def stored_chunks(pipeline, filename: str) -> dict:
+    return await pipeline.chromadb.get_chunk_metadata({"filename": filename})
+
+
+class TestIncrementalUpdate:
+    """Test diffing a new document version against stored chunks."""
+
+    @pytest.mark.asyncio
+    async def test_small_edit_touches_one_chunk(self, tmp_path):
+        """Only the edited chunk is embedded; unchanged chunks keep their entries."""
+        api = RecordingEmbeddings()
+        pipeline = make_pipeline(tmp_path, api, embedding_cache_path=None)
+        original = text_file("handbook", 20)
+        uploaded = (await pipeline.ingest([original]))[0]
+        before = await stored_chunks(pipeline, "handbook.txt")
+        api.texts.clear()
+
+        result = await pipeline.update(revise(original, "paragraph 7:", "paragraph 7 (amended):"), before)
+        after = await stored_chunks(pipeline, "handbook.txt")
+
+        assert result.success
+        assert (result.added_chunks, result.removed_chunks, result.unchanged_chunks) == (1, 1, 19)
+        assert len(api.texts) == 1 and "amended" in api.texts[0]
+        assert len(after) == 20
+        assert len(set(after) & set(before)) == 19
+        assert result.document_info.document_id == uploaded.document_info.document_id
+        assert {m["document_id"] for m in after.values()} == {uploaded.document_info.document_id}
+        assert sorted(m["chunk_index"] for m in after.values()) == list(range(20))
+        assert sorted(result.document_info.chunk_ids) == sorted(after)
+
+    @pytest.mark.asyncio
+    async def test_removed_and_appended_sections(self, tmp_path):
+        """Dropped sections are deleted and appended sections inserted."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        original = text_file("policy", 10)
+        await pipeline.ingest([original])
+        text = original.file_content.decode().split("\n\n")
+        closing = "A new closing section on liquidity stress testing and contingency funding plans for the holding company."
+        revised_text = "\n\n".join(text[:6] + [text[6].replace("policy", "appendix"), closing])
+        revised = IngestionFile(file_path=original.file_path, file_content=revised_text.encode())
+
+        result = await pipeline.update(revised, await stored_chunks(pipeline, "policy.txt"))
+        after = await stored_chunks(pipeline, "policy.txt")
+
+        assert (result.added_chunks, result.removed_chunks, result.unchanged_chunks) == (2, 4, 6)
+        assert len(after) == 8
+        assert pipeline.chromadb._db._collection.count() == 8
+
+    @pytest.mark.asyncio
+    async def test_chunks_without_content_hash(self, tmp_path):
+        """Chunks stored before content hashes were recorded are hashed from their text."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        original = text_file("legacy", 6)
+        await pipeline.ingest([original])
+        before = await stored_chunks(pipeline, "legacy.txt")
+        legacy = {chunk_id: {k: v for k, v in m.items() if k != "content_hash"} for chunk_id, m in before.items()}
+        await pipeline.chromadb.update_chunk_metadata(list(legacy), list(legacy.values()))
+
+        result = await pipeline.update(original, await stored_chunks(pipeline, "legacy.txt"))
+
+        assert (result.added_chunks, result.removed_chunks, result.unchanged_chunks) == (0, 0, 6)
+
+    @pytest.mark.asyncio
+    async def test_failed_update_keeps_previous_version(self, tmp_path):
+        """An embedding failure leaves the stored document untouched."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings(fail_on="broken"))
+        original = text_file("stable", 8)
+        await pipeline.ingest([original])
+        before = await stored_chunks(pipeline, "stable.txt")
+
+        result = await pipeline.update(revise(original, "paragraph 3:", "paragraph 3 broken:"), before)
+
+        assert not result.success and "deployment unavailable" in result.error
+        assert await stored_chunks(pipeline, "stable.txt") == before
+
+    @pytest.mark.asyncio
+    async def test_failed_removal_restores_metadata(self, tmp_path):
+        """A failed removal of outdated chunks also restores the refreshed metadata."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        original = text_file("ledger", 8)
+        await pipeline.ingest([original])
+        before = await stored_chunks(pipeline, "ledger.txt")
+        delete = pipeline.chromadb.delete_documents_by_ids
+        calls = []
+
+        async def fail_first_delete(ids):
+            calls.append(ids)
+            return False if len(calls) == 1 else await delete(ids)
+
+        pipeline.chromadb.delete_documents_by_ids = fail_first_delete
+        result = await pipeline.update(revise(original, "paragraph 3:", "paragraph 3 (amended):"), before)
+
+        assert not result.success and "outdated chunks" in result.error
+        assert len(calls) == 2
+        assert await stored_chunks(pipeline, "ledger.txt") == before
+
+    @pytest.mark.asyncio
+    async def test_manager_uploads_unknown_document(self, tmp_path):
+        """Updating a document that is not stored yet uploads it in full."""
+        settings = make_settings(tmp_path)
+        manager = DocumentManager(settings)
+        manager.database_manager.chromadb = LocalChromaDBService(settings, FakeEmbeddings())
+        first = text_file("fresh", 5)
+
+        created = await manager.update_document(first.file_path, first.file_content)
+        updated = await manager.update_document(first.file_path, revise(first, "paragraph 4:", "paragraph 4 (new):").file_content)
+
+        assert created.success and created.added_chunks == 5
+        assert updated.success and (updated.added_chunks, updated.removed_chunks, updated.unchanged_chunks) == (1, 1, 4)
+        assert (await manager.get_statistics()).total_chunks == 5
@@ -0,0 +1,149 @@
+"""
+Tests for the concurrent document ingestion pipeline.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management.document_models import IngestionFile
+from document_management.ingestion_pipeline import EmbeddingRateLimiter
+
+from tests.helpers import FakeEmbeddings, make_pipeline, text_file
+
+
+class TestIngestionPipeline:
+    """Test staged ingestion into ChromaDB."""
+
+    @pytest.mark.asyncio
+    async def test_ingests_multiple_files(self, tmp_path):
+        """Every file is chunked, embedded and stored with its own chunk ids."""
+        embeddings = FakeEmbeddings()
+        pipeline = make_pipeline(tmp_path, embeddings)
+        files = [text_file(f"report{i}", 10 + i) for i in range(4)]
+        finished = []
+
+        results = await pipeline.ingest(files, on_result=lambda index, result: finished.append(index))
+
+        assert all(result.success for result in results)
+        assert sorted(finished) == [0, 1, 2, 3]
+        assert [r.document_info.filename for r in results] == [f"report{i}.txt" for i in range(4)]
+
+        collection = pipeline.chromadb._db._collection
+        for result in results:
+            info = result.document_info
+            assert len(info.chunk_ids) == info.chunk_count > 1
+            stored = collection.get(ids=info.chunk_ids, include=["metadatas"])
+            assert {m["document_id"] for m in stored["metadatas"]} == {info.document_id}
+        assert collection.count() == sum(r.document_info.chunk_count for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_file_is_isolated(self, tmp_path):
+        """An unsupported or empty file fails without affecting the others."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        files = [
+            text_file("good", 5),
+            IngestionFile(file_path=Path("image.png"), file_content=b"\x89PNG"),
+            IngestionFile(file_path=Path("empty.txt"), file_content=b"   "),
+        ]
+
+        results = await pipeline.ingest(files)
+
+        assert results[0].success
+        assert not results[1].success and "Unsupported" in results[1].error
+        assert not results[2].success
+        assert pipeline.chromadb._db._collection.count() == results[0].document_info.chunk_count
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_removes_written_chunks(self, tmp_path):
+        """A document whose embedding fails leaves no chunks behind."""
+        embeddings = FakeEmbeddings(fail_on="broken paragraph 30")
+        pipeline = make_pipeline(tmp_path, embeddings, embedding_batch_size=4, chromadb_write_batch_size=4)
+
+        results = await pipeline.ingest([text_file("broken", 40), text_file("fine", 3)])
+
+        assert not results[0].success and "Embedding failed" in results[0].error
+        assert results[1].success
+        collection = pipeline.chromadb._db._collection
+        assert collection.count() == results[1].document_info.chunk_count
+        assert collection.get(where={"filename": "broken.txt"})["ids"] == []
+
+    @pytest.mark.asyncio
+    async def test_embedding_concurrency_is_bounded(self, tmp_path):
+        """No more than embedding_concurrency batches are in flight at once."""
+        embeddings = FakeEmbeddings(latency=0.01)
+        pipeline = make_pipeline(tmp_path, embeddings, embedding_concurrency=2, embedding_batch_size=2)
+
+        results = await pipeline.ingest([text_file(f"doc{i}", 8) for i in range(3)])
+
+        assert all(result.success for result in results)
+        assert embeddings.max_active == 2
+
+    def test_process_pool_extraction(self, tmp_path):
+        """Text extracted in a worker process feeds the rest of the pipeline."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings(), ingestion_extract_workers=1)
+        try:
+            results = asyncio.run(pipeline.ingest([text_file("pooled", 6)]))
+        finally:
+            pipeline.close()
+
+        assert results[0].success
+        assert results[0].document_info.chunk_count > 1
+
+
+class TestEmbeddingRateLimiter:
+    """Test request and token quotas."""
+
+    @pytest.mark.asyncio
+    async def test_request_quota_waits(self):
+        """Requests beyond the bucket wait for it to refill."""
+        limiter = EmbeddingRateLimiter(requests_per_minute=600)  # 10 per second
+
+        waits = [await limiter.acquire(1) for _ in range(602)]
+
+        assert sum(waits[:600]) == 0
+        assert sum(waits) == pytest.approx(0.2, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_token_quota_waits(self):
+        """Large requests wait until enough tokens are available."""
+        limiter = EmbeddingRateLimiter(tokens_per_minute=6000)  # 100 per second
+
+        assert await limiter.acquire(6000) == 0
+        assert await limiter.acquire(10) == pytest.approx(0.1, abs=0.05)
+
+
+@pytest.mark.slow
+class TestIngestionBenchmark:
+    """Compare sequential uploads with the pipeline."""
+
+    FILES = 8
+    LATENCY = 0.02
+
+    @pytest.mark.asyncio
+    async def test_pipeline_overlaps_embedding(self, tmp_path):
+        """Concurrent batched embedding beats one file and one request at a time."""
+        files = [text_file(f"bench{i}", 30) for i in range(self.FILES)]
+
+        # Previous path: process each file, then embed and store its chunks
+        sequential = make_pipeline(tmp_path / "sequential", FakeEmbeddings(self.LATENCY))
+        start = time.perf_counter()
+        for file in files:
+            chunks = await sequential.processor.process_file(file.file_path, file.file_content, file.source_name)
+            await sequential.chromadb.add_documents(chunks, batch_size=sequential.embed_batch_size)
+        sequential_seconds = time.perf_counter() - start
+
+        embeddings = FakeEmbeddings(self.LATENCY)
+        pipeline = make_pipeline(tmp_path / "pipeline", embeddings)
+        start = time.perf_counter()
+        results = await pipeline.ingest(files)
+        pipeline_seconds = time.perf_counter() - start
+
+        assert all(result.success for result in results)
+        assert pipeline_seconds < sequential_seconds
@@ -0,0 +1,212 @@
+"""
+Tests for the semantic response cache.
+"""
+
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.chatbot.agent import ChatbotAgent
+from src.chatbot.response_cache import (
+    SemanticResponseCache, is_standalone, latest_report_date, question_entities, question_scope
+)
+
+from tests.tools.conversation_simulations.test_parallel_tool_calls import ScriptedToolModel, SlowTool
+
+
+class KeywordEmbeddings(Embeddings):
+    """Bag-of-keywords embedding: questions with the same keywords embed identically."""
+
+    STOP_WORDS = {"what", "whats", "are", "is", "the", "of", "for", "a", "me", "show", "please"}
+
+    def __init__(self, fail: bool = False):
+        self.calls: List[str] = []
+        self.fail = fail
+
+    def embed_query(self, text: str) -> List[float]:
+        self.calls.append(text)
+        if self.fail:
+            raise RuntimeError("embedding deployment unavailable")
+        vector = np.zeros(512)
+        for word in re.findall(r"[a-z0-9]+", text.lower()):
+            if word not in self.STOP_WORDS:
+                vector[sum(map(ord, word)) * 31 % 512] += 1
+        return vector.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+
+# Analyst questions, their paraphrases, and the tools the scripted model calls for them
+QUESTION_TOOLS = {
+    "What are the total assets of Wells Fargo?": ["fdic_financial_data"],
+    "wells fargo total assets": ["fdic_financial_data"],
+    "Total assets for Bank of America": ["fdic_financial_data"],
+    "What is the tier 1 ratio for cert 3511?": ["ffiec_call_report_data"],
+    "Tier 1 ratio for cert 3511": ["ffiec_call_report_data"],
+    "What is the tier 1 ratio for cert 628?": ["ffiec_call_report_data"],
+    "And what about its deposits?": ["fdic_financial_data"],
+}
+
+
+def make_agent(cache, tool_latency=0.01, model_latency=0.0, error=None):
+    settings = SimpleNamespace(max_conversation_turns=20, agent_tool_timeout_seconds=60.0, agent_max_concurrent_tools=4)
+    tools = [SlowTool(name=name, latency=tool_latency, error=error) for name in ("fdic_financial_data", "ffiec_call_report_data")]
+    model = ScriptedToolModel(turn_tools=QUESTION_TOOLS, latency=model_latency)
+    with patch("src.chatbot.agent.create_azure_chat_openai", return_value=model):
+        return ChatbotAgent(settings, tools=tools, enable_multi_step=True, response_cache=cache), tools
+
+
+class TestScope:
+    """Test the report date and identifier scoping of questions."""
+
+    def test_latest_report_date_follows_publication(self):
+        """A quarter counts as the latest once its data is published."""
+        assert latest_report_date(date(2025, 2, 10)) == "2024-09-30"
+        assert latest_report_date(date(2025, 2, 20)) == "2024-12-31"
+        assert latest_report_date(date(2025, 8, 15), publication_lag_days=30) == "2025-06-30"
+
+    def test_question_scope(self):
+        """Named dates and quarters become report dates; other numbers are identifiers."""
+        assert question_scope("tier 1 ratio for cert 3511 as of 2024-12-31") == ("2024-12-31", "1,3511")
+        assert question_scope("tier 1 ratio for cert 3511 q4 2024") == ("2024-12-31", "1,3511")
+        assert question_scope("total assets of wells fargo 20240630")[0] == "2024-06-30"
+        assert question_scope("total assets of wells fargo")[0] == latest_report_date()
+
+    def test_question_entities(self):
+        """Capitalized names and tickers are entities; question words are not."""
+        assert question_entities("What are the total assets of Wells Fargo?") == {"wells", "fargo"}
+        assert question_entities("Compare JPM and BAC deposits for Q4 2024") == {"jpm", "bac"}
+        assert question_entities("total assets of wells fargo") == frozenset()
+
+    def test_follow_up_questions_not_standalone(self):
+        assert is_standalone("total assets of wells fargo")
+        assert not is_standalone("and what about its deposits?")
+        assert not is_standalone("show the same for bank of america")
+
+
+class TestSemanticResponseCache:
+    """Test lookups, scoping, eviction and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_similar_question_reuses_answer(self):
+        """A paraphrase above the threshold gets the stored answer; a different bank does not."""
+        embeddings = KeywordEmbeddings()
+        cache = SemanticResponseCache(embeddings, similarity_threshold=0.9)
+        assert await cache.store("What are the total assets of Wells Fargo?", "$1.9T", conversation_id="c1", tools=["fdic_financial_data"])
+
+        hit = await cache.lookup("wells fargo total assets")
+        exact = await cache.lookup("what are the TOTAL assets of  Wells Fargo?")
+        miss = await cache.lookup("Total assets for Bank of America")
+
+        assert hit.answer == "$1.9T" and hit.similarity == pytest.approx(1.0)
+        assert hit.provenance()["question"] == "What are the total assets of Wells Fargo?"
+        assert hit.provenance()["tools"] == ["fdic_financial_data"] and hit.provenance()["report_date"] == latest_report_date()
+        assert exact.answer == "$1.9T" and miss is None
+        # The exact repeat is found without embedding it
+        assert len(embeddings.calls) == 3
+
+        stats = cache.stats()
+        assert (stats["lookups"], stats["hits"], stats["exact_hits"], stats["misses"]) == (3, 2, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(0.6667) and stats["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_bank_names_never_share_answers(self):
+        """Questions naming different banks miss even when their embeddings are near-identical."""
+        class NameBlindEmbeddings(KeywordEmbeddings):
+            STOP_WORDS = KeywordEmbeddings.STOP_WORDS | {"wells", "fargo", "bank", "of", "america", "citibank"}
+
+        cache = SemanticResponseCache(NameBlindEmbeddings(), similarity_threshold=0.95)
+        await cache.store("What are the total assets of Wells Fargo?", "$1.9T")
+        await cache.store("What are the total assets of Citibank?", "$1.7T")
+
+        assert await cache.lookup("Total assets for Bank of America") is None
+        assert (await cache.lookup("Citibank total assets")).answer == "$1.7T"
+        assert (await cache.lookup("wells fargo total assets")).answer == "$1.9T"
+
+    @pytest.mark.asyncio
+    async def test_scope_separates_identifiers_dates_and_context(self):
+        """Different certificates, report dates or agent contexts never share answers."""
+        cache = SemanticResponseCache(KeywordEmbeddings(), similarity_threshold=0.5)
+        await cache.store("tier 1 ratio for cert 3511 Q4 2024", "13.2%", context="banking")
+
+        assert (await cache.lookup("tier 1 ratio for cert 3511 as of 2024-12-31", context="banking")).answer == "13.2%"
+        assert await cache.lookup("tier 1 ratio for cert 3510 Q4 2024", context="banking") is None
+        assert await cache.lookup("tier 1 ratio for cert 3511 Q3 2024", context="banking") is None
+        assert await cache.lookup("tier 1 ratio for cert 3511", context="banking") is None
+        assert await cache.lookup("tier 1 ratio for cert 3511 Q4 2024", context="general") is None
+
+    @pytest.mark.asyncio
+    async def test_follow_ups_expiry_eviction_and_failures(self):
+        """Follow-ups are skipped, old answers expire or are evicted, and embedding failures are misses."""
+        cache = SemanticResponseCache(KeywordEmbeddings(), max_entries=2, ttl_seconds=60)
+        assert not await cache.store("And what about its deposits?", "$1.4T")
+        assert await cache.lookup("And what about its deposits?") is None
+
+        for bank in ("wells fargo", "bank of america", "citibank"):
+            await cache.store(f"total assets of {bank}", bank)
+        assert await cache.lookup("total assets of wells fargo") is None
+        assert (await cache.lookup("total assets of citibank")).answer == "citibank"
+
+        with patch("src.chatbot.response_cache.time.monotonic", return_value=time.monotonic() + 120):
+            assert await cache.lookup("total assets of citibank") is None
+
+        failing = SemanticResponseCache(KeywordEmbeddings(fail=True))
+        assert not await failing.store("total assets of citibank", "x")
+        assert await failing.lookup("total assets of citibank") is None
+        assert failing.stats()["errors"] == 2 and cache.stats()["skipped"] == 1
+
+
+class TestAgentResponseCache:
+    """Test the agent answering from the cache."""
+
+    def test_cached_answer_skips_pipeline(self):
+        """A paraphrased question is answered from the cache with provenance, without tool calls."""
+        cache = SemanticResponseCache(KeywordEmbeddings(), similarity_threshold=0.9)
+        agent, tools = make_agent(cache)
+        other, _ = make_agent(cache)
+
+        first = agent.process_message("What are the total assets of Wells Fargo?")
+        tool_calls = sum(len(tool.loops) for tool in tools)
+        second = other.process_message("wells fargo total assets")
+        chunks = list(other.stream_response("What are the total assets of Wells Fargo?"))
+
+        assert first["processing_mode"] == "multi-step" and "cache" not in first
+        assert second["processing_mode"] == "cached" and second["content"] == first["content"]
+        assert second["cache"]["conversation_id"] == agent.conversation_id
+        assert second["cache"]["tools"] == ["fdic_financial_data"]
+        assert chunks[0]["processing_mode"] == "cached" and chunks[0]["content"] == first["content"] and chunks[-1]["is_final"]
+        assert sum(len(tool.loops) for tool in tools) == tool_calls
+        assert [message.content for message in other.get_conversation_history()[::2]] == [
+            "wells fargo total assets", "What are the total assets of Wells Fargo?"
+        ]
+        assert other.get_statistics()["response_cache"]["hits"] == 2
+
+    def test_failed_tool_answers_not_cached(self):
+        """An answer given after a tool failure is not reused."""
+        cache = SemanticResponseCache(KeywordEmbeddings())
+        agent, _ = make_agent(cache, error="FDIC API unavailable")
+
+        agent.process_message("What are the total assets of Wells Fargo?")
+        repeat = agent.process_message("What are the total assets of Wells Fargo?")
+
+        assert repeat["processing_mode"] == "multi-step" and cache.stats()["entries"] == 0
+
+    def test_disabled_by_default(self):
+        """Without response_cache_enabled the agent has no cache."""
+        agent, _ = make_agent(None)
+
+        assert agent.response_cache is None and agent.get_statistics()["response_cache"] is None
+        assert agent.process_message("What are the total assets of Wells Fargo?")["processing_mode"] == "multi-step"
@@ -0,0 +1,132 @@
+"""
+Tests for the query embedding and search result cache.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from rag_access.rag_models import RAGQuery
+from rag_access.search_cache import normalize_query
+from rag_access.search_service import SearchService
+
+from tests.helpers import FakeEmbeddings, LocalChromaDBService, make_pipeline, make_settings, text_file
+
+
+class QueryCountingEmbeddings(FakeEmbeddings):
+    """Fake embeddings counting query embeddings."""
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(latency)
+        self.queries = 0
+
+    def embed_query(self, text):
+        self.queries += 1
+        time.sleep(self.latency)
+        return super().embed_query(text)
+
+
+async def make_service(tmp_path, embeddings, **overrides):
+    """Search service over a collection holding a few documents."""
+    settings = make_settings(tmp_path, **overrides)
+    pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+    await pipeline.ingest([text_file(f"manual{i}", 6) for i in range(3)])
+
+    service = SearchService(settings)
+    service.database_manager.chromadb = LocalChromaDBService(settings, embeddings)
+    searches = []
+    search_similar = service.database_manager.search_similar
+
+    async def counting_search(**kwargs):
+        searches.append(kwargs)
+        return await search_similar(**kwargs)
+
+    service.database_manager.search_similar = counting_search
+    return service, pipeline, searches
+
+
+def rag_query(text: str, **kwargs) -> RAGQuery:
+    return RAGQuery(query=text, max_chunks=kwargs.pop("max_chunks", 3), score_threshold=0.0, **kwargs)
+
+
+class TestSearchCache:
+    """Test caching in SearchService."""
+
+    def test_normalize_query(self):
+        """Case, spacing and Unicode compatibility variants normalize alike."""
+        assert normalize_query("  Deposit   Growth\n") == normalize_query("deposit growth")
+        assert normalize_query("ＲＯＡ") == normalize_query("roa")
+
+    @pytest.mark.asyncio
+    async def test_repeated_and_equivalent_queries(self, tmp_path):
+        """Equivalent queries are embedded and searched once."""
+        embeddings = QueryCountingEmbeddings()
+        service, _, searches = await make_service(tmp_path, embeddings)
+
+        first = await service._search_documents(rag_query("loan quality"))
+        again = await service._search_documents(rag_query("  Loan   QUALITY "))
+
+        assert first and [r.chunk_id for r in again] == [r.chunk_id for r in first]
+        assert embeddings.queries == 1
+        assert len(searches) == 1
+        assert service.search_cache.stats()["search_results"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_parameters_are_part_of_the_key(self, tmp_path):
+        """Different k or filters search again but reuse the query embedding."""
+        embeddings = QueryCountingEmbeddings()
+        service, _, searches = await make_service(tmp_path, embeddings)
+
+        await service._search_documents(rag_query("deposit growth"))
+        await service._search_documents(rag_query("deposit growth", max_chunks=5))
+        filtered = await service._search_documents(rag_query("deposit growth", filters={"filename": "manual1.txt"}))
+
+        assert embeddings.queries == 1
+        assert len(searches) == 3
+        assert {r.metadata["filename"] for r in filtered} == {"manual1.txt"}
+
+    @pytest.mark.asyncio
+    async def test_collection_changes_invalidate_results(self, tmp_path):
+        """Adding or deleting documents through any service instance invalidates results."""
+        service, pipeline, searches = await make_service(tmp_path, QueryCountingEmbeddings())
+        query = rag_query("quarterly deposit growth", max_chunks=50)
+
+        before = await service._search_documents(query)
+        await pipeline.ingest([text_file("addendum", 2)])
+        after_add = await service._search_documents(query)
+        await pipeline.chromadb.delete_documents_by_filter({"filename": "addendum.txt"})
+        after_delete = await service._search_documents(query)
+
+        assert len(searches) == 3
+        assert len(after_add) == len(before) + 2
+        assert len(after_delete) == len(before)
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_copies(self, tmp_path):
+        """Changing a returned result does not change the cached one."""
+        service, _, _ = await make_service(tmp_path, QueryCountingEmbeddings())
+
+        first = await service._search_documents(rag_query("loan quality"))
+        first[0].metadata["annotated"] = True
+        again = await service._search_documents(rag_query("loan quality"))
+
+        assert "annotated" not in again[0].metadata
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache(self, tmp_path):
+        """A zero TTL disables caching."""
+        embeddings = QueryCountingEmbeddings()
+        service, _, searches = await make_service(tmp_path, embeddings, search_cache_ttl_seconds=0)
+
+        await service._search_documents(rag_query("loan quality"))
+        await service._search_documents(rag_query("loan quality"))
+
+        assert service.search_cache is None
+        assert embeddings.queries == 2
+        assert len(searches) == 2
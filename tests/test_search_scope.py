@@ -0,0 +1,133 @@
+"""
+Tests for metadata-scoped RAG retrieval.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management.document_models import IngestionFile
+from document_management.keyword_index import KeywordIndex
+from rag_access.rag_models import RAGQuery
+from rag_access.rag_tool import RAGSearchInput, RAGSearchTool
+from rag_access.search_scope import SearchScope, build_where
+from rag_access.search_service import SearchService
+
+from tests.test_hybrid_search import BagOfWordsEmbeddings, call_report_corpus
+from tests.helpers import LocalChromaDBService, make_pipeline, make_settings
+from tests.test_streaming_extraction import make_pdf
+
+
+def corpus_file(name: str, paragraphs) -> IngestionFile:
+    text = "\n\n".join(text for _, text in paragraphs)
+    return IngestionFile(file_path=Path(name), file_content=text.encode())
+
+
+def make_service(tmp_path, **overrides) -> SearchService:
+    settings = make_settings(tmp_path, **overrides)
+    service = SearchService(settings)
+    service.database_manager.chromadb = LocalChromaDBService(settings, BagOfWordsEmbeddings())
+    return service
+
+
+async def backdate(pipeline, filename: str, timestamp: str) -> None:
+    """Change the recorded upload time of a stored document."""
+    stored = await pipeline.chromadb.get_chunk_metadata({"filename": filename})
+    await pipeline.chromadb.update_chunk_metadata(
+        list(stored), [dict(metadata, upload_timestamp=timestamp) for metadata in stored.values()]
+    )
+
+
+class TestSearchScope:
+    """Test translating scopes into ChromaDB where clauses."""
+
+    def test_where_clause(self):
+        """Scope fields become conditions combined with existing filters."""
+        scope = SearchScope(filenames=["a.pdf"], file_types=["PDF", ".txt"], document_ids=["d1", "d2", "d1"])
+
+        assert build_where({}, []) is None
+        assert build_where({"filename": "a.pdf"}) == {"filename": "a.pdf"}
+        assert build_where({"source": "x"}, scope.where_clauses()) == {"$and": [
+            {"source": "x"},
+            {"filename": "a.pdf"},
+            {"file_type": {"$in": [".pdf", ".txt"]}},
+            {"document_id": {"$in": ["d1", "d2"]}}
+        ]}
+        assert SearchScope().is_empty() and not SearchScope(uploaded_before="2025-01-01").is_empty()
+
+    def test_upload_bounds(self):
+        """Date bounds cover whole days; malformed dates are rejected."""
+        assert SearchScope(uploaded_after="2025-03-01", uploaded_before="2025-03-31").upload_bounds() == (
+            "2025-03-01T00:00:00+00:00", "2025-04-01T00:00:00+00:00"
+        )
+        assert SearchScope(uploaded_after="2025-03-01T09:30:00-05:00").upload_bounds()[0] == "2025-03-01T14:30:00+00:00"
+        with pytest.raises(ValueError, match="Invalid upload date"):
+            SearchScope(uploaded_before="March 2025").upload_bounds()
+
+    def test_keyword_index_restricted_to_chunks(self):
+        """BM25 ranks only the given chunks and keeps whole-index scores."""
+        index = KeywordIndex()
+        index.add(["a", "b", "c"], ["tier one capital ratio", "capital ratio of tier two", "deposit growth"])
+        everything = dict(index.search("tier capital", k=3))
+
+        scoped = index.search("tier capital", k=3, chunk_ids=["b", "c", "missing"])
+
+        assert scoped == [("b", everything["b"])]
+        assert index.search("tier capital", chunk_ids=["missing"]) == []
+
+
+class TestScopedRetrieval:
+    """Test scoped searches through SearchService and the RAG tool."""
+
+    @pytest.mark.asyncio
+    async def test_scoped_searches(self, tmp_path):
+        """Scoped searches only return chunks of documents in scope."""
+        corpus = call_report_corpus(40)
+        pipeline = make_pipeline(tmp_path, BagOfWordsEmbeddings())
+        await pipeline.ingest([
+            corpus_file("capital.txt", corpus[:10]),
+            corpus_file("deposits.txt", corpus[10:20]),
+            IngestionFile(file_path=Path("manual.pdf"), file_content=make_pdf([[text for _, text in corpus[20:30]]]))
+        ])
+        await backdate(pipeline, "deposits.txt", "2024-06-15T10:00:00+00:00")
+        service = make_service(tmp_path)
+
+        async def files(**scope):
+            results = await service._search_documents(RAGQuery(
+                query="report loans secured by real estate", max_chunks=10, score_threshold=0.0,
+                scope=SearchScope(**scope)
+            ))
+            return {result.metadata["filename"] for result in results}
+
+        assert await files() == {"capital.txt", "deposits.txt", "manual.pdf"}
+        assert await files(filenames=["deposits.txt"]) == {"deposits.txt"}
+        assert await files(file_types=["pdf"]) == {"manual.pdf"}
+        assert await files(uploaded_before="2024-12-31") == {"deposits.txt"}
+        assert await files(uploaded_after="2025-01-01", file_types=["txt"]) == {"capital.txt"}
+        assert await files(uploaded_after="2024-06-16", uploaded_before="2024-06-30") == set()
+
+        document_id = (await pipeline.chromadb.list_documents())[0]["document_id"]
+        scoped = await service._search_documents(RAGQuery(
+            query=corpus[3][0], max_chunks=3, score_threshold=0.0, scope=SearchScope(document_ids=[document_id])
+        ))
+        assert {result.metadata["document_id"] for result in scoped} == {document_id}
+
+    @pytest.mark.asyncio
+    async def test_tool_schema_and_scope(self, tmp_path):
+        """The RAG tool exposes the scope fields and reports malformed dates."""
+        pipeline = make_pipeline(tmp_path, BagOfWordsEmbeddings())
+        corpus = call_report_corpus(20)
+        await pipeline.ingest([corpus_file("capital.txt", corpus[:10]), corpus_file("deposits.txt", corpus[10:])])
+        tool = RAGSearchTool(make_settings(tmp_path))
+        tool._search_service.database_manager.chromadb = LocalChromaDBService(make_settings(tmp_path), BagOfWordsEmbeddings())
+
+        fields = RAGSearchInput.model_json_schema()["properties"]
+        context = await tool._arun(corpus[12][0], max_chunks=5, filenames=["deposits.txt"])
+
+        assert {"filenames", "file_types", "document_ids", "uploaded_after", "uploaded_before"} <= set(fields)
+        assert "deposits.txt" in context and "capital.txt" not in context
+        assert "Invalid upload date" in await tool._arun("capital", uploaded_after="last week")
@@ -0,0 +1,187 @@
+"""
+Tests for streaming text extraction and incremental splitting.
+"""
+
+import random
+import re
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import docx
+import pytest
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, StreamObject
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from document_management.document_models import IngestionFile
+from document_management.document_processor import DocumentProcessor
+from document_management.streaming_splitter import IncrementalTextSplitter
+
+from tests.helpers import FakeEmbeddings, make_pipeline, make_settings
+
+
+def make_pdf(pages) -> bytes:
+    """Build a PDF with one line of Helvetica text per entry of each page."""
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica")
+    }))
+    for lines in pages:
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})
+        })
+        stream = StreamObject()
+        stream.set_data("".join(
+            f"BT /F1 9 Tf 36 {760 - 14 * i} Td ({line}) Tj ET\n" for i, line in enumerate(lines)
+        ).encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def manual_pages(count: int, lines: int = 40):
+    """Pages of a regulatory manual, each line naming its page."""
+    return [
+        [f"Page {page} line {line}: institutions report past due loans in Schedule RC-N." for line in range(lines)]
+        for page in range(1, count + 1)
+    ]
+
+
+def make_processor(tmp_path, **overrides) -> DocumentProcessor:
+    return DocumentProcessor(make_settings(tmp_path, **overrides))
+
+
+class TestIncrementalTextSplitter:
+    """Test that streamed splitting matches splitting the whole text."""
+
+    @pytest.mark.parametrize("separator", ["\n\n", "\n", ""])
+    def test_streamed_chunks_cover_text(self, separator):
+        """Streamed chunks respect the chunk size and cover every line in order."""
+        rng = random.Random(7)
+        words = "capital deposits loans allowance securities tier leverage ratio schedule".split()
+        segments = [
+            "\n".join(
+                f"s{i}l{j} " + " ".join(rng.choice(words) for _ in range(rng.randint(3, 40)))
+                for j in range(rng.randint(1, 6))
+            )
+            for i in range(300)
+        ]
+        text = separator.join(segments)
+        text_splitter = RecursiveCharacterTextSplitter(chunk_size=200, chunk_overlap=20)
+        splitter = IncrementalTextSplitter(text_splitter, buffer_size=1600, separator=separator)
+
+        streamed = [chunk for segment in segments for chunk in splitter.feed(segment)] + splitter.finish()
+
+        tags = [tag for chunk in streamed for tag in re.findall(r"s\d+l\d+", chunk.content)]
+        assert all(len(chunk.content) <= 200 for chunk in streamed)
+        assert list(dict.fromkeys(tags)) == re.findall(r"s\d+l\d+", text)
+        assert abs(len(streamed) - len(text_splitter.split_text(text))) <= len(streamed) // 50
+
+    def test_pages_of_chunks(self):
+        """Chunks report the pages they start and end on."""
+        splitter = IncrementalTextSplitter(
+            RecursiveCharacterTextSplitter(chunk_size=60, chunk_overlap=0), buffer_size=100
+        )
+        chunks = []
+        for page in range(1, 6):
+            chunks += splitter.feed(f"page {page} " + "x" * 30, page)
+        chunks += splitter.finish()
+
+        for chunk in chunks:
+            assert chunk.content.startswith(f"page {chunk.page} ")
+            assert chunk.page_end in (chunk.page, chunk.page + 1)
+        assert [chunk.page for chunk in chunks] == [1, 2, 3, 4, 5]
+
+
+class TestStreamingExtraction:
+    """Test streaming extraction of each supported format."""
+
+    def test_pdf_chunks_carry_pages(self, tmp_path):
+        """PDF chunks record their pages; pages without text are skipped."""
+        pages = manual_pages(6, lines=8)
+        pages[2] = []
+        processor = make_processor(tmp_path)
+        metadata = processor.create_file_metadata(Path("manual.pdf"), b"x")
+
+        chunks = list(processor.iter_chunks(Path("manual.pdf"), make_pdf(pages), "manual.pdf", metadata))
+
+        assert {chunk.metadata["page"] for chunk in chunks} == {1, 2, 4, 5, 6}
+        for chunk in chunks:
+            assert chunk.page_content.startswith(f"Page {chunk.metadata['page']} ")
+            assert chunk.metadata["page"] <= chunk.metadata["page_end"] <= chunk.metadata["page"] + 1
+        assert [chunk.metadata["chunk_index"] for chunk in chunks] == list(range(len(chunks)))
+
+    @pytest.mark.asyncio
+    async def test_streamed_text_matches_full_extraction(self, tmp_path):
+        """Joining streamed segments gives the text extract_text returns."""
+        processor = make_processor(tmp_path)
+        document = docx.Document()
+        document.add_paragraph("Schedule RC-R\tregulatory capital")
+        document.add_paragraph("")
+        document.add_paragraph("Tier 1 leverage ratio")
+        buffer = BytesIO()
+        document.save(buffer)
+        files = {
+            "manual.pdf": make_pdf(manual_pages(3, lines=5)),
+            "guide.docx": buffer.getvalue(),
+            "notes.txt": ("Line with café and — dashes\n" * 5000).encode("utf-8"),
+        }
+
+        for name, content in files.items():
+            separator = DocumentProcessor.SEGMENT_SEPARATORS[Path(name).suffix]
+            streamed = separator.join(text for text, _ in processor.iter_text(Path(name), content))
+            assert streamed == await processor.extract_text(Path(name), content), name
+
+        assert [text for text, _ in processor.iter_text(Path("guide.docx"), files["guide.docx"])] == [
+            "Schedule RC-R\tregulatory capital", "Tier 1 leverage ratio"
+        ]
+
+    def test_docx_tables_and_empty_files(self, tmp_path):
+        """Table cell paragraphs are extracted; files without text are rejected."""
+        processor = make_processor(tmp_path)
+        document = docx.Document()
+        document.add_paragraph("Before the table")
+        document.add_table(rows=1, cols=2).rows[0].cells[1].text = "RCON2170 total assets"
+        buffer = BytesIO()
+        document.save(buffer)
+
+        assert "RCON2170 total assets" in [text for text, _ in processor.iter_text(Path("t.docx"), buffer.getvalue())]
+        with pytest.raises(ValueError, match="No text content extracted from PDF"):
+            list(processor.iter_text(Path("scan.pdf"), make_pdf([[], []])))
+        with pytest.raises(ValueError, match="TXT file is empty"):
+            list(processor.iter_text(Path("empty.txt"), b"   \n"))
+        with pytest.raises(ValueError, match="Failed to process DOCX file"):
+            list(processor.iter_text(Path("broken.docx"), b"not a zip archive"))
+
+    @pytest.mark.asyncio
+    async def test_pipeline_streams_pdf_chunks(self, tmp_path):
+        """Ingested PDF chunks are stored with page metadata and complete chunk IDs."""
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings())
+        content = make_pdf(manual_pages(12, lines=10))
+
+        result = (await pipeline.ingest([IngestionFile(file_path=Path("manual.pdf"), file_content=content)]))[0]
+        stored = await pipeline.chromadb.get_chunk_metadata({"filename": "manual.pdf"})
+
+        assert result.success
+        assert len(stored) == result.document_info.chunk_count == len(result.document_info.chunk_ids)
+        assert {metadata["page"] for metadata in stored.values()} == set(range(1, 13))
+
+    @pytest.mark.asyncio
+    async def test_failure_while_streaming_discards_written_chunks(self, tmp_path):
+        """Chunks written before a later embedding failure are removed again."""
+        pages = manual_pages(20, lines=10)
+        pages[-1] = ["This page triggers a broken embedding request."]
+        pipeline = make_pipeline(tmp_path, FakeEmbeddings(fail_on="broken"), chromadb_write_batch_size=4)
+
+        result = (await pipeline.ingest([IngestionFile(file_path=Path("manual.pdf"), file_content=make_pdf(pages))]))[0]
+
+        assert not result.success
+        assert pipeline.chromadb._db._collection.count() == 0
@@ -0,0 +1,219 @@
+"""
+Conversation simulation tests for concurrent tool calls in multi-step mode.
+
+The model and tools are scripted stand-ins with fixed latencies, so turns of
+the multi-tool scenarios can be timed without Azure OpenAI or the banking APIs.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+from langchain.agents import AgentExecutor
+from langchain.memory import ConversationBufferWindowMemory
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import BaseTool
+
+from src.chatbot.agent import ChatbotAgent
+from src.utils.event_loop import get_event_loop
+
+
+# Multi-tool turns of the conversation scenarios and the tools the model calls for them
+SCENARIO_TURNS = {
+    "What's Wells Fargo's RSSD ID?": ["fdic_institution_search"],
+    "Can you look up Bank of America and also search our documents for banking policies?": [
+        "fdic_institution_search", "rag_search"
+    ],
+    "Compare Bank of America's financial data and CET1 ratio with our lending policies": [
+        "fdic_financial_data", "ffiec_call_report_data", "rag_search"
+    ],
+}
+
+
+class ScriptedToolModel(BaseChatModel):
+    """Chat model that calls every tool a turn expects in one step, then answers with their results."""
+
+    turn_tools: Dict[str, List[str]]
+    latency: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-tool-model"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+    def _respond(self, messages: List[BaseMessage]) -> ChatResult:
+        turn = max(i for i, message in enumerate(messages) if isinstance(message, HumanMessage))
+        results = [message.content for message in messages[turn + 1:] if isinstance(message, ToolMessage)]
+        if results:
+            message = AIMessage(content=" | ".join(results))
+        else:
+            question = messages[turn].content
+            message = AIMessage(content="", tool_calls=[
+                {"name": name, "args": {"query": question}, "id": f"call_{i}"}
+                for i, name in enumerate(self.turn_tools[question])
+            ])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class SlowTool(BaseTool):
+    """Tool with a fixed latency whose synchronous shim wraps the async code like the banking tools."""
+
+    name: str
+    description: str = "Scripted banking or document tool"
+    latency: float = 0.1
+    error: Optional[str] = None
+    loops: List[Any] = []
+
+    def _run(self, query: str) -> str:
+        return asyncio.run(self._arun(query))
+
+    async def _arun(self, query: str) -> str:
+        self.loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(self.latency)
+        if self.error:
+            raise RuntimeError(self.error)
+        return f"{self.name} result"
+
+
+def make_agent(tools: List[BaseTool], model_latency: float = 0.0, **overrides) -> ChatbotAgent:
+    settings = SimpleNamespace(**dict(
+        dict(max_conversation_turns=20, agent_tool_timeout_seconds=60.0, agent_max_concurrent_tools=4),
+        **overrides
+    ))
+    model = ScriptedToolModel(turn_tools=SCENARIO_TURNS, latency=model_latency)
+    with patch("src.chatbot.agent.create_azure_chat_openai", return_value=model):
+        return ChatbotAgent(settings, tools=tools, enable_multi_step=True)
+
+
+def banking_tools(latency: float) -> List[BaseTool]:
+    names = {name for tools in SCENARIO_TURNS.values() for name in tools}
+    return [SlowTool(name=name, latency=latency) for name in sorted(names)]
+
+
+class TestParallelToolCalls:
+    """Test tool calls of one agent step running concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_step_tool_calls_run_concurrently(self):
+        """A three-tool turn takes about as long as one tool, also when called from a running event loop."""
+        agent = make_agent(banking_tools(latency=0.3))
+        question = "Compare Bank of America's financial data and CET1 ratio with our lending policies"
+
+        start = time.perf_counter()
+        response = agent.process_message(question)
+        elapsed = time.perf_counter() - start
+
+        assert response["processing_mode"] == "multi-step"
+        assert response["content"] == "fdic_financial_data result | ffiec_call_report_data result | rag_search result"
+        assert elapsed < 0.6
+
+    def test_timeouts_and_failures_become_observations(self):
+        """A slow or failing tool does not fail the turn; the other results are kept."""
+        agent = make_agent(
+            [
+                SlowTool(name="fdic_financial_data", latency=0.01),
+                SlowTool(name="ffiec_call_report_data", latency=5.0),
+                SlowTool(name="rag_search", latency=0.01, error="ChromaDB unavailable")
+            ],
+            agent_tool_timeout_seconds=0.2
+        )
+
+        start = time.perf_counter()
+        response = agent.process_message("Compare Bank of America's financial data and CET1 ratio with our lending policies")
+
+        assert time.perf_counter() - start < 2.0
+        results = response["content"].split(" | ")
+        assert results[0] == "fdic_financial_data result"
+        assert "ffiec_call_report_data timed out after 0.2 seconds" in results[1]
+        assert results[2] == "Tool rag_search failed: ChromaDB unavailable"
+
+    def test_stream_and_memory(self):
+        """Streaming reports tool use before the answer, and turns are remembered."""
+        agent = make_agent(banking_tools(latency=0.01))
+
+        chunks = list(agent.stream_response("What's Wells Fargo's RSSD ID?"))
+        agent.process_message("Can you look up Bank of America and also search our documents for banking policies?")
+        history = agent.agent_executor.memory.load_memory_variables({})["chat_history"]
+
+        assert [chunk.get("is_intermediate", False) for chunk in chunks] == [True, False, False]
+        assert chunks[0]["content"] == "[Using tool: fdic_institution_search]"
+        assert chunks[1]["content"] == "fdic_institution_search result"
+        assert [message.content for message in history[::2]] == list(SCENARIO_TURNS)[:2]
+
+
+class TestAsyncAgent:
+    """Test the async agent API and the event loop tools run on."""
+
+    @pytest.mark.asyncio
+    async def test_tools_awaited_on_callers_loop(self):
+        """aprocess_message and astream_response await the tools on the caller's event loop."""
+        tools = banking_tools(latency=0.01)
+        agent = make_agent(tools)
+
+        response = await agent.aprocess_message("Can you look up Bank of America and also search our documents for banking policies?")
+        chunks = [chunk async for chunk in agent.astream_response("What's Wells Fargo's RSSD ID?")]
+
+        assert response["content"] == "fdic_institution_search result | rag_search result"
+        assert [chunk["content"] for chunk in chunks[:2]] == ["[Using tool: fdic_institution_search]", "fdic_institution_search result"]
+        assert {loop for tool in tools for loop in tool.loops} == {asyncio.get_running_loop()}
+
+    def test_sync_turns_share_one_loop(self):
+        """Synchronous turns run on the process-wide loop instead of a new loop per call."""
+        tools = banking_tools(latency=0.01)
+        agent = make_agent(tools)
+
+        for question in SCENARIO_TURNS:
+            agent.process_message(question)
+        list(agent.stream_response("What's Wells Fargo's RSSD ID?"))
+
+        assert {loop for tool in tools for loop in tool.loops} == {get_event_loop()}
+
+
+@pytest.mark.slow
+class TestParallelToolCallsBenchmark:
+    """Compare turn latency with AgentExecutor running tool calls one after another."""
+
+    MODEL_LATENCY = 0.05
+    TOOL_LATENCY = 0.2
+
+    def test_multi_tool_turn_latency(self):
+        """Turns needing several tools finish sooner when their calls run concurrently."""
+        agent = make_agent(banking_tools(self.TOOL_LATENCY), model_latency=self.MODEL_LATENCY)
+        parallel = agent.agent_executor
+        sequential = AgentExecutor(
+            agent=parallel.agent,
+            tools=list(parallel.tools.values()),
+            memory=ConversationBufferWindowMemory(memory_key="chat_history", output_key="output", return_messages=True, k=3),
+            max_iterations=5,
+            early_stopping_method="force",
+            handle_parsing_errors=True
+        )
+
+        timings = {}
+        for question, tools in SCENARIO_TURNS.items():
+            # The synchronous AgentExecutor path process_message used before
+            start = time.perf_counter()
+            output = sequential.invoke({"input": question})["output"]
+            timings["sequential", len(tools)] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            response = agent.process_message(question)
+            timings["parallel", len(tools)] = time.perf_counter() - start
+
+            assert output == response["content"] == " | ".join(f"{tool} result" for tool in tools)
+
+        assert timings["parallel", 1] < timings["sequential", 1] * 1.5
+        assert timings["parallel", 2] < timings["sequential", 2] * 0.8
+        assert timings["parallel", 3] < timings["sequential", 3] * 0.6
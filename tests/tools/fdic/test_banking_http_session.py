@@ -0,0 +1,207 @@
+"""
+Tests for the shared, connection-pooled banking HTTP session.
+"""
+
+import asyncio
+import gc
+import sys
+import threading
+import time
+import warnings
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from tools.infrastructure.banking.banking_http_session import BankingHTTPSession
+from tools.infrastructure.banking.fdic_api_client import FDICAPIClient
+from tools.infrastructure.banking.fdic_financial_api import FDICFinancialAPI
+from tools.infrastructure.banking.fdic_constants import FDIC_INSTITUTIONS_ENDPOINT
+
+
+class TestBankingHTTPSession:
+    """Test pooled session lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_within_event_loop(self):
+        """Repeated calls on one loop return the same session."""
+        pool = BankingHTTPSession()
+
+        first = await pool.get_session()
+        second = await pool.get_session()
+
+        assert first is second
+        assert pool.get_stats()["sessions_created"] == 1
+        await pool.close()
+
+    def test_session_recreated_for_new_event_loop(self):
+        """A session requested from another loop is replaced."""
+        pool = BankingHTTPSession()
+
+        first = asyncio.run(pool.get_session())
+        second = asyncio.run(pool.get_session())
+
+        assert first is not second
+        assert pool.get_stats()["sessions_created"] == 2
+        asyncio.run(pool.close())
+        assert pool.closed
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        """Closing releases the session and a later call reopens it."""
+        pool = BankingHTTPSession()
+        session = await pool.get_session()
+
+        await pool.close()
+
+        assert session.closed
+        assert pool.closed
+        assert not pool.get_stats()["session_open"]
+
+        reopened = await pool.get_session()
+        assert reopened is not session
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_session(self):
+        """Clients given the same pool use one session and do not close it."""
+        pool = BankingHTTPSession()
+        search_client = FDICAPIClient(api_key="test_key", http_session=pool)
+        financial_client = FDICFinancialAPI(api_key="test_key", http_session=pool)
+
+        assert search_client.http_session is financial_client.http_session
+        session = await pool.get_session()
+
+        await search_client.close()
+        await financial_client.close()
+
+        assert not session.closed
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_client_owns_default_session(self):
+        """A client without a shared pool closes its own session."""
+        client = FDICAPIClient(api_key="test_key")
+        await client.http_session.get_session()
+
+        await client.close()
+
+        assert client.http_session.closed
+
+
+class _StubFDICServer:
+    """Local stub of the FDIC institutions endpoint that counts connections."""
+
+    def __init__(self):
+        self.peers = set()
+        self.requests = 0
+        self.runner = None
+        self.url = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response({
+            "data": [{"data": {"CERT": "3511", "NAME": "Stub Bank", "ACTIVE": 1}}],
+            "meta": {"total": 1}
+        })
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get(FDIC_INSTITUTIONS_ENDPOINT, self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+class TestSessionShutdown:
+    """Test that sessions of finished event loops release their connections."""
+
+    def test_asyncio_run_callers_leave_nothing_open(self):
+        """Requests from two asyncio.run calls leave no unclosed session, connector or socket."""
+        server_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=server_loop.run_forever, daemon=True)
+        thread.start()
+        server = _StubFDICServer()
+        asyncio.run_coroutine_threadsafe(server.start(), server_loop).result()
+
+        pool = BankingHTTPSession()
+        client = FDICAPIClient(api_key="test_key", http_session=pool)
+        client.base_url = server.url
+        unclosed = []
+
+        async def request():
+            asyncio.get_running_loop().set_exception_handler(lambda loop, context: unclosed.append(context["message"]))
+            await client._make_request(FDIC_INSTITUTIONS_ENDPOINT, {"limit": "1"})
+
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ResourceWarning)
+                asyncio.run(request())
+                asyncio.run(request())
+                gc.collect()
+        finally:
+            asyncio.run_coroutine_threadsafe(server.stop(), server_loop).result()
+            server_loop.call_soon_threadsafe(server_loop.stop)
+            thread.join()
+            server_loop.close()
+
+        assert server.requests == 2 and pool.closed
+        # Event loops left behind by earlier tests may be collected here too
+        leaks = [
+            str(warning.message) for warning in caught
+            if warning.category is ResourceWarning and not str(warning.message).startswith("unclosed event loop")
+        ]
+        assert leaks == []
+        assert unclosed == []
+
+
+@pytest.mark.slow
+class TestConnectionPoolBenchmark:
+    """Compare pooled requests against a new session per request."""
+
+    REQUESTS = 200
+
+    @pytest.mark.asyncio
+    async def test_pooled_session_reuses_connections(self):
+        """Pooled client reuses one keep-alive connection and beats a session per request."""
+        server = _StubFDICServer()
+        await server.start()
+        try:
+            # Baseline: one session (and one connection) per request
+            start = time.perf_counter()
+            for _ in range(self.REQUESTS):
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(f"{server.url}{FDIC_INSTITUTIONS_ENDPOINT}") as response:
+                        await response.json()
+            unpooled_seconds = time.perf_counter() - start
+            unpooled_connections = len(server.peers)
+
+            server.peers.clear()
+            pool = BankingHTTPSession()
+            client = FDICAPIClient(api_key="test_key", http_session=pool)
+            client.base_url = server.url
+
+            start = time.perf_counter()
+            for _ in range(self.REQUESTS):
+                await client._make_request(FDIC_INSTITUTIONS_ENDPOINT, {"limit": "1"})
+            pooled_seconds = time.perf_counter() - start
+            pooled_connections = len(server.peers)
+            await pool.close()
+        finally:
+            await server.stop()
+
+        assert server.requests == self.REQUESTS * 2
+        assert unpooled_connections == self.REQUESTS
+        assert pooled_connections == 1
+        assert pooled_seconds < unpooled_seconds
@@ -0,0 +1,236 @@
+"""
+Tests for batch bank analysis over combined FDIC financial queries.
+"""
+
+import asyncio
+import json
+import re
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+from pydantic import ValidationError
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from tools.composite.bank_analysis_tool import BankAnalysisTool
+from tools.infrastructure.banking.fdic_financial_api import FDICFinancialAPI
+from tools.infrastructure.banking.fdic_financial_constants import FDIC_FINANCIAL_ENDPOINT
+from tools.infrastructure.banking.fdic_models import BankAnalysisInput
+
+
+def financial_record(cert: str, repdte: str = "20240630") -> dict:
+    """Build one raw FDIC financial record for a bank."""
+    base = int(cert) * 1000
+    return {
+        "CERT": cert,
+        "REPDTE": repdte,
+        "NAME": f"Bank {cert}",
+        "ASSET": base * 10,
+        "DEP": base * 8,
+        "LNLS": base * 6,
+        "EQ": base,
+        "NETINC": base // 10,
+        "ROA": 1.05,
+        "ROE": 10.4,
+        "TIER1R": 12.5,
+    }
+
+
+class _StubFinancialServer:
+    """Local stub of the FDIC financial endpoint that answers CERT filters."""
+
+    def __init__(self, records, latency: float = 0):
+        self.records = records
+        self.latency = latency
+        self.filters = []
+        self.runner = None
+        self.url = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        filters = request.query.get("filters", "")
+        self.filters.append(filters)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        certs = set(re.findall(r"\d+", filters.split("CERT:", 1)[1].split(" AND ")[0]))
+        rows = sorted(
+            (record for record in self.records if record["CERT"] in certs),
+            key=lambda record: record["REPDTE"],
+            reverse=True
+        )[:int(request.query.get("limit", 10))]
+        return web.json_response({"data": [{"data": row} for row in rows], "meta": {"total": len(rows)}})
+
+    @property
+    def requests(self) -> int:
+        return len(self.filters)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get(FDIC_FINANCIAL_ENDPOINT, self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+@asynccontextmanager
+async def running_server(records, latency: float = 0):
+    """Run a stub financial server for the duration of a block."""
+    server = _StubFinancialServer(records, latency)
+    await server.start()
+    try:
+        yield server
+    finally:
+        await server.stop()
+
+
+def build_client(server: _StubFinancialServer) -> FDICFinancialAPI:
+    client = FDICFinancialAPI(api_key="test_key")
+    client.base_url = server.url
+    return client
+
+
+class TestGetFinancialDataForBanks:
+    """Test combined CERT queries and the per-bank fallback."""
+
+    @pytest.mark.asyncio
+    async def test_one_query_for_many_banks(self):
+        """Several banks are fetched with one combined filter, newest record per bank."""
+        records = [
+            financial_record("3511"),
+            financial_record("3511", "20240331"),
+            financial_record("628"),
+            financial_record("7213"),
+        ]
+        async with running_server(records) as server:
+            client = build_client(server)
+
+            results = await client.get_financial_data_for_banks(["7213", "3511", "628", "03511"])
+            await client.close()
+
+            assert list(results) == ["7213", "3511", "628"]
+            assert str(results["3511"].repdte) == "2024-06-30"
+            assert server.filters == ["CERT:(7213 OR 3511 OR 628)"]
+
+    @pytest.mark.asyncio
+    async def test_missing_banks_fetched_individually(self):
+        """A bank crowded out of the combined result is queried on its own."""
+        # Six quarters of one bank fill the combined query's two-records-per-bank limit
+        quarters = ["20240630", "20240331", "20231231", "20230930", "20230630", "20230331"]
+        records = [financial_record("3511", quarter) for quarter in quarters]
+        records.append(financial_record("628", "20221231"))
+        async with running_server(records) as server:
+            client = build_client(server)
+
+            results = await client.get_financial_data_for_banks(["3511", "628", "99999"])
+            await client.close()
+
+            assert str(results["628"].repdte) == "2022-12-31"
+            assert results["99999"] is None
+            assert server.filters[1:] == ["CERT:628", "CERT:99999"]
+
+    @pytest.mark.asyncio
+    async def test_large_peer_groups_are_chunked(self):
+        """Peer groups above certs_per_query are split over several combined queries."""
+        certs = [str(1000 + i) for i in range(40)]
+        async with running_server([financial_record(cert) for cert in certs]) as server:
+            client = build_client(server)
+
+            results = await client.get_financial_data_for_banks(certs, max_concurrency=2)
+            await client.close()
+
+            assert all(results[cert] is not None for cert in certs)
+            assert server.requests == 2
+
+
+class TestBatchInput:
+    """Test batch fields on the analysis input."""
+
+    def test_batch_input_accepted(self):
+        """Either list alone is a valid identifier."""
+        params = BankAnalysisInput(cert_ids=[" 3511 ", "628"])
+
+        assert params.cert_ids == ["3511", "628"]
+        assert params.is_batch()
+        assert params.has_bank_identifier()
+
+    def test_batch_input_validated(self):
+        """Non-numeric certificates and peer groups above the limit are rejected."""
+        with pytest.raises(ValidationError):
+            BankAnalysisInput(cert_ids=["abc"])
+        with pytest.raises(ValidationError):
+            BankAnalysisInput(cert_ids=[str(i) for i in range(1, 52)])
+
+
+class FakeLookup:
+    """Institution search stand-in resolving names from a fixed table."""
+
+    def __init__(self, certs_by_name):
+        self.certs_by_name = certs_by_name
+        self.names = []
+
+    async def _arun(self, name, state=None, limit=1, **kwargs):
+        self.names.append(name)
+        cert = self.certs_by_name.get(name)
+        if cert is None:
+            return json.dumps({"success": True, "institutions": []})
+        return json.dumps({"success": True, "institutions": [{"cert": cert, "name": name}]})
+
+
+def build_tool(server: _StubFinancialServer, certs_by_name) -> BankAnalysisTool:
+    settings = SimpleNamespace(
+        fdic_api_key=None,
+        fdic_financial_api_timeout=30.0,
+        fdic_financial_cache_ttl=1800,
+        fdic_api_timeout=30.0,
+        fdic_cache_ttl=3600,
+        ffiec_cdr_enabled=False,
+        ffiec_cdr_api_key=None,
+        ffiec_cdr_username=None
+    )
+    tool = BankAnalysisTool(settings=settings)
+    object.__setattr__(tool, '_bank_lookup', FakeLookup(certs_by_name))
+    tool.financial_client.base_url = server.url
+    return tool
+
+
+class TestBatchBankAnalysisTool:
+    """Test the batch mode of the composite analysis tool."""
+
+    @pytest.mark.asyncio
+    async def test_comparison_table(self):
+        """Names and certificates are combined into one comparison table."""
+        async with running_server([financial_record("3511"), financial_record("628")]) as server:
+            tool = build_tool(server, {"Wells Fargo Bank": "3511"})
+
+            result = await tool._arun(cert_ids=["628", "4242"], bank_names=["Wells Fargo Bank", "Unknown Bank"])
+            await tool.financial_client.close()
+
+            assert "Batch Comparison (2 of 3 banks with data)" in result
+            assert "| Wells Fargo Bank | 3511 | 2024-06-30 |" in result
+            assert "| Bank 628 | 628 |" in result
+            assert "10.00%" in result  # equity to assets
+            assert "Not found: Unknown Bank" in result
+            assert "No financial data: Cert 4242" in result
+            assert server.filters[0] == "CERT:(628 OR 4242 OR 3511)"
+
+    @pytest.mark.asyncio
+    async def test_nothing_resolved(self):
+        """Without any identifiable bank no FDIC request is made."""
+        async with running_server([]) as server:
+            tool = build_tool(server, {})
+
+            result = await tool._arun(bank_names=["Unknown Bank"])
+
+            assert result.startswith("Error:")
+            assert server.requests == 0
@@ -6,7 +6,7 @@ for FDIC BankFind Suite API data structures.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime
 from decimal import Decimal
 from typing import Dict, Any
 
@@ -23,7 +23,6 @@ from tools.infrastructure.banking.fdic_models import (
     FDICInstitution,
     FDICSearchFilters,
     FDICAPIResponse,
-    FDICCacheEntry,
     BankLookupInput,
     BankAnalysisInput
 )
@@ -305,55 +304,6 @@ class TestFDICAPIResponse:
         assert response.total_count == 1
 
 
-class TestFDICCacheEntry:
-    """Test cases for FDIC cache entry functionality."""
-    
-    def test_cache_entry_creation(self):
-        """Test FDICCacheEntry creation and properties."""
-        response = FDICAPIResponse(
-            success=True,
-            data=[],
-            timestamp=datetime.now().isoformat()
-        )
-        
-        now = datetime.now()
-        expires_in_hour = now + timedelta(hours=1)
-        
-        entry = FDICCacheEntry(
-            response=response,
-            query_hash="test_hash_123",
-            cached_at=now,
-            expires_at=expires_in_hour
-        )
-        
-        assert entry.response == response
-        assert entry.query_hash == "test_hash_123"
-        assert entry.cached_at == now
-        assert entry.expires_at == expires_in_hour
-        assert entry.is_expired() == False
-        assert entry.time_to_expiry() > 3500  # Should be close to 1 hour
-    
-    def test_cache_entry_expiry(self):
-        """Test cache entry expiry detection."""
-        response = FDICAPIResponse(
-            success=True,
-            data=[],
-            timestamp=datetime.now().isoformat()
-        )
-        
-        # Create expired entry
-        past_time = datetime.now() - timedelta(hours=1)
-        entry = FDICCacheEntry(
-            response=response,
-            query_hash="expired_hash",
-            cached_at=past_time,
-            expires_at=past_time
-        )
-        
-        assert entry.is_expired() == True
-        assert entry.time_to_expiry() < 0
-
-
 class TestBankLookupInput:
     """Test cases for enhanced BankLookupInput model."""
     
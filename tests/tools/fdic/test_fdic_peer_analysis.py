@@ -0,0 +1,222 @@
+"""
+Tests for the NumPy peer group engine.
+"""
+
+import random
+import sys
+from contextlib import asynccontextmanager
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from aiohttp import web
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from tools.composite.bank_analysis_tool import BankAnalysisTool
+from tools.infrastructure.banking.fdic_financial_api import FDICFinancialAPI
+from tools.infrastructure.banking.fdic_financial_constants import FDIC_FINANCIAL_ENDPOINT
+from tools.infrastructure.banking.fdic_financial_models import FDICFinancialData
+from tools.infrastructure.banking.fdic_peer_analysis import PEER_RATIOS, PeerMatrix
+
+
+def peer_rows(count: int, repdte: str = "20240630", seed: int = 7) -> list:
+    """Build raw FDIC records for a synthetic peer universe."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        asset = rng.choice([50_000, 500_000, 5_000_000]) * rng.uniform(0.5, 1.5)
+        row = {
+            "CERT": str(10_000 + i),
+            "REPDTE": repdte,
+            "ASSET": round(asset),
+            "DEP": round(asset * rng.uniform(0.6, 0.9)),
+            "LNLS": round(asset * rng.uniform(0.4, 0.8)),
+            "EQ": round(asset * rng.uniform(0.06, 0.14)),
+            "NETINC": round(asset * rng.uniform(-0.005, 0.02)),
+            "INTINC": round(asset * 0.05),
+            "EINTEXP": round(asset * 0.02),
+            "NETINTINC": round(asset * rng.uniform(0.02, 0.04)),
+            "NONII": round(asset * rng.uniform(0.002, 0.01)),
+            "NONIX": round(asset * rng.uniform(0.015, 0.03)),
+        }
+        # Some banks leave fields unreported
+        if i % 17 == 0:
+            row["NETINTINC"] = None
+        if i % 23 == 0:
+            row["EQ"] = None
+        rows.append(row)
+    return rows
+
+
+def to_model(row: dict) -> FDICFinancialData:
+    fields = {key.lower(): value for key, value in row.items() if key not in ("CERT", "REPDTE")}
+    return FDICFinancialData(cert=row["CERT"], repdte=date(2024, 6, 30), **fields)
+
+
+class TestPeerMatrix:
+    """Test vectorized ratios and peer statistics."""
+
+    def test_ratios_match_model_calculation(self):
+        """Array ratios equal calculate_derived_ratios() for every bank."""
+        rows = peer_rows(200)
+        matrix = PeerMatrix.from_rows("20240630", rows)
+
+        for i, row in enumerate(rows):
+            expected = to_model(row).calculate_derived_ratios()
+            for j, name in enumerate(PEER_RATIOS):
+                if name in expected:
+                    assert matrix.ratios[i, j] == pytest.approx(float(expected[name]))
+                else:
+                    assert np.isnan(matrix.ratios[i, j])
+
+    def test_rank_against_asset_size_group(self):
+        """Percentile, z-score and median are computed within the bank's asset group."""
+        rows = peer_rows(300)
+        matrix = PeerMatrix.from_rows("20240630", rows)
+        cert = rows[5]["CERT"]
+
+        ranking = matrix.rank(cert)
+
+        lower, upper = ranking["asset_range"]
+        peers = [row for row in rows if lower <= row["ASSET"] < upper]
+        roa = sorted(row["NETINC"] / row["ASSET"] * 100 for row in peers)
+        value = rows[5]["NETINC"] / rows[5]["ASSET"] * 100
+        stats = ranking["ratios"]["calculated_roa"]
+
+        assert ranking["peer_count"] == len(peers)
+        assert stats["value"] == pytest.approx(value)
+        assert stats["percentile"] == pytest.approx(sum(v <= value for v in roa) / len(roa) * 100)
+        assert stats["z_score"] == pytest.approx((value - np.mean(roa)) / np.std(roa))
+        assert stats["peer_median"] == pytest.approx(np.median(roa))
+
+    def test_missing_values_and_unknown_banks(self):
+        """Missing ratios rank as None; banks outside the matrix are not found."""
+        rows = peer_rows(50)
+        matrix = PeerMatrix.from_rows("20240630", rows)
+
+        ranking = matrix.rank(rows[0]["CERT"], asset_range=(0, None))
+
+        assert ranking["ratios"]["calculated_roe"]["value"] is None
+        assert ranking["ratios"]["calculated_roe"]["percentile"] is None
+        assert ranking["peer_count"] == 50
+        assert matrix.rank("99999999") is None
+        assert matrix.rank("not-a-cert") is None
+
+    def test_summary_and_percentile_matrix(self):
+        """Group summaries and all-bank percentiles are consistent."""
+        matrix = PeerMatrix.from_rows("20240630", peer_rows(120))
+
+        summary = matrix.summary()
+        percentiles = matrix.percentile_matrix()
+
+        assert summary["equity_to_assets"]["count"] == 120 - len(range(0, 120, 23))
+        assert summary["equity_to_assets"]["p25"] <= summary["equity_to_assets"]["median"] <= summary["equity_to_assets"]["p75"]
+        assert percentiles.shape == (120, len(PEER_RATIOS))
+        assert np.nanmax(percentiles) == 100
+
+
+class _StubPeerServer:
+    """Local stub of the FDIC financial endpoint with offset paging."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.requests = []
+        self.runner = None
+        self.url = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        query = request.query
+        self.requests.append(dict(query))
+        rows = sorted(self.rows, key=lambda row: row["REPDTE"], reverse=True)
+        if query.get("filters", "").startswith("REPDTE:"):
+            rows = [row for row in rows if row["REPDTE"] == query["filters"].split(":", 1)[1]]
+        offset, limit = int(query.get("offset", 0)), int(query.get("limit", 10))
+        page = rows[offset:offset + limit]
+        return web.json_response({"data": [{"data": row} for row in page], "meta": {"total": len(rows)}})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get(FDIC_FINANCIAL_ENDPOINT, self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+@asynccontextmanager
+async def running_client(rows):
+    """Run a stub server and a financial client pointed at it."""
+    server = _StubPeerServer(rows)
+    await server.start()
+    client = FDICFinancialAPI(api_key="test_key")
+    client.base_url = server.url
+    try:
+        yield server, client
+    finally:
+        await client.close()
+        await server.stop()
+
+
+class TestPeerGroupEngine:
+    """Test loading and caching peer matrices."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_latest_report_date(self):
+        """The latest date is resolved once and all of its pages are loaded."""
+        rows = peer_rows(250) + peer_rows(30, repdte="20240331")
+        async with running_client(rows) as (server, client):
+            matrix = await client.peer_groups.get_peer_matrix()
+            again = await client.peer_groups.get_peer_matrix("2024-06-30")
+
+        assert matrix is again
+        assert matrix.report_date == "20240630"
+        assert len(matrix) == 250
+        # One latest-date probe plus three pages of 100
+        assert len(server.requests) == 4
+        assert sorted(request.get("offset") for request in server.requests[1:]) == ["0", "100", "200"]
+
+    @pytest.mark.asyncio
+    async def test_rank_bank(self):
+        """Rankings are answered for banks that reported on the date."""
+        rows = peer_rows(40)
+        async with running_client(rows) as (server, client):
+            ranking = await client.peer_groups.rank_bank(rows[3]["CERT"], report_date="20240630")
+            missing = await client.peer_groups.rank_bank("424242", report_date="20240630")
+
+        assert ranking["report_date"] == "20240630"
+        assert missing is None
+        assert len(server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_peer_ranking(self):
+        """The analysis tool renders a ranking per ratio."""
+        rows = peer_rows(60)
+        async with running_client(rows) as (server, client):
+            settings = SimpleNamespace(
+                fdic_api_key=None,
+                fdic_financial_api_timeout=30.0,
+                fdic_financial_cache_ttl=1800,
+                fdic_api_timeout=30.0,
+                fdic_cache_ttl=3600,
+                ffiec_cdr_enabled=False,
+                ffiec_cdr_api_key=None,
+                ffiec_cdr_username=None
+            )
+            tool = BankAnalysisTool(settings=settings)
+            object.__setattr__(tool, '_financial_client', client)
+
+            result = await tool._get_peer_ranking({"name": "Stub Bank"}, rows[1]["CERT"])
+
+        assert "Report Date: 20240630" in result
+        assert "Return on Assets (ROA):" in result
+        assert "percentile" in result
+        assert "Analysis Type: Peer Ranking" in result
@@ -0,0 +1,175 @@
+"""
+Tests for the shared LRU/TTL response cache engine.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from structlog.testing import ReturnLogger
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from src.utils.lru_cache import ResponseCache, estimate_size_bytes
+
+
+class TestResponseCache:
+    """Test cache semantics and counters."""
+
+    def test_lru_eviction_respects_recent_access(self):
+        """Reading an entry protects it from the next eviction."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+
+        assert cache.get("a") == "1"
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Entries expire after their TTL and are counted."""
+        cache = ResponseCache(default_ttl_seconds=0.05)
+        cache.put("short", "value")
+        cache.put("long", "value", ttl_seconds=60)
+
+        time.sleep(0.1)
+
+        assert cache.get("short") is None
+        assert cache.get("long") == "value"
+        stats = cache.stats()
+        assert stats["expired_entries"] == 1
+        assert stats["total_entries"] == 1
+
+    def test_zero_ttl_is_not_replaced_by_default(self):
+        """An explicit TTL of zero expires the entry instead of using the default."""
+        cache = ResponseCache(default_ttl_seconds=60)
+        cache.put("stale", "value", ttl_seconds=0)
+
+        assert cache.get("stale") is None
+
+    def test_expired_entries_purged_on_put(self):
+        """Expired entries are removed from the heap front on insert."""
+        cache = ResponseCache(default_ttl_seconds=0.05)
+        for i in range(10):
+            cache.put(f"key{i}", "value")
+
+        time.sleep(0.1)
+        cache.put("fresh", "value", ttl_seconds=60)
+
+        assert len(cache) == 1
+
+    def test_byte_limit(self):
+        """Total estimated size stays within max_bytes."""
+        cache = ResponseCache(max_entries=100, max_bytes=10)
+        cache.put("a", "12345")
+        cache.put("b", "12345")
+        cache.put("c", "12345")
+
+        stats = cache.stats()
+        assert stats["total_bytes"] <= 10
+        assert cache.get("a") is None
+        assert cache.get("c") == "12345"
+
+    def test_oversized_value_not_cached(self):
+        """A value larger than the byte budget is skipped, replacing any old value."""
+        cache = ResponseCache(max_bytes=4)
+        cache.put("key", "abc")
+        cache.put("key", "abcdefgh")
+
+        assert cache.get("key") is None
+        assert cache.stats()["total_bytes"] == 0
+
+    def test_overwrite_updates_value_and_size(self):
+        """Overwriting a key replaces its value and byte accounting."""
+        cache = ResponseCache()
+        cache.put("key", "abc")
+        cache.put("key", "abcdef")
+
+        assert cache.get("key") == "abcdef"
+        assert cache.stats()["total_bytes"] == 6
+        assert len(cache) == 1
+
+    def test_hit_miss_counters(self):
+        """Hits, misses and hit rate are tracked."""
+        cache = ResponseCache()
+        cache.put("key", "value")
+
+        cache.get("key")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_clear(self):
+        """Clearing drops entries and byte accounting."""
+        cache = ResponseCache()
+        cache.put("key", "value")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats()["total_bytes"] == 0
+
+    def test_estimate_size_bytes(self):
+        """Size estimation handles raw and text payloads."""
+        assert estimate_size_bytes(b"abcd") == 4
+        assert estimate_size_bytes("é") == 2
+
+
+@pytest.mark.slow
+class TestResponseCacheBenchmark:
+    """Microbenchmark at 100k entries."""
+
+    ENTRIES = 100_000
+
+    def test_operations_at_100k_entries(self):
+        """Full-cache puts, hits and TTL purges stay fast at 100k entries."""
+        cache = ResponseCache(
+            default_ttl_seconds=3600,
+            max_entries=self.ENTRIES,
+            size_estimator=lambda value: 64
+        )
+        # Time the engine, not the per-operation debug logging
+        cache.logger = ReturnLogger()
+
+        start = time.perf_counter()
+        for i in range(self.ENTRIES):
+            cache.put(f"key{i}", i)
+        fill_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(self.ENTRIES):
+            cache.get(f"key{i}")
+        get_seconds = time.perf_counter() - start
+
+        # Every further insert evicts; the old implementation scanned all keys here
+        start = time.perf_counter()
+        for i in range(self.ENTRIES, self.ENTRIES + 10_000):
+            cache.put(f"key{i}", i)
+        evict_seconds = time.perf_counter() - start
+
+        expiring = ResponseCache(max_entries=self.ENTRIES, size_estimator=lambda value: 64)
+        expiring.logger = ReturnLogger()
+        for i in range(self.ENTRIES):
+            expiring.put(f"key{i}", i, ttl_seconds=0.5 if i % 2 else 3600)
+        time.sleep(0.6)
+        start = time.perf_counter()
+        expiring.put("trigger", 0)
+        purge_seconds = time.perf_counter() - start
+
+        stats = cache.stats()
+        assert stats["total_entries"] == self.ENTRIES
+        assert stats["evictions"] == 10_000
+        assert stats["hits"] == self.ENTRIES
+        assert len(expiring) == self.ENTRIES // 2 + 1
+        # Generous bounds: O(n) scanning per put would take minutes here
+        assert fill_seconds < 5 and get_seconds < 5 and evict_seconds < 5
+        assert purge_seconds < 1
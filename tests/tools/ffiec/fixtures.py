@@ -25,6 +25,15 @@ from tools.infrastructure.banking.ffiec_cdr_models import (
     FFIECDiscoveryResult,
     FFIECCDRAPIResponse
 )
+from tools.infrastructure.banking.ffiec_filer_index import reset_filer_indexes
+
+
+@pytest.fixture(autouse=True)
+def reset_ffiec_filer_index():
+    """Start every test without a process-wide filer index."""
+    reset_filer_indexes()
+    yield
+    reset_filer_indexes()
 
 
 @pytest.fixture
@@ -322,4 +322,113 @@ class TestFFIECCallReportDataTool:
             assert result_data["error"] == "Test error message"
             assert result_data["error_code"] == "TEST_ERROR"
             assert result_data["rssd_id"] == "451965"
-            assert result_data["reporting_period"] == "2024-06-30"
\ No newline at end of file
+            assert result_data["reporting_period"] == "2024-06-30"
+
+SAMPLE_SDF = (
+    "MDRM\tRCON2170\tRCA\tTotal assets\t9500000\t20240630\n"
+    "MDRM\tRCON2200\tRCE\tTotal deposits\t7000000\t20240630\n"
+    "MDRM\tRCON8274\tRCRI\tCommon equity tier 1 capital\t800000\t20240630\n"
+    "MDRM\tRCON7273\tRCRI\tCommon equity tier 1 capital ratio\t12.5\t20240630\n"
+).encode("utf-8")
+
+
+SAMPLE_UBPR_XBRL = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<xbrl xmlns="http://www.xbrl.org/2003/instance" '
+    'xmlns:uc="http://www.cdr.ffiec.gov/xbrl/ubpr/v174/Concepts">\n'
+    '<uc:UBPRE013 contextRef="CI_451965_2023-12-31" unitRef="PURE">0.90</uc:UBPRE013>\n'
+    '<uc:UBPRE013 contextRef="CI_451965_2024-06-30" unitRef="PURE">1.25</uc:UBPRE013>\n'
+    '<uc:UBPRD486 contextRef="CI_451965_2024-06-30" unitRef="PURE">12.50</uc:UBPRD486>\n'
+    '</xbrl>\n'
+).encode("utf-8")
+
+
+class TestParsedReportCache:
+    """Test cases for parsed call report caching and the MDRM index."""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_request_skips_parsing(self, mock_settings, mock_ffiec_api_client):
+        """A second request for the same report is served without re-parsing."""
+        mock_ffiec_api_client.retrieve_facsimile = AsyncMock(return_value=SAMPLE_SDF)
+        with patch('tools.atomic.ffiec_call_report_data_tool.FFIECCDRAPIClient', return_value=mock_ffiec_api_client):
+            tool = FFIECCallReportDataTool(settings=mock_settings)
+            
+            original_parse = FFIECCallReportDataTool._parse_sdf_data
+            with patch.object(FFIECCallReportDataTool, '_parse_sdf_data', autospec=True, side_effect=original_parse) as parse_spy:
+                first = await tool._arun(rssd_id="451965", reporting_period="2024-06-30", schedules=["RCA", "RCE"])
+                second = await tool._arun(rssd_id="451965", reporting_period="2024-06-30", schedules=["RCE", "RCA"])
+            
+            assert parse_spy.call_count == 1
+            assert mock_ffiec_api_client.retrieve_facsimile.call_count == 1
+            first_data = json.loads(first)
+            second_data = json.loads(second)
+            assert first_data["call_report_schedules"] == second_data["call_report_schedules"]
+            assert second_data["semantic_mappings"]["total_assets"]["value"] == 9500000.0
+    
+    @pytest.mark.asyncio
+    async def test_different_schedules_parsed_separately(self, mock_settings, mock_ffiec_api_client):
+        """Requests for other schedules get their own parsed entry."""
+        mock_ffiec_api_client.retrieve_facsimile = AsyncMock(return_value=SAMPLE_SDF)
+        with patch('tools.atomic.ffiec_call_report_data_tool.FFIECCDRAPIClient', return_value=mock_ffiec_api_client):
+            tool = FFIECCallReportDataTool(settings=mock_settings)
+            
+            await tool._arun(rssd_id="451965", reporting_period="2024-06-30", schedules=["RCA"])
+            result = await tool._arun(rssd_id="451965", reporting_period="2024-06-30", schedules=["RCRI"])
+            
+            assert list(json.loads(result)["call_report_schedules"].keys()) == ["RCRI"]
+    
+    @pytest.mark.asyncio
+    async def test_specific_fields_from_cached_report(self, mock_settings, mock_ffiec_api_client):
+        """Field filtering uses the cached report's MDRM index."""
+        mock_ffiec_api_client.retrieve_facsimile = AsyncMock(return_value=SAMPLE_SDF)
+        with patch('tools.atomic.ffiec_call_report_data_tool.FFIECCDRAPIClient', return_value=mock_ffiec_api_client):
+            tool = FFIECCallReportDataTool(settings=mock_settings)
+            
+            await tool._arun(rssd_id="451965", reporting_period="2024-06-30", schedules=["RCRI"])
+            result = await tool._arun(
+                rssd_id="451965",
+                reporting_period="2024-06-30",
+                schedules=["RCRI"],
+                specific_fields=["RCON7273", "RCON9999"]
+            )
+            
+            result_data = json.loads(result)
+            assert result_data["balance_sheet_data"]["capital_ratios"]["RCON7273"]["value"] == 12.5
+            assert result_data["balance_sheet_data"]["summary"]["fields_found"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_specific_fields_parse_is_partial_and_not_cached(self, mock_settings, mock_ffiec_api_client):
+        """Requested fields stop the XBRL parse early; the short report is not reused."""
+        mock_ffiec_api_client.retrieve_ubpr_facsimile = AsyncMock(return_value=SAMPLE_UBPR_XBRL)
+        with patch('tools.atomic.ffiec_call_report_data_tool.FFIECCDRAPIClient', return_value=mock_ffiec_api_client):
+            tool = FFIECCallReportDataTool(settings=mock_settings)
+            
+            original_parse = FFIECCallReportDataTool._parse_ubpr_xbrl_data
+            with patch.object(FFIECCallReportDataTool, '_parse_ubpr_xbrl_data', autospec=True, side_effect=original_parse) as parse_spy:
+                await tool._arun(
+                    rssd_id="451965",
+                    reporting_period="2024-06-30",
+                    data_type="ubpr",
+                    specific_fields=["UBPRE013"]
+                )
+                await tool._arun(rssd_id="451965", reporting_period="2024-06-30", data_type="ubpr")
+            
+            assert parse_spy.call_count == 2
+            assert parse_spy.call_args_list[0].args[2:] == (["UBPRE013"], "2024-06-30")
+            # The requested period's fact is kept, not the older context listed first
+            partial = tool._parse_ubpr_xbrl_data(SAMPLE_UBPR_XBRL, ["UBPRE013"], "2024-06-30")
+            assert partial["ubpre013"] == 1.25 and partial["ubpre013_context"] == "CI_451965_2024-06-30"
+            assert parse_spy.call_args_list[1].args[2] is None
+    
+    def test_mdrm_index_and_semantic_mappings(self, mock_settings):
+        """Semantic mappings are derived from the MDRM index."""
+        with patch('tools.atomic.ffiec_call_report_data_tool.FFIECCDRAPIClient'):
+            tool = FFIECCallReportDataTool(settings=mock_settings)
+            parsed = tool._parse_sdf_data(SAMPLE_SDF, "451965", ["RCA", "RCE"])
+            
+            index = tool._build_mdrm_index(parsed["call_report_schedules"])
+            
+            assert [entry["schedule"] for entry in index["RCON2170"]] == ["RCA"]
+            mappings = tool._generate_semantic_mappings(parsed["call_report_schedules"], index)
+            assert mappings["total_deposits"]["mdrm_code"] == "RCON2200"
+            assert round(mappings["deposits_to_assets_ratio"]["value"], 2) == 73.68
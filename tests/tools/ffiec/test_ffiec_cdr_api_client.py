@@ -240,6 +240,10 @@ class TestFFIECCDRAPIClient:
                 result = await client.retrieve_facsimile("451965", "2024-06-30", "PDF")
                 
                 assert result is None  # Should return None on fault
+                
+                # Callers that must tell faults from missing filings get the fault
+                with pytest.raises(SOAPFault):
+                    await client.retrieve_facsimile("451965", "2024-06-30", "PDF", raise_on_error=True)
     
     @pytest.mark.asyncio
     @patch('tools.infrastructure.banking.ffiec_cdr_api_client.AsyncClient')
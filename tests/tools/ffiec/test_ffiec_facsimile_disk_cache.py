@@ -0,0 +1,147 @@
+"""
+Tests for the persistent FFIEC facsimile disk cache.
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from tools.infrastructure.banking.ffiec_facsimile_disk_cache import FFIECFacsimileDiskCache
+from tools.infrastructure.banking.ffiec_cdr_api_client import FFIECCDRAPIClient
+from tools.infrastructure.banking.ffiec_cdr_constants import build_ffiec_cache_key
+
+
+SAMPLE_FACSIMILE = b"<xbrl>" + b"<item>RCON2170 1000000</item>" * 2000 + b"</xbrl>"
+
+
+class TestFFIECFacsimileDiskCache:
+    """Test cases for the on-disk facsimile tier."""
+
+    def test_put_and_get_round_trip(self, tmp_path):
+        """Stored facsimiles are compressed and read back intact."""
+        cache = FFIECFacsimileDiskCache(str(tmp_path))
+        cache_key = build_ffiec_cache_key("451965", "2024-06-30", "XBRL")
+
+        cache.put(cache_key, SAMPLE_FACSIMILE)
+
+        assert cache.get(cache_key) == SAMPLE_FACSIMILE
+        stats = cache.stats()
+        assert stats["total_entries"] == 1
+        assert stats["stored_bytes"] < stats["uncompressed_bytes"]
+        assert stats["hits"] == 1
+
+    def test_missing_directory_and_key(self, tmp_path):
+        """A cache over a missing directory just misses."""
+        cache = FFIECFacsimileDiskCache(str(tmp_path / "not_created"))
+
+        assert cache.get("unknown") is None
+        assert not (tmp_path / "not_created").exists()
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new process (instance) sees facsimiles stored by another."""
+        FFIECFacsimileDiskCache(str(tmp_path)).put("key", SAMPLE_FACSIMILE)
+
+        reopened = FFIECFacsimileDiskCache(str(tmp_path))
+
+        assert reopened.get("key") == SAMPLE_FACSIMILE
+
+    def test_size_bounded_lru_eviction(self, tmp_path):
+        """Least recently used blobs are evicted when over the byte budget."""
+        probe = FFIECFacsimileDiskCache(str(tmp_path / "probe"))
+        probe.put("probe", SAMPLE_FACSIMILE)
+        blob_size = probe.stats()["stored_bytes"]
+
+        cache = FFIECFacsimileDiskCache(str(tmp_path / "cache"), max_bytes=blob_size * 2)
+        cache.put("a", SAMPLE_FACSIMILE)
+        cache.put("b", SAMPLE_FACSIMILE)
+        cache.get("a")
+        cache.put("c", SAMPLE_FACSIMILE)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == SAMPLE_FACSIMILE
+        assert cache.get("c") == SAMPLE_FACSIMILE
+        assert cache.stats()["evictions"] == 1
+        assert not (tmp_path / "cache" / "b.zlib").exists()
+
+    def test_hit_does_not_rewrite_index(self, tmp_path):
+        """Reads record access on the blob, leaving the index untouched."""
+        cache = FFIECFacsimileDiskCache(str(tmp_path))
+        cache.put("key", SAMPLE_FACSIMILE)
+        index_mtime = (tmp_path / "index.json").stat().st_mtime_ns
+        blob_mtime = (tmp_path / "key.zlib").stat().st_mtime_ns
+
+        assert cache.get("key") == SAMPLE_FACSIMILE
+
+        assert (tmp_path / "index.json").stat().st_mtime_ns == index_mtime
+        assert (tmp_path / "key.zlib").stat().st_mtime_ns > blob_mtime
+
+    def test_concurrent_writers_keep_each_others_entries(self, tmp_path):
+        """Instances sharing a directory merge their index updates."""
+        writers = [FFIECFacsimileDiskCache(str(tmp_path)) for _ in range(2)]
+
+        def store(cache, prefix):
+            for i in range(10):
+                cache.put(f"{prefix}{i}", SAMPLE_FACSIMILE)
+
+        threads = [
+            threading.Thread(target=store, args=(cache, prefix))
+            for cache, prefix in zip(writers, ("a", "b"))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert FFIECFacsimileDiskCache(str(tmp_path)).stats()["total_entries"] == 20
+
+    def test_corrupt_blob_discarded(self, tmp_path):
+        """A damaged blob is treated as a miss and removed."""
+        cache = FFIECFacsimileDiskCache(str(tmp_path))
+        cache.put("key", SAMPLE_FACSIMILE)
+        (tmp_path / "key.zlib").write_bytes(b"not zlib data")
+
+        assert cache.get("key") is None
+        assert cache.stats()["total_entries"] == 0
+
+    def test_clear(self, tmp_path):
+        """Clearing removes blobs and index entries."""
+        cache = FFIECFacsimileDiskCache(str(tmp_path))
+        cache.put("key", SAMPLE_FACSIMILE)
+
+        cache.clear()
+
+        assert cache.get("key") is None
+        assert list(tmp_path.glob("*.zlib")) == []
+
+
+class TestFFIECClientDiskTier:
+    """Test the disk tier underneath the client's memory cache."""
+
+    @pytest.mark.asyncio
+    @patch('tools.infrastructure.banking.ffiec_cdr_api_client.AsyncClient')
+    async def test_disk_hit_skips_soap_call(self, mock_async_client_class, tmp_path):
+        """A facsimile downloaded by one client is served from disk to the next."""
+        mock_client = MagicMock()
+        mock_client.service.RetrieveFacsimile = AsyncMock(return_value=SAMPLE_FACSIMILE)
+        mock_async_client_class.return_value = mock_client
+
+        with patch('tools.infrastructure.banking.ffiec_cdr_api_client.httpx'):
+            first = FFIECCDRAPIClient("test_key", "test_user", disk_cache_path=str(tmp_path))
+            first._soap_client = mock_client
+            assert await first.retrieve_facsimile("451965", "2024-06-30", "XBRL") == SAMPLE_FACSIMILE
+
+            # Fresh client: empty memory cache, same disk directory
+            second = FFIECCDRAPIClient("test_key", "test_user", disk_cache_path=str(tmp_path))
+            second._soap_client = mock_client
+            assert await second.retrieve_facsimile("451965", "2024-06-30", "XBRL") == SAMPLE_FACSIMILE
+
+        assert mock_client.service.RetrieveFacsimile.call_count == 1
+        assert second.get_cache_stats()["disk_cache"]["hits"] == 1
+        # Disk hits are promoted into the memory tier
+        assert second.cache.get(build_ffiec_cache_key("451965", "2024-06-30", "XBRL")) is not None
@@ -0,0 +1,189 @@
+"""
+Tests for the process-wide FFIEC filer index.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from tools.infrastructure.banking.ffiec_cdr_api_client import FFIECCDRAPIClient
+from tools.infrastructure.banking.ffiec_filer_index import FFIECFilerIndex, get_filer_index
+from .fixtures import *
+
+
+FILERS = {
+    "2024-06-30": [451965, 123456],
+    "2024-03-31": [451965, 123456, 789012],
+    "2023-12-31": [789012, 555555],
+}
+
+
+class CountingLoader:
+    """Filer loader that counts loads and can be switched to new data or errors."""
+
+    def __init__(self, filers=FILERS, delay: float = 0):
+        self.filers = filers
+        self.delay = delay
+        self.error = None
+        self.loads = 0
+
+    async def __call__(self):
+        self.loads += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.filers
+
+
+def age_snapshot(index: FFIECFilerIndex, seconds: float) -> None:
+    index._snapshot.built_at -= seconds
+
+
+class TestFFIECFilerIndex:
+    """Test snapshot lookups and refresh behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_latest_period_per_bank(self):
+        """Each bank resolves to the newest period it filed for, from one load."""
+        index = FFIECFilerIndex("Call")
+        loader = CountingLoader()
+
+        assert await index.latest_period("451965", loader) == "2024-06-30"
+        assert await index.latest_period("789012", loader) == "2024-03-31"
+        assert await index.latest_period("555555", loader) == "2023-12-31"
+        assert await index.latest_period("999999", loader) is None
+        assert loader.loads == 1
+        assert index.stats()["banks_indexed"] == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_load(self):
+        """Lookups arriving while the index loads wait for the same refresh."""
+        index = FFIECFilerIndex("Call")
+        loader = CountingLoader(delay=0.01)
+
+        results = await asyncio.gather(*(index.latest_period("451965", loader) for _ in range(20)))
+
+        assert set(results) == {"2024-06-30"}
+        assert loader.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_refreshes_in_background(self):
+        """An aged snapshot still answers while the refresh runs."""
+        index = FFIECFilerIndex("Call", refresh_interval_seconds=60, max_stale_seconds=3600)
+        loader = CountingLoader()
+        await index.latest_period("789012", loader)
+
+        age_snapshot(index, 120)
+        loader.filers = {**FILERS, "2024-09-30": [789012]}
+
+        assert await index.latest_period("789012", loader) == "2024-03-31"
+        await asyncio.sleep(0)
+        assert await index.latest_period("789012", loader) == "2024-09-30"
+        assert loader.loads == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_waits_and_falls_back(self):
+        """Past max_stale the lookup waits; a failed refresh keeps the old snapshot."""
+        index = FFIECFilerIndex("Call", refresh_interval_seconds=60, max_stale_seconds=600)
+        loader = CountingLoader()
+        await index.latest_period("451965", loader)
+
+        age_snapshot(index, 1200)
+        loader.error = RuntimeError("FFIEC unavailable")
+
+        assert await index.latest_period("451965", loader) == "2024-06-30"
+        assert index.stats()["refresh_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_first_load_raises(self):
+        """Without a snapshot, load errors and empty loads reach the caller."""
+        index = FFIECFilerIndex("Call")
+        loader = CountingLoader(filers={})
+
+        with pytest.raises(ValueError):
+            await index.latest_period("451965", loader)
+
+    def test_process_wide_registry(self):
+        """Clients share one index per data series."""
+        assert get_filer_index("Call") is get_filer_index("Call")
+        assert get_filer_index("Call") is not get_filer_index("UBPR")
+
+
+def build_client(service) -> FFIECCDRAPIClient:
+    soap_client = MagicMock()
+    soap_client.service = service
+    with patch('tools.infrastructure.banking.ffiec_cdr_api_client.AsyncClient', return_value=soap_client), \
+            patch('tools.infrastructure.banking.ffiec_cdr_api_client.httpx'):
+        return FFIECCDRAPIClient("test_key", "test_user")
+
+
+def build_service(periods, filers_by_period, latency: float = 0):
+    async def reporting_periods(dataSeries):
+        await asyncio.sleep(latency)
+        return periods
+
+    async def filers_since_date(dataSeries, reportingPeriodEndDate, lastUpdateDateTime):
+        await asyncio.sleep(latency)
+        return filers_by_period.get(reportingPeriodEndDate, [])
+
+    service = MagicMock()
+    service.RetrieveReportingPeriods = AsyncMock(side_effect=reporting_periods)
+    service.RetrieveFilersSinceDate = AsyncMock(side_effect=filers_since_date)
+    return service
+
+
+class TestClientDiscovery:
+    """Test discover_latest_filing on top of the shared index."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_the_index(self):
+        """A second client resolves banks without calling the service again."""
+        service = build_service(["2024-03-31", "2024-06-30"], {"2024-06-30": [451965], "2024-03-31": [480228]})
+
+        first = await build_client(service).discover_latest_filing("451965")
+        second = await build_client(service).discover_latest_filing("480228")
+
+        assert (first, second) == ("2024-06-30", "2024-03-31")
+        assert service.RetrieveReportingPeriods.await_count == 1
+        assert service.RetrieveFilersSinceDate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_periods_ordered_by_date(self):
+        """M/D/YYYY periods are ordered chronologically, not as strings."""
+        periods = ["9/30/2023", "12/31/2023", "3/31/2024", "6/30/2024", "12/31/2022"]
+        service = build_service(periods, {period: [451965] for period in periods})
+
+        result = await build_client(service).discover_latest_filing("451965")
+
+        assert result == "2024-06-30"
+        requested = {call.kwargs["reportingPeriodEndDate"] for call in service.RetrieveFilersSinceDate.await_args_list}
+        assert requested == {"6/30/2024", "3/31/2024", "12/31/2023", "9/30/2023"}
+
+    @pytest.mark.asyncio
+    async def test_failing_period_is_skipped(self):
+        """A period whose filer list fails to load does not break discovery."""
+        service = build_service(["2024-06-30", "2024-03-31"], {"2024-03-31": [451965]})
+        filers_since_date = service.RetrieveFilersSinceDate.side_effect
+
+        async def flaky(dataSeries, reportingPeriodEndDate, lastUpdateDateTime):
+            if reportingPeriodEndDate == "2024-06-30":
+                raise RuntimeError("timeout")
+            return await filers_since_date(dataSeries, reportingPeriodEndDate, lastUpdateDateTime)
+
+        service.RetrieveFilersSinceDate.side_effect = flaky
+
+        assert await build_client(service).discover_latest_filing("451965") == "2024-03-31"
+
+    @pytest.mark.asyncio
+    async def test_invalid_rssd(self):
+        """Non-numeric RSSD IDs are reported as not found."""
+        service = build_service(["2024-06-30"], {"2024-06-30": [451965]})
+
+        assert await build_client(service).discover_latest_filing("not-a-bank") is None
@@ -0,0 +1,156 @@
+"""
+Tests for the parallel quarter-based filing search in the FFIEC Call Report tool.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from tools.atomic.ffiec_call_report_data_tool import FFIECCallReportDataTool
+from .fixtures import *
+
+
+class FakeFacsimileClient:
+    """FFIEC client stand-in whose banks filed only some quarters."""
+
+    def __init__(self, missing_newest: int, latency: float = 0.01, fail_with_error: bool = False):
+        self.missing_newest = missing_newest
+        self.latency = latency
+        self.fail_with_error = fail_with_error
+        self.requested: List[str] = []
+        self.cancelled: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def retrieve_facsimile(self,
+                                 rssd_id: str,
+                                 reporting_period: str,
+                                 format_type: str,
+                                 raise_on_error: bool = False) -> Optional[bytes]:
+        self.requested.append(reporting_period)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # The oldest quarter answers first, newer ones in request order after it
+            rank = len(self.requested)
+            await asyncio.sleep(self.latency * (1 if rank == 8 else 2 + rank))
+        except asyncio.CancelledError:
+            self.cancelled.append(reporting_period)
+            raise
+        finally:
+            self.in_flight -= 1
+
+        quarter_ends = sorted(_recent_quarter_ends(), reverse=True)
+        if reporting_period in quarter_ends[:self.missing_newest]:
+            if self.fail_with_error:
+                raise RuntimeError("CDR service unavailable")
+            return None
+        return f"SDF {reporting_period}".encode()
+
+
+def _recent_quarter_ends() -> List[str]:
+    from datetime import date
+    today = date.today()
+    quarters = [
+        date(year, month, day)
+        for year in range(today.year - 2, today.year + 1)
+        for month, day in ((3, 31), (6, 30), (9, 30), (12, 31))
+    ]
+    return [q.strftime("%Y-%m-%d") for q in sorted(quarters, reverse=True) if q < today][:8]
+
+
+@pytest.fixture
+def probe_tool(mock_settings):
+    """Build tools whose FFIEC client is replaced by a fake."""
+    def with_client(client):
+        with patch('tools.atomic.ffiec_call_report_data_tool.FFIECCDRAPIClient'):
+            tool = FFIECCallReportDataTool(settings=mock_settings)
+        object.__setattr__(tool, '_ffiec_client', client)
+        return tool
+
+    return with_client
+
+
+class TestParallelFilingProbe:
+    """Test the bounded-concurrency quarter probe."""
+
+    @pytest.mark.asyncio
+    async def test_newest_filed_quarter_wins(self, probe_tool):
+        """The newest quarter with a filing is returned even if older ones answer first."""
+        client = FakeFacsimileClient(missing_newest=2)
+        tool = probe_tool(client)
+
+        period, data = await tool._get_most_recent_filing("451965", max_concurrency=8)
+
+        expected = _recent_quarter_ends()[2]
+        assert period == expected
+        assert data == f"SDF {expected}".encode()
+        # Quarters older than the winner were still in flight and got cancelled
+        assert client.cancelled
+        assert all(cancelled < expected for cancelled in client.cancelled)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, probe_tool):
+        """No more than max_concurrency facsimile requests run at once."""
+        client = FakeFacsimileClient(missing_newest=8)
+        tool = probe_tool(client)
+
+        period, data = await tool._get_most_recent_filing("451965", max_concurrency=3)
+
+        assert (period, data) == (None, None)
+        assert len(client.requested) == 8
+        assert client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_periods_are_not_reprobed(self, probe_tool):
+        """Periods without a filing are skipped on the next search within the TTL."""
+        client = FakeFacsimileClient(missing_newest=2)
+        tool = probe_tool(client)
+
+        first = await tool._get_most_recent_filing("451965", max_concurrency=1)
+        client.requested.clear()
+        second = await tool._get_most_recent_filing("451965", max_concurrency=1)
+
+        assert first == second
+        assert client.requested == [_recent_quarter_ends()[2]]
+
+    @pytest.mark.asyncio
+    async def test_failed_probes_are_retried(self, probe_tool):
+        """Periods whose request errored are probed again on the next search."""
+        client = FakeFacsimileClient(missing_newest=2, fail_with_error=True)
+        tool = probe_tool(client)
+
+        first = await tool._get_most_recent_filing("451965", max_concurrency=1)
+        client.requested.clear()
+        client.fail_with_error = False
+        second = await tool._get_most_recent_filing("451965", max_concurrency=1)
+
+        assert first[0] == _recent_quarter_ends()[2]
+        assert client.requested[:2] == _recent_quarter_ends()[:2]
+        assert second[0] == _recent_quarter_ends()[2]
+
+    @pytest.mark.asyncio
+    async def test_missing_periods_are_cached_per_bank(self, probe_tool):
+        """A miss for one bank does not hide the same period for another bank."""
+        client = FakeFacsimileClient(missing_newest=1)
+        tool = probe_tool(client)
+
+        await tool._get_most_recent_filing("451965", max_concurrency=1)
+        client.requested.clear()
+        await tool._get_most_recent_filing("480228", max_concurrency=1)
+
+        assert client.requested[0] == _recent_quarter_ends()[0]
+
+    @pytest.mark.asyncio
+    async def test_without_client(self, probe_tool):
+        """Without an FFIEC client the search reports nothing found."""
+        tool = probe_tool(None)
+
+        assert await tool._get_most_recent_filing("451965") == (None, None)
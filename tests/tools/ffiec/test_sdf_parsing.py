@@ -0,0 +1,95 @@
+"""
+Tests for the call report tool's SDF parsing.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from tools.atomic.ffiec_call_report_data_tool import FFIECCallReportDataTool
+from .fixtures import *
+
+
+TAB_SDF = (
+    "Report header\n"
+    "MDRM\trcon2170 \tRCA\t Total assets\t9,500,000\t20240630\r\n"
+    "MDRM\tRCON2200\tRCE\tTotal deposits\t$7000000\t20240630\n"
+    "MDRM\tRCON9999\tRCE\tConfidential item\tCONF\t20240630\n"
+    "MDRM\tRCON0010\tRCA\tCash and balances due\t\t20240630\n"
+    "MDRM\tRCON1234\tRCA\tTruncated row\t5\n"
+    "  RIAD4340\tRIAD4340\tRI\tNet income\t120000\t20240630\n"
+)
+
+LEGACY_SDF = (
+    "Call Date;Bank RSSD Identifier;MDRM #;Value;Last Update;Short Definition;Call Schedule;Line Number\n"
+    "20240630;451965;RCON2170;9500000;20240715;Total assets;RCA;12\n"
+    "20240630;999999;RCON2170;1;20240715;Total assets;RCA;12\n"
+    "20240630;451965;rcon3210;850000;20240715;Total equity capital;RCG\n"
+    "20240630;451965;short;row\n"
+)
+
+
+@pytest.fixture
+def tool(mock_settings):
+    with patch('tools.atomic.ffiec_call_report_data_tool.FFIECCDRAPIClient'):
+        yield FFIECCallReportDataTool(settings=mock_settings)
+
+
+class TestToolSDFParsing:
+    """Test parsing SDF text into schedule-grouped line items."""
+
+    def test_grouped_output_and_semantic_mappings(self, tool):
+        """Requested schedules are grouped and key metrics mapped."""
+        parsed = tool._parse_sdf_data(TAB_SDF.encode("utf-8"), "451965", ["RCA", "RCE"])
+
+        assert parsed["format_used"] == "SDF_DYNAMIC_SCHEDULE_GROUPED"
+        assert parsed["metadata"]["total_line_items"] == 4
+        assert parsed["metadata"]["data_rows_processed"] == 5
+        assert parsed["summary"]["balance_sheet_schedules"] == ["RCA", "RCE"]
+        assert parsed["semantic_mappings"]["total_assets"]["value"] == 9_500_000
+        assert parsed["semantic_mappings"]["deposits_to_assets_ratio"]["formatted_value"] == "73.68%"
+        assert parsed["semantic_mappings"]["cash_and_equivalents"]["schedule"] == "RCA"
+
+    def test_line_item_fields(self, tool):
+        """Fields are stripped, codes upper-cased, and blank or text values kept as reported."""
+        schedules = tool._parse_sdf_data(TAB_SDF.encode("utf-8"), None, ["RCA", "RCE", "RI"])["call_report_schedules"]
+
+        assert list(schedules) == ["RCA", "RCE", "RI"]
+        assert schedules["RCA"]["schedule_info"]["name"] == "Balance Sheet - Assets"
+        assert schedules["RCA"]["line_items"][0] == {
+            "mdrm_code": "RCON2170", "short_definition": "Total assets", "value": 9_500_000.0,
+            "formatted_value": "$9.5M", "call_date": "20240630"
+        }
+        assert schedules["RCA"]["line_items"][1]["formatted_value"] == "$0"
+        assert schedules["RCE"]["line_items"][1]["value"] == "CONF"
+
+    def test_repeated_code_mapping_follows_schedule_order(self, tool):
+        """When several line items match a metric, the last one in schedule order wins."""
+        text = (
+            "MDRM\tRCON2170\tRCA\tTotal assets\t100\t20240630\n"
+            "MDRM\tRCON2171\tRCE\tTotal assets, other basis\t200\t20240630\n"
+            "MDRM\tRCON2170\tRCG\tTotal assets\t300\t20240630\n"
+        )
+
+        parsed = tool._parse_sdf_data(text.encode("utf-8"), None, ["RCA", "RCE", "RCG"])
+
+        assert parsed["semantic_mappings"]["total_assets"] == {
+            "value": 300.0, "formatted_value": "$300", "mdrm_code": "RCON2170", "schedule": "RCG"
+        }
+
+    def test_summary_mode_samples(self, tool):
+        """Summary mode reports counts and the first items of each schedule for the requested bank."""
+        parsed = tool._parse_sdf_data(LEGACY_SDF.encode("utf-8"), "451965")
+
+        assert parsed["summary_mode"] is True
+        assert parsed["metadata"]["rssd_id"] == "451965"
+        assert parsed["metadata"]["data_rows_processed"] == 3
+        assert parsed["available_schedules"]["RCA"]["line_item_count"] == 1
+        assert parsed["available_schedules"]["RCG"]["sample_items"][0]["mdrm_code"] == "RCON3210"
+        assert parsed["available_schedules"]["RCG"]["sample_items"][0]["line_number"] == ""
+
@@ -0,0 +1,191 @@
+"""
+Tests for the streaming XBRL fact parser.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+src_dir = Path(__file__).parent.parent.parent.parent / "src"
+sys.path.insert(0, str(src_dir))
+parser_module = src_dir / "tools" / "infrastructure" / "banking" / "xbrl_stream_parser.py"
+
+from tools.atomic.ffiec_call_report_data_tool import FFIECCallReportDataTool
+from tools.infrastructure.banking.xbrl_stream_parser import (
+    extract_xbrl_facts,
+    call_report_concept,
+    ubpr_concept
+)
+from .fixtures import *
+
+
+def build_ubpr_instance(concepts: int, contexts: int = 5) -> bytes:
+    """Build a synthetic UBPR instance with one fact per concept and context."""
+    parts = [
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<xbrl xmlns="http://www.xbrl.org/2003/instance" '
+        'xmlns:uc="http://www.cdr.ffiec.gov/xbrl/ubpr/v174/Concepts">\n'
+    ]
+    for context in range(contexts):
+        parts.append(
+            f'<context id="CI_451965_2024-0{context + 1}-30"><entity>'
+            f'<identifier scheme="http://www.ffiec.gov/cdr">451965</identifier>'
+            f'</entity></context>\n'
+        )
+    for concept in range(concepts):
+        for context in range(contexts):
+            parts.append(
+                f'<uc:UBPR{concept:04d} contextRef="CI_451965_2024-0{context + 1}-30" '
+                f'unitRef="PURE" decimals="4">{concept}.{context}</uc:UBPR{concept:04d}>\n'
+            )
+    parts.append('</xbrl>\n')
+    return "".join(parts).encode("utf-8")
+
+
+CALL_REPORT_XBRL = b"""<?xml version="1.0" encoding="utf-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"
+            xmlns:cc="http://www.ffiec.gov/xbrl/call/concepts">
+  <xbrli:context id="CI_2024-03-31"/>
+  <cc:RCON2170 contextRef="CI_2024-03-31" unitRef="USD">9000</cc:RCON2170>
+  <cc:RCON2170 contextRef="CI_2024-06-30" unitRef="USD">9500</cc:RCON2170>
+  <cc:RCON7273 contextRef="CI_2024-06-30" unitRef="PURE">0.125</cc:RCON7273>
+  <cc:RCON2200 contextRef="CI_2024-06-30" unitRef="USD">  </cc:RCON2200>
+</xbrli:xbrl>
+"""
+
+
+class TestExtractXBRLFacts:
+    """Test cases for streaming fact extraction."""
+
+    def test_call_report_latest_context_wins(self):
+        """The most recent context is kept per concept and blank facts skipped."""
+        facts, scanned = extract_xbrl_facts(CALL_REPORT_XBRL, call_report_concept)
+
+        assert set(facts) == {"RCON2170", "RCON7273"}
+        assert facts["RCON2170"] == {"context": "CI_2024-06-30", "unit": "USD", "value": "9500"}
+        assert scanned == 6
+
+    def test_ubpr_concepts_matched_by_prefix(self):
+        """UBPR concepts are found regardless of taxonomy version namespace."""
+        facts, _ = extract_xbrl_facts(build_ubpr_instance(3), ubpr_concept)
+
+        assert sorted(facts) == ["UBPR0000", "UBPR0001", "UBPR0002"]
+        assert facts["UBPR0002"]["value"] == "2.4"
+
+    def test_requested_concepts_stop_early(self):
+        """Parsing stops once every requested concept has been seen for the reporting period."""
+        data = build_ubpr_instance(1000)
+
+        facts, scanned = extract_xbrl_facts(
+            data, ubpr_concept, concepts=["ubpr0001"], stop_early=True, period="2024-05-30"
+        )
+        full, full_scan = extract_xbrl_facts(data, ubpr_concept)
+
+        assert list(facts) == ["UBPR0001"]
+        assert scanned < full_scan / 100
+        # Contexts are listed oldest first; the latest one still wins
+        assert facts["UBPR0001"] == full["UBPR0001"]
+        assert facts["UBPR0001"]["value"] == "1.4"
+
+    def test_stop_early_without_period_reads_every_context(self):
+        """Without a reporting period the latest context is only known at the end."""
+        data = build_ubpr_instance(10)
+
+        facts, scanned = extract_xbrl_facts(data, ubpr_concept, concepts=["UBPR0001"], stop_early=True)
+        _, full_scan = extract_xbrl_facts(data, ubpr_concept)
+
+        assert facts["UBPR0001"]["context"] == "CI_451965_2024-05-30"
+        assert facts["UBPR0001"]["value"] == "1.4"
+        assert scanned == full_scan
+
+    def test_undeclared_latin1_bytes(self):
+        """Latin-1 payloads that claim UTF-8 are re-encoded and parsed."""
+        data = CALL_REPORT_XBRL.replace(b'<xbrli:context id="CI_2024-03-31"/>', b"<note>Soci\xe9t\xe9</note>")
+
+        facts, _ = extract_xbrl_facts(data, call_report_concept)
+
+        assert facts["RCON7273"]["value"] == "0.125"
+
+    def test_tool_parsers_use_stream(self, mock_settings):
+        """The tool's XBRL and UBPR parsers produce their usual output."""
+        with patch('tools.atomic.ffiec_call_report_data_tool.FFIECCDRAPIClient'):
+            tool = FFIECCallReportDataTool(settings=mock_settings)
+
+            call_report = tool._parse_xbrl_data(CALL_REPORT_XBRL)
+            ubpr = tool._parse_ubpr_xbrl_data(build_ubpr_instance(2))
+
+        assert call_report["parsing_successful"] is True
+        assert call_report["rcon2170"] == 9500.0
+        assert call_report["rcon7273_formatted"] == "12.50%"
+        assert ubpr["parsing_successful"] is True
+        assert ubpr["ubpr0001"] == 1.4
+        assert ubpr["total_elements_available"] == 2
+
+
+_BENCHMARK_SCRIPT = textwrap.dedent("""
+    import importlib.util, json, sys, time
+    import xml.etree.ElementTree as ET
+
+    def peak_rss_kb():
+        # VmHWM is per address space; ru_maxrss would inherit the pytest parent's peak
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+
+    # Load the parser module directly to keep the tools package imports out of the measurement
+    spec = importlib.util.spec_from_file_location("xbrl_stream_parser", sys.argv[3])
+    parser = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(parser)
+    data = open(sys.argv[2], "rb").read()
+    baseline_kb = peak_rss_kb()
+    start = time.perf_counter()
+    if sys.argv[1] == "tree":
+        # Previous path: decode to str, build the full tree, scan every element
+        root = ET.fromstring(data.decode("utf-8"))
+        facts = {}
+        for elem in root.iter():
+            name = elem.tag.split("}")[-1]
+            if name.startswith("UBPR") and elem.text:
+                context = elem.get("contextRef", "")
+                if name not in facts or context > facts[name]["context"]:
+                    facts[name] = {"element": elem, "context": context, "value": elem.text}
+    else:
+        facts, _ = parser.extract_xbrl_facts(data, parser.ubpr_concept, strip_values=False)
+    elapsed = time.perf_counter() - start
+    peak_kb = peak_rss_kb()
+    print(json.dumps({"seconds": elapsed, "peak_growth_kb": peak_kb - baseline_kb, "facts": len(facts)}))
+""")
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not Path("/proc/self/status").exists(), reason="peak RSS read from /proc")
+class TestXBRLStreamBenchmark:
+    """Compare the streaming parser with the previous full-tree path."""
+
+    def _measure(self, mode: str, path: Path) -> dict:
+        output = subprocess.run(
+            [sys.executable, "-c", _BENCHMARK_SCRIPT, mode, str(path), str(parser_module)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def test_ubpr_sized_payload(self, tmp_path):
+        """Streaming uses far less peak memory on a UBPR-sized instance, in similar wall time."""
+        # Roughly the size of a large bank's UBPR instance (~15 MB, 150k facts)
+        path = tmp_path / "ubpr.xml"
+        path.write_bytes(build_ubpr_instance(concepts=30_000, contexts=5))
+
+        tree = self._measure("tree", path)
+        stream = self._measure("stream", path)
+
+        assert stream["facts"] == tree["facts"] == 30_000
+        assert stream["peak_growth_kb"] < tree["peak_growth_kb"] / 2
+        # Streaming trades no meaningful wall time for the memory saved
+        assert stream["seconds"] < tree["seconds"] * 1.5